@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""Benchmark video encoding profiles: encode time versus output size.
+
+Each selected profile is used to render the same deck at each selected
+resolution. Without ``--deck`` a synthetic deck of text slides is generated.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.append(".")
+
+from PIL import Image, ImageDraw, ImageFont
+from rich.table import Table
+
+from scripts._console_utils import get_console
+from slidespeaker.video import VideoComposer
+from slidespeaker.video.profiles import available_profiles
+
+RESOLUTIONS = ("sd", "hd", "fullhd")
+IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg"}
+
+console = get_console()
+
+
+def make_sample_deck(target_dir: Path, slides: int) -> list[Path]:
+    """Write ``slides`` synthetic 1920x1080 text slides and return their paths."""
+    target_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        title_font: Any = ImageFont.truetype("DejaVuSans.ttf", 72)
+        body_font: Any = ImageFont.truetype("DejaVuSans.ttf", 40)
+    except OSError:
+        title_font = ImageFont.load_default(size=72)
+        body_font = ImageFont.load_default(size=40)
+    paths: list[Path] = []
+    for index in range(slides):
+        image = Image.new("RGB", (1920, 1080), (248, 249, 251))
+        draw = ImageDraw.Draw(image)
+        draw.rectangle((0, 0, 1920, 160), fill=(32, 64, 128))
+        draw.text((80, 40), f"Sample slide {index + 1}", font=title_font, fill="white")
+        for line in range(6):
+            draw.text(
+                (120, 260 + line * 110),
+                f"- Key point {line + 1} for benchmarking slide encodes",
+                font=body_font,
+                fill=(40, 40, 40),
+            )
+        path = target_dir / f"slide_{index + 1:03d}.png"
+        image.save(path)
+        paths.append(path)
+    return paths
+
+
+def load_deck(deck_dir: Path) -> tuple[list[Path], list[Path]]:
+    """Return slide images and their matching narration files from a directory.
+
+    Narration is matched by stem (``slide_001.png`` -> ``slide_001.mp3``); slides
+    without narration are rendered with the composer's default duration.
+    """
+    images = sorted(p for p in deck_dir.iterdir() if p.suffix.lower() in IMAGE_SUFFIXES)
+    audio = [p.with_suffix(".mp3") for p in images]
+    if not all(p.exists() for p in audio):
+        audio = []
+    return images, audio
+
+
+def run_benchmark(
+    images: list[Path],
+    audio: list[Path],
+    profiles: list[str],
+    resolutions: list[str],
+    work_dir: Path,
+) -> list[dict[str, Any]]:
+    """Encode the deck once per profile and resolution and collect measurements."""
+    results: list[dict[str, Any]] = []
+    for resolution in resolutions:
+        for profile in profiles:
+            composer = VideoComposer(encoding_profile=profile)
+            output = work_dir / f"{profile}_{resolution}.mp4"
+            started = time.perf_counter()
+            composer._create_video_sync(images, audio, output, resolution)
+            elapsed = time.perf_counter() - started
+            size_bytes = output.stat().st_size
+            results.append(
+                {
+                    "profile": profile,
+                    "resolution": resolution,
+                    "slides": len(images),
+                    "encode_seconds": round(elapsed, 2),
+                    "size_bytes": size_bytes,
+                    "seconds_per_slide": round(elapsed / max(1, len(images)), 3),
+                }
+            )
+            output.unlink(missing_ok=True)
+    return results
+
+
+def render_table(results: list[dict[str, Any]]) -> Table:
+    table = Table(title="Encoding profiles")
+    for column in ("Resolution", "Profile", "Encode (s)", "s/slide", "Size (KB)"):
+        table.add_column(column, justify="right" if "(" in column else "left")
+    for row in results:
+        table.add_row(
+            row["resolution"],
+            row["profile"],
+            f"{row['encode_seconds']:.2f}",
+            f"{row['seconds_per_slide']:.3f}",
+            f"{row['size_bytes'] / 1024:.0f}",
+        )
+    return table
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--deck",
+        type=Path,
+        help="Directory of slide images (and optional same-named .mp3 narration)",
+    )
+    parser.add_argument(
+        "--slides",
+        type=int,
+        default=6,
+        help="Number of synthetic slides when --deck is not given (default: 6)",
+    )
+    parser.add_argument(
+        "--profiles",
+        default=",".join(available_profiles()),
+        help="Comma-separated profiles to compare (default: all)",
+    )
+    parser.add_argument(
+        "--resolutions",
+        default="hd",
+        help=f"Comma-separated resolutions from {', '.join(RESOLUTIONS)} (default: hd)",
+    )
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    profiles = [p.strip() for p in args.profiles.split(",") if p.strip()]
+    resolutions = [r.strip() for r in args.resolutions.split(",") if r.strip()]
+    unknown = [p for p in profiles if p not in available_profiles()]
+    unknown += [r for r in resolutions if r not in RESOLUTIONS]
+    if unknown:
+        console.print(
+            f"[bold red]Unknown profile or resolution:[/] {', '.join(unknown)}"
+        )
+        sys.exit(2)
+
+    with tempfile.TemporaryDirectory(prefix="encoding-bench-") as tmp:
+        work_dir = Path(tmp)
+        if args.deck:
+            images, audio = load_deck(args.deck)
+        else:
+            images, audio = make_sample_deck(work_dir / "deck", args.slides), []
+        if not images:
+            console.print("[bold red]No slide images found.[/]")
+            sys.exit(1)
+        results = run_benchmark(images, audio, profiles, resolutions, work_dir)
+
+    if args.json:
+        console.print_json(json.dumps(results))
+    else:
+        console.print(render_table(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Benchmark subtitle cue timing on long synthetic transcripts.
+
+Builds a transcript of ``--hours`` of narration split into one-minute slides,
+with a timing model that has a pause after every sentence, then times cue
+building and SRT/VTT serialisation. No audio is read: the timing model is
+synthesised, so only the timing engine is measured.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.append(".")
+
+import numpy as np
+from rich.table import Table
+
+from scripts._console_utils import get_console
+from slidespeaker.subtitle.cues import CueBuilder
+from slidespeaker.subtitle.srt_generator import format_srt
+from slidespeaker.subtitle.timeline import SlideTiming
+from slidespeaker.subtitle.vtt_generator import format_vtt
+
+SLIDE_SECONDS = 60.0
+WORDS_PER_SECOND = 2.6
+
+console = get_console()
+
+
+def make_transcript(
+    hours: float, seed: int = 0
+) -> tuple[list[dict[str, Any]], list[SlideTiming]]:
+    """Return scripts and a matching timing model for ``hours`` of narration."""
+    rng = np.random.default_rng(seed)
+    slides = max(1, int(hours * 3600 / SLIDE_SECONDS))
+    words_per_slide = int(SLIDE_SECONDS * WORDS_PER_SECOND)
+    scripts: list[dict[str, Any]] = []
+    timing: list[SlideTiming] = []
+    for index in range(slides):
+        lengths = rng.integers(6, 22, size=words_per_slide // 6)
+        lengths = lengths[np.cumsum(lengths) <= words_per_slide]
+        sentences = [
+            " ".join(f"word{index}_{n}" for n in range(length)).capitalize() + "."
+            for length in lengths
+        ]
+        pauses = np.cumsum(lengths) / WORDS_PER_SECOND
+        pauses += rng.normal(0.0, 0.2, size=len(pauses))
+        scripts.append({"script": " ".join(sentences)})
+        timing.append(
+            SlideTiming(
+                Path(f"slide_{index + 1}.mp3"),
+                SLIDE_SECONDS,
+                tuple(float(p) for p in pauses if 0 < p < SLIDE_SECONDS),
+                (),
+            )
+        )
+    return scripts, timing
+
+
+def run_benchmark(hours: float, repeat: int) -> dict[str, Any]:
+    scripts, timing = make_transcript(hours)
+    builder = CueBuilder()
+    build_times: list[float] = []
+    format_times: list[float] = []
+    cues: list[Any] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        cues = builder.build_cues(scripts, [], "english", timing=timing)
+        build_times.append(time.perf_counter() - started)
+        started = time.perf_counter()
+        format_srt(cues)
+        format_vtt(cues, "english")
+        format_times.append(time.perf_counter() - started)
+    return {
+        "hours": hours,
+        "slides": len(scripts),
+        "words": sum(len(s["script"].split()) for s in scripts),
+        "cues": len(cues),
+        "build_seconds": round(min(build_times), 3),
+        "format_seconds": round(min(format_times), 3),
+        "cues_per_second": round(len(cues) / max(min(build_times), 1e-9)),
+    }
+
+
+def render_table(result: dict[str, Any]) -> Table:
+    table = Table(title="Subtitle timing")
+    for column in ("Hours", "Slides", "Words", "Cues", "Build (s)", "Format (s)"):
+        table.add_column(column, justify="right")
+    table.add_row(
+        f"{result['hours']:g}",
+        str(result["slides"]),
+        str(result["words"]),
+        str(result["cues"]),
+        f"{result['build_seconds']:.3f}",
+        f"{result['format_seconds']:.3f}",
+    )
+    return table
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--hours",
+        type=float,
+        default=2.0,
+        help="Length of the synthetic narration in hours (default: 2)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Runs to take the best time from (default: 3)",
+    )
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    result = run_benchmark(args.hours, max(1, args.repeat))
+    if args.json:
+        console.print_json(json.dumps(result))
+    else:
+        console.print(render_table(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -15,6 +15,7 @@ from fastapi.staticfiles import StaticFiles
 
 from slidespeaker.configs.config import config
 from slidespeaker.configs.logging_config import setup_logging
+from slidespeaker.core.http_client import close_http_clients
 from slidespeaker.core.rate_limit import add_rate_limiting
 from slidespeaker.routes.audio_routes import router as audio_router
 from slidespeaker.routes.auth_routes import router as auth_router
@@ -61,7 +62,8 @@ async def lifespan(app: FastAPI):
 
     yield  # The application runs during this period
 
-    # No specific shutdown cleanup needed for now
+    # Release pooled outbound connections
+    await close_http_clients()
 
 
 app = FastAPI(title="AI Slider API", lifespan=lifespan)
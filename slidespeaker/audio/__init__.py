@@ -4,8 +4,20 @@ Audio package for SlideSpeaker.
 Contains audio generation (TTS) utilities and helpers.
 """
 
+from .clip_cache import TTSClipCache
 from .generator import AudioGenerator
+from .probe import probe_duration, record_duration
+from .scheduler import TTSJob, TTSScheduler
 from .tts_factory import TTSFactory
 from .tts_interface import TTSInterface
 
-__all__ = ["AudioGenerator", "TTSFactory", "TTSInterface"]
+__all__ = [
+    "AudioGenerator",
+    "TTSClipCache",
+    "TTSFactory",
+    "TTSInterface",
+    "TTSJob",
+    "TTSScheduler",
+    "probe_duration",
+    "record_duration",
+]
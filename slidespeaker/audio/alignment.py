@@ -0,0 +1,217 @@
+"""
+Word-level timing for TTS clips (audio package).
+
+Providers that return timestamps with the audio (ElevenLabs) have their word
+timings saved next to the clip (``slide_1.words.json``) as it is synthesised.
+Subtitle cues are then cut exactly at word boundaries instead of being
+estimated from text length and silences, and the clip is not analysed at all.
+
+For other providers, with ``SUBTITLE_TIMING_MODE=aligned`` every finished clip is force-aligned
+against the script it was synthesised from. The aligner is torchaudio's MMS
+forced-alignment model. It runs offline on the CPU once its weights are cached,
+and is installed with the ``align`` extra. Its word timestamps are saved in the
+same sidecar.
+
+The aligner works on romanised text, so clips whose script is mostly
+non-Latin are not aligned. Alignment is best effort: without torchaudio, or when
+alignment fails, no sidecar is written and subtitles use heuristic timing.
+"""
+
+import asyncio
+import functools
+import json
+import os
+import re
+import unicodedata
+import uuid
+from pathlib import Path
+from typing import Any, TypedDict
+
+from loguru import logger
+
+from slidespeaker.configs.config import config
+
+from .limits import loop_semaphore
+
+WORDS_SUFFIX = ".words.json"
+
+_NON_ALIGNABLE_RE = re.compile(r"[^a-z']")
+
+
+class WordTiming(TypedDict):
+    """When one word of the script is spoken within its clip."""
+
+    word: str
+    start: float
+    end: float
+
+
+def words_path(audio_path: Path) -> Path:
+    """Return the word-timing sidecar path for ``audio_path``."""
+    return audio_path.with_suffix(WORDS_SUFFIX)
+
+
+def write_words(audio_path: Path, words: list[WordTiming], source: str) -> None:
+    """Persist word timings for the clip currently at ``audio_path``."""
+    stat = audio_path.stat()
+    path = words_path(audio_path)
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    payload = {
+        "source": source,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "words": words,
+    }
+    tmp.write_text(json.dumps(payload), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def read_words(audio_path: Path | str | None) -> list[WordTiming]:
+    """Load word timings for ``audio_path``; empty when missing or stale."""
+    if audio_path is None:
+        return []
+    path = Path(audio_path)
+    try:
+        data: Any = json.loads(words_path(path).read_text("utf-8"))
+        stat = path.stat()
+    except (OSError, ValueError):
+        return []
+    if not isinstance(data, dict):
+        return []
+    # Timings of an earlier render do not describe a re-synthesised clip
+    if data.get("size") != stat.st_size or data.get("mtime_ns") != stat.st_mtime_ns:
+        return []
+    words: list[WordTiming] = []
+    try:
+        for item in data["words"]:
+            words.append(
+                {
+                    "word": str(item["word"]),
+                    "start": float(item["start"]),
+                    "end": float(item["end"]),
+                }
+            )
+    except (KeyError, TypeError, ValueError):
+        return []
+    return words
+
+
+def words_from_characters(
+    characters: list[str], starts: list[float], ends: list[float]
+) -> list[WordTiming]:
+    """Group per-character timestamps (as TTS providers return them) into words."""
+    words: list[WordTiming] = []
+    current: list[str] = []
+    start = end = 0.0
+    for char, char_start, char_end in zip(characters, starts, ends, strict=True):
+        if char.isspace():
+            if current:
+                words.append({"word": "".join(current), "start": start, "end": end})
+                current = []
+            continue
+        if not current:
+            start = float(char_start)
+        current.append(char)
+        end = max(start, float(char_end))
+    if current:
+        words.append({"word": "".join(current), "start": start, "end": end})
+    return words
+
+
+def _romanise(word: str) -> str:
+    ascii_word = unicodedata.normalize("NFKD", word).encode("ascii", "ignore")
+    return _NON_ALIGNABLE_RE.sub("", ascii_word.decode("ascii").lower())
+
+
+@functools.lru_cache(maxsize=1)
+def _mms_aligner() -> tuple[Any, Any, Any, int]:
+    import torchaudio
+
+    bundle = torchaudio.pipelines.MMS_FA
+    model = bundle.get_model(with_star=False)
+    model.eval()
+    return model, bundle.get_tokenizer(), bundle.get_aligner(), bundle.sample_rate
+
+
+def align_words(audio_path: Path, text: str) -> list[WordTiming] | None:
+    """Force-align the words of ``text`` to ``audio_path`` (blocking, CPU bound).
+
+    Returns None when the text cannot be aligned.
+    """
+    import torch
+    import torchaudio
+
+    words = text.split()
+    romanised = [_romanise(w) for w in words]
+    alignable = [r for r in romanised if r]
+    if not alignable or len(alignable) < len(words) / 2:
+        return None
+
+    model, tokenizer, aligner, sample_rate = _mms_aligner()
+    waveform, rate = torchaudio.load(str(audio_path))
+    waveform = waveform.mean(dim=0, keepdim=True)
+    if rate != sample_rate:
+        waveform = torchaudio.functional.resample(waveform, rate, sample_rate)
+    with torch.inference_mode():
+        emission, _ = model(waveform)
+        spans = aligner(emission[0], tokenizer(alignable))
+    seconds_per_frame = waveform.size(1) / emission.size(1) / sample_rate
+
+    # Words with nothing to align (numbers, symbols) share their neighbours' gap
+    timings: list[WordTiming] = []
+    aligned = iter(spans)
+    cursor = 0.0
+    for word, roman in zip(words, romanised, strict=True):
+        if roman:
+            word_spans = next(aligned)
+            start = word_spans[0].start * seconds_per_frame
+            end = word_spans[-1].end * seconds_per_frame
+            cursor = end
+        else:
+            start = end = cursor
+        timings.append({"word": word, "start": start, "end": end})
+    for index, timing in enumerate(timings):
+        if timing["end"] <= timing["start"] and index + 1 < len(timings):
+            timing["end"] = max(timing["start"], timings[index + 1]["start"])
+    return timings
+
+
+def _semaphore() -> asyncio.Semaphore:
+    return loop_semaphore("alignment", config.subtitle_align_concurrency)
+
+
+async def align_clip(audio_path: Path | str, text: str) -> list[WordTiming] | None:
+    """Align ``text`` to the clip at ``audio_path`` and save the word timings.
+
+    Returns None (writing nothing) when alignment is unavailable or fails.
+    """
+    path = Path(audio_path)
+    try:
+        async with _semaphore():
+            words = await asyncio.to_thread(align_words, path, text)
+    except ImportError:
+        logger.warning(
+            "Forced alignment needs torchaudio (install the 'align' extra); "
+            "using heuristic subtitle timing"
+        )
+        return None
+    except Exception as e:
+        logger.warning(f"Forced alignment failed for {path}: {e}")
+        return None
+    if not words:
+        logger.debug(f"Skipping forced alignment of {path.name}: script not alignable")
+        return None
+    await asyncio.to_thread(write_words, path, words, "aligner")
+    logger.debug(f"Aligned {len(words)} words in {path.name}")
+    return words
+
+
+__all__ = [
+    "WordTiming",
+    "align_clip",
+    "align_words",
+    "read_words",
+    "words_from_characters",
+    "words_path",
+    "write_words",
+]
@@ -0,0 +1,137 @@
+"""
+Long-script TTS chunking for SlideSpeaker (audio package).
+
+Scripts longer than ``TTS_CHUNK_MAX_CHARS`` are split at sentence boundaries
+into pieces that are synthesised independently (in parallel, retried one by
+one) and then joined frame by frame into a single MP3 (see ``concat``). No
+silence is added and nothing is re-encoded. Because the stitched file is made
+of exactly the chunks' frames, each chunk boundary is an exact timestamp.
+These timing anchors are saved next to the clip (``slide_1.timing.json``) for
+subtitle timing. Word timings returned with the chunks are shifted by the same
+offsets and saved for the whole clip.
+"""
+
+import json
+import os
+import uuid
+from pathlib import Path
+from typing import Any, TypedDict
+
+from .alignment import WordTiming, read_words, write_words
+from .concat import concat_mp3
+
+ANCHORS_SUFFIX = ".timing.json"
+
+
+class TimingAnchor(TypedDict):
+    """Exact position of one synthesised text chunk within its clip."""
+
+    text: str
+    start: float
+    end: float
+
+
+def plan_chunks(text: str, max_chars: int) -> list[str]:
+    """Group the sentences of ``text`` into chunks of at most ``max_chars``.
+
+    Returns ``[text]`` unchanged when it already fits. A single sentence longer
+    than ``max_chars`` is split further on word (or character) boundaries.
+    """
+    # Imported here: the subtitle package itself reads anchors from this module
+    from slidespeaker.subtitle.text_segmentation import split_sentences
+
+    stripped = text.strip()
+    if max_chars <= 0 or len(stripped) <= max_chars:
+        return [stripped] if stripped else []
+    chunks: list[str] = []
+    current = ""
+    for sentence in split_sentences(stripped, max_fallback_len=max_chars):
+        candidate = f"{current} {sentence}".strip() if current else sentence
+        if current and len(candidate) > max_chars:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = candidate
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def anchors_path(audio_path: Path) -> Path:
+    """Return the timing-anchor sidecar path for ``audio_path``."""
+    return audio_path.with_suffix(ANCHORS_SUFFIX)
+
+
+def write_anchors(audio_path: Path, anchors: list[TimingAnchor]) -> None:
+    """Persist timing anchors next to ``audio_path``."""
+    path = anchors_path(audio_path)
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    tmp.write_text(json.dumps({"anchors": anchors}), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def clear_anchors(audio_path: Path) -> None:
+    """Remove anchors left over from an earlier render of ``audio_path``."""
+    anchors_path(audio_path).unlink(missing_ok=True)
+
+
+def read_anchors(audio_path: Path | str | None) -> list[TimingAnchor]:
+    """Load timing anchors for ``audio_path``; empty when none were saved."""
+    if audio_path is None:
+        return []
+    try:
+        data: Any = json.loads(anchors_path(Path(audio_path)).read_text("utf-8"))
+    except (OSError, ValueError):
+        return []
+    anchors = data.get("anchors") if isinstance(data, dict) else None
+    if not isinstance(anchors, list):
+        return []
+    valid: list[TimingAnchor] = []
+    for item in anchors:
+        try:
+            valid.append(
+                {
+                    "text": str(item["text"]),
+                    "start": float(item["start"]),
+                    "end": float(item["end"]),
+                }
+            )
+        except (KeyError, TypeError, ValueError):
+            return []
+    return valid
+
+
+def stitch_clips(
+    parts: list[Path], texts: list[str], output_path: Path
+) -> list[TimingAnchor]:
+    """Join MP3 ``parts`` gaplessly into ``output_path`` and return the anchors."""
+    clips = concat_mp3(parts, output_path)
+    anchors: list[TimingAnchor] = [
+        {"text": text, "start": clip["start"], "end": clip["end"]}
+        for text, clip in zip(texts, clips, strict=True)
+    ]
+    write_anchors(output_path, anchors)
+    part_words = [read_words(part) for part in parts]
+    if all(part_words):
+        words: list[WordTiming] = [
+            {
+                "word": word["word"],
+                "start": anchor["start"] + word["start"],
+                "end": anchor["start"] + word["end"],
+            }
+            for anchor, chunk_words in zip(anchors, part_words, strict=True)
+            for word in chunk_words
+        ]
+        write_words(output_path, words, "tts")
+    return anchors
+
+
+__all__ = [
+    "TimingAnchor",
+    "anchors_path",
+    "clear_anchors",
+    "plan_chunks",
+    "read_anchors",
+    "stitch_clips",
+    "write_anchors",
+]
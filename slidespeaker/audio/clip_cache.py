@@ -0,0 +1,249 @@
+"""
+Persistent TTS clip cache for SlideSpeaker (audio package).
+
+Synthesised clips are stored under ``CACHE_DIR/tts`` keyed by a hash of
+(provider, model, voice, language, normalised text), with the model and voice
+the TTS service resolves for the request. Retries, re-runs and re-renders of
+unchanged slides reuse earlier clips instead of calling the TTS API again.
+Each clip has a small JSON sidecar holding its duration and any word timings
+the provider returned; the sidecar's mtime doubles as the last-used time for
+size-based LRU eviction.
+
+Hits are served as a hardlink to the cached clip (or a copy across
+filesystems). Consumers that post-process a clip must write a new file and
+replace the old one rather than editing it in place, which would also change
+the cached copy. With ``TTS_CACHE_SHARED`` the clips are also stored in the
+configured storage provider so that workers on other hosts can reuse them.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+import uuid
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from slidespeaker.configs.config import config, get_storage_provider
+
+from .alignment import WordTiming, write_words
+from .probe import record_duration
+
+CLIP_SUFFIX = ".mp3"
+META_SUFFIX = ".json"
+STORAGE_PREFIX = "cache/tts"
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace so formatting-only edits still hit the cache."""
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def clip_cache_key(
+    provider: str,
+    model: str | None,
+    voice: str | None,
+    language: str,
+    text: str,
+) -> str:
+    """Return the cache key for one synthesised clip."""
+    parts = [
+        provider.lower(),
+        str(model or ""),
+        voice or "default",
+        (language or "english").lower(),
+        normalize_text(text),
+    ]
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def _link_or_copy(src: Path, dest: Path) -> None:
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest.with_name(f".{dest.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        os.link(src, tmp)
+    except OSError:
+        shutil.copyfile(src, tmp)
+    os.replace(tmp, dest)
+
+
+class TTSClipCache:
+    """Disk-backed clip store with size-based LRU eviction."""
+
+    def __init__(
+        self,
+        root: Path | None = None,
+        max_bytes: int | None = None,
+        shared: bool | None = None,
+    ) -> None:
+        self.root = root or (config.cache_dir / "tts")
+        self.max_bytes = (
+            config.tts_cache_max_mb * 1024 * 1024 if max_bytes is None else max_bytes
+        )
+        self.shared = config.tts_cache_shared if shared is None else shared
+        self._lock = threading.Lock()
+
+    def _clip_path(self, key: str) -> Path:
+        return self.root / f"{key}{CLIP_SUFFIX}"
+
+    def _meta_path(self, key: str) -> Path:
+        return self.root / f"{key}{META_SUFFIX}"
+
+    def _read_meta(self, key: str) -> dict[str, Any]:
+        try:
+            data = json.loads(self._meta_path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _write_meta(self, key: str, meta: dict[str, Any]) -> None:
+        path = self._meta_path(key)
+        tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        tmp.write_text(json.dumps(meta), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def _fetch_shared(self, key: str) -> bool:
+        """Pull a clip from the storage provider into the local cache."""
+        object_key = f"{STORAGE_PREFIX}/{key}{CLIP_SUFFIX}"
+        try:
+            storage = get_storage_provider()
+            if not storage.file_exists(object_key):
+                return False
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp = self.root / f".{key}.{uuid.uuid4().hex}.download"
+            storage.download_file(object_key, tmp)
+            os.replace(tmp, self._clip_path(key))
+            meta: dict[str, Any] = {}
+            try:
+                raw = storage.download_bytes(f"{STORAGE_PREFIX}/{key}{META_SUFFIX}")
+                meta = json.loads(raw.decode("utf-8"))
+            except Exception:
+                pass
+            self._write_meta(key, meta if isinstance(meta, dict) else {})
+        except Exception as e:
+            logger.debug(f"Shared TTS cache lookup failed for {key[:12]}: {e}")
+            return False
+        self._evict()
+        return True
+
+    def _push_shared(self, key: str, meta: dict[str, Any]) -> None:
+        try:
+            storage = get_storage_provider()
+            storage.upload_file(
+                self._clip_path(key),
+                f"{STORAGE_PREFIX}/{key}{CLIP_SUFFIX}",
+                "audio/mpeg",
+            )
+            storage.upload_bytes(
+                json.dumps(meta).encode("utf-8"),
+                f"{STORAGE_PREFIX}/{key}{META_SUFFIX}",
+                "application/json",
+            )
+        except Exception as e:
+            logger.warning(f"Could not share TTS clip {key[:12]}: {e}")
+
+    def _discard(self, key: str) -> None:
+        self._clip_path(key).unlink(missing_ok=True)
+        self._meta_path(key).unlink(missing_ok=True)
+
+    def _has_clip(self, key: str) -> bool:
+        """Return True when a non-empty clip is cached; empty ones are evicted."""
+        try:
+            if self._clip_path(key).stat().st_size > 0:
+                return True
+        except OSError:
+            return False
+        logger.warning(f"Evicting empty cached TTS clip {key[:12]}")
+        self._discard(key)
+        return False
+
+    def get(self, key: str, dest: Path) -> bool:
+        """Materialise the cached clip for ``key`` at ``dest``; False on a miss."""
+        clip = self._clip_path(key)
+        if not self._has_clip(key) and not (
+            self.shared and self._fetch_shared(key) and self._has_clip(key)
+        ):
+            return False
+        try:
+            _link_or_copy(clip, dest)
+        except OSError as e:
+            logger.warning(f"Could not reuse cached TTS clip {key[:12]}: {e}")
+            return False
+        meta = self._read_meta(key)
+        # Touch the sidecar, not the clip: the clip may be hardlinked elsewhere
+        with contextlib.suppress(OSError):
+            self._meta_path(key).touch()
+        duration = meta.get("duration")
+        if isinstance(duration, int | float) and duration > 0:
+            record_duration(dest, float(duration))
+        words = meta.get("words")
+        if isinstance(words, list) and words:
+            try:
+                write_words(dest, words, "tts")
+            except OSError as e:
+                logger.debug(f"Could not restore word timings for {key[:12]}: {e}")
+        return True
+
+    def put(
+        self,
+        key: str,
+        src: Path,
+        duration: float | None = None,
+        words: list[WordTiming] | None = None,
+    ) -> None:
+        """Store ``src`` as the clip for ``key`` and evict old clips if needed."""
+        if src.stat().st_size == 0:
+            logger.warning(f"Not caching empty TTS clip {key[:12]}")
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.root / f".{key}.{uuid.uuid4().hex}.tmp"
+        shutil.copyfile(src, tmp)
+        os.replace(tmp, self._clip_path(key))
+        meta: dict[str, Any] = {"duration": duration} if duration else {}
+        if words:
+            meta["words"] = words
+        self._write_meta(key, meta)
+        if self.shared:
+            self._push_shared(key, meta)
+        self._evict()
+
+    def size_bytes(self) -> int:
+        """Return the total size of cached clips."""
+        return sum(p.stat().st_size for p in self.root.glob(f"*{CLIP_SUFFIX}"))
+
+    def _last_used(self, clip: Path) -> float:
+        meta = clip.with_suffix(META_SUFFIX)
+        try:
+            return meta.stat().st_mtime
+        except OSError:
+            return clip.stat().st_mtime
+
+    def _evict(self) -> None:
+        with self._lock:
+            try:
+                clips = [
+                    (self._last_used(p), p.stat().st_size, p)
+                    for p in self.root.glob(f"*{CLIP_SUFFIX}")
+                ]
+            except OSError:
+                return
+            total = sum(size for _, size, _ in clips)
+            if total <= self.max_bytes:
+                return
+            for _, size, clip in sorted(clips, key=lambda item: item[0]):
+                clip.unlink(missing_ok=True)
+                clip.with_suffix(META_SUFFIX).unlink(missing_ok=True)
+                total -= size
+                if total <= self.max_bytes:
+                    break
+            logger.debug(f"TTS clip cache trimmed to {total} bytes")
+
+
+__all__ = ["TTSClipCache", "clip_cache_key", "normalize_text"]
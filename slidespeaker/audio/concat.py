@@ -0,0 +1,194 @@
+"""
+MP3 concatenation for SlideSpeaker (audio package).
+
+Joins per-slide or per-segment clips into one MP3 that players and range
+requests handle correctly. Appending whole files would leave one ID3 tag and
+Xing header per clip in the middle of the stream. Here only audio frames are
+copied, and the result gets a single Xing/Info header with the true frame
+count and a seek table. Clips whose streams cannot be joined frame by frame
+(different sample rates or channel layouts, or no parsable frames) go through
+the ffmpeg concat demuxer with stream copy instead. Both paths return each
+clip's start and end time in the joined file.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import uuid
+from array import array
+from collections.abc import Sequence
+from contextlib import suppress
+from pathlib import Path
+from typing import TypedDict
+
+from loguru import logger
+
+from .mp3 import build_xing_frame, iter_frames, stream_signature
+from .probe import probe_duration, record_duration
+
+
+class ClipOffset(TypedDict):
+    """Position of one input clip within the concatenated file."""
+
+    path: str
+    start: float
+    end: float
+
+
+class _Scan(TypedDict):
+    frames: int
+    bytes: int
+    vbr: bool
+    template: bytes
+    times: array[float]
+    offsets: array[int]
+    clips: list[ClipOffset]
+
+
+def _scan(inputs: list[Path]) -> _Scan:
+    """Measure every input's frames; raise ValueError if they cannot be joined."""
+    signature: tuple[int, int, int] | None = None
+    template = b""
+    bitrates: set[int] = set()
+    times: array[float] = array("d")
+    offsets: array[int] = array("Q")
+    clips: list[ClipOffset] = []
+    cursor = 0.0
+    size = 0
+    for path in inputs:
+        data = path.read_bytes()
+        start = cursor
+        found = False
+        for pos, header in iter_frames(data):
+            frame_sig = stream_signature(data[pos : pos + 4])
+            if signature is None:
+                signature = frame_sig
+                template = data[pos : pos + 4]
+            elif frame_sig != signature:
+                raise ValueError(f"{path} uses a different stream layout")
+            times.append(cursor)
+            offsets.append(size)
+            bitrates.add(data[pos + 2] >> 4)
+            cursor += header.samples / header.sample_rate
+            size += header.length
+            found = True
+        if not found:
+            raise ValueError(f"{path} has no MP3 frames")
+        clips.append({"path": str(path), "start": start, "end": cursor})
+    return {
+        "frames": len(times),
+        "bytes": size,
+        "vbr": len(bitrates) > 1,
+        "template": template,
+        "times": times,
+        "offsets": offsets,
+        "clips": clips,
+    }
+
+
+def _seek_table(scan: _Scan, header_size: int) -> list[int]:
+    total_time = scan["clips"][-1]["end"] if scan["clips"] else 0.0
+    total_bytes = scan["bytes"] + header_size
+    times, offsets = scan["times"], scan["offsets"]
+    toc: list[int] = []
+    index = 0
+    for percent in range(100):
+        target = total_time * percent / 100
+        while index + 1 < len(times) and times[index + 1] <= target:
+            index += 1
+        toc.append(int((offsets[index] + header_size) * 256 / max(1, total_bytes)))
+    return toc
+
+
+def _concat_frames(inputs: list[Path], output: Path) -> list[ClipOffset]:
+    scan = _scan(inputs)
+    # The seek table counts the header frame itself, so size it first
+    header_size = len(
+        build_xing_frame(
+            scan["template"], scan["frames"], scan["bytes"], [], scan["vbr"]
+        )
+    )
+    xing = build_xing_frame(
+        scan["template"],
+        scan["frames"],
+        scan["bytes"],
+        _seek_table(scan, header_size),
+        scan["vbr"],
+    )
+    tmp = output.with_name(f".{output.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with tmp.open("wb") as out:
+            out.write(xing)
+            for path in inputs:
+                data = memoryview(path.read_bytes())
+                for pos, header in iter_frames(data):
+                    out.write(data[pos : pos + header.length])
+        os.replace(tmp, output)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return scan["clips"]
+
+
+def _concat_demuxer(inputs: list[Path], output: Path) -> list[ClipOffset]:
+    list_file = output.with_name(f".{output.stem}.{uuid.uuid4().hex}.txt")
+    try:
+        with open(list_file, "w", encoding="utf-8") as f:
+            for path in inputs:
+                escaped = str(path.resolve()).replace("'", "'\\''")
+                f.write(f"file '{escaped}'\n")
+        cmd = [
+            "ffmpeg",
+            "-y",
+            "-v",
+            "error",
+            "-f",
+            "concat",
+            "-safe",
+            "0",
+            "-i",
+            str(list_file),
+            "-c",
+            "copy",
+            str(output),
+        ]
+        res = subprocess.run(cmd, capture_output=True, text=True)
+        if res.returncode != 0:
+            raise RuntimeError(f"ffmpeg concat failed: {res.stderr[:400]}")
+    finally:
+        with suppress(Exception):
+            list_file.unlink(missing_ok=True)
+    clips: list[ClipOffset] = []
+    cursor = 0.0
+    for path in inputs:
+        duration = probe_duration(path) or 0.0
+        clips.append({"path": str(path), "start": cursor, "end": cursor + duration})
+        cursor += duration
+    return clips
+
+
+def concat_mp3(inputs: Sequence[Path | str], output: Path | str) -> list[ClipOffset]:
+    """Concatenate MP3 ``inputs`` into ``output`` and return each clip's offsets.
+
+    Raises:
+        ValueError: If ``inputs`` is empty
+        RuntimeError: If the ffmpeg fallback fails
+    """
+    paths = [Path(p) for p in inputs]
+    output_path = Path(output)
+    if not paths:
+        raise ValueError("No MP3 inputs to concatenate")
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        clips = _concat_frames(paths, output_path)
+    except ValueError as e:
+        logger.warning(f"Frame-level MP3 concat not possible ({e}); using ffmpeg")
+        clips = _concat_demuxer(paths, output_path)
+    total = clips[-1]["end"]
+    if total > 0:
+        record_duration(output_path, total)
+    logger.info(f"Concatenated {len(paths)} clips into {output_path} ({total:.2f}s)")
+    return clips
+
+
+__all__ = ["ClipOffset", "concat_mp3"]
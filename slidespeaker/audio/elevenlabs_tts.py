@@ -3,18 +3,30 @@ ElevenLabs TTS Service Implementation
 
 This module provides an implementation of the TTS interface using ElevenLabs' text-to-speech API.
 It supports multiple voices and high-quality speech synthesis through the ElevenLabs platform.
+The with-timestamps endpoint also returns per-character timings, which are grouped
+into word timings for subtitles.
 """
 
+import base64
+from collections.abc import AsyncIterator
 from pathlib import Path
+from typing import Any
 
 import httpx
 from loguru import logger
 
 from slidespeaker.configs.config import config
+from slidespeaker.core.http_client import get_http_client
 
+from .alignment import WordTiming, words_from_characters
+from .streaming import stream_to_file
 from .tts_interface import TTSInterface
 
 
+async def _single_chunk(data: bytes) -> AsyncIterator[bytes]:
+    yield data
+
+
 class ElevenLabsTTSService(TTSInterface):
     """ElevenLabs TTS implementation"""
 
@@ -25,55 +37,96 @@ class ElevenLabsTTSService(TTSInterface):
         self.default_voice_id = (
             config.elevenlabs_voice_id or "21m00Tcm4TlvDq8ikWAM"
         )  # Default voice
+        self.model_id = "eleven_monolingual_v1"
 
-    async def generate_speech(
-        self,
-        text: str,
-        output_path: Path,
-        language: str = "english",
-        voice: str | None = None,
-    ) -> None:
-        """Generate speech using ElevenLabs TTS"""
+    def _request(
+        self, text: str, voice: str | None, accept: str
+    ) -> tuple[str, dict[str, str], dict[str, Any]]:
+        """Return the URL, headers and body of a synthesis request"""
         if not text or not text.strip():
             raise ValueError("Text is empty or contains only whitespace")
 
         if not self.api_key:
             raise ValueError("ElevenLabs API key not configured")
 
-        # Use provided voice or default
-        voice_id = voice or self.default_voice_id
+        voice_id, model_id = self.resolve_voice(voice=voice)
 
         url = f"{self.base_url}/text-to-speech/{voice_id}"
         headers = {
-            "Accept": "audio/mpeg",
+            "Accept": accept,
             "Content-Type": "application/json",
             "xi-api-key": self.api_key,
         }
 
         data = {
             "text": text.strip(),
-            "model_id": "eleven_monolingual_v1",
+            "model_id": model_id,
             "voice_settings": {
                 "stability": 0.5,
                 "similarity_boost": 0.5,
             },
         }
+        return url, headers, data
+
+    def resolve_voice(
+        self, language: str = "english", voice: str | None = None
+    ) -> tuple[str, str]:
+        """Return the voice ID and model ElevenLabs uses for a request"""
+        # Use provided voice or default
+        return voice or self.default_voice_id, self.model_id
+
+    async def generate_speech(
+        self,
+        text: str,
+        output_path: Path,
+        language: str = "english",
+        voice: str | None = None,
+    ) -> None:
+        """Generate speech using ElevenLabs TTS"""
+        url, headers, data = self._request(text, voice, "audio/mpeg")
 
         try:
-            async with (
-                httpx.AsyncClient(timeout=30) as client,
-                client.stream("POST", url, headers=headers, json=data) as response,
-            ):
+            client = get_http_client("elevenlabs")
+            async with client.stream(
+                "POST", url, headers=headers, json=data, timeout=30
+            ) as response:
                 response.raise_for_status()
+                duration = await stream_to_file(
+                    response.aiter_bytes(chunk_size=64 * 1024), output_path
+                )
 
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                with output_path.open("wb") as f:
-                    async for chunk in response.aiter_bytes(chunk_size=1024):
-                        if chunk:
-                            f.write(chunk)
+            logger.info(f"Generated ElevenLabs TTS: {output_path} ({duration:.2f}s)")
+
+        except httpx.HTTPError as e:
+            logger.error(f"ElevenLabs TTS API error: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"ElevenLabs TTS error: {e}")
+            raise
 
-            logger.info(f"Generated ElevenLabs TTS: {output_path}")
+    def supports_word_timings(self) -> bool:
+        """ElevenLabs returns character timestamps with the audio"""
+        return True
 
+    async def generate_speech_with_timings(
+        self,
+        text: str,
+        output_path: Path,
+        language: str = "english",
+        voice: str | None = None,
+    ) -> list[WordTiming] | None:
+        """Generate speech via the with-timestamps endpoint and return word timings"""
+        url, headers, data = self._request(text, voice, "application/json")
+
+        try:
+            client = get_http_client("elevenlabs")
+            response = await client.post(
+                f"{url}/with-timestamps", headers=headers, json=data, timeout=30
+            )
+            response.raise_for_status()
+            payload = response.json()
+            audio = base64.b64decode(payload["audio_base64"])
+            duration = await stream_to_file(_single_chunk(audio), output_path)
         except httpx.HTTPError as e:
             logger.error(f"ElevenLabs TTS API error: {e}")
             raise
@@ -81,6 +134,29 @@ class ElevenLabsTTSService(TTSInterface):
             logger.error(f"ElevenLabs TTS error: {e}")
             raise
 
+        words = self._words(payload.get("alignment"))
+        logger.info(
+            f"Generated ElevenLabs TTS: {output_path} ({duration:.2f}s, "
+            f"{len(words or [])} timed words)"
+        )
+        return words
+
+    @staticmethod
+    def _words(alignment: Any) -> list[WordTiming] | None:
+        """Group the character alignment of a response into words"""
+        if not isinstance(alignment, dict):
+            return None
+        try:
+            words = words_from_characters(
+                list(alignment["characters"]),
+                [float(t) for t in alignment["character_start_times_seconds"]],
+                [float(t) for t in alignment["character_end_times_seconds"]],
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Ignoring malformed ElevenLabs alignment: {e}")
+            return None
+        return words or None
+
     def is_available(self) -> bool:
         """Check if ElevenLabs TTS is available"""
         return bool(self.api_key)
@@ -5,18 +5,20 @@ Centralizes text preparation for TTS, including optional translation of
 podcast dialogue to the requested audio (voice) language.
 """
 
-import json
+import asyncio
 import re
-import subprocess
-import time
 from pathlib import Path
 from typing import Any
 
 from slidespeaker.configs.config import config
 from slidespeaker.llm import chat_completion
 
+from .alignment import WordTiming, write_words
+from .clip_cache import TTSClipCache, clip_cache_key
+from .probe import probe_duration
 from .tts_factory import TTSFactory
 from .tts_interface import TTSInterface
+from .voice_catalog import voice_catalog, voices_key, voices_payload
 
 # System prompt for translating podcast dialogue for TTS
 PODCAST_TRANSLATION_SYSTEM_PROMPT = (
@@ -34,6 +36,8 @@ class AudioGenerator:
     """Generator for text-to-speech audio files"""
 
     def __init__(self) -> None:
+        # Provider name (e.g. "openai") used for per-provider request limits
+        self.provider = (config.tts_model or "openai").partition("/")[0].lower()
         try:
             self.tts_service: TTSInterface | None = TTSFactory.create_service(
                 config.tts_model
@@ -41,6 +45,7 @@ class AudioGenerator:
         except Exception as e:
             print(f"Warning: Could not initialize TTS service: {e}")
             self.tts_service = None
+        self.clip_cache = TTSClipCache() if config.tts_cache_enabled else None
 
     async def generate_audio(
         self,
@@ -57,14 +62,59 @@ class AudioGenerator:
         try:
             output_path_obj = Path(output_path)
             output_path_obj.parent.mkdir(parents=True, exist_ok=True)
-            await self.tts_service.generate_speech(
-                text, output_path_obj, language, voice
-            )
-            return output_path_obj.exists() and output_path_obj.stat().st_size > 0
+            # Key on what the service really uses, so changing its configured
+            # default voice or model never serves clips in the old voice
+            used_voice, model = self.tts_service.resolve_voice(language, voice)
+            cache_key = clip_cache_key(self.provider, model, used_voice, language, text)
+            cache = self.clip_cache
+            if cache and await self._from_cache(cache, cache_key, output_path_obj):
+                return True
+            # A previous clip may be hardlinked to the cache; never write through it
+            output_path_obj.unlink(missing_ok=True)
+            words: list[WordTiming] | None = None
+            if config.tts_word_timings and self.tts_service.supports_word_timings():
+                words = await self.tts_service.generate_speech_with_timings(
+                    text, output_path_obj, language, voice
+                )
+            else:
+                await self.tts_service.generate_speech(
+                    text, output_path_obj, language, voice
+                )
+            if not output_path_obj.exists() or output_path_obj.stat().st_size == 0:
+                return False
+            if words:
+                # Subtitles are cut at these instead of analysing the clip
+                await asyncio.to_thread(write_words, output_path_obj, words, "tts")
+            # Measure once while the clip is fresh so later steps hit the cache
+            duration = probe_duration(output_path_obj)
+            if cache:
+                await self._to_cache(cache, cache_key, output_path_obj, duration, words)
+            return True
         except Exception as e:
             print(f"Error generating audio: {e}")
             return False
 
+    @staticmethod
+    async def _from_cache(cache: TTSClipCache, key: str, output_path: Path) -> bool:
+        try:
+            return await asyncio.to_thread(cache.get, key, output_path)
+        except Exception as e:
+            print(f"Warning: TTS clip cache lookup failed: {e}")
+            return False
+
+    @staticmethod
+    async def _to_cache(
+        cache: TTSClipCache,
+        key: str,
+        output_path: Path,
+        duration: float | None,
+        words: list[WordTiming] | None = None,
+    ) -> None:
+        try:
+            await asyncio.to_thread(cache.put, key, output_path, duration, words)
+        except Exception as e:
+            print(f"Warning: Could not cache TTS clip: {e}")
+
     # ----------------------- Dialogue preparation utils -----------------------
 
     @staticmethod
@@ -185,58 +235,12 @@ class AudioGenerator:
         return self.translate_dialogue(base_dialogue_en or [], vlang)
 
     def _get_audio_duration(self, audio_path: Path) -> float:
-        try:
-            if not audio_path.exists() or audio_path.stat().st_size == 0:
-                return self._estimate_duration_from_text(audio_path)
-            max_retries = 5
-            for attempt in range(max_retries):
-                if attempt > 0:
-                    time.sleep(0.2 * (attempt + 1))
-                try:
-                    time.sleep(0.1)
-                    cmd = [
-                        "ffprobe",
-                        "-v",
-                        "quiet",
-                        "-print_format",
-                        "json",
-                        "-show_format",
-                        "-show_streams",
-                        str(audio_path),
-                    ]
-                    result = subprocess.run(
-                        cmd, capture_output=True, text=True, timeout=15
-                    )
-                    if result.returncode != 0:
-                        if attempt == max_retries - 1:
-                            return self._fallback_audio_duration(audio_path)
-                        continue
-                    if not result.stdout.strip():
-                        if attempt == max_retries - 1:
-                            return self._fallback_audio_duration(audio_path)
-                        continue
-                    data = json.loads(result.stdout)
-                    if "format" in data and "duration" in data["format"]:
-                        return float(data["format"]["duration"])
-                    if "streams" in data:
-                        for stream in data["streams"]:
-                            if "duration" in stream:
-                                return float(stream["duration"])
-                except subprocess.TimeoutExpired:
-                    if attempt == max_retries - 1:
-                        return self._fallback_audio_duration(audio_path)
-                    continue
-                except json.JSONDecodeError:
-                    if attempt == max_retries - 1:
-                        return self._fallback_audio_duration(audio_path)
-                    continue
-                except Exception:
-                    if attempt == max_retries - 1:
-                        return self._fallback_audio_duration(audio_path)
-                    continue
-        except Exception:
-            return self._fallback_audio_duration(audio_path)
-        return self._fallback_audio_duration(audio_path)
+        if not audio_path.exists() or audio_path.stat().st_size == 0:
+            return self._estimate_duration_from_text(audio_path)
+        duration = probe_duration(audio_path)
+        if duration is None:
+            return self._estimate_duration_from_text(audio_path)
+        return duration
 
     def _estimate_duration_from_text(self, _audio_path: Path) -> float:
         try:
@@ -244,24 +248,18 @@ class AudioGenerator:
         except Exception:
             return 5.0
 
-    def _fallback_audio_duration(self, audio_path: Path) -> float:
-        """Attempt secondary strategies to measure audio duration."""
-        try:
-            from moviepy import AudioFileClip
-
-            with AudioFileClip(str(audio_path)) as clip:
-                duration = float(getattr(clip, "duration", 0.0) or 0.0)
-                if duration > 0:
-                    return duration
-        except Exception:
-            pass
-        return self._estimate_duration_from_text(audio_path)
-
     def get_supported_voices(self, language: str = "english") -> list[str]:
         if not self.tts_service:
             return []
+        service = self.tts_service
         try:
-            return self.tts_service.get_supported_voices(language)
+            entry = voice_catalog.get_sync(
+                voices_key(self.provider, language),
+                lambda: voices_payload(
+                    self.provider, service.get_supported_voices(language)
+                ),
+            )
+            return list(entry.payload["voices"])
         except Exception as e:
             print(f"Error getting supported voices: {e}")
             return []
@@ -0,0 +1,43 @@
+"""
+Per-event-loop concurrency limits for the audio package.
+
+asyncio semaphores are bound to the loop they are first used on, so shared
+limits are kept per running loop. Entries hold their loop weakly and are
+forgotten once that loop is closed or gone, and a new loop that reuses a dead
+loop's id never inherits its semaphores.
+"""
+
+import asyncio
+import weakref
+from typing import Any
+
+_limits: dict[tuple[str, int], tuple[weakref.ref[Any], asyncio.Semaphore]] = {}
+
+
+def _forget_stale_limits() -> None:
+    for key, (loop_ref, _) in list(_limits.items()):
+        owner = loop_ref()
+        if owner is None or owner.is_closed():
+            del _limits[key]
+
+
+def loop_semaphore(name: str, limit: int) -> asyncio.Semaphore:
+    """Return the semaphore ``name`` of the running loop, allowing ``limit`` holders.
+
+    ``limit`` only applies when the semaphore is created for the running loop.
+    """
+    loop = asyncio.get_running_loop()
+    key = (name, id(loop))
+    entry = _limits.get(key)
+    if entry is not None:
+        loop_ref, semaphore = entry
+        # A recycled loop id can point at a semaphore bound to a dead loop
+        if loop_ref() is loop:
+            return semaphore
+    _forget_stale_limits()
+    semaphore = asyncio.Semaphore(max(1, limit))
+    _limits[key] = (weakref.ref(loop), semaphore)
+    return semaphore
+
+
+__all__ = ["loop_semaphore"]
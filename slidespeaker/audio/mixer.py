@@ -0,0 +1,157 @@
+"""
+Podcast dialogue mixing for SlideSpeaker (audio package).
+
+The timeline is planned before anything is mixed: each turn starts
+``PODCAST_TURN_GAP`` seconds after the previous one ends, less
+``PODCAST_CROSSFADE``. When the crossfade is longer than the gap, consecutive
+turns overlap and are crossfaded. The audio step stores the planned start and
+end of every line, subtitles are rendered from those timings, and the compose
+step mixes the segments to exactly the same plan.
+
+The mix is one ffmpeg run with one filter graph. Every segment is decoded into
+a common format, so segments with different codecs, sample rates or channel
+layouts can be mixed together. Each segment is cut or padded to its planned
+slot. Runs of back-to-back turns are joined with ``concat``, and overlapping
+turns with ``acrossfade``. The filters stream, so memory use does not grow
+with podcast length.
+"""
+
+import os
+import subprocess
+import uuid
+from collections.abc import Sequence
+from pathlib import Path
+from typing import TypedDict
+
+from loguru import logger
+
+from .mp3 import iter_frames
+from .probe import record_duration
+
+MIX_SAMPLE_RATE = 44100
+MIX_CHANNEL_LAYOUT = "mono"
+MIX_BITRATE = "128k"
+
+
+class DialogueTurn(TypedDict):
+    """One segment placed on the podcast timeline."""
+
+    path: str
+    start: float
+    end: float
+
+
+def plan_timeline(
+    durations: Sequence[float], gap: float = 0.0, crossfade: float = 0.0
+) -> list[tuple[float, float]]:
+    """Return the (start, end) of each segment in the mixed podcast.
+
+    An overlap never exceeds half of either neighbouring segment, so turns
+    always stay in dialogue order.
+    """
+    timeline: list[tuple[float, float]] = []
+    offset = gap - crossfade
+    cursor = 0.0
+    previous = 0.0
+    for index, duration in enumerate(durations):
+        duration = max(0.0, float(duration))
+        if index:
+            step = offset
+            if step < 0:
+                step = -min(-step, previous / 2, duration / 2)
+            cursor += step
+        timeline.append((cursor, cursor + duration))
+        cursor += duration
+        previous = duration
+    return timeline
+
+
+def _filter_graph(turns: Sequence[DialogueTurn]) -> str:
+    fmt = (
+        f"aresample={MIX_SAMPLE_RATE},aformat=sample_fmts=fltp"
+        f":sample_rates={MIX_SAMPLE_RATE}:channel_layouts={MIX_CHANNEL_LAYOUT}"
+    )
+    lines: list[str] = []
+    groups: list[list[str]] = [[]]
+    overlaps: list[float] = []
+    for index, turn in enumerate(turns):
+        duration = max(0.0, turn["end"] - turn["start"])
+        following = turns[index + 1]["start"] if index + 1 < len(turns) else None
+        gap = 0.0 if following is None else following - turn["end"]
+        # Cut to the planned length; pad with the pause before the next turn.
+        # (apad straight into acrossfade can stall ffmpeg, so only pad pauses)
+        chain = f"[{index}:a]{fmt},atrim=end={duration:.6f}"
+        if gap > 0:
+            chain += f",apad=whole_dur={duration + gap:.6f}"
+        lines.append(f"{chain}[s{index}]")
+        groups[-1].append(f"[s{index}]")
+        if gap < 0:
+            overlaps.append(-gap)
+            groups.append([])
+
+    joined: list[str] = []
+    for index, group in enumerate(groups):
+        if len(group) == 1:
+            joined.append(group[0])
+            continue
+        lines.append(f"{''.join(group)}concat=n={len(group)}:v=0:a=1[g{index}]")
+        joined.append(f"[g{index}]")
+
+    current = joined[0]
+    for index, (label, overlap) in enumerate(zip(joined[1:], overlaps, strict=True)):
+        lines.append(f"{current}{label}acrossfade=d={overlap:.6f}[x{index}]")
+        current = f"[x{index}]"
+    lines.append(f"{current}anull[out]")
+    return ";\n".join(lines)
+
+
+def mix_dialogue(turns: Sequence[DialogueTurn], output: Path | str) -> float:
+    """Mix ``turns`` into an MP3 at ``output``; return its duration in seconds.
+
+    Raises:
+        ValueError: If ``turns`` is empty
+        RuntimeError: If ffmpeg fails
+    """
+    if not turns:
+        raise ValueError("No dialogue turns to mix")
+    output_path = Path(output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    token = uuid.uuid4().hex
+    script = output_path.with_name(f".{output_path.stem}.{token}.filter")
+    tmp = output_path.with_name(f".{output_path.stem}.{token}.mp3")
+    cmd = ["ffmpeg", "-y", "-hide_banner", "-nostats", "-v", "error"]
+    for turn in turns:
+        cmd += ["-i", str(turn["path"])]
+    # The graph goes in a file: one line per segment outgrows argv limits
+    cmd += [
+        "-filter_complex_script",
+        str(script),
+        "-map",
+        "[out]",
+        "-map_metadata",
+        "-1",
+        "-c:a",
+        "libmp3lame",
+        "-b:a",
+        MIX_BITRATE,
+        str(tmp),
+    ]
+    try:
+        script.write_text(_filter_graph(turns), encoding="utf-8")
+        res = subprocess.run(cmd, capture_output=True, text=True)
+        if res.returncode != 0:
+            raise RuntimeError(f"ffmpeg mix failed: {res.stderr[-400:]}")
+        with tmp.open("rb") as f:
+            if next(iter_frames(f.read(64 * 1024)), None) is None:
+                raise RuntimeError("ffmpeg mix produced no audio")
+        os.replace(tmp, output_path)
+    finally:
+        script.unlink(missing_ok=True)
+        tmp.unlink(missing_ok=True)
+    duration = turns[-1]["end"]
+    record_duration(output_path, duration)
+    logger.info(f"Mixed {len(turns)} dialogue turns into {output_path}")
+    return duration
+
+
+__all__ = ["DialogueTurn", "mix_dialogue", "plan_timeline"]
@@ -0,0 +1,239 @@
+"""
+MP3 frame parsing helpers for SlideSpeaker (audio package).
+
+TTS providers return MPEG Layer III streams. Walking the frame headers as the
+bytes arrive gives the exact clip duration without decoding the audio or
+shelling out to ffprobe after the file is written.
+"""
+
+from collections.abc import Iterator
+from typing import NamedTuple
+
+# Layer III bitrates in kbps, indexed by the header's bitrate index
+_BITRATES_V1 = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320)
+_BITRATES_V2 = (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)
+
+# Sample rates by MPEG version id (3 = MPEG-1, 2 = MPEG-2, 0 = MPEG-2.5)
+_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    0: (11025, 12000, 8000),
+}
+
+HEADER_SIZE = 4
+ID3_HEADER_SIZE = 10
+
+
+class FrameHeader(NamedTuple):
+    """Decoded fields of one frame header."""
+
+    length: int
+    samples: int
+    sample_rate: int
+
+
+def parse_frame_header(header: bytes | bytearray | memoryview) -> FrameHeader | None:
+    """Parse a 4-byte Layer III frame header; None if it is not a valid header."""
+    if len(header) < HEADER_SIZE:
+        return None
+    b0, b1, b2 = header[0], header[1], header[2]
+    if b0 != 0xFF or (b1 & 0xE0) != 0xE0:
+        return None
+    version = (b1 >> 3) & 0x03
+    layer = (b1 >> 1) & 0x03
+    bitrate_index = (b2 >> 4) & 0x0F
+    rate_index = (b2 >> 2) & 0x03
+    if version == 1 or layer != 1 or rate_index == 3:
+        return None
+    if bitrate_index in (0, 15):
+        return None
+    padding = (b2 >> 1) & 0x01
+    sample_rate = _SAMPLE_RATES[version][rate_index]
+    if version == 3:
+        bitrate = _BITRATES_V1[bitrate_index] * 1000
+        samples = 1152
+    else:
+        bitrate = _BITRATES_V2[bitrate_index] * 1000
+        samples = 576
+    length = (samples // 8) * bitrate // sample_rate + padding
+    return FrameHeader(length, samples, sample_rate)
+
+
+def id3v2_size(data: bytes | bytearray | memoryview) -> int | None:
+    """Return the total size of a leading ID3v2 tag, 0 if absent, None if short."""
+    if len(data) < 3:
+        return None
+    if bytes(data[:3]) != b"ID3":
+        return 0
+    if len(data) < ID3_HEADER_SIZE:
+        return None
+    flags = data[5]
+    size = 0
+    for byte in data[6:10]:
+        size = (size << 7) | (byte & 0x7F)
+    footer = ID3_HEADER_SIZE if flags & 0x10 else 0
+    return ID3_HEADER_SIZE + size + footer
+
+
+def is_info_frame(frame: bytes | bytearray | memoryview) -> bool:
+    """True for a Xing/Info/VBRI header frame, which carries no audio."""
+    head = bytes(frame[:64])
+    return b"Xing" in head or b"Info" in head or b"VBRI" in head
+
+
+class MP3DurationCounter:
+    """Incrementally count MP3 frames and their duration from streamed bytes."""
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._skip = 0
+        self._started = False
+        self.frames = 0
+        self.seconds = 0.0
+
+    def feed(self, chunk: bytes) -> None:
+        """Consume the next chunk of the stream."""
+        if self._skip:
+            consumed = min(self._skip, len(chunk))
+            self._skip -= consumed
+            chunk = chunk[consumed:]
+        self._buffer += chunk
+        pos = 0
+        buf = self._buffer
+        if not self._started:
+            tag = id3v2_size(buf)
+            if tag is None:
+                return
+            self._started = True
+            pos = tag
+        while pos + HEADER_SIZE <= len(buf):
+            header = parse_frame_header(buf[pos : pos + HEADER_SIZE])
+            if header is None:
+                pos += 1
+                continue
+            if pos + header.length > len(buf):
+                break
+            if not (self.frames == 0 and is_info_frame(buf[pos : pos + header.length])):
+                self.frames += 1
+                self.seconds += header.samples / header.sample_rate
+            pos += header.length
+        if pos > len(buf):
+            self._skip = pos - len(buf)
+            pos = len(buf)
+        del buf[:pos]
+
+    @property
+    def duration(self) -> float:
+        return self.seconds
+
+
+def iter_frames(data: bytes | memoryview) -> Iterator[tuple[int, FrameHeader]]:
+    """Yield (offset, header) for each audio frame of a complete MP3 byte string.
+
+    Leading ID3v2 tags, the Xing/Info header frame and bytes that do not form
+    a valid frame are skipped.
+    """
+    view = memoryview(data)
+    pos = id3v2_size(view) or 0
+    first = True
+    while pos + HEADER_SIZE <= len(view):
+        header = parse_frame_header(view[pos : pos + HEADER_SIZE])
+        if header is None or pos + header.length > len(view):
+            pos += 1
+            continue
+        if not (first and is_info_frame(view[pos : pos + header.length])):
+            yield pos, header
+        first = False
+        pos += header.length
+
+
+def audio_frames(data: bytes) -> tuple[bytes, float, int | None]:
+    """Return (audio frames, duration, sample rate) of a complete MP3 byte string.
+
+    Only audio frames are kept, so the frames of several clips can be joined
+    back to back into one valid stream.
+    """
+    view = memoryview(data)
+    out = bytearray()
+    seconds = 0.0
+    sample_rate: int | None = None
+    for pos, header in iter_frames(view):
+        out += view[pos : pos + header.length]
+        seconds += header.samples / header.sample_rate
+        sample_rate = sample_rate or header.sample_rate
+    return bytes(out), seconds, sample_rate
+
+
+def stream_signature(frame: bytes | memoryview) -> tuple[int, int, int]:
+    """Return the (version, sample rate index, channel mode) bits of a frame.
+
+    Frames can only be concatenated into one stream when these match.
+    """
+    return ((frame[1] >> 3) & 0x03, (frame[2] >> 2) & 0x03, (frame[3] >> 6) & 0x03)
+
+
+def _side_info_size(version: int, channel_mode: int) -> int:
+    mono = channel_mode == 3
+    if version == 3:
+        return 17 if mono else 32
+    return 9 if mono else 17
+
+
+def build_xing_frame(
+    template: bytes | memoryview,
+    frame_count: int,
+    byte_count: int,
+    toc: list[int],
+    vbr: bool,
+) -> bytes:
+    """Build a Xing (VBR) or Info (CBR) header frame for a concatenated stream.
+
+    ``template`` is the first audio frame; the header frame copies its
+    version, sample rate and channel mode so decoders accept it, and carries
+    the frame count, total byte count and a 100-entry seek table.
+    """
+    version = (template[1] >> 3) & 0x03
+    rate_index = (template[2] >> 2) & 0x03
+    channel_bits = template[3]
+    offset = HEADER_SIZE + _side_info_size(version, (channel_bits >> 6) & 0x03)
+    needed = offset + 120
+    for bitrate_index in range(1, 15):
+        b1 = 0xE0 | (version << 3) | (0x01 << 1) | 0x01  # Layer III, no CRC
+        b2 = (bitrate_index << 4) | (rate_index << 2)
+        header = bytes([0xFF, b1, b2, channel_bits])
+        parsed = parse_frame_header(header)
+        if parsed is not None and parsed.length >= needed:
+            break
+    else:
+        raise ValueError("No bitrate yields a frame large enough for a Xing header")
+
+    body = bytearray(parsed.length)
+    body[:HEADER_SIZE] = header
+    tag = bytearray(b"Xing" if vbr else b"Info")
+    tag += (0x0007).to_bytes(4, "big")  # frames, bytes and TOC present
+    tag += frame_count.to_bytes(4, "big")
+    tag += (byte_count + parsed.length).to_bytes(4, "big")
+    tag += bytes(max(0, min(255, v)) for v in toc[:100]).ljust(100, b"\xff")
+    body[offset : offset + len(tag)] = tag
+    return bytes(body)
+
+
+def mp3_duration(data: bytes) -> float:
+    """Return the duration in seconds of a complete MP3 byte string."""
+    counter = MP3DurationCounter()
+    counter.feed(data)
+    return counter.duration
+
+
+__all__ = [
+    "FrameHeader",
+    "MP3DurationCounter",
+    "audio_frames",
+    "build_xing_frame",
+    "id3v2_size",
+    "is_info_frame",
+    "iter_frames",
+    "mp3_duration",
+    "parse_frame_header",
+    "stream_signature",
+]
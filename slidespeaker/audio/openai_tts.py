@@ -7,18 +7,28 @@ It supports multiple voices and languages through the OpenAI TTS models.
 
 from pathlib import Path
 
-from fastapi.concurrency import run_in_threadpool
 from loguru import logger
 
 from slidespeaker.configs.config import config
-from slidespeaker.llm import tts_speech_stream
+from slidespeaker.llm import tts_speech_stream_async
 
+from .streaming import stream_to_file
 from .tts_interface import TTSInterface
 
 
 class OpenAITTSService(TTSInterface):
     """OpenAI TTS implementation"""
 
+    # Language-specific voice mapping
+    VOICE_MAPPING: dict[str, str] = {
+        "english": "alloy",
+        "simplified_chinese": "onyx",
+        "traditional_chinese": "onyx",
+        "japanese": "nova",
+        "korean": "shimmer",
+        "thai": "alloy",
+    }
+
     def __init__(self) -> None:
         """Initialize the OpenAI TTS service with API client and configuration"""
         api_key = config.openai_api_key
@@ -48,36 +58,21 @@ class OpenAITTSService(TTSInterface):
         if not text or not text.strip():
             raise ValueError("Text is empty or contains only whitespace")
 
-        # Language-specific voice mapping
-        voice_mapping: dict[str, str] = {
-            "english": "alloy",
-            "simplified_chinese": "onyx",
-            "traditional_chinese": "onyx",
-            "japanese": "nova",
-            "korean": "shimmer",
-            "thai": "alloy",
-        }
-
-        use_voice = voice or voice_mapping.get(language, self.default_voice)
+        use_voice, _ = self.resolve_voice(language, voice)
 
         try:
             logger.info(
                 f"TTS request: model={self.model}, voice={use_voice}, language={language}, "
                 f"text_len={len(text.strip())}"
             )
-            stream = await run_in_threadpool(
-                tts_speech_stream,
+            stream = tts_speech_stream_async(
                 model=self.model,
                 voice=use_voice,
                 input_text=text.strip(),
             )
+            duration = await stream_to_file(stream, output_path)
 
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with output_path.open("wb") as f:
-                for chunk in stream:
-                    f.write(chunk)
-
-            logger.info(f"Generated OpenAI TTS: {output_path}")
+            logger.info(f"Generated OpenAI TTS: {output_path} ({duration:.2f}s)")
 
         except Exception as e:
             logger.error(
@@ -85,6 +80,12 @@ class OpenAITTSService(TTSInterface):
             )
             raise
 
+    def resolve_voice(
+        self, language: str = "english", voice: str | None = None
+    ) -> tuple[str, str]:
+        """Return the voice and model OpenAI TTS uses for a request"""
+        return voice or self.VOICE_MAPPING.get(language, self.default_voice), self.model
+
     def is_available(self) -> bool:
         """Check if OpenAI TTS is available"""
         return bool(config.openai_api_key)
@@ -0,0 +1,240 @@
+"""
+TTS clip post-processing for SlideSpeaker (audio package).
+
+Clips come back from TTS providers with uneven loudness and a little silence
+at either end. One ffmpeg pass per clip trims that silence, applies EBU R128
+loudness normalisation and runs silence detection on the result, then
+re-encodes in the clip's own format. The silences found in that pass are saved
+next to the clip (``slide_1.audio.json``) so subtitle timing and podcast
+composition reuse them instead of decoding the clip again.
+
+Chunked clips (see ``chunking``) and clips with provider word timings (see
+``alignment``) are normalised but not trimmed, so their timestamps stay exact.
+Processing is best effort: if ffmpeg is missing or fails, the original clip is
+kept unchanged.
+"""
+
+import asyncio
+import json
+import os
+import re
+import uuid
+from pathlib import Path
+from typing import Any, TypedDict
+
+from loguru import logger
+
+from slidespeaker.configs.config import config
+
+from .alignment import read_words, write_words
+from .limits import loop_semaphore
+from .mp3 import iter_frames, mp3_duration
+from .probe import record_duration
+
+METADATA_SUFFIX = ".audio.json"
+
+# Pauses worth aligning subtitle cues to
+SILENCE_DETECT_FILTER = "silencedetect=noise=-35dB:d=0.28"
+# Leading/trailing silence quieter than this is cut down to TRIM_KEEP seconds
+TRIM_THRESHOLD = "-50dB"
+TRIM_KEEP = 0.1
+
+_SILENCE_RE = re.compile(r"silence_(?:start|end):\s*([0-9.]+)")
+
+
+class ClipMetadata(TypedDict):
+    """Measurements saved next to a post-processed clip."""
+
+    duration: float
+    silences: list[float]
+    trimmed: bool
+    loudness: float
+    size: int
+    mtime_ns: int
+
+
+def parse_silences(output: str, duration: float | None = None) -> list[float]:
+    """Collect sorted, de-duplicated silence timestamps from silencedetect logs."""
+    values: list[float] = []
+    for match in _SILENCE_RE.finditer(output):
+        try:
+            ts = float(match.group(1))
+        except ValueError:
+            continue
+        if ts > 0.0 and (duration is None or ts < duration):
+            values.append(ts)
+    deduped: list[float] = []
+    seen: set[float] = set()
+    for ts in sorted(values):
+        key = round(ts, 2)
+        if key not in seen:
+            seen.add(key)
+            deduped.append(ts)
+    return deduped
+
+
+def metadata_path(audio_path: Path) -> Path:
+    """Return the metadata sidecar path for ``audio_path``."""
+    return audio_path.with_suffix(METADATA_SUFFIX)
+
+
+def read_clip_metadata(audio_path: Path | str | None) -> ClipMetadata | None:
+    """Load metadata for ``audio_path`` if it still describes the file on disk."""
+    if audio_path is None:
+        return None
+    path = Path(audio_path)
+    try:
+        data: Any = json.loads(metadata_path(path).read_text("utf-8"))
+        stat = path.stat()
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    # A clip re-synthesised after processing no longer matches its sidecar
+    if data.get("size") != stat.st_size or data.get("mtime_ns") != stat.st_mtime_ns:
+        return None
+    try:
+        return {
+            "duration": float(data["duration"]),
+            "silences": [float(ts) for ts in data["silences"]],
+            "trimmed": bool(data["trimmed"]),
+            "loudness": float(data["loudness"]),
+            "size": int(data["size"]),
+            "mtime_ns": int(data["mtime_ns"]),
+        }
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _write_metadata(audio_path: Path, metadata: ClipMetadata) -> None:
+    path = metadata_path(audio_path)
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    tmp.write_text(json.dumps(metadata), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _source_format(data: bytes) -> tuple[int, int, int] | None:
+    """Return (sample_rate, kbps, channels) of the first audio frame."""
+    for pos, header in iter_frames(data):
+        kbps = round(header.length * 8 * header.sample_rate / header.samples / 1000)
+        channels = 1 if data[pos + 3] >> 6 == 3 else 2
+        return header.sample_rate, kbps, channels
+    return None
+
+
+def _filter_chain(trim: bool, sample_rate: int) -> str:
+    filters: list[str] = []
+    if trim:
+        # Trim the start, then the (reversed) end
+        remove = (
+            f"silenceremove=start_periods=1:start_silence={TRIM_KEEP}"
+            f":start_threshold={TRIM_THRESHOLD}"
+        )
+        filters += [remove, "areverse", remove, "areverse"]
+    filters += [
+        f"loudnorm=I={config.audio_loudness_target}:TP=-1.5:LRA=11",
+        # loudnorm upsamples internally; return to the clip's own rate
+        f"aresample={sample_rate}",
+        SILENCE_DETECT_FILTER,
+    ]
+    return ",".join(filters)
+
+
+def _semaphore() -> asyncio.Semaphore:
+    return loop_semaphore("postprocess", config.audio_postprocess_concurrency)
+
+
+async def postprocess_clip(
+    audio_path: Path | str, trim: bool = True
+) -> ClipMetadata | None:
+    """Trim and loudness-normalise ``audio_path`` in place; return its metadata.
+
+    Returns None (leaving the clip untouched) when the clip cannot be processed.
+    """
+    path = Path(audio_path)
+    try:
+        source = await asyncio.to_thread(path.read_bytes)
+    except OSError as e:
+        logger.warning(f"Cannot post-process {path}: {e}")
+        return None
+    fmt = _source_format(source)
+    if fmt is None:
+        logger.warning(f"Skipping post-processing of {path}: no MP3 frames")
+        return None
+    sample_rate, kbps, channels = fmt
+    # Word timings survive normalisation but would be shifted by trimming
+    words = await asyncio.to_thread(read_words, path)
+    trim = trim and not words
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.mp3")
+    cmd = [
+        "ffmpeg",
+        "-hide_banner",
+        "-nostats",
+        "-y",
+        "-i",
+        str(path),
+        "-af",
+        _filter_chain(trim, sample_rate),
+        "-map_metadata",
+        "-1",
+        "-id3v2_version",
+        "0",
+        "-ac",
+        str(channels),
+        "-c:a",
+        "libmp3lame",
+        "-b:a",
+        f"{kbps}k",
+        str(tmp),
+    ]
+    try:
+        async with _semaphore():
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            _, stderr = await proc.communicate()
+        if proc.returncode != 0:
+            tail = stderr.decode("utf-8", "replace")[-400:]
+            logger.warning(f"Post-processing failed for {path}: {tail}")
+            return None
+        processed = await asyncio.to_thread(tmp.read_bytes)
+        duration = mp3_duration(processed)
+        if duration <= 0:
+            logger.warning(f"Post-processing produced no audio for {path}")
+            return None
+        os.replace(tmp, path)
+    except FileNotFoundError:
+        logger.debug("ffmpeg not found; skipping audio post-processing")
+        return None
+    finally:
+        tmp.unlink(missing_ok=True)
+
+    stat = path.stat()
+    metadata: ClipMetadata = {
+        "duration": duration,
+        "silences": parse_silences(stderr.decode("utf-8", "replace"), duration),
+        "trimmed": trim,
+        "loudness": float(config.audio_loudness_target),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+    await asyncio.to_thread(_write_metadata, path, metadata)
+    if words:
+        await asyncio.to_thread(write_words, path, words, "tts")
+    record_duration(path, duration)
+    logger.debug(
+        f"Post-processed {path.name}: {mp3_duration(source):.2f}s -> {duration:.2f}s"
+    )
+    return metadata
+
+
+__all__ = [
+    "ClipMetadata",
+    "SILENCE_DETECT_FILTER",
+    "metadata_path",
+    "parse_silences",
+    "postprocess_clip",
+    "read_clip_metadata",
+]
@@ -0,0 +1,131 @@
+"""
+Shared media duration probe for SlideSpeaker (audio package).
+
+Durations are cached per file fingerprint (resolved path, size, mtime), so a
+clip is measured at most once however many pipeline steps ask for it. TTS
+writers record the duration as soon as a clip lands on disk, which lets later
+consumers (subtitle timing, podcast segment timing, composition) read it without
+decoding the file again. A rewritten file gets a new fingerprint and is probed
+afresh.
+"""
+
+import subprocess
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from loguru import logger
+
+MAX_ENTRIES = 4096
+
+_Fingerprint = tuple[str, int, int]
+
+_durations: "OrderedDict[_Fingerprint, float]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def _fingerprint(path: Path) -> _Fingerprint | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+
+
+def _remember(key: _Fingerprint, duration: float) -> None:
+    with _lock:
+        _durations[key] = duration
+        _durations.move_to_end(key)
+        while len(_durations) > MAX_ENTRIES:
+            _durations.popitem(last=False)
+
+
+def _ffprobe_duration(path: Path) -> float | None:
+    cmd = [
+        "ffprobe",
+        "-v",
+        "error",
+        "-show_entries",
+        "format=duration",
+        "-of",
+        "default=noprint_wrappers=1:nokey=1",
+        str(path),
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=15)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+    try:
+        return float(result.stdout.strip().splitlines()[0])
+    except (IndexError, ValueError):
+        return None
+
+
+def _decoder_duration(path: Path) -> float | None:
+    try:
+        from moviepy import AudioFileClip
+
+        with AudioFileClip(str(path)) as clip:
+            return float(getattr(clip, "duration", 0.0) or 0.0)
+    except Exception:
+        return None
+
+
+def record_duration(path: Path | str, duration: float) -> None:
+    """Store a known duration for ``path`` (e.g. right after TTS wrote it)."""
+    key = _fingerprint(Path(path))
+    if key is not None and duration > 0:
+        _remember(key, float(duration))
+
+
+def cached_duration(path: Path | str) -> float | None:
+    """Return the cached duration for ``path`` without probing, if known."""
+    key = _fingerprint(Path(path))
+    if key is None:
+        return None
+    with _lock:
+        duration = _durations.get(key)
+        if duration is not None:
+            _durations.move_to_end(key)
+        return duration
+
+
+def probe_duration(path: Path | str) -> float | None:
+    """Return the duration of a media file in seconds, probing at most once.
+
+    Uses ffprobe and falls back to decoding with MoviePy. Returns None when the
+    file is missing, empty or cannot be measured; failures are not cached.
+    """
+    path = Path(path)
+    key = _fingerprint(path)
+    if key is None or key[1] == 0:
+        return None
+    with _lock:
+        duration = _durations.get(key)
+        if duration is not None:
+            _durations.move_to_end(key)
+            return duration
+    duration = _ffprobe_duration(path)
+    if not duration or duration <= 0:
+        duration = _decoder_duration(path)
+    if not duration or duration <= 0:
+        logger.warning(f"Could not determine media duration for {path}")
+        return None
+    _remember(key, duration)
+    return duration
+
+
+def clear_duration_cache() -> None:
+    """Forget all cached durations."""
+    with _lock:
+        _durations.clear()
+
+
+__all__ = [
+    "cached_duration",
+    "clear_duration_cache",
+    "probe_duration",
+    "record_duration",
+]
@@ -0,0 +1,167 @@
+"""
+Concurrent TTS scheduling for SlideSpeaker (audio package).
+
+Pipeline steps hand the scheduler a list of clips to synthesise. Clips run
+concurrently up to the provider's limit, each clip is retried on its own when
+synthesis fails, and results come back in submission order regardless of which
+request finishes first. Limits are shared by every scheduler in the process, so
+two steps running side by side never exceed a provider's budget together.
+
+Scripts longer than ``TTS_CHUNK_MAX_CHARS`` are synthesised as sentence-aligned
+chunks that share the same limit and retry independently, then stitched into
+the requested clip (see ``chunking``).
+
+Each finished clip is post-processed (silence trim, loudness normalisation)
+straight away, so that work overlaps with synthesis of the remaining clips
+(see ``postprocess``). In aligned subtitle timing mode it is then force-aligned
+against its script (see ``alignment``), unless the provider already returned
+word timings with the audio.
+"""
+
+import asyncio
+from pathlib import Path
+from typing import TypedDict
+
+from loguru import logger
+
+from slidespeaker.configs.config import config
+
+from .alignment import align_clip, read_words, words_path
+from .chunking import clear_anchors, plan_chunks, stitch_clips
+from .generator import AudioGenerator
+from .limits import loop_semaphore
+from .postprocess import postprocess_clip
+
+DEFAULT_PROVIDER_CONCURRENCY = 2
+
+
+class TTSJob(TypedDict):
+    """One clip to synthesise."""
+
+    text: str
+    output_path: Path
+    language: str
+    voice: str | None
+
+
+def provider_concurrency(provider: str) -> int:
+    """Return the configured number of concurrent requests for ``provider``."""
+    limit = getattr(config, f"{provider}_tts_concurrency", None)
+    return max(1, int(limit or DEFAULT_PROVIDER_CONCURRENCY))
+
+
+def _provider_semaphore(provider: str) -> asyncio.Semaphore:
+    return loop_semaphore(f"tts:{provider}", provider_concurrency(provider))
+
+
+class TTSScheduler:
+    """Bounded-concurrency TTS runner with ordered results and per-clip retries."""
+
+    def __init__(
+        self,
+        audio_generator: AudioGenerator,
+        max_retries: int | None = None,
+        retry_backoff: float = 1.0,
+    ) -> None:
+        self.audio_generator = audio_generator
+        self.provider = audio_generator.provider
+        self.max_retries = (
+            config.tts_max_retries if max_retries is None else max(0, max_retries)
+        )
+        self.retry_backoff = retry_backoff
+        self.chunk_max_chars = config.tts_chunk_max_chars
+        self.postprocess = config.audio_postprocess_enabled
+        self.align = config.subtitle_timing_mode == "aligned"
+
+    async def _synthesise_text(
+        self, label: str, text: str, output_path: Path, job: TTSJob
+    ) -> bool:
+        attempts = self.max_retries + 1
+        for attempt in range(1, attempts + 1):
+            async with _provider_semaphore(self.provider):
+                ok = await self.audio_generator.generate_audio(
+                    text,
+                    str(output_path),
+                    language=job["language"],
+                    voice=job["voice"],
+                )
+            if ok:
+                return True
+            if attempt < attempts:
+                delay = self.retry_backoff * (2 ** (attempt - 1))
+                logger.warning(
+                    f"TTS {label} failed (attempt {attempt}/{attempts}); "
+                    f"retrying in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+        logger.error(f"TTS {label} failed after {attempts} attempts")
+        return False
+
+    async def _synthesise(self, index: int, job: TTSJob) -> bool:
+        chunks = plan_chunks(job["text"], self.chunk_max_chars)
+        chunked = len(chunks) > 1
+        if chunked:
+            ok = await self._synthesise_chunks(index, job, chunks)
+        else:
+            clear_anchors(job["output_path"])
+            ok = await self._synthesise_text(
+                f"clip {index + 1}", job["text"], job["output_path"], job
+            )
+        if ok and self.postprocess:
+            # Trimming would shift the chunk anchors, so chunked clips keep theirs
+            await postprocess_clip(
+                job["output_path"], trim=config.audio_trim_silence and not chunked
+            )
+        if ok and self.align and not read_words(job["output_path"]):
+            # Aligned last, so the word times describe the final audio
+            await align_clip(job["output_path"], job["text"])
+        return ok
+
+    async def _synthesise_chunks(
+        self, index: int, job: TTSJob, chunks: list[str]
+    ) -> bool:
+        output_path = job["output_path"]
+        parts = [
+            output_path.with_name(f".{output_path.stem}.part{n:03d}.mp3")
+            for n in range(len(chunks))
+        ]
+        logger.info(
+            f"TTS clip {index + 1}: {len(job['text'])} chars in {len(chunks)} chunks"
+        )
+        try:
+            results = await asyncio.gather(
+                *(
+                    self._synthesise_text(
+                        f"clip {index + 1} chunk {n + 1}/{len(chunks)}", text, part, job
+                    )
+                    for n, (text, part) in enumerate(zip(chunks, parts, strict=True))
+                )
+            )
+            if not all(results):
+                return False
+            await asyncio.to_thread(stitch_clips, parts, chunks, output_path)
+            return True
+        except Exception as e:
+            logger.error(f"Could not stitch TTS chunks for clip {index + 1}: {e}")
+            return False
+        finally:
+            for part in parts:
+                part.unlink(missing_ok=True)
+                words_path(part).unlink(missing_ok=True)
+
+    async def run(self, jobs: list[TTSJob]) -> list[bool]:
+        """Synthesise all jobs; return success flags in the order of ``jobs``."""
+        if not jobs:
+            return []
+        logger.info(
+            f"Synthesising {len(jobs)} TTS clips via {self.provider} "
+            f"(concurrency={provider_concurrency(self.provider)})"
+        )
+        return list(
+            await asyncio.gather(
+                *(self._synthesise(index, job) for index, job in enumerate(jobs))
+            )
+        )
+
+
+__all__ = ["TTSJob", "TTSScheduler", "provider_concurrency"]
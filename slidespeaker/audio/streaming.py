@@ -0,0 +1,56 @@
+"""
+Streaming TTS writer for SlideSpeaker (audio package).
+
+Speech is written to disk chunk by chunk as it arrives from the provider, so a
+clip never has to be held in memory and the event loop is not blocked by file
+I/O. The MP3 frames are counted on the way through, which gives the clip's
+duration without a separate probe once the file is complete.
+"""
+
+import os
+import uuid
+from collections.abc import AsyncIterable
+from pathlib import Path
+
+import aiofiles
+from loguru import logger
+
+from .mp3 import MP3DurationCounter
+from .probe import record_duration
+
+
+async def stream_to_file(chunks: AsyncIterable[bytes], output_path: Path) -> float:
+    """Write streamed audio to ``output_path`` and return its duration.
+
+    The stream goes to a temporary file that replaces ``output_path`` only when
+    complete, so readers never see a partial clip and a path that is hardlinked
+    elsewhere (e.g. to the clip cache) is replaced rather than overwritten.
+    The duration is 0.0 when the stream holds no recognisable MP3 frames.
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_name(f".{output_path.name}.{uuid.uuid4().hex}.part")
+    counter = MP3DurationCounter()
+    written = 0
+    try:
+        async with aiofiles.open(tmp_path, "wb") as f:
+            async for chunk in chunks:
+                if not chunk:
+                    continue
+                counter.feed(chunk)
+                await f.write(chunk)
+                written += len(chunk)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    duration = counter.duration
+    if duration > 0:
+        record_duration(output_path, duration)
+    logger.debug(
+        f"Streamed {written} bytes to {output_path} ({counter.frames} frames, "
+        f"{duration:.2f}s)"
+    )
+    return duration
+
+
+__all__ = ["stream_to_file"]
@@ -4,12 +4,15 @@ Abstract base class for Text-to-Speech services
 
 This module defines the interface that all TTS service implementations must follow.
 It provides a consistent API for generating speech from text with support for
-multiple languages and voices.
+multiple languages and voices. Services that can also report when each word is
+spoken implement ``generate_speech_with_timings``.
 """
 
 from abc import ABC, abstractmethod
 from pathlib import Path
 
+from .alignment import WordTiming
+
 
 class TTSInterface(ABC):
     """Abstract interface for TTS services"""
@@ -33,6 +36,54 @@ class TTSInterface(ABC):
         """
         pass
 
+    def resolve_voice(
+        self, language: str = "english", voice: str | None = None
+    ) -> tuple[str | None, str | None]:
+        """
+        Resolve the voice and model a request would really be synthesised with
+
+        Args:
+            language: Language of the text (default: "english")
+            voice: Requested voice, or None for the service default
+
+        Returns:
+            (voice, model) after applying the service's defaults and
+            language mapping; either may be None when the service cannot tell
+        """
+        return voice, None
+
+    def supports_word_timings(self) -> bool:
+        """
+        Check if the service returns word timestamps with the audio
+
+        Returns:
+            True if generate_speech_with_timings can return word timings
+        """
+        return False
+
+    async def generate_speech_with_timings(
+        self,
+        text: str,
+        output_path: Path,
+        language: str = "english",
+        voice: str | None = None,
+    ) -> list[WordTiming] | None:
+        """
+        Generate speech like generate_speech and report when each word is spoken
+
+        Args:
+            text: Text to convert to speech
+            output_path: Path to save the generated audio file
+            language: Language of the text (default: "english")
+            voice: Specific voice to use (default: service-specific default)
+
+        Returns:
+            Word timings in seconds from the start of the clip, or None when the
+            service does not provide them
+        """
+        await self.generate_speech(text, output_path, language, voice)
+        return None
+
     @abstractmethod
     def is_available(self) -> bool:
         """
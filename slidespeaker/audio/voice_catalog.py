@@ -0,0 +1,153 @@
+"""
+Process-wide TTS voice catalogue cache for SlideSpeaker (audio package).
+
+Voice lists change rarely, but they are requested for every clip a worker
+synthesises and on every page load in the UI, and some providers answer from a
+network API. Entries are kept in memory for ``TTS_CATALOG_TTL`` seconds. An
+expired entry is still served while a background task refreshes it, so only
+the very first request for a key waits for the provider. Concurrent misses for
+the same key share one load. Each entry carries an ETag derived from its
+content, so the API can answer conditional requests with 304.
+"""
+
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, NamedTuple
+
+from loguru import logger
+
+from slidespeaker.configs.config import config
+
+
+class CatalogEntry(NamedTuple):
+    """A cached catalogue payload and its validator."""
+
+    payload: Any
+    etag: str
+    fetched_at: float
+
+
+def catalog_etag(payload: Any) -> str:
+    """Return a strong ETag for a JSON-serialisable payload."""
+    body = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return f'"{hashlib.sha256(body.encode("utf-8")).hexdigest()[:32]}"'
+
+
+class VoiceCatalogCache:
+    """TTL cache with stale-while-refresh semantics for voice catalogues."""
+
+    def __init__(
+        self,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: dict[Hashable, CatalogEntry] = {}
+        self._lock = threading.Lock()
+        # In-flight loads, per event loop (tasks cannot be awaited across loops)
+        self._loads: dict[tuple[Hashable, int], asyncio.Task[CatalogEntry]] = {}
+
+    @property
+    def ttl(self) -> float:
+        return float(config.tts_catalog_ttl if self._ttl is None else self._ttl)
+
+    def _store(self, key: Hashable, payload: Any) -> CatalogEntry:
+        entry = CatalogEntry(payload, catalog_etag(payload), self._clock())
+        with self._lock:
+            self._entries[key] = entry
+        return entry
+
+    def peek(self, key: Hashable) -> CatalogEntry | None:
+        """Return the cached entry for ``key`` (fresh or stale) without loading."""
+        with self._lock:
+            return self._entries.get(key)
+
+    def is_fresh(self, entry: CatalogEntry) -> bool:
+        return self._clock() - entry.fetched_at < self.ttl
+
+    def get_sync(self, key: Hashable, loader: Callable[[], Any]) -> CatalogEntry:
+        """Return the entry for ``key``, loading it inline when missing or expired.
+
+        For loaders that are cheap and local (static voice tables).
+        """
+        entry = self.peek(key)
+        if entry is not None and self.is_fresh(entry):
+            return entry
+        try:
+            return self._store(key, loader())
+        except Exception as e:
+            if entry is None:
+                raise
+            logger.warning(f"Voice catalogue refresh failed for {key}: {e}")
+            return entry
+
+    async def get(
+        self, key: Hashable, loader: Callable[[], Awaitable[Any]]
+    ) -> CatalogEntry:
+        """Return the entry for ``key``; expired entries refresh in the background."""
+        entry = self.peek(key)
+        if entry is not None:
+            if not self.is_fresh(entry):
+                self._load(key, loader)
+            return entry
+        return await asyncio.shield(self._load(key, loader))
+
+    def _load(
+        self, key: Hashable, loader: Callable[[], Awaitable[Any]]
+    ) -> asyncio.Task[CatalogEntry]:
+        loop = asyncio.get_running_loop()
+        slot = (key, id(loop))
+        task = self._loads.get(slot)
+        if task is not None and not task.done():
+            return task
+
+        async def run() -> CatalogEntry:
+            try:
+                return self._store(key, await loader())
+            finally:
+                self._loads.pop(slot, None)
+
+        task = loop.create_task(run())
+        task.add_done_callback(lambda t: self._log_failure(key, t))
+        self._loads[slot] = task
+        return task
+
+    @staticmethod
+    def _log_failure(key: Hashable, task: asyncio.Task[CatalogEntry]) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Voice catalogue load failed for {key}: {task.exception()}")
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """Drop one entry, or every entry when ``key`` is None."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+
+def voices_key(provider: str, language: str) -> tuple[str, str, str]:
+    """Return the cache key of a provider's voice list for ``language``."""
+    return ("voices", provider, language)
+
+
+def voices_payload(provider: str, voices: list[str]) -> dict[str, Any]:
+    """Build the voice list entry shared by the API and the audio generator."""
+    return {"model": provider, "voices": list(voices)}
+
+
+voice_catalog = VoiceCatalogCache()
+
+__all__ = [
+    "CatalogEntry",
+    "VoiceCatalogCache",
+    "catalog_etag",
+    "voice_catalog",
+    "voices_key",
+    "voices_payload",
+]
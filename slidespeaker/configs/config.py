@@ -17,6 +17,7 @@ class Config:
     def __init__(self) -> None:
         self._output_dir: Path | None = None
         self._uploads_dir: Path | None = None
+        self._cache_dir: Path | None = None
 
         # Watermark
         self.watermark_enabled = (
@@ -36,6 +37,24 @@ class Config:
         self.ffmpeg_audio_codec = os.getenv("FFMPEG_AUDIO_CODEC", "aac")
         # Performance optimization flags
         self.ffmpeg_fast_mode = os.getenv("FFMPEG_FAST_MODE", "false").lower() == "true"
+        # Named encoding profile used when a task does not choose one
+        # (see slidespeaker/video/profiles.py)
+        self.ffmpeg_profile = os.getenv("FFMPEG_PROFILE", "default")
+        # Encode each slide as its own segment in a process pool and join the
+        # segments with the ffmpeg concat demuxer instead of one monolithic render
+        self.video_segmented_encoding = (
+            os.getenv("VIDEO_SEGMENTED_ENCODING", "false").lower() == "true"
+        )
+        self.video_segment_workers = int(
+            os.getenv("VIDEO_SEGMENT_WORKERS", str(min(4, os.cpu_count() or 1)))
+        )
+        # Render slides in memory-bounded windows; the budget caps RSS growth
+        # during composition and the window max caps slides per window
+        self.video_streaming_composition = (
+            os.getenv("VIDEO_STREAMING_COMPOSITION", "false").lower() == "true"
+        )
+        self.video_memory_budget_mb = int(os.getenv("VIDEO_MEMORY_BUDGET_MB", "500"))
+        self.video_stream_window_max = int(os.getenv("VIDEO_STREAM_WINDOW_MAX", "8"))
 
         # Logging / runtime
         self.log_level = os.getenv("LOG_LEVEL", "INFO").upper()
@@ -92,6 +111,8 @@ class Config:
         )
         self.openai_tts_model = os.getenv("OPENAI_TTS_MODEL", "tts-1")
         self.openai_tts_voice = os.getenv("OPENAI_TTS_VOICE", "alloy")
+        self.elevenlabs_api_key = os.getenv("ELEVENLABS_API_KEY")
+        self.elevenlabs_voice_id = os.getenv("ELEVENLABS_VOICE_ID")
 
         self.script_generate_model = os.getenv("SCRIPT_GENERATION_MODEL")
         self.script_review_model = os.getenv("SCRIPT_REVIEW_MODEL")
@@ -101,6 +122,59 @@ class Config:
         self.image_generation_model = os.getenv("IMAGE_GENERATION_MODEL")
         self.tts_model = os.getenv("TTS_MODEL")
         self.tts_voice = os.getenv("TTS_VOICE")
+        # Concurrent TTS requests allowed per provider, and retries per clip
+        self.openai_tts_concurrency = int(os.getenv("OPENAI_TTS_CONCURRENCY", "4"))
+        self.elevenlabs_tts_concurrency = int(
+            os.getenv("ELEVENLABS_TTS_CONCURRENCY", "2")
+        )
+        self.tts_max_retries = int(os.getenv("TTS_MAX_RETRIES", "2"))
+        # Longer scripts are synthesised as sentence-aligned chunks (0 disables)
+        self.tts_chunk_max_chars = int(os.getenv("TTS_CHUNK_MAX_CHARS", "1500"))
+        # Persistent clip cache (CACHE_DIR/tts), optionally shared via storage
+        self.tts_cache_enabled = (
+            os.getenv("TTS_CACHE_ENABLED", "true").lower() == "true"
+        )
+        self.tts_cache_max_mb = int(os.getenv("TTS_CACHE_MAX_MB", "1024"))
+        self.tts_cache_shared = os.getenv("TTS_CACHE_SHARED", "false").lower() == "true"
+        # Ask providers that can (e.g. ElevenLabs) for word timestamps with the audio
+        self.tts_word_timings = os.getenv("TTS_WORD_TIMINGS", "false").lower() == "true"
+        # Seconds a voice catalogue is served before it is refreshed in the background
+        self.tts_catalog_ttl = float(os.getenv("TTS_CATALOG_TTL", "3600"))
+        # Trim silence and normalise loudness of every synthesised clip
+        self.audio_postprocess_enabled = (
+            os.getenv("AUDIO_POSTPROCESS_ENABLED", "true").lower() == "true"
+        )
+        self.audio_trim_silence = (
+            os.getenv("AUDIO_TRIM_SILENCE", "true").lower() == "true"
+        )
+        self.audio_loudness_target = float(os.getenv("AUDIO_LOUDNESS_TARGET", "-16"))
+        self.audio_postprocess_concurrency = int(
+            os.getenv("AUDIO_POSTPROCESS_CONCURRENCY", str(os.cpu_count() or 2))
+        )
+        # Subtitle timing: "heuristic" (text weights + silences) or "aligned"
+        # (forced alignment of each clip; needs the 'align' extra)
+        self.subtitle_timing_mode = os.getenv(
+            "SUBTITLE_TIMING_MODE", "heuristic"
+        ).lower()
+        self.subtitle_align_concurrency = int(
+            os.getenv("SUBTITLE_ALIGN_CONCURRENCY", "1")
+        )
+        # Pause between podcast turns; a longer crossfade overlaps the turns
+        self.podcast_turn_gap = float(os.getenv("PODCAST_TURN_GAP", "0.25"))
+        self.podcast_crossfade = float(os.getenv("PODCAST_CROSSFADE", "0"))
+
+        # Avatar videos: provider, and how many render jobs run at once with
+        # their status polled on an adaptive interval (seconds)
+        self.avatar_service = os.getenv("AVATAR_SERVICE", "heygen")
+        self.heygen_api_key = os.getenv("HEYGEN_API_KEY")
+        self.avatar_max_concurrent_jobs = int(
+            os.getenv("AVATAR_MAX_CONCURRENT_JOBS", "3")
+        )
+        self.avatar_poll_interval = float(os.getenv("AVATAR_POLL_INTERVAL", "2"))
+        self.avatar_poll_max_interval = float(
+            os.getenv("AVATAR_POLL_MAX_INTERVAL", "30")
+        )
+        self.avatar_job_timeout = float(os.getenv("AVATAR_JOB_TIMEOUT", "1800"))
 
         # Feature flags
         self.enable_visual_analysis = (
@@ -108,11 +182,48 @@ class Config:
         )
 
         self.slide_image_provider = os.getenv("SLIDE_IMAGE_PROVIDER", "pil")
+        # Chapter images: PIL slides render in a process pool, LLM images are
+        # requested concurrently (downloads do not hold a request slot)
+        self.image_render_workers = int(
+            os.getenv("IMAGE_RENDER_WORKERS", str(min(4, os.cpu_count() or 1)))
+        )
+        self.image_generation_concurrency = int(
+            os.getenv("IMAGE_GENERATION_CONCURRENCY", "4")
+        )
+
+        # Reuse vision analysis for pixel-identical slides; near-identical ones
+        # (perceptual hashes of 256 bits differing in at most this many bits)
+        # only when opted in, since slides sharing a template hash alike
+        self.slide_dedup_enabled = (
+            os.getenv("SLIDE_DEDUP_ENABLED", "true").lower() == "true"
+        )
+        self.slide_dedup_max_distance = int(os.getenv("SLIDE_DEDUP_MAX_DISTANCE", "-1"))
+        # Vision requests send a downscaled JPEG/WebP copy of each slide; the
+        # defaults match the resolution OpenAI vision models actually use
+        self.vision_image_optimize = (
+            os.getenv("VISION_IMAGE_OPTIMIZE", "true").lower() == "true"
+        )
+        self.vision_image_format = os.getenv("VISION_IMAGE_FORMAT", "webp")
+        self.vision_image_quality = int(os.getenv("VISION_IMAGE_QUALITY", "85"))
+        self.vision_image_short_side = int(os.getenv("VISION_IMAGE_SHORT_SIDE", "768"))
+        self.vision_image_long_side = int(os.getenv("VISION_IMAGE_LONG_SIDE", "2048"))
+        # Ask the vision model for schema-validated JSON; free-text answers are
+        # still parsed by keyword scraping
+        self.vision_structured_output = (
+            os.getenv("VISION_STRUCTURED_OUTPUT", "true").lower() == "true"
+        )
 
         self.storage_provider = os.getenv("STORAGE_PROVIDER", "oss")
         self.proxy_cloud_media = (
             os.getenv("PROXY_CLOUD_MEDIA", "false").lower() == "true"
         )
+        # Shared outbound HTTP pools (HTTP/2 needs the optional h2 package)
+        self.http_max_connections = int(os.getenv("HTTP_MAX_CONNECTIONS", "50"))
+        self.http_max_keepalive = int(os.getenv("HTTP_MAX_KEEPALIVE", "20"))
+        self.http_keepalive_expiry = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "60"))
+        self.http_timeout = float(os.getenv("HTTP_TIMEOUT", "60"))
+        self.http_connect_timeout = float(os.getenv("HTTP_CONNECT_TIMEOUT", "10"))
+        self.http2_enabled = os.getenv("HTTP2_ENABLED", "true").lower() == "true"
         # CORS settings
         self.cors_origins = self._parse_cors_origins(
             os.getenv("CORS_ORIGINS", "http://localhost:3000")
@@ -144,6 +255,17 @@ class Config:
                 self._uploads_dir = Path(__file__).parent.parent.parent / "uploads"
         return self._uploads_dir
 
+    @property
+    def cache_dir(self) -> Path:
+        """Directory for reusable derived assets (not served as task output)."""
+        if self._cache_dir is None:
+            cache_dir_env = os.getenv("CACHE_DIR")
+            if cache_dir_env:
+                self._cache_dir = Path(cache_dir_env).resolve()
+            else:
+                self._cache_dir = self.output_dir / ".cache"
+        return self._cache_dir
+
     def ensure_directories_exist(self) -> None:
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.uploads_dir.mkdir(parents=True, exist_ok=True)
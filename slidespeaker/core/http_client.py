@@ -0,0 +1,109 @@
+"""
+Shared pooled HTTP clients for outbound calls.
+
+Creating an ``httpx.AsyncClient`` per request pays for a new connection and TLS
+handshake every time (for HeyGen that meant one per status poll). Callers ask
+the registry for a named client instead: each upstream (``elevenlabs``,
+``heygen``, ``media`` for downloads and proxying, ``default`` for the rest)
+gets its own keep-alive pool, so a slow bulk download never starves API calls
+of connections. HTTP/2 is negotiated when the ``h2`` package is installed.
+
+Clients are bound to the event loop that created them. Processes call
+``close_http_clients()`` on the way out (worker exit, server shutdown) to
+release pooled connections cleanly.
+"""
+
+import asyncio
+import importlib.util
+import weakref
+from typing import Any
+
+import httpx
+from loguru import logger
+
+from slidespeaker.configs.config import config
+
+DEFAULT_CLIENT = "default"
+
+# Per-client overrides of the shared defaults
+CLIENT_PROFILES: dict[str, dict[str, Any]] = {
+    DEFAULT_CLIENT: {},
+    "elevenlabs": {"timeout": 30.0},
+    "heygen": {"timeout": 30.0},
+    # Large downloads and media proxying: no read timeout, follow CDN redirects.
+    # Players hold many long-lived range streams, so the pool is large, and a
+    # request that still finds it full fails with PoolTimeout instead of waiting
+    # forever for a stream to end
+    "media": {
+        "timeout": None,
+        "follow_redirects": True,
+        "max_connections": 1000,
+        "pool_timeout": 10.0,
+    },
+}
+
+_clients: dict[tuple[str, int], tuple[weakref.ref[Any], httpx.AsyncClient]] = {}
+
+
+def http2_available() -> bool:
+    """True when HTTP/2 is enabled and the ``h2`` package can be imported."""
+    return config.http2_enabled and importlib.util.find_spec("h2") is not None
+
+
+def _build_client(name: str) -> httpx.AsyncClient:
+    profile = CLIENT_PROFILES.get(name, {})
+    limits = httpx.Limits(
+        max_connections=profile.get("max_connections", config.http_max_connections),
+        max_keepalive_connections=config.http_max_keepalive,
+        keepalive_expiry=config.http_keepalive_expiry,
+    )
+    read_timeout = profile.get("timeout", config.http_timeout)
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(
+            read_timeout,
+            connect=config.http_connect_timeout,
+            pool=profile.get("pool_timeout", read_timeout),
+        ),
+        limits=limits,
+        http2=http2_available(),
+        follow_redirects=profile.get("follow_redirects", False),
+    )
+
+
+def get_http_client(name: str = DEFAULT_CLIENT) -> httpx.AsyncClient:
+    """Return the pooled client ``name`` for the running event loop."""
+    loop = asyncio.get_running_loop()
+    key = (name, id(loop))
+    entry = _clients.get(key)
+    if entry is not None:
+        loop_ref, client = entry
+        # A recycled loop id can point at a client owned by a dead loop
+        if loop_ref() is loop and not client.is_closed:
+            return client
+    client = _build_client(name)
+    _clients[key] = (weakref.ref(loop), client)
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close every client owned by the running loop and forget stale ones."""
+    loop = asyncio.get_running_loop()
+    for key, (loop_ref, client) in list(_clients.items()):
+        owner = loop_ref()
+        if owner is loop:
+            del _clients[key]
+            if not client.is_closed:
+                try:
+                    await client.aclose()
+                except Exception as e:
+                    logger.debug(f"Error closing HTTP client {key[0]}: {e}")
+        elif owner is None or owner.is_closed():
+            del _clients[key]
+
+
+__all__ = [
+    "CLIENT_PROFILES",
+    "close_http_clients",
+    "get_http_client",
+    "http2_available",
+]
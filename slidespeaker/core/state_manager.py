@@ -286,10 +286,17 @@ class RedisStateManager:
         if isinstance(podcast_guest_voice, str) and podcast_guest_voice.strip():
             safe_task_kwargs["podcast_guest_voice"] = podcast_guest_voice.strip()
         if isinstance(task_kwargs, dict):
-            for key in ("voice_id", "podcast_host_voice", "podcast_guest_voice"):
+            for key in (
+                "voice_id",
+                "podcast_host_voice",
+                "podcast_guest_voice",
+                "encoding_profile",
+            ):
                 val = task_kwargs.get(key)
                 if isinstance(val, str) and val.strip():
                     safe_task_kwargs[key] = val.strip()
+            if "encoding_profile" in safe_task_kwargs:
+                state["encoding_profile"] = safe_task_kwargs["encoding_profile"]
 
         state["task_kwargs"] = safe_task_kwargs.copy()
         state["task_config"] = safe_task_kwargs.copy()
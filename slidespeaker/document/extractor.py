@@ -17,6 +17,8 @@ from PIL import Image
 from pptx import Presentation
 from pypdf import PdfReader
 
+from slidespeaker.image.templates import load_font, slide_background
+
 
 class SlideExtractor:
     """Extractor for presentation slides and converter to images"""
@@ -146,7 +148,7 @@ class SlideExtractor:
         try:
             import textwrap
 
-            from PIL import Image, ImageDraw, ImageFont
+            from PIL import ImageDraw
 
             # Extract text content from the specific PDF page
             page_text = ""
@@ -156,49 +158,16 @@ class SlideExtractor:
                     page = pdf_reader.pages[page_index]
                     page_text = page.extract_text().strip()
 
-            # Create a 16:9 slide image (1920x1080) - standard video resolution
+            # Create a 16:9 slide image (1920x1080) - standard video resolution,
+            # starting from the cached background (gradient, rule, corner dot)
             width, height = 1920, 1080
-            img = Image.new("RGB", (width, height), "#ffffff")
+            img = slide_background("pdf_page", width, height)
             draw = ImageDraw.Draw(img)
 
-            # Try to load system fonts, fallback to default if not available
-            title_font: ImageFont.FreeTypeFont | ImageFont.ImageFont
-            content_font: ImageFont.FreeTypeFont | ImageFont.ImageFont
-            small_font: ImageFont.FreeTypeFont | ImageFont.ImageFont
-            try:
-                # Try common system fonts
-                title_font = ImageFont.truetype("Arial.ttf", 48)
-                content_font = ImageFont.truetype("Arial.ttf", 32)
-                small_font = ImageFont.truetype("Arial.ttf", 24)
-            except Exception:
-                try:
-                    # Try alternative font names
-                    title_font = ImageFont.truetype("DejaVuSans.ttf", 48)
-                    content_font = ImageFont.truetype("DejaVuSans.ttf", 32)
-                    small_font = ImageFont.truetype("DejaVuSans.ttf", 24)
-                except Exception:
-                    # Fallback to default font
-                    title_font = ImageFont.load_default()
-                    content_font = ImageFont.load_default()
-                    small_font = ImageFont.load_default()
-
-            # Add a subtle gradient background
-            gradient = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-            gradient_draw = ImageDraw.Draw(gradient)
-
-            # Create a vertical gradient from light blue to white
-            for y in range(height):
-                # Calculate color intensity (0 at top, 200 at bottom)
-                intensity = int(200 * (y / height))
-                color = (240, 245, 255, 255 - intensity)  # Light blue to transparent
-                gradient_draw.line([(0, y), (width, y)], fill=color)
-
-            img = Image.alpha_composite(img.convert("RGBA"), gradient)
-            draw = ImageDraw.Draw(img)
-
-            # Add decorative elements
-            # Draw a subtle horizontal line
-            draw.line([(100, 150), (width - 100, 150)], fill="#4287f5", width=2)
+            # Fonts are loaded once per process
+            title_font = load_font(48)
+            content_font = load_font(32)
+            small_font = load_font(24)
 
             # Add slide title (Page X)
             title = f"Page {page_index + 1}"
@@ -268,16 +237,6 @@ class SlideExtractor:
                 x = (width - text_width) // 2
                 draw.text((x, height // 2), message, fill="#7f8c8d", font=content_font)
 
-            # Add a subtle decorative element in the corner
-            # Draw a small circle in bottom right corner
-            circle_x, circle_y = width - 50, height - 50
-            draw.ellipse(
-                [circle_x - 15, circle_y - 15, circle_x + 15, circle_y + 15],
-                fill="#4287f5",
-                outline="#2c3e50",
-                width=1,
-            )
-
             # Add slide number in bottom center
             slide_number_text = f"{page_index + 1}"
             bbox = draw.textbbox((0, 0), slide_number_text, font=small_font)
@@ -288,7 +247,7 @@ class SlideExtractor:
             )
 
             # Save the image
-            img.convert("RGB").save(output_path)
+            img.save(output_path)
 
         except Exception:
             # Final fallback to simple placeholder
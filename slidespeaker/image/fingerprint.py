@@ -0,0 +1,173 @@
+"""Perceptual fingerprints of slide images (image package).
+
+Decks often repeat a slide almost unchanged: section dividers, blank slides,
+animation steps exported as separate pages. Each slide image gets a difference
+hash (dHash) and a digest of its decoded pixels when it is created, saved next
+to it (``slide_1.phash.json``). Slides with the same digest are duplicates, so
+their vision analysis is done once and reused.
+
+The 16x16 hash only sees layout: slides built on one template with different
+text usually hash alike. Matching on hash distance is therefore opt-in
+(``SLIDE_DEDUP_MAX_DISTANCE`` >= 0), for decks where near-identical slides are
+animation steps. Like the audio sidecars, the sidecar is tied to the image's
+size and mtime, so a re-rendered slide is hashed again.
+"""
+
+import hashlib
+import json
+import os
+import uuid
+from pathlib import Path
+from typing import Any, TypedDict
+
+from PIL import Image
+
+from slidespeaker.configs.config import config
+
+FINGERPRINT_SUFFIX = ".phash.json"
+
+# The hash compares neighbouring pixels of a HASH_SIZE x HASH_SIZE thumbnail
+HASH_SIZE = 16
+
+
+class SlideFingerprint(TypedDict):
+    """Perceptual hash and pixel digest of one slide image."""
+
+    phash: int
+    digest: str
+    size: int
+    mtime_ns: int
+
+
+def fingerprint_path(image_path: Path) -> Path:
+    """Return the fingerprint sidecar path for ``image_path``."""
+    return image_path.with_suffix(FINGERPRINT_SUFFIX)
+
+
+def perceptual_hash(img: Image.Image) -> int:
+    """Return the difference hash of ``img`` as a HASH_SIZE**2-bit integer."""
+    thumb = img.convert("L").resize((HASH_SIZE + 1, HASH_SIZE), Image.Resampling.BOX)
+    pixels = list(thumb.getdata())
+    value = 0
+    for row in range(HASH_SIZE):
+        offset = row * (HASH_SIZE + 1)
+        for col in range(HASH_SIZE):
+            left = pixels[offset + col]
+            right = pixels[offset + col + 1]
+            value = (value << 1) | (left > right)
+    return value
+
+
+def hash_distance(a: int, b: int) -> int:
+    """Return the number of differing bits between two hashes."""
+    return (a ^ b).bit_count()
+
+
+def fingerprint_image(image_path: Path) -> SlideFingerprint:
+    """Hash the image at ``image_path`` and save the fingerprint next to it."""
+    with Image.open(image_path) as img:
+        img.load()
+        phash = perceptual_hash(img)
+        digest = hashlib.sha1(
+            f"{img.mode}:{img.size}".encode() + img.tobytes()
+        ).hexdigest()
+    stat = image_path.stat()
+    fingerprint: SlideFingerprint = {
+        "phash": phash,
+        "digest": digest,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+    path = fingerprint_path(image_path)
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    tmp.write_text(
+        json.dumps({**fingerprint, "phash": format(phash, "x")}), encoding="utf-8"
+    )
+    os.replace(tmp, path)
+    return fingerprint
+
+
+def read_fingerprint(image_path: Path | str | None) -> SlideFingerprint | None:
+    """Load the fingerprint of ``image_path`` if it still describes the file."""
+    if image_path is None:
+        return None
+    path = Path(image_path)
+    try:
+        data: Any = json.loads(fingerprint_path(path).read_text("utf-8"))
+        stat = path.stat()
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    if data.get("size") != stat.st_size or data.get("mtime_ns") != stat.st_mtime_ns:
+        return None
+    try:
+        return {
+            "phash": int(data["phash"], 16),
+            "digest": str(data["digest"]),
+            "size": int(data["size"]),
+            "mtime_ns": int(data["mtime_ns"]),
+        }
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def load_fingerprint(image_path: Path) -> SlideFingerprint | None:
+    """Return the saved fingerprint, hashing the image when there is none."""
+    fingerprint = read_fingerprint(image_path)
+    if fingerprint is not None:
+        return fingerprint
+    try:
+        return fingerprint_image(image_path)
+    except (OSError, ValueError):
+        return None
+
+
+def find_duplicates(
+    fingerprints: list[SlideFingerprint | None], max_distance: int | None = None
+) -> list[int]:
+    """Map each slide to the first earlier slide it duplicates (or itself).
+
+    Exact pixel matches always count; perceptual matches count when their
+    hashes differ in at most ``max_distance`` bits (``SLIDE_DEDUP_MAX_DISTANCE``
+    by default; negative, the default, disables them).
+    """
+    if max_distance is None:
+        max_distance = config.slide_dedup_max_distance
+    owners: list[int] = []
+    by_digest: dict[str, int] = {}
+    originals: list[tuple[int, int]] = []
+    for index, fingerprint in enumerate(fingerprints):
+        if fingerprint is None:
+            owners.append(index)
+            continue
+        owner = by_digest.get(fingerprint["digest"])
+        if owner is None and max_distance >= 0:
+            owner = next(
+                (
+                    i
+                    for i, phash in originals
+                    if hash_distance(phash, fingerprint["phash"]) <= max_distance
+                ),
+                None,
+            )
+        if owner is None:
+            owner = index
+            by_digest[fingerprint["digest"]] = index
+            originals.append((index, fingerprint["phash"]))
+        owners.append(owner)
+    return owners
+
+
+__all__ = [
+    "FINGERPRINT_SUFFIX",
+    "HASH_SIZE",
+    "SlideFingerprint",
+    "find_duplicates",
+    "fingerprint_image",
+    "fingerprint_path",
+    "hash_distance",
+    "load_fingerprint",
+    "perceptual_hash",
+    "read_fingerprint",
+]
@@ -1,5 +1,15 @@
-"""Unified image generation (image package)."""
+"""Unified image generation (image package).
 
+Chapter images are produced in parallel, so a deck takes roughly as long as its
+slowest chapter. PIL slides are drawn in a process pool (drawing is CPU bound
+and would otherwise hold the event loop). LLM images are requested with
+bounded concurrency; each image is downloaded after its request slot is
+released, so downloads overlap with the remaining generations.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -11,6 +21,11 @@ from .llm import LLMImageGenerator
 from .pil import PILImageGenerator
 
 
+def _render_pil_chapter(chapter: dict[str, Any], image_path: Path) -> None:
+    """Draw one chapter slide (runs in a worker process)."""
+    PILImageGenerator().render_slide_image(chapter, image_path)
+
+
 class ImageGenerator:
     def __init__(self) -> None:
         self.llm_generator = LLMImageGenerator()
@@ -28,34 +43,77 @@ class ImageGenerator:
         self, chapters: list[dict[str, Any]], output_dir: Path
     ) -> list[Path]:
         output_dir.mkdir(exist_ok=True, parents=True)
-        image_paths: list[Path] = []
-        for i, chapter in enumerate(chapters):
-            image_path = output_dir / f"chapter_{i + 1}.png"
-            await self.pil_generator.generate_slide_image(chapter, image_path)
-            image_paths.append(image_path)
-            logger.info(f"Generated slide image for chapter {i + 1}: {image_path}")
+        image_paths = [
+            output_dir / f"chapter_{i + 1}.png" for i in range(len(chapters))
+        ]
+        if not chapters:
+            return image_paths
+        started = time.perf_counter()
+        workers = max(1, min(config.image_render_workers, len(chapters)))
+        if workers == 1:
+            # Not worth starting a process for a single worker
+            for chapter, image_path in zip(chapters, image_paths, strict=True):
+                await self.pil_generator.generate_slide_image(chapter, image_path)
+        else:
+            loop = asyncio.get_running_loop()
+            # Shut down off the event loop; after a failure, do not wait for
+            # the chapters still being drawn
+            executor = ProcessPoolExecutor(max_workers=workers)
+            try:
+                await asyncio.gather(
+                    *(
+                        loop.run_in_executor(
+                            executor, _render_pil_chapter, chapter, image_path
+                        )
+                        for chapter, image_path in zip(
+                            chapters, image_paths, strict=True
+                        )
+                    )
+                )
+            except BaseException:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            await asyncio.to_thread(executor.shutdown)
+        logger.info(
+            f"Generated {len(image_paths)} slide images with PIL in "
+            f"{time.perf_counter() - started:.2f}s (workers={workers})"
+        )
         return image_paths
 
     async def _generate_slide_images_by_llm(
         self, chapters: list[dict[str, Any]], output_dir: Path
     ) -> list[Path]:
         output_dir.mkdir(exist_ok=True, parents=True)
-        image_paths: list[Path] = []
         style = "professional"
-        for i, chapter in enumerate(chapters):
+        started = time.perf_counter()
+        limit = asyncio.Semaphore(max(1, config.image_generation_concurrency))
+
+        async def generate(i: int, chapter: dict[str, Any]) -> Path:
             image_path = output_dir / f"chapter_{i + 1}.png"
             title = chapter.get("title", f"Chapter {i + 1}")
             description = chapter.get("description", "")
             key_points = chapter.get("key_points", [])
-            await self.llm_generator.generate_slide_image(
-                title=title,
-                description=description,
-                key_points=key_points,
-                output_path=image_path,
-                style=style,
-            )
-            image_paths.append(image_path)
+            async with limit:
+                url = await self.llm_generator.request_slide_image(
+                    title=title,
+                    description=description,
+                    key_points=key_points,
+                    style=style,
+                )
+            # Downloaded outside the limit so the next request can start
+            await self.llm_generator.download_image(url, image_path)
             logger.info(f"Generated slide image for chapter {i + 1}: {image_path}")
+            return image_path
+
+        image_paths = list(
+            await asyncio.gather(
+                *(generate(i, chapter) for i, chapter in enumerate(chapters))
+            )
+        )
+        logger.info(
+            f"Generated {len(image_paths)} slide images with the image model in "
+            f"{time.perf_counter() - started:.2f}s"
+        )
         return image_paths
 
 
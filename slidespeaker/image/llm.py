@@ -1,5 +1,6 @@
 """LLM-based image generation module for SlideSpeaker."""
 
+import asyncio
 import base64
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -9,6 +10,7 @@ from fastapi.concurrency import run_in_threadpool
 from loguru import logger
 
 from slidespeaker.configs.config import config
+from slidespeaker.core.http_client import get_http_client
 from slidespeaker.llm import image_generate
 
 if TYPE_CHECKING:
@@ -91,6 +93,24 @@ class LLMImageGenerator:
         Returns:
             bool: True if image was generated successfully
         """
+        url = await self.request_slide_image(title, description, key_points, style)
+        await self.download_image(url, output_path)
+        logger.info(f"Slide image generated successfully: {output_path}")
+        return True
+
+    async def request_slide_image(
+        self,
+        title: str,
+        description: str,
+        key_points: list[str],
+        style: str = "professional",
+    ) -> str:
+        """
+        Ask the image model for a slide image and return its URL (or data URI).
+
+        The image is not downloaded, so callers can release request capacity
+        before fetching it with ``download_image``.
+        """
         try:
             # Create a structured prompt for slide generation
             slide_content = f"""
@@ -134,9 +154,7 @@ Requirements:
             )
             if not urls:
                 raise ValueError("No image returned from configured image provider")
-            await self._download_image(urls[0], output_path)
-            logger.info(f"Slide image generated successfully: {output_path}")
-            return True
+            return str(urls[0])
 
         except Exception as e:
             logger.error(f"Slide image generation error: {e}")
@@ -144,7 +162,7 @@ Requirements:
 
     # Qwen image generation removed
 
-    async def _download_image(self, image_url: str, output_path: Path) -> None:
+    async def download_image(self, image_url: str, output_path: Path) -> None:
         """Download image from URL and save to output path."""
         try:
             if image_url.startswith("data:"):
@@ -153,15 +171,15 @@ Requirements:
                     raise ValueError("Unsupported data URI for generated image")
                 data = base64.b64decode(payload)
                 output_path.parent.mkdir(parents=True, exist_ok=True)
-                output_path.write_bytes(data)
+                await asyncio.to_thread(output_path.write_bytes, data)
                 return
 
-            async with httpx.AsyncClient(timeout=30) as client:
-                response = await client.get(image_url)
-                response.raise_for_status()
+            client = get_http_client("media")
+            response = await client.get(image_url, timeout=30)
+            response.raise_for_status()
 
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                output_path.write_bytes(response.content)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            await asyncio.to_thread(output_path.write_bytes, response.content)
 
         except httpx.HTTPError as e:
             logger.error(f"Image download error: {e}")
@@ -1,15 +1,21 @@
 """PIL-based image generation module for SlideSpeaker.
 
 This module generates presentation-style images using PIL (Python Imaging Library)
-for creating chapter slides and simple backgrounds programmatically.
+for creating chapter slides and simple backgrounds programmatically. Drawing is
+CPU bound and synchronous (``render_slide_image``), so it can run in a worker
+thread or process. The background and fonts come from the per-process template
+cache (see ``templates``); only the chapter text is drawn per slide.
 """
 
+import asyncio
 import textwrap
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from loguru import logger
 
+from .templates import Font, default_font, load_font, slide_background
+
 if TYPE_CHECKING:
     pass
 
@@ -27,42 +33,37 @@ class PILImageGenerator:
             chapter: Chapter dictionary with title, description, and key_points
             output_path: Path to save the generated image
         """
+        await asyncio.to_thread(self.render_slide_image, chapter, output_path)
+
+    def render_slide_image(self, chapter: dict[str, Any], output_path: Path) -> None:
+        """Draw the chapter slide synchronously (see ``generate_slide_image``)."""
         try:
-            from PIL import Image, ImageDraw
+            from PIL import ImageDraw
 
-            # Create a 16:9 slide image (1920x1080)
+            # Create a 16:9 slide image (1920x1080) on the cached background
             width, height = 1920, 1080
-            img = Image.new("RGB", (width, height), "#ffffff")
+            img = slide_background("chapter", width, height)
             draw = ImageDraw.Draw(img)
 
-            # Load fonts with fallback
             title_font, desc_font, keypoint_font = self._load_fonts()
 
-            # Add gradient background
-            self._add_gradient_background(img, draw, width, height)
-
-            # Add decorative elements
-            self._add_decorative_elements(draw, width, height)
-
             # Add content
             self._add_slide_content(
                 draw, chapter, title_font, desc_font, keypoint_font, width, height
             )
 
             # Save the image
-            img.convert("RGB").save(output_path)
+            img.save(output_path)
             logger.info(f"Created chapter slide: {output_path}")
 
         except ImportError:
             logger.warning("PIL not available for slide generation, using fallback")
-            await self._create_programmatic_background(output_path, "#4287f5")
+            self._create_programmatic_background(output_path, "#4287f5")
         except Exception as e:
             logger.error(f"Error creating chapter slide: {e}")
-            await self._create_programmatic_background(output_path, "#4287f5")
+            self._create_programmatic_background(output_path, "#4287f5")
 
-    async def _create_programmatic_background(
-        self, output_path: Path, color: str
-    ) -> None:
+    def _create_programmatic_background(self, output_path: Path, color: str) -> None:
         """Create a simple background programmatically using PIL."""
         try:
             from PIL import Image
@@ -78,67 +79,9 @@ class PILImageGenerator:
                 "Image generation requires PIL for background creation"
             ) from None
 
-    def _load_fonts(self) -> tuple[Any, Any, Any]:
-        """Load fonts with fallback to default if system fonts are not available."""
-        title_font: Any
-        desc_font: Any
-        keypoint_font: Any
-
-        try:
-            from PIL import ImageFont
-
-            # Try common system fonts
-            title_font = ImageFont.truetype("Arial.ttf", 60)
-            desc_font = ImageFont.truetype("Arial.ttf", 36)
-            keypoint_font = ImageFont.truetype("Arial.ttf", 28)
-        except Exception:
-            try:
-                from PIL import ImageFont
-
-                # Try alternative font names
-                title_font = ImageFont.truetype("DejaVuSans.ttf", 60)
-                desc_font = ImageFont.truetype("DejaVuSans.ttf", 36)
-                keypoint_font = ImageFont.truetype("DejaVuSans.ttf", 28)
-            except Exception:
-                from PIL import ImageFont
-
-                # Fallback to default font
-                title_font = ImageFont.load_default()
-                desc_font = ImageFont.load_default()
-                keypoint_font = ImageFont.load_default()
-
-        return title_font, desc_font, keypoint_font
-
-    def _add_gradient_background(
-        self, img: Any, draw: Any, width: int, height: int
-    ) -> None:
-        """Add a subtle gradient background to the slide."""
-        from PIL import Image, ImageDraw
-
-        gradient = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-        gradient_draw = ImageDraw.Draw(gradient)
-
-        # Create a vertical gradient from light blue to white
-        for y in range(height):
-            intensity = int(200 * (y / height))
-            color = (240, 245, 255, 255 - intensity)  # Light blue to transparent
-            gradient_draw.line([(0, y), (width, y)], fill=color)
-
-        img.paste(Image.alpha_composite(img.convert("RGBA"), gradient))
-
-    def _add_decorative_elements(self, draw: Any, width: int, height: int) -> None:
-        """Add decorative elements to the slide."""
-        # Draw a subtle horizontal line
-        draw.line([(100, 200), (width - 100, 200)], fill="#4287f5", width=3)
-
-        # Draw a small circle in bottom right corner
-        circle_x, circle_y = width - 50, height - 50
-        draw.ellipse(
-            [circle_x - 20, circle_y - 20, circle_x + 20, circle_y + 20],
-            fill="#4287f5",
-            outline="#2c3e50",
-            width=2,
-        )
+    def _load_fonts(self) -> tuple[Font, Font, Font]:
+        """Return the title, description and key point fonts (memoised)."""
+        return load_font(60), load_font(36), load_font(28)
 
     def _add_slide_content(
         self,
@@ -183,12 +126,8 @@ class PILImageGenerator:
 
         # Increase font size for description and keypoints
         # We'll create larger fonts based on the originals
-        from PIL import ImageFont
-
         # Try to get the font path and size from the original font objects
-        def get_larger_font(
-            orig_font: ImageFont.ImageFont, scale: float = 1.25
-        ) -> ImageFont.ImageFont:
+        def get_larger_font(orig_font: Font, scale: float = 1.25) -> Font:
             try:
                 # Try to get the font size (this is a more reliable approach)
                 # We'll try to get the size by checking the font's attributes
@@ -196,11 +135,7 @@ class PILImageGenerator:
                     orig_size = orig_font.size
                     # Since we can't easily get the font path, we'll try to create a new font
                     # with the same size scaled up. This is a best-effort approach.
-                    from PIL import ImageFont
-
-                    # Try to create a new default font with larger size
-                    new_font = ImageFont.load_default(size=int(orig_size * scale))
-                    return new_font  # type: ignore[return-value]
+                    return default_font(int(orig_size * scale))
                 else:
                     # If we can't determine the size, return the original font
                     return orig_font
@@ -0,0 +1,109 @@
+"""Cached slide backgrounds and fonts for PIL rendering (image package).
+
+Generated slides (PIL chapter slides, PDF pages rendered from their text) share
+a gradient background with a few decorative elements and use a handful of font
+sizes. Backgrounds are rendered once per (theme, size) and copied for each
+slide, and fonts are loaded once per size, both per process. Only the text
+layer is drawn per slide.
+"""
+
+import functools
+from typing import NamedTuple
+
+from PIL import Image, ImageDraw, ImageFont
+
+# Tried in order; the PIL default font is used when none is installed
+FONT_CANDIDATES = ("Arial.ttf", "DejaVuSans.ttf")
+
+# What ``load_font``/``default_font`` return: a TrueType font, or PIL's bitmap
+# default when no TrueType font can be loaded
+Font = ImageFont.FreeTypeFont | ImageFont.ImageFont
+
+ACCENT = "#4287f5"
+INK = "#2c3e50"
+
+
+class SlideTheme(NamedTuple):
+    """Decoration drawn on top of the shared gradient."""
+
+    # Horizontal rule below the title area
+    rule_y: int
+    rule_width: int
+    # Dot in the bottom-right corner
+    dot_radius: int
+    dot_outline: int
+
+
+THEMES: dict[str, SlideTheme] = {
+    "chapter": SlideTheme(rule_y=200, rule_width=3, dot_radius=20, dot_outline=2),
+    "pdf_page": SlideTheme(rule_y=150, rule_width=2, dot_radius=15, dot_outline=1),
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _background(theme: str, width: int, height: int) -> Image.Image:
+    spec = THEMES[theme]
+    # Vertical gradient from light blue to white; one column, stretched
+    column = Image.new("RGBA", (1, height))
+    column.putdata(
+        [(240, 245, 255, 255 - int(200 * (y / height))) for y in range(height)]
+    )
+    gradient = column.resize((width, height), Image.Resampling.NEAREST)
+    base = Image.new("RGBA", (width, height), (255, 255, 255, 255))
+    img = Image.alpha_composite(base, gradient).convert("RGB")
+
+    draw = ImageDraw.Draw(img)
+    draw.line(
+        [(100, spec.rule_y), (width - 100, spec.rule_y)],
+        fill=ACCENT,
+        width=spec.rule_width,
+    )
+    cx, cy, r = width - 50, height - 50, spec.dot_radius
+    draw.ellipse(
+        [cx - r, cy - r, cx + r, cy + r],
+        fill=ACCENT,
+        outline=INK,
+        width=spec.dot_outline,
+    )
+    return img
+
+
+def slide_background(theme: str, width: int = 1920, height: int = 1080) -> Image.Image:
+    """Return a fresh RGB copy of the decorated background for ``theme``."""
+    return _background(theme, width, height).copy()
+
+
+@functools.lru_cache(maxsize=32)
+def load_font(size: int) -> Font:
+    """Return the first installed candidate font at ``size`` (memoised)."""
+    for name in FONT_CANDIDATES:
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=32)
+def default_font(size: int) -> Font:
+    """Return PIL's bundled font at ``size`` (memoised)."""
+    return ImageFont.load_default(size=size)
+
+
+def clear_template_cache() -> None:
+    """Forget rendered backgrounds and loaded fonts."""
+    _background.cache_clear()
+    load_font.cache_clear()
+    default_font.cache_clear()
+
+
+__all__ = [
+    "FONT_CANDIDATES",
+    "Font",
+    "SlideTheme",
+    "THEMES",
+    "clear_template_cache",
+    "default_font",
+    "load_font",
+    "slide_background",
+]
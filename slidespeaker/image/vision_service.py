@@ -3,10 +3,19 @@ Vision Service for Slide Analysis
 
 This module provides image analysis capabilities using OpenAI vision models
 to extract content from presentation slides. It analyzes both text and visual elements
-to provide context for script generation.
+to provide context for script generation. Requests carry a downscaled
+JPEG/WebP copy of each slide (see ``vision_variant``) rather than the full PNG.
+
+The model is asked for JSON matching ``SLIDE_ANALYSIS_SCHEMA`` (structured
+output where the provider supports it), which is validated and used as is.
+Free-text answers, and JSON that does not validate, go through the keyword
+scraper in ``_parse_analysis`` instead.
 """
 
+import asyncio
 import base64
+import json
+import time
 from pathlib import Path
 from typing import Any
 
@@ -15,6 +24,8 @@ from loguru import logger
 from slidespeaker.configs.config import config
 from slidespeaker.llm import chat_completion
 
+from .vision_variant import load_vision_variant
+
 # Prompt for slide image analysis optimized for script generation
 SLIDE_ANALYSIS_PROMPT = """
 Analyze this presentation slide to enable a deeply understood, audience-friendly narration.
@@ -49,6 +60,146 @@ Analyze slide images to extract content that directly supports creating engaging
 presentation scripts. Focus on speaking points, narrative flow, and audience
 engagement strategies."""
 
+SLIDE_TYPES = ["title", "content", "transition", "conclusion"]
+
+
+def _object_schema(properties: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(properties),
+        "additionalProperties": False,
+    }
+
+
+_TEXT: dict[str, Any] = {"type": "string"}
+_TEXT_LIST: dict[str, Any] = {"type": "array", "items": _TEXT}
+
+# Same shape as ``_parse_analysis`` output (without ``raw_analysis``); strict
+# structured output requires every property to be listed as required
+SLIDE_ANALYSIS_SCHEMA = _object_schema(
+    {
+        "slide_metadata": _object_schema(
+            {
+                "type": {"type": "string", "enum": SLIDE_TYPES},
+                "title": _TEXT,
+                "estimated_duration_seconds": {"type": "integer"},
+            }
+        ),
+        "content": _object_schema(
+            {
+                "text_content": _TEXT,
+                "speaking_points": _TEXT_LIST,
+                "visual_highlights": _TEXT_LIST,
+                "transition_phrases": _TEXT_LIST,
+            }
+        ),
+        "presentation_context": _object_schema(
+            {
+                "main_topic": _TEXT,
+                "key_insights": _TEXT_LIST,
+                "audience_focus": _TEXT,
+                "visual_elements": _TEXT_LIST,
+                "numerical_data": _TEXT_LIST,
+            }
+        ),
+        "script_guidance": _object_schema(
+            {
+                "opening_line": _TEXT,
+                "emphasis_points": _TEXT_LIST,
+                "explanation_needs": _TEXT_LIST,
+                "closing_transition": _TEXT,
+            }
+        ),
+    }
+)
+
+# Appended to the prompt in structured mode, for providers that only get a
+# JSON mime type rather than the schema itself
+SLIDE_ANALYSIS_JSON_PROMPT = f"""
+Respond with a single JSON object (no prose, no code fences) matching this
+JSON schema:
+{json.dumps(SLIDE_ANALYSIS_SCHEMA)}
+
+- slide_metadata.type: the slide's role
+- slide_metadata.estimated_duration_seconds: narration time for the slide
+- content.text_content: the slide's text, verbatim where possible
+- content.speaking_points: points to explain, in speaking order
+- presentation_context.numerical_data: figures and statistics as written
+- script_guidance: how to open, what to stress or define, how to move on
+"""
+
+
+def _conform(value: Any, schema: dict[str, Any], path: str = "analysis") -> Any:
+    """Check ``value`` against ``schema`` and return a normalised copy.
+
+    Supports the subset of JSON schema used by ``SLIDE_ANALYSIS_SCHEMA``.
+    """
+    kind = schema["type"]
+    if kind == "object":
+        if not isinstance(value, dict):
+            raise ValueError(f"{path} is not an object")
+        missing = [key for key in schema["required"] if key not in value]
+        if missing:
+            raise ValueError(f"{path} is missing {', '.join(missing)}")
+        return {
+            key: _conform(value[key], sub, f"{path}.{key}")
+            for key, sub in schema["properties"].items()
+        }
+    if kind == "array":
+        if not isinstance(value, list):
+            raise ValueError(f"{path} is not a list")
+        items = [_conform(item, schema["items"], f"{path}[]") for item in value]
+        return [item for item in items if item != ""]
+    if kind == "integer":
+        if isinstance(value, bool) or not isinstance(value, int | float):
+            raise ValueError(f"{path} is not a number")
+        return int(value)
+    if isinstance(value, int | float) and not isinstance(value, bool):
+        value = str(value)
+    if not isinstance(value, str):
+        raise ValueError(f"{path} is not a string")
+    value = value.strip()
+    enum = schema.get("enum")
+    if enum is not None and value.lower() not in enum:
+        raise ValueError(f"{path} is not one of {', '.join(enum)}")
+    return value.lower() if enum is not None else value
+
+
+def _structured_output_options(model: str) -> dict[str, Any]:
+    """Return chat_completion options requesting schema-conforming JSON."""
+    provider = model.partition("/")[0].lower() if "/" in model else "openai"
+    if provider in {"google", "gemini"}:
+        return {
+            "response_mime_type": "application/json",
+            "response_json_schema": SLIDE_ANALYSIS_SCHEMA,
+        }
+    return {
+        "response_format": {
+            "type": "json_schema",
+            "json_schema": {
+                "name": "slide_analysis",
+                "strict": True,
+                "schema": SLIDE_ANALYSIS_SCHEMA,
+            },
+        }
+    }
+
+
+def _is_unsupported_error(error: Exception) -> bool:
+    """Return True when a structured request was rejected rather than lost.
+
+    Client errors (4xx other than timeouts and rate limits) mean the model
+    refused the request; timeouts and connection errors may succeed later.
+    """
+    status = getattr(error, "status_code", None) or getattr(error, "code", None)
+    if isinstance(status, int):
+        return 400 <= status < 500 and status not in (408, 429)
+    if isinstance(error, TimeoutError | ConnectionError):
+        return False
+    name = type(error).__name__.lower()
+    return "timeout" not in name and "connection" not in name
+
 
 class VisionService:
     """Vision service for analyzing slide images using OpenAI vision models"""
@@ -58,15 +209,24 @@ class VisionService:
         # Client is managed by shared LLM helpers (chat_completion). Keep attribute
         # for backward compatibility but don't require it at runtime.
         self.client = None
+        # Models that rejected structured output; later slides skip the attempt
+        self.structured_unsupported: set[str] = set()
         if not config.openai_api_key:
             logger.warning(
                 "OPENAI_API_KEY not set; vision analysis will fall back gracefully"
             )
 
-    def _encode_image(self, image_path: Path) -> str:
-        """Encode image to base64 for OpenAI API"""
+    def _encode_image(self, image_path: Path) -> tuple[str, str]:
+        """Encode image to base64 for OpenAI API; returns (mime type, data)"""
+        mime_type = "image/png"
+        if config.vision_image_optimize:
+            try:
+                variant = load_vision_variant(image_path)
+                image_path, mime_type = variant.path, variant.mime_type
+            except Exception as e:
+                logger.warning(f"Sending original image for {image_path.name}: {e}")
         with open(image_path, "rb") as image_file:
-            return base64.b64encode(image_file.read()).decode("utf-8")
+            return mime_type, base64.b64encode(image_file.read()).decode("utf-8")
 
     async def analyze_slide_image(
         self, image_path: Path, slide_text: str = ""
@@ -84,7 +244,9 @@ class VisionService:
         """
         try:
             # Encode the image
-            base64_image = self._encode_image(image_path)
+            mime_type, base64_image = await asyncio.to_thread(
+                self._encode_image, image_path
+            )
 
             # Build enhanced prompt with slide text context if provided
             enhanced_prompt = SLIDE_ANALYSIS_PROMPT
@@ -98,24 +260,58 @@ Use this extracted text to enhance your analysis and ensure consistency between
 
             # Use shared chat_completion helper; do not depend on self.client
             model_name = config.vision_analyzer_model
-            analysis_text = chat_completion(
-                model=model_name,
-                messages=[
-                    {"role": "system", "content": SLIDE_ANALYSIS_SYSTEM_PROMPT},
-                    {
-                        "role": "user",
-                        "content": [
-                            {"type": "text", "text": enhanced_prompt},
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": f"data:image/png;base64,{base64_image}"
+            if not model_name:
+                raise ValueError("VISION_ANALYZER_MODEL is not configured")
+
+            def request(prompt: str, **options: Any) -> str:
+                started = time.perf_counter()
+                text = chat_completion(
+                    model=model_name,
+                    messages=[
+                        {"role": "system", "content": SLIDE_ANALYSIS_SYSTEM_PROMPT},
+                        {
+                            "role": "user",
+                            "content": [
+                                {"type": "text", "text": prompt},
+                                {
+                                    "type": "image_url",
+                                    "image_url": {
+                                        "url": f"data:{mime_type};base64,{base64_image}"
+                                    },
                                 },
-                            },
-                        ],
-                    },
-                ],
-            )
+                            ],
+                        },
+                    ],
+                    **options,
+                )
+                logger.debug(
+                    f"Vision request for {image_path.name}: {len(base64_image)} "
+                    f"base64 bytes ({mime_type}), {time.perf_counter() - started:.2f}s"
+                )
+                return text
+
+            analysis_text = None
+            if (
+                config.vision_structured_output
+                and model_name not in self.structured_unsupported
+            ):
+                try:
+                    # One attempt: the free-text request below is the retry
+                    analysis_text = request(
+                        f"{enhanced_prompt}\n{SLIDE_ANALYSIS_JSON_PROMPT}",
+                        retries=1,
+                        **_structured_output_options(model_name),
+                    )
+                except Exception as e:
+                    if _is_unsupported_error(e):
+                        # e.g. the model does not support structured output
+                        self.structured_unsupported.add(model_name)
+                    logger.warning(
+                        f"Structured vision analysis failed for {image_path.name}, "
+                        f"retrying as free text: {e}"
+                    )
+            if analysis_text is None:
+                analysis_text = request(enhanced_prompt)
 
             analysis_text = analysis_text or ""
             if not analysis_text:
@@ -123,8 +319,11 @@ Use this extracted text to enhance your analysis and ensure consistency between
 
             analysis_text = analysis_text.strip()
 
-            # Parse the analysis into structured format
-            analysis = self._parse_analysis(analysis_text)
+            # Parse the analysis into structured format: validated JSON when
+            # the model returned it, keyword scraping otherwise
+            analysis = self._parse_structured_analysis(analysis_text)
+            if analysis is None:
+                analysis = self._parse_analysis(analysis_text)
 
             # Add slide text context to the analysis if provided
             if slide_text.strip():
@@ -160,6 +359,32 @@ Use this extracted text to enhance your analysis and ensure consistency between
 
     # Qwen support removed from this module; using OpenAI only
 
+    def _parse_structured_analysis(self, analysis_text: str) -> dict[str, Any] | None:
+        """Validate a JSON analysis against ``SLIDE_ANALYSIS_SCHEMA``.
+
+        Returns None when the text is not a conforming JSON object, so the
+        caller can fall back to ``_parse_analysis``.
+        """
+        text = analysis_text.strip()
+        if text.startswith("```"):
+            text = text.strip("`").removeprefix("json").strip()
+        if not text.startswith("{"):
+            return None
+        try:
+            analysis: dict[str, Any] = _conform(json.loads(text), SLIDE_ANALYSIS_SCHEMA)
+        except ValueError as e:
+            logger.warning(f"Discarding structured vision analysis: {e}")
+            return None
+        metadata = analysis["slide_metadata"]
+        metadata["estimated_duration_seconds"] = max(
+            30, min(180, metadata["estimated_duration_seconds"])
+        )
+        if not metadata["title"]:
+            metadata["title"] = "Presentation Content"
+        if not analysis["presentation_context"]["visual_elements"]:
+            analysis["presentation_context"]["visual_elements"] = ["visual_content"]
+        return {"raw_analysis": analysis_text, **analysis}
+
     def _parse_analysis(self, analysis_text: str) -> dict[str, Any]:
         """Parse the LLM analysis into structured format optimized for script generation"""
         return {
@@ -0,0 +1,152 @@
+"""Vision-optimised copies of slide images (image package).
+
+Slides are rendered at print resolution (``pdftoppm -r 150``), but vision models
+downscale large images before looking at them: OpenAI fits an image in
+2048x2048 and then scales its short side to 768 px. Sending the full PNG only
+costs upload time. Each slide therefore gets a copy downscaled to that size and
+re-encoded as WebP or JPEG (``slide_1.vision.webp``). It is made once, when the
+slide is converted, and described by a sidecar (``slide_1.vision.json``) tied
+to the source image's size and mtime and to the encoding settings.
+"""
+
+import json
+import os
+import uuid
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from PIL import Image
+
+from slidespeaker.configs.config import config
+
+VARIANT_SUFFIX = ".vision"
+
+# format -> (MIME type, file extension, PIL format name)
+VARIANT_FORMATS: dict[str, tuple[str, str, str]] = {
+    "jpeg": ("image/jpeg", ".jpg", "JPEG"),
+    "webp": ("image/webp", ".webp", "WEBP"),
+}
+
+
+class VisionImage(NamedTuple):
+    """Image file to send to a vision model."""
+
+    path: Path
+    mime_type: str
+
+
+def variant_settings() -> dict[str, Any]:
+    """Return the configured variant encoding settings."""
+    fmt = config.vision_image_format.lower()
+    if fmt not in VARIANT_FORMATS:
+        fmt = "webp"
+    return {
+        "format": fmt,
+        "quality": config.vision_image_quality,
+        "short_side": config.vision_image_short_side,
+        "long_side": config.vision_image_long_side,
+    }
+
+
+def variant_metadata_path(image_path: Path) -> Path:
+    """Return the sidecar describing the vision variant of ``image_path``."""
+    return image_path.with_suffix(f"{VARIANT_SUFFIX}.json")
+
+
+def target_size(
+    width: int, height: int, short_side: int, long_side: int
+) -> tuple[int, int]:
+    """Return the size that fits both limits, never enlarging the image."""
+    scale = min(1.0, long_side / max(width, height), short_side / min(width, height))
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def _read_variant(image_path: Path, settings: dict[str, Any]) -> VisionImage | None:
+    try:
+        data: Any = json.loads(variant_metadata_path(image_path).read_text("utf-8"))
+        stat = image_path.stat()
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    if (
+        data.get("size") != stat.st_size
+        or data.get("mtime_ns") != stat.st_mtime_ns
+        or data.get("settings") != settings
+    ):
+        return None
+    path = image_path.with_name(str(data.get("file", "")))
+    if not path.is_file():
+        return None
+    return VisionImage(path, str(data.get("mime_type", "image/png")))
+
+
+def create_vision_variant(image_path: Path) -> VisionImage:
+    """Downscale and re-encode ``image_path`` for vision requests.
+
+    Falls back to the original image when re-encoding would not make it
+    smaller (small or already compressed slides).
+    """
+    settings = variant_settings()
+    mime_type, ext, pil_format = VARIANT_FORMATS[settings["format"]]
+    path = image_path.with_suffix(f"{VARIANT_SUFFIX}{ext}")
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    with Image.open(image_path) as img:
+        img.load()
+        source_mime = Image.MIME.get(img.format or "", "image/png")
+        if img.mode in ("RGBA", "LA", "P"):
+            rgba = img.convert("RGBA")
+            flat = Image.new("RGB", rgba.size, (255, 255, 255))
+            flat.paste(rgba, mask=rgba.getchannel("A"))
+        else:
+            flat = img.convert("RGB")
+    size = target_size(*flat.size, settings["short_side"], settings["long_side"])
+    if size != flat.size:
+        flat = flat.resize(size, Image.Resampling.LANCZOS)
+    flat.save(tmp, pil_format, quality=settings["quality"], optimize=True)
+
+    stat = image_path.stat()
+    if tmp.stat().st_size < stat.st_size:
+        os.replace(tmp, path)
+        variant = VisionImage(path, mime_type)
+    else:
+        tmp.unlink()
+        path.unlink(missing_ok=True)
+        variant = VisionImage(image_path, source_mime)
+
+    meta = variant_metadata_path(image_path)
+    meta_tmp = meta.with_name(f".{meta.name}.{uuid.uuid4().hex}.tmp")
+    meta_tmp.write_text(
+        json.dumps(
+            {
+                "file": variant.path.name,
+                "mime_type": variant.mime_type,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "settings": settings,
+            }
+        ),
+        encoding="utf-8",
+    )
+    os.replace(meta_tmp, meta)
+    return variant
+
+
+def load_vision_variant(image_path: Path) -> VisionImage:
+    """Return the cached vision variant, creating it when missing or stale."""
+    variant = _read_variant(image_path, variant_settings())
+    if variant is not None:
+        return variant
+    return create_vision_variant(image_path)
+
+
+__all__ = [
+    "VARIANT_FORMATS",
+    "VARIANT_SUFFIX",
+    "VisionImage",
+    "create_vision_variant",
+    "load_vision_variant",
+    "target_size",
+    "variant_metadata_path",
+    "variant_settings",
+]
@@ -9,6 +9,18 @@ from collections.abc import Iterable
 
 from slidespeaker.llm.base import ChatMessages
 
-from .provider import _get_llm, chat_completion, image_generate, tts_speech_stream
+from .provider import (
+    _get_llm,
+    chat_completion,
+    image_generate,
+    tts_speech_stream,
+    tts_speech_stream_async,
+)
 
-__all__ = ["_get_llm", "chat_completion", "image_generate", "tts_speech_stream"]
+__all__ = [
+    "_get_llm",
+    "chat_completion",
+    "image_generate",
+    "tts_speech_stream",
+    "tts_speech_stream_async",
+]
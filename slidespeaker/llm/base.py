@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import abc
-from collections.abc import Iterable, Sequence
+import asyncio
+from collections.abc import AsyncIterator, Iterable, Sequence
 from typing import Any, Literal, NotRequired, TypedDict, cast
 
 MessageRole = Literal["system", "user", "assistant", "tool"]
@@ -213,3 +214,34 @@ class LLMClient(abc.ABC):
         timeout: float | None = None,
     ) -> Iterable[bytes]:
         """Return an iterator of audio bytes for synthesized speech."""
+
+    async def tts_speech_stream_async(
+        self,
+        model: str,
+        voice: str,
+        input_text: str,
+        *,
+        retries: int | None = None,
+        backoff: float | None = None,
+        timeout: float | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Yield audio bytes for synthesized speech as they arrive.
+
+        The default pulls from ``tts_speech_stream`` in a worker thread; clients
+        with a native async API override this to stream without threads.
+        """
+        stream = await asyncio.to_thread(
+            self.tts_speech_stream,
+            model,
+            voice,
+            input_text,
+            retries=retries,
+            backoff=backoff,
+            timeout=timeout,
+        )
+        iterator = iter(stream)
+        while True:
+            chunk = await asyncio.to_thread(next, iterator, None)
+            if chunk is None:
+                return
+            yield chunk
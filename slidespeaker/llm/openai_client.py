@@ -4,17 +4,22 @@ OpenAI LLM client implementation for the pluggable LLM interface.
 
 from __future__ import annotations
 
+import asyncio
 import time
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Iterable
 from typing import Any, cast
 
+import httpx
 from loguru import logger
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from slidespeaker.configs.config import config
+from slidespeaker.core.http_client import get_http_client
 
 from .base import ChatMessages, LLMClient, to_openai_messages
 
+TTS_STREAM_CHUNK_SIZE = 64 * 1024
+
 
 class OpenAILLMClient(LLMClient):
     def __init__(self) -> None:
@@ -25,6 +30,22 @@ class OpenAILLMClient(LLMClient):
             self._client = OpenAI(api_key=api_key, base_url=config.openai_base_url)
         else:
             self._client = OpenAI(api_key=api_key)
+        # Async clients ride on the shared keep-alive HTTP pool of each loop
+        self._async_clients: dict[int, tuple[httpx.AsyncClient, AsyncOpenAI]] = {}
+
+    def _async_client(self) -> AsyncOpenAI:
+        http_client = get_http_client()
+        key = id(asyncio.get_running_loop())
+        cached = self._async_clients.get(key)
+        if cached is not None and cached[0] is http_client:
+            return cached[1]
+        client = AsyncOpenAI(
+            api_key=config.openai_api_key,
+            base_url=config.openai_base_url or None,
+            http_client=http_client,
+        )
+        self._async_clients[key] = (http_client, client)
+        return client
 
     def chat_completion(
         self,
@@ -159,6 +180,36 @@ class OpenAILLMClient(LLMClient):
             raise last_err
         return iter(())
 
+    async def tts_speech_stream_async(
+        self,
+        model: str,
+        voice: str,
+        input_text: str,
+        *,
+        retries: int | None = None,
+        backoff: float | None = None,
+        timeout: float | None = None,
+    ) -> AsyncIterator[bytes]:
+        cli = cast(Any, self._async_client())
+        r = config.openai_retries if retries is None else retries
+        b = config.openai_backoff if backoff is None else backoff
+        t = config.openai_timeout if timeout is None else timeout
+        for attempt in range(max(1, r)):
+            started = False
+            try:
+                async with cli.audio.speech.with_streaming_response.create(
+                    model=model, voice=voice, input=input_text, timeout=t
+                ) as resp:
+                    async for chunk in resp.iter_bytes(TTS_STREAM_CHUNK_SIZE):
+                        started = True
+                        yield chunk
+                return
+            except Exception:
+                # Once audio has been handed out a retry would duplicate it
+                if started or attempt >= r - 1:
+                    raise
+                await asyncio.sleep(b * (2**attempt))
+
 
 def _normalize_openai_image_size(model: str, size: str) -> str:
     """
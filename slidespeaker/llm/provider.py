@@ -4,7 +4,7 @@ LLM provider factory and module-level facade functions.
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Iterable
 from typing import Any
 
 from .base import ChatMessages, LLMClient
@@ -102,3 +102,24 @@ def tts_speech_stream(
         backoff=backoff,
         timeout=timeout,
     )
+
+
+def tts_speech_stream_async(
+    model: str,
+    voice: str,
+    input_text: str,
+    *,
+    retries: int | None = None,
+    backoff: float | None = None,
+    timeout: float | None = None,
+) -> AsyncIterator[bytes]:
+    provider_name, model_name = _resolve_provider_and_model(model)
+    voice_name = voice.split("/", 1)[1] if "/" in voice else voice
+    return _get_llm(provider_name).tts_speech_stream_async(
+        model_name,
+        voice_name,
+        input_text,
+        retries=retries,
+        backoff=backoff,
+        timeout=timeout,
+    )
@@ -5,12 +5,14 @@ This module provides common functionality for generating audio from transcripts
 in both PDF and presentation slide processing pipelines.
 """
 
+import asyncio
 from collections.abc import Callable
 from typing import Any
 
 from loguru import logger
 
-from slidespeaker.audio import AudioGenerator
+from slidespeaker.audio import AudioGenerator, TTSJob, TTSScheduler
+from slidespeaker.audio.concat import concat_mp3
 from slidespeaker.configs.config import config, get_storage_provider
 from slidespeaker.core.state_manager import state_manager
 from slidespeaker.storage.paths import output_storage_uri
@@ -48,6 +50,7 @@ async def generate_audio_common(
     audio_dir.mkdir(parents=True, exist_ok=True)
 
     audio_files = []
+    audio_indices: list[int] = []
     audio_generator = AudioGenerator()
 
     # Determine default language from state (voice_language), fallback to English
@@ -68,53 +71,54 @@ async def generate_audio_common(
         if isinstance(candidate_voice, str) and candidate_voice.strip():
             voice_override = candidate_voice.strip()
 
-    voice_cache: dict[str, list[str]] = {}
+    file_prefix = "chapter" if is_pdf else "slide"
+    jobs: list[TTSJob] = []
+    job_indices: list[int] = []
     for i, transcript_data in enumerate(transcripts):
         # Additional null check for individual transcript data
+        script_text = ""
         if transcript_data and isinstance(transcript_data, dict):
             script_text = str(transcript_data.get("script", "") or "")
-            if script_text.strip():
-                try:
-                    # Determine language and voice
-                    language = str(transcript_data.get("language") or default_language)
-                    file_prefix = "chapter" if is_pdf else "slide"
-
-                    # Get appropriate voice for the language
-                    voices = voice_cache.get(language)
-                    if voices is None:
-                        voices = audio_generator.get_supported_voices(language)
-                        voice_cache[language] = voices
-                    voice = voice_override or (voices[0] if voices else None)
-
-                    # Generate audio
-                    logger.info(
-                        f"Generating TTS for {file_prefix} {i + 1}: language={language}, voice={voice}"
-                    )
-                    audio_path = audio_dir / f"{file_prefix}_{i + 1}.mp3"
-                    ok = await audio_generator.generate_audio(
-                        script_text, str(audio_path), language=language, voice=voice
-                    )
-
-                    if ok and audio_path.exists() and audio_path.stat().st_size > 0:
-                        # Keep audio files local - only final files should be uploaded to cloud storage
-                        audio_files.append(str(audio_path))
-                        logger.info(
-                            f"Generated audio for {file_prefix} {i + 1}: {audio_path}"
-                        )
-                    else:
-                        logger.error(
-                            f"Audio generation failed for {file_prefix} {i + 1}; skipping file"
-                        )
-                except Exception as e:
-                    logger.error(
-                        f"Failed to generate audio for {file_prefix} {i + 1}: {e}"
-                    )
-                    raise
-            else:
-                logger.warning(
-                    f"Skipping audio generation for {file_prefix} {i + 1} due to "
-                    f"missing or empty transcript data"
-                )
+        if not script_text.strip():
+            logger.warning(
+                f"Skipping audio generation for {file_prefix} {i + 1} due to "
+                f"missing or empty transcript data"
+            )
+            continue
+
+        # Determine language and voice
+        language = str(transcript_data.get("language") or default_language)
+
+        # Get appropriate voice for the language
+        voices = audio_generator.get_supported_voices(language)
+        voice = voice_override or (voices[0] if voices else None)
+
+        logger.info(
+            f"Queueing TTS for {file_prefix} {i + 1}: language={language}, voice={voice}"
+        )
+        jobs.append(
+            {
+                "text": script_text,
+                "output_path": audio_dir / f"{file_prefix}_{i + 1}.mp3",
+                "language": language,
+                "voice": voice,
+            }
+        )
+        job_indices.append(i)
+
+    # Synthesise concurrently; results come back in transcript order
+    results = await TTSScheduler(audio_generator).run(jobs)
+    for i, job, ok in zip(job_indices, jobs, results, strict=True):
+        audio_path = job["output_path"]
+        if ok and audio_path.exists() and audio_path.stat().st_size > 0:
+            # Keep audio files local - only final files should be uploaded to cloud storage
+            audio_files.append(str(audio_path))
+            audio_indices.append(i)
+            logger.info(f"Generated audio for {file_prefix} {i + 1}: {audio_path}")
+        else:
+            logger.error(
+                f"Audio generation failed for {file_prefix} {i + 1}; skipping file"
+            )
 
     await state_manager.update_step_status(file_id, state_key, "completed", audio_files)
     logger.info(
@@ -139,14 +143,9 @@ async def generate_audio_common(
             local_dir = config.output_dir / "/".join(storage_key.split("/")[:-1])
             local_dir.mkdir(parents=True, exist_ok=True)
             final_local_path = config.output_dir / storage_key
-            with open(final_local_path, "wb") as outfile:
-                for ap in audio_files:
-                    with open(ap, "rb") as infile:
-                        while True:
-                            chunk = infile.read(1024 * 256)
-                            if not chunk:
-                                break
-                            outfile.write(chunk)
+            # Frame-level join: one header for the whole file, so seeking and
+            # duration are right; offsets say where each track starts
+            clips = await asyncio.to_thread(concat_mp3, audio_files, final_local_path)
 
             # Upload to storage with task-id-based key when possible
             storage_provider.upload_file(
@@ -156,8 +155,6 @@ async def generate_audio_common(
             # Verify availability with a short retry loop (handles eventual consistency)
             ok = False
             try_count = 0
-            import asyncio
-
             while try_count < 3:
                 try_count += 1
                 try:
@@ -186,6 +183,10 @@ async def generate_audio_common(
                     "storage_key": storage_key,
                     "storage_uri": storage_uri,
                     "content_type": "audio/mpeg",
+                    "segments": [
+                        {"index": index, "start": clip["start"], "end": clip["end"]}
+                        for index, clip in zip(audio_indices, clips, strict=True)
+                    ],
                 }
                 state["artifacts"] = artifacts
                 await state_manager.save_state(file_id, state)
@@ -80,7 +80,11 @@ async def compose_video(
         final_video_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Generate video using shared composer
-        composer = VideoComposer()
+        encoding_profile = state.get("encoding_profile") if state else None
+        composer = VideoComposer(
+            max_memory_mb=config.video_memory_budget_mb,
+            encoding_profile=encoding_profile,
+        )
 
         # Get subtitle files (SRT and VTT) if available
         subtitle_files = []
@@ -151,12 +155,14 @@ async def compose_video(
         )
 
         # Store in state
-        video_data = {
+        video_data: dict[str, Any] = {
             "local_path": str(final_video_path),
             "storage_url": storage_url,
             "storage_key": storage_key,
             "storage_uri": storage_uri,
         }
+        if composer.last_render_stats:
+            video_data["render_stats"] = composer.last_render_stats
 
         await state_manager.update_step_status(
             file_id, state_key, "completed", video_data
@@ -1,50 +1,52 @@
 """
-Compose final podcast MP3 by concatenating generated segments.
+Compose final podcast MP3 by mixing generated segments.
 
-Uses ffmpeg concat demuxer and uploads the result with task-first naming if available.
+Mixes the segments in one ffmpeg pass, following the timeline (pauses and
+crossfades) that the audio step planned and the subtitles already use. Uploads
+the result with task-first naming if available.
 """
 
-import os
-import subprocess
-from contextlib import suppress
-from pathlib import Path
+import asyncio
+from typing import Any
 
 from loguru import logger
 
+from slidespeaker.audio.mixer import DialogueTurn, mix_dialogue, plan_timeline
+from slidespeaker.audio.probe import probe_duration
 from slidespeaker.configs.config import config, get_storage_provider
 from slidespeaker.core.state_manager import state_manager
 from slidespeaker.storage.paths import output_storage_uri
 
 
-def _concat_with_ffmpeg(inputs: list[str], output_mp3: str) -> bool:
-    if not inputs:
-        return False
-    list_file = Path(output_mp3).with_suffix(".txt")
-    try:
-        with open(list_file, "w", encoding="utf-8") as f:
-            for p in inputs:
-                f.write(f"file '{p}'\n")
-        cmd = [
-            "ffmpeg",
-            "-y",
-            "-f",
-            "concat",
-            "-safe",
-            "0",
-            "-i",
-            str(list_file),
-            "-c",
-            "copy",
-            output_mp3,
-        ]
-        res = subprocess.run(cmd, capture_output=True, text=True)
-        if res.returncode != 0:
-            logger.error(f"ffmpeg concat failed: {res.stderr[:400]}")
-            return False
-        return os.path.exists(output_mp3) and os.path.getsize(output_mp3) > 0
-    finally:
-        with suppress(Exception):
-            list_file.unlink(missing_ok=True)
+def _dialogue_turns(data: dict[str, Any]) -> list[DialogueTurn]:
+    """Timeline planned by the audio step (re-planned for older task states)."""
+    turns: list[DialogueTurn] = []
+    for item in data.get("segment_metadata") or []:
+        if not isinstance(item, dict):
+            continue
+        try:
+            turns.append(
+                {
+                    "path": str(item["segment_file"]),
+                    "start": float(item["start"]),
+                    "end": float(item["end"]),
+                }
+            )
+        except (KeyError, TypeError, ValueError):
+            turns = []
+            break
+    if turns:
+        return turns
+    segments = [str(p) for p in data.get("segments") or []]
+    timeline = plan_timeline(
+        [probe_duration(p) or 0.0 for p in segments],
+        gap=config.podcast_turn_gap,
+        crossfade=config.podcast_crossfade,
+    )
+    return [
+        {"path": path, "start": start, "end": end}
+        for path, (start, end) in zip(segments, timeline, strict=True)
+    ]
 
 
 async def compose_podcast_step(file_id: str) -> None:
@@ -53,13 +55,13 @@ async def compose_podcast_step(file_id: str) -> None:
 
     try:
         st = await state_manager.get_state(file_id)
-        segments: list[str] = []
+        turns: list[DialogueTurn] = []
         if st and st.get("steps") and st["steps"].get("generate_podcast_audio"):
             data = st["steps"]["generate_podcast_audio"].get("data") or {}
             if isinstance(data, dict):
-                segments = list(data.get("segments") or [])
+                turns = _dialogue_turns(data)
 
-        if not segments:
+        if not turns:
             logger.warning("No podcast segments; composing empty output")
             await state_manager.update_step_status(
                 file_id, "compose_podcast", "completed", {"podcast_file": None}
@@ -75,12 +77,14 @@ async def compose_podcast_step(file_id: str) -> None:
         podcast_dir.mkdir(parents=True, exist_ok=True)
         podcast_path = config.output_dir / storage_key
 
-        ok = _concat_with_ffmpeg(segments, str(podcast_path))
-        if not ok:
+        try:
+            total_duration = await asyncio.to_thread(mix_dialogue, turns, podcast_path)
+        except Exception as e:
+            logger.error(f"Podcast mix failed: {e}")
             await state_manager.update_step_status(
-                file_id, "compose_podcast", "failed", {"error": "concat_failed"}
+                file_id, "compose_podcast", "failed", {"error": "mix_failed"}
             )
-            raise RuntimeError("Podcast composition failed")
+            raise RuntimeError("Podcast composition failed") from e
 
         # Upload to storage (using same base_id as local file)
         url = None
@@ -114,6 +118,7 @@ async def compose_podcast_step(file_id: str) -> None:
                 "storage_url": url,
                 "storage_key": storage_key,
                 "storage_uri": storage_uri,
+                "total_duration": total_duration,
             },
         )
 
@@ -1,12 +1,18 @@
 """
 Generate podcast audio segments (Host/Guest) from dialogue.
 
-Emits per-line MP3 segments and optionally uploads them via storage provider.
+Emits per-line MP3 segments (trimmed and loudness-normalised by the TTS
+scheduler) with their pause metadata, and plans where each line sits in the
+mixed podcast. Subtitles and the compose step both use that plan.
 """
 
 from loguru import logger
 
 from slidespeaker.audio.generator import AudioGenerator
+from slidespeaker.audio.mixer import plan_timeline
+from slidespeaker.audio.postprocess import ClipMetadata, read_clip_metadata
+from slidespeaker.audio.probe import probe_duration
+from slidespeaker.audio.scheduler import TTSJob, TTSScheduler
 from slidespeaker.configs.config import config
 from slidespeaker.core.state_manager import state_manager
 
@@ -113,7 +119,6 @@ async def generate_podcast_audio_step(file_id: str, language: str = "english") -
     segment_paths: list[str] = []
     segment_metadata: list[dict[str, object]] = []
     timed_dialogue: list[dict[str, object]] = []
-    cumulative_start = 0.0
 
     def _duration_fallback(content: str) -> float:
         # Approximate speech rate (around 150 words per minute).
@@ -121,6 +126,8 @@ async def generate_podcast_audio_step(file_id: str, language: str = "english") -
         approx = words / 2.5
         return max(approx, 2.0)
 
+    jobs: list[TTSJob] = []
+    speakers: list[str] = []
     for idx, line in enumerate(dialogue, start=1):
         raw_speaker = (line.get("speaker") or "Host").strip()
         text = (line.get("text") or "").strip()
@@ -136,37 +143,62 @@ async def generate_podcast_audio_step(file_id: str, language: str = "english") -
             )
         )
         voice = host_voice if normalized.startswith("host") else guest_voice
-        out_path = work_dir / f"segment_{idx:03d}.mp3"
-        ok = await ag.generate_audio(
-            text, str(out_path), language=language, voice=voice
+        jobs.append(
+            {
+                "text": text,
+                "output_path": work_dir / f"segment_{idx:03d}.mp3",
+                "language": language,
+                "voice": voice,
+            }
         )
+        speakers.append(speaker_label)
+
+    # Synthesise lines concurrently; results keep dialogue order for timing
+    results = await TTSScheduler(ag).run(jobs)
+    done: list[tuple[TTSJob, str, ClipMetadata | None, float]] = []
+    for job, speaker_label, ok in zip(jobs, speakers, results, strict=True):
         if not ok:
             continue
+        out_path = job["output_path"]
+        # Post-processed lines carry their trimmed duration and pauses
+        clip_meta = read_clip_metadata(out_path)
+        duration = (
+            clip_meta["duration"]
+            if clip_meta
+            else probe_duration(out_path) or _duration_fallback(job["text"])
+        )
+        done.append((job, speaker_label, clip_meta, duration))
 
-        duration = float(ag._get_audio_duration(out_path))  # noqa: SLF001 - internal helper
-        if duration <= 0:
-            duration = _duration_fallback(text)
-
-        start_time = cumulative_start
-        end_time = start_time + duration
-        cumulative_start = end_time
+    # The compose step mixes the lines to exactly this timeline
+    timeline = plan_timeline(
+        [duration for *_, duration in done],
+        gap=config.podcast_turn_gap,
+        crossfade=config.podcast_crossfade,
+    )
+    total_duration = timeline[-1][1] if timeline else 0.0
+    for (job, speaker_label, clip_meta, duration), (start_time, end_time) in zip(
+        done, timeline, strict=True
+    ):
+        out_path = job["output_path"]
+        text = job["text"]
 
         segment_paths.append(str(out_path))
         segment_metadata.append(
             {
                 "segment_file": str(out_path),
-                "voice": voice,
+                "voice": job["voice"],
                 "speaker": speaker_label,
                 "start": start_time,
                 "end": end_time,
                 "duration": duration,
+                "silences": clip_meta["silences"] if clip_meta else [],
             }
         )
         timed_dialogue.append(
             {
                 "speaker": speaker_label,
                 "text": text,
-                "voice": voice,
+                "voice": job["voice"],
                 "start": start_time,
                 "end": end_time,
                 "duration": duration,
@@ -189,6 +221,6 @@ async def generate_podcast_audio_step(file_id: str, language: str = "english") -
             "guest_voice": guest_voice,
             "dialogue": timed_dialogue,
             "dialogue_language": language,
-            "total_duration": cumulative_start,
+            "total_duration": total_duration,
         },
     )
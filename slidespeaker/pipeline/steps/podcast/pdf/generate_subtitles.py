@@ -1,5 +1,9 @@
 """
 Generate podcast subtitle artifacts (SRT/VTT) based on timed dialogue metadata.
+
+Lines whose audio came with word timings from the TTS provider (or forced
+alignment) are split into sentence cues at those times; other lines are shown
+as one cue spanning their turn.
 """
 
 from __future__ import annotations
@@ -9,9 +13,11 @@ from typing import Any
 
 from loguru import logger
 
+from slidespeaker.audio.alignment import read_words
 from slidespeaker.configs.config import config, get_storage_provider
 from slidespeaker.core.state_manager import state_manager
 from slidespeaker.storage.paths import output_storage_uri
+from slidespeaker.subtitle.cues import CueBuilder
 
 
 def _clean_voice(value: Any) -> str | None:
@@ -81,9 +87,38 @@ def _normalize_dialogue_entry(
     }
     if voice:
         normalized_entry["voice"] = voice
+    segment_file = entry.get("segment_file")
+    if isinstance(segment_file, str) and segment_file:
+        normalized_entry["segment_file"] = segment_file
     return normalized_entry
 
 
+def _subtitle_items(
+    dialogue: list[dict[str, Any]], language: str
+) -> list[dict[str, Any]]:
+    """Split lines with word timings into sentence cues within their turn."""
+    builder = CueBuilder()
+    items: list[dict[str, Any]] = []
+    for entry in dialogue:
+        words = read_words(entry.get("segment_file"))
+        cues = builder.word_cues(entry["text"], words, language) if words else []
+        if not cues:
+            items.append(entry)
+            continue
+        for cue_start, cue_end, text in cues:
+            start = entry["start"] + cue_start
+            end = min(entry["start"] + cue_end, entry["end"])
+            items.append(
+                {
+                    "label": entry["label"],
+                    "text": text,
+                    "start": start,
+                    "end": max(end, start + 0.1),
+                }
+            )
+    return items
+
+
 def _render_srt(dialogue: list[dict[str, Any]]) -> str:
     lines: list[str] = []
     for idx, item in enumerate(dialogue, start=1):
@@ -264,8 +299,9 @@ async def generate_podcast_subtitles_step(file_id: str) -> None:
         srt_path = work_dir / "dialogue.srt"
         vtt_path = work_dir / "dialogue.vtt"
 
-        srt_body = _render_srt(normalized_dialogue)
-        vtt_body = _render_vtt(normalized_dialogue)
+        subtitle_items = _subtitle_items(normalized_dialogue, subtitle_language)
+        srt_body = _render_srt(subtitle_items)
+        vtt_body = _render_vtt(subtitle_items)
 
         srt_path.write_text(srt_body, encoding="utf-8")
         vtt_path.write_text(vtt_body, encoding="utf-8")
@@ -4,11 +4,20 @@ Analyze slide images step for the presentation pipeline.
 This module performs visual analysis of slide images using AI vision services.
 It extracts visual elements, charts, diagrams, and other non-text content
 that should be considered when generating presentation scripts.
+Slides identical to an earlier one (same pixels, or a close perceptual hash
+when SLIDE_DEDUP_MAX_DISTANCE is set) reuse its analysis.
 """
 
+import asyncio
+import copy
 from pathlib import Path
+from typing import Any
 
+from loguru import logger
+
+from slidespeaker.configs.config import config
 from slidespeaker.core.state_manager import state_manager
+from slidespeaker.image.fingerprint import find_duplicates, load_fingerprint
 from slidespeaker.image.vision_service import VisionService
 
 vision_service = VisionService()
@@ -41,12 +50,33 @@ async def analyze_slides_step(file_id: str) -> None:
     if not slide_images:
         raise ValueError("No slide images available for analysis")
 
-    # Analyze each slide image using vision service
-    image_analyses = []
+    owners = list(range(len(slide_images)))
+    if config.slide_dedup_enabled:
+        fingerprints = [
+            await asyncio.to_thread(load_fingerprint, Path(p)) for p in slide_images
+        ]
+        owners = find_duplicates(fingerprints)
+
+    # Analyze each distinct slide image using vision service
+    image_analyses: list[dict[str, Any]] = []
     for i, image_path in enumerate(slide_images):
+        owner = owners[i]
+        if owner != i:
+            analysis = copy.deepcopy(image_analyses[owner]["analysis"])
+            image_analyses.append(
+                {"slide_number": i + 1, "analysis": analysis, "duplicate_of": owner + 1}
+            )
+            continue
         analysis = await vision_service.analyze_slide_image(Path(image_path))
         image_analyses.append({"slide_number": i + 1, "analysis": analysis})
 
+    reused = sum(1 for i, owner in enumerate(owners) if owner != i)
+    if reused:
+        logger.info(
+            f"Reused vision analysis for {reused} of {len(slide_images)} "
+            "duplicate slides"
+        )
+
     await state_manager.update_step_status(
         file_id, "analyze_slide_images", "completed", image_analyses
     )
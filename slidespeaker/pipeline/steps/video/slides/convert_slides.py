@@ -4,8 +4,11 @@ Convert slides to images step for the presentation pipeline.
 This module handles the conversion of presentation slides to image files.
 It takes the extracted slide content and generates PNG images for each slide
 that can be used in subsequent processing steps like visual analysis and video composition.
+Each image is fingerprinted as it is created, so visual analysis can skip duplicates,
+and gets a downscaled copy for vision requests.
 """
 
+import asyncio
 from pathlib import Path
 
 from loguru import logger
@@ -13,6 +16,8 @@ from loguru import logger
 from slidespeaker.configs.config import config, get_storage_provider
 from slidespeaker.core.state_manager import state_manager
 from slidespeaker.document import SlideExtractor
+from slidespeaker.image.fingerprint import fingerprint_image
+from slidespeaker.image.vision_variant import create_vision_variant
 
 slide_processor = SlideExtractor()
 
@@ -80,6 +85,16 @@ async def convert_slides_step(file_id: str, file_path: Path, file_ext: str) -> N
 
         image_path = images_dir / f"slide_{i + 1}.png"
         await slide_processor.convert_to_image(Path(file_path), file_ext, i, image_path)
+        if config.slide_dedup_enabled:
+            try:
+                await asyncio.to_thread(fingerprint_image, image_path)
+            except Exception as e:
+                logger.warning(f"Could not fingerprint slide {i + 1}: {e}")
+        if config.enable_visual_analysis and config.vision_image_optimize:
+            try:
+                await asyncio.to_thread(create_vision_variant, image_path)
+            except Exception as e:
+                logger.warning(f"Could not prepare vision image for slide {i + 1}: {e}")
 
         # Keep slide images local - only final files should be uploaded to cloud storage
         slide_images.append(str(image_path))
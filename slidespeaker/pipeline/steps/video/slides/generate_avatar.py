@@ -10,7 +10,7 @@ from loguru import logger
 
 from slidespeaker.configs.config import config, get_storage_provider
 from slidespeaker.core.state_manager import state_manager
-from slidespeaker.video.avatar import AvatarFactory
+from slidespeaker.video.avatar import AvatarFactory, AvatarJobRunner, AvatarRequest
 
 # Get storage provider instance
 storage_provider = get_storage_provider()
@@ -87,47 +87,53 @@ async def generate_avatar_step(file_id: str) -> None:
         if isinstance(candidate_voice, str) and candidate_voice.strip():
             voice_override = candidate_voice.strip()
 
-    for i, script_data in enumerate(scripts):
-        # Check for task cancellation periodically
-        if i % 2 == 0 and state and state.get("task_id"):  # Check every 2 slides
-            from slidespeaker.core.task_queue import task_queue
-
-            if await task_queue.is_task_cancelled(state["task_id"]):
-                logger.debug(
-                    f"Task {state['task_id']} was cancelled during "
-                    f"avatar video generation"
-                )
-                await state_manager.mark_cancelled(
-                    file_id, cancelled_step="generate_avatar_videos"
-                )
-                return
+    kwargs = {}
+    if voice_override:
+        kwargs["voice_id"] = voice_override
 
+    # Submit every slide up front; the runner bounds concurrency and polls
+    # all outstanding jobs together
+    indices: list[int] = []
+    requests: list[AvatarRequest] = []
+    for i, script_data in enumerate(scripts):
         # Additional null check for individual script data
         if script_data and "script" in script_data and script_data["script"]:
-            video_path = config.output_dir / f"{file_id}_avatar_{i + 1}.mp4"
-            try:
-                # Create avatar service using factory
-                avatar_service = AvatarFactory.create_service()
-
-                kwargs = {}
-                if voice_override:
-                    kwargs["voice_id"] = voice_override
-
-                await avatar_service.generate_avatar_video(
-                    script_data["script"],
-                    video_path,
-                    **kwargs,
-                )
-
-                # Keep avatar videos local - only final files should be uploaded to cloud storage
-                avatar_videos.append(str(video_path))
-                logger.debug(f"Generated avatar video for slide {i + 1}: {video_path}")
-
-            except Exception as e:
-                logger.error(f"Failed to generate avatar video for slide {i + 1}: {e}")
-                failed_slides.append(i + 1)
-                # Continue with other slides instead of failing completely
-                continue
+            indices.append(i)
+            requests.append(
+                {
+                    "script": script_data["script"],
+                    "output_path": config.output_dir / f"{file_id}_avatar_{i + 1}.mp4",
+                    "options": dict(kwargs),
+                }
+            )
+
+    task_id = state.get("task_id") if state else None
+
+    async def is_cancelled() -> bool:
+        if not task_id:
+            return False
+        from slidespeaker.core.task_queue import task_queue
+
+        return await task_queue.is_task_cancelled(task_id)
+
+    runner = AvatarJobRunner(AvatarFactory.create_service(), is_cancelled=is_cancelled)
+    results = await runner.run(requests)
+    if runner.cancelled:
+        logger.debug(f"Task {task_id} was cancelled during avatar video generation")
+        await state_manager.mark_cancelled(
+            file_id, cancelled_step="generate_avatar_videos"
+        )
+        return
+
+    for i, request, ok in zip(indices, requests, results, strict=True):
+        if ok:
+            # Keep avatar videos local - only final files should be uploaded to cloud storage
+            avatar_videos.append(str(request["output_path"]))
+            logger.debug(
+                f"Generated avatar video for slide {i + 1}: {request['output_path']}"
+            )
+        else:
+            failed_slides.append(i + 1)
 
     # If all slides failed, raise an error
     if len(failed_slides) == len(scripts):
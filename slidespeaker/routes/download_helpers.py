@@ -14,6 +14,7 @@ from fastapi.responses import StreamingResponse
 from starlette.background import BackgroundTask
 
 from slidespeaker.configs.config import get_storage_provider
+from slidespeaker.core.http_client import get_http_client
 from slidespeaker.storage import StorageProvider
 from slidespeaker.storage.paths import output_object_key
 
@@ -238,9 +239,7 @@ async def proxy_cloud_media(
         if range_header:
             headers["Range"] = range_header
 
-        client = await stack.enter_async_context(
-            httpx.AsyncClient(timeout=None, follow_redirects=True)
-        )
+        client = get_http_client("media")
         resp = await stack.enter_async_context(
             client.stream("GET", url, headers=headers)
         )
@@ -387,9 +386,7 @@ async def proxy_cloud_media_with_range(
         if range_header:
             headers["Range"] = range_header
 
-        client = await stack.enter_async_context(
-            httpx.AsyncClient(timeout=None, follow_redirects=True)
-        )
+        client = get_http_client("media")
         resp = await stack.enter_async_context(
             client.stream("GET", url, headers=headers)
         )
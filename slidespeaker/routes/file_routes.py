@@ -21,6 +21,7 @@ from slidespeaker.storage.paths import (
     object_key_from_uri,
     upload_object_key,
 )
+from slidespeaker.video.profiles import available_profiles
 
 router = APIRouter(
     prefix="/api",
@@ -42,7 +43,8 @@ async def run_file(
       voice_language: str,
       subtitle_language?: str|null,
       transcript_language?: str|null,
-      video_resolution?: 'sd'|'hd'|'fullhd'
+      video_resolution?: 'sd'|'hd'|'fullhd',
+      encoding_profile?: str
     }
     """
     # Lookup filename/ext from state if available
@@ -144,6 +146,17 @@ async def run_file(
         if isinstance(raw_guest_voice, str) and raw_guest_voice.strip()
         else None
     )
+    raw_profile = payload.get("encoding_profile")
+    encoding_profile = (
+        raw_profile.strip().lower()
+        if isinstance(raw_profile, str) and raw_profile.strip()
+        else None
+    )
+    if encoding_profile is not None and encoding_profile not in available_profiles():
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported encoding profile: {encoding_profile}",
+        )
 
     # Fallback to previous selections when not provided
     if st and isinstance(st, dict):
@@ -171,6 +184,14 @@ async def run_file(
             )
             if isinstance(stored_guest, str) and stored_guest.strip():
                 podcast_guest_voice = stored_guest.strip()
+        if encoding_profile is None:
+            stored_profile = st.get("encoding_profile") or (
+                (st.get("task_config") or {}).get("encoding_profile")
+                if isinstance(st.get("task_config"), dict)
+                else None
+            )
+            if isinstance(stored_profile, str) and stored_profile.strip():
+                encoding_profile = stored_profile.strip()
 
     # Enforce permissible combinations
     if file_ext.lower() != ".pdf" and task_type == "podcast":
@@ -240,6 +261,7 @@ async def run_file(
             voice_id=voice_for_task,
             podcast_host_voice=host_voice_for_task,
             podcast_guest_voice=guest_voice_for_task,
+            encoding_profile=encoding_profile if generate_video else None,
         )
         return {"task_id": new_task_id, "file_id": file_id}
     except Exception as e:
@@ -1,13 +1,26 @@
 """
 TTS and LLM routes for listing provider catalogs.
+
+Voice lists and catalogs come from the in-memory voice catalogue cache and
+carry ETags, so repeat requests are answered without touching the provider.
 """
 
+import asyncio
+
 import httpx
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import JSONResponse
 
 from slidespeaker.audio.tts_factory import TTSFactory
+from slidespeaker.audio.voice_catalog import (
+    CatalogEntry,
+    voice_catalog,
+    voices_key,
+    voices_payload,
+)
 from slidespeaker.auth import require_authenticated_user
 from slidespeaker.configs.config import config
+from slidespeaker.core.http_client import get_http_client
 
 router = APIRouter(
     prefix="/api",
@@ -16,83 +29,109 @@ router = APIRouter(
 )
 
 
+def _cached_response(request: Request, entry: CatalogEntry) -> Response:
+    """Serve a catalogue entry, or 304 when the client already has it."""
+    headers = {
+        "ETag": entry.etag,
+        "Cache-Control": f"private, max-age={int(voice_catalog.ttl)}",
+    }
+    if_none_match = request.headers.get("if-none-match", "")
+    if entry.etag in if_none_match or if_none_match.strip() == "*":
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(entry.payload, headers=headers)
+
+
+def _provider_name(provider: str | None) -> str:
+    return (provider or config.tts_model or "openai").partition("/")[0].lower()
+
+
 @router.get("/tts/voices")
 async def list_tts_voices(
-    language: str = "english", provider: str | None = None
-) -> dict[str, object]:
+    request: Request, language: str = "english", provider: str | None = None
+) -> Response:
     """List supported TTS voices for the given language.
 
     Args:
         language: Normalized language key (e.g., 'english', 'simplified_chinese')
         provider: Optional provider override (openai|elevenlabs). Defaults to config.
     """
-    try:
-        service = TTSFactory.create_service(config.tts_model)
-        voices = service.get_supported_voices(language)
+    model_spec = provider or config.tts_model
+
+    provider_name = _provider_name(model_spec)
+
+    async def load() -> dict[str, object]:
+        service = TTSFactory.create_service(model_spec)
+        voices = await asyncio.to_thread(service.get_supported_voices, language)
         # Extract model name instead of returning the service instance
-        model_name = (
-            config.tts_model.split("/")[0]
-            if "/" in config.tts_model
-            else config.tts_model
-        )
-        return {"model": model_name, "voices": voices}
+        return voices_payload(provider_name, voices)
+
+    try:
+        entry = await voice_catalog.get(voices_key(provider_name, language), load)
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"TTS voices unavailable: {e}"
         ) from e
+    return _cached_response(request, entry)
+
+
+async def _load_catalog(p: str) -> dict[str, object]:
+    catalog: dict[str, object] = {"provider": p, "voices": []}
+    if p == "elevenlabs":
+        api_key = config.elevenlabs_api_key
+        if not api_key:
+            raise RuntimeError("ELEVENLABS_API_KEY not configured")
+        client = get_http_client("elevenlabs")
+        resp = await client.get(
+            "https://api.elevenlabs.io/v1/voices",
+            headers={"xi-api-key": api_key},
+        )
+        resp.raise_for_status()
+        data = resp.json()
+        voices = []
+        for v in data.get("voices") or []:
+            voices.append(
+                {
+                    "id": v.get("voice_id"),
+                    "name": v.get("name"),
+                    "labels": v.get("labels", {}),
+                    "category": v.get("category"),
+                }
+            )
+        catalog["voices"] = voices
+        return catalog
+    elif p == "openai":
+        # Static catalog; OpenAI doesn't provide a voice list endpoint
+        base = [
+            {"id": "alloy", "name": "Alloy"},
+            {"id": "echo", "name": "Echo"},
+            {"id": "fable", "name": "Fable"},
+            {"id": "onyx", "name": "Onyx"},
+            {"id": "nova", "name": "Nova"},
+            {"id": "shimmer", "name": "Shimmer"},
+        ]
+        catalog["voices"] = base
+        catalog["notes"] = "Static OpenAI voice set; no official list-voices API"
+        return catalog
+    else:
+        raise RuntimeError(f"Unknown provider: {p}")
 
 
 @router.get("/tts/catalog")
-async def tts_catalog(provider: str | None = None) -> dict[str, object]:
+async def tts_catalog(request: Request, provider: str | None = None) -> Response:
     """Return a richer voice catalog for a provider (IDs, names, languages).
 
     Provider-specific behavior:
     - elevenlabs: calls list-voices API when possible.
     - openai: returns static set with common voices and language hints.
+
+    Catalogs are served from the process-wide voice catalogue cache.
     """
-    p = (provider or config.tts_service).lower()
-    catalog: dict[str, object] = {"provider": p, "voices": []}
+    p = _provider_name(provider)
     try:
-        if p == "elevenlabs":
-            api_key = config.elevenlabs_api_key
-            if not api_key:
-                raise RuntimeError("ELEVENLABS_API_KEY not configured")
-            async with httpx.AsyncClient(timeout=30) as client:
-                resp = await client.get(
-                    "https://api.elevenlabs.io/v1/voices",
-                    headers={"xi-api-key": api_key},
-                )
-                resp.raise_for_status()
-                data = resp.json()
-            voices = []
-            for v in data.get("voices") or []:
-                voices.append(
-                    {
-                        "id": v.get("voice_id"),
-                        "name": v.get("name"),
-                        "labels": v.get("labels", {}),
-                        "category": v.get("category"),
-                    }
-                )
-            catalog["voices"] = voices
-            return catalog
-        elif p == "openai":
-            # Static catalog; OpenAI doesn't provide a voice list endpoint
-            base = [
-                {"id": "alloy", "name": "Alloy"},
-                {"id": "echo", "name": "Echo"},
-                {"id": "fable", "name": "Fable"},
-                {"id": "onyx", "name": "Onyx"},
-                {"id": "nova", "name": "Nova"},
-                {"id": "shimmer", "name": "Shimmer"},
-            ]
-            catalog["voices"] = base
-            catalog["notes"] = "Static OpenAI voice set; no official list-voices API"
-            return catalog
-        else:
-            raise RuntimeError(f"Unknown provider: {p}")
+        entry = await voice_catalog.get(("catalog", p), lambda: _load_catalog(p))
     except httpx.HTTPError as e:
         raise HTTPException(status_code=500, detail=f"Catalog error: {e}") from e
+    return _cached_response(request, entry)
 
 
 @router.get("/llm/models")
@@ -31,6 +31,7 @@ from slidespeaker.repository.upload import (
     upsert_upload,
 )
 from slidespeaker.storage.paths import upload_storage_uri
+from slidespeaker.video.profiles import available_profiles
 
 # Create a rate limiter for this router
 limiter = Limiter(key_func=get_remote_address)
@@ -215,6 +216,7 @@ async def _parse_upload_payload(request: Request) -> dict[str, Any]:
             "podcast_guest_voice": _coerce_optional_str(
                 form.get("podcast_guest_voice")
             ),
+            "encoding_profile": _coerce_optional_str(form.get("encoding_profile")),
         }
         return payload
 
@@ -262,6 +264,7 @@ async def _parse_upload_payload(request: Request) -> dict[str, Any]:
         "voice_id": _coerce_optional_str(body.get("voice_id")),
         "podcast_host_voice": _coerce_optional_str(body.get("podcast_host_voice")),
         "podcast_guest_voice": _coerce_optional_str(body.get("podcast_guest_voice")),
+        "encoding_profile": _coerce_optional_str(body.get("encoding_profile")),
     }
 
 
@@ -317,6 +320,7 @@ async def upload_file(
         voice_id = _coerce_optional_str(payload.get("voice_id"))
         podcast_host_voice = _coerce_optional_str(payload.get("podcast_host_voice"))
         podcast_guest_voice = _coerce_optional_str(payload.get("podcast_guest_voice"))
+        encoding_profile = _coerce_optional_str(payload.get("encoding_profile"))
 
         file_ext = Path(filename).suffix.lower()
         # Determine source_type from request or by extension and validate
@@ -390,6 +394,16 @@ async def upload_file(
                 f"Valid options: {', '.join(valid_resolutions)}",
             )
 
+        # Validate encoding profile (optional; defaults to FFMPEG_PROFILE)
+        if encoding_profile is not None:
+            encoding_profile = encoding_profile.lower()
+            if encoding_profile not in available_profiles():
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Unsupported encoding profile: {encoding_profile}. "
+                    f"Valid options: {', '.join(available_profiles())}",
+                )
+
         if file_ext == ".pdf":
             content_type = "application/pdf"
         elif file_ext == ".pptx":
@@ -500,6 +514,7 @@ async def upload_file(
             voice_id=voice_for_task,
             podcast_host_voice=host_voice_for_task,
             podcast_guest_voice=guest_voice_for_task,
+            encoding_profile=encoding_profile if generate_video else None,
         )
 
         logger.info(
@@ -4,11 +4,17 @@ Subtitle package for SlideSpeaker.
 Provides subtitle generation, sentence segmentation, and timing utilities.
 """
 
-from .generator import SubtitleGenerator
+from .cues import CueBuilder
+from .generator import SUBTITLE_FORMATS, SubtitleGenerator
 from .text_segmentation import split_sentences
+from .timeline import Cue, SlideTiming
 from .timing import calculate_chunk_durations
 
 __all__ = [
+    "SUBTITLE_FORMATS",
+    "Cue",
+    "CueBuilder",
+    "SlideTiming",
     "SubtitleGenerator",
     "split_sentences",
     "calculate_chunk_durations",
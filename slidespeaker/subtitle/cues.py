@@ -10,192 +10,363 @@ from __future__ import annotations
 import math
 import re
 import subprocess
-from datetime import timedelta
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 from loguru import logger
 
-from ..audio import AudioGenerator
-from .text_segmentation import split_sentences
-from .timing import calculate_chunk_durations
+from ..audio.alignment import WordTiming
+from ..audio.chunking import TimingAnchor
+from ..audio.postprocess import (
+    SILENCE_DETECT_FILTER,
+    parse_silences,
+    read_clip_metadata,
+)
+from .text_segmentation import (
+    ScriptClass,
+    Segmentation,
+    classify_script,
+    measure_chunks,
+    segment,
+    word_count,
+)
+from .timeline import NO_AUDIO, Cue, SlideTiming, measure_slide
+from .timing import segment_durations, snap_to_boundaries
+
+MIN_CUE_SECONDS = 0.1
+
+_SPACE_RE = re.compile(r"\s+")
+_NOT_SPOKEN_RE = re.compile(r"[\W_]+")
+_PUNCTUATION_RE = re.compile(r"[。！？?!,.、；;：:…·—\-]+")
+
+
+def _spoken(text: str) -> str:
+    """Letters and digits of ``text``: what aligned words and chunks share."""
+    return _NOT_SPOKEN_RE.sub("", text).casefold()
 
 
 class CueBuilder:
     def __init__(self) -> None:
-        self.audio_generator = AudioGenerator()
         self._silence_cache: dict[str, list[float]] = {}
 
+    def build_timing(self, audio_files: list[Path]) -> list[SlideTiming]:
+        """Measure each clip once; the result serves every subtitle language."""
+        return [
+            measure_slide(path, self._detect_silence_boundaries)
+            for path in audio_files or []
+        ]
+
     def build_cues(
         self,
         scripts: list[dict[str, Any]],
         audio_files: list[Path],
         language: str,
-    ) -> list[tuple[timedelta, timedelta, str]]:
-        cues: list[tuple[timedelta, timedelta, str]] = []
+        timing: list[SlideTiming] | None = None,
+    ) -> list[Cue]:
+        cues: list[Cue] = []
         if not scripts:
             return cues
-        start_time = timedelta(seconds=0)
+        if timing is None:
+            timing = self.build_timing(audio_files)
+        start_time = 0.0
         max_cue_seconds = self._max_cue_seconds(language)
-        audio_paths = list(audio_files or [])
 
         for idx, script_data in enumerate(scripts):
             script_text = script_data.get("script", "").strip() if script_data else ""
             if not script_text:
                 continue
-            audio_path = audio_paths[idx] if idx < len(audio_paths) else None
-            duration = self._resolve_duration(audio_path, script_text)
+            slide = timing[idx] if idx < len(timing) else NO_AUDIO
+            # Classified once; chunking, timing and estimation all reuse it
+            script = classify_script(script_text)
+            duration = self._resolve_duration(slide, script_text, script)
             # Ensure we have a minimum duration to prevent timestamp issues
             duration = max(0.5, duration)
             if duration <= 0:
                 logger.warning(f"Skipping segment with zero duration at index {idx}")
                 continue
-            text_chunks = self._normalize_chunks(
-                self._split_text_for_subtitles(script_text, language)
-            )
-            chunk_durations = calculate_chunk_durations(
-                duration, text_chunks, script_text, language
-            )
-            if audio_path:
-                boundaries = self._detect_silence_boundaries(audio_path, duration)
-                if boundaries:
-                    chunk_durations = self._snap_chunk_durations_to_audio(
-                        chunk_durations, boundaries, duration
-                    )
-            # Ensure no chunk durations are zero to prevent duplicate timestamps
-            min_chunk_duration = 0.1
-            chunk_durations = [max(min_chunk_duration, dur) for dur in chunk_durations]
-            for j, (chunk, chunk_duration) in enumerate(
-                zip(text_chunks, chunk_durations, strict=False)
-            ):
-                chunk_start_time = start_time
-                if j == len(text_chunks) - 1:
-                    elapsed_time = sum(chunk_durations[:j])
-                    chunk_end_time = start_time + timedelta(
-                        seconds=duration - elapsed_time
+            words = self._matching_words(slide, script_text)
+            anchors = self._matching_anchors(slide, script_text)
+            boundaries = [ts for ts in slide.silences if 0.0 < ts < duration]
+            if words:
+                # Forced alignment gave word times: cut cues exactly at them
+                slide_start = start_time
+                end = self._word_cues(
+                    cues,
+                    script_text,
+                    words,
+                    slide_start,
+                    language,
+                    max_cue_seconds,
+                    script,
+                )
+                start_time = max(end, slide_start + duration)
+            elif anchors:
+                # Chunked synthesis recorded exact chunk positions; time each
+                # chunk's text within its own span
+                clip_start = start_time
+                for anchor in anchors:
+                    span = max(0.1, anchor["end"] - anchor["start"])
+                    local_boundaries = [
+                        b - anchor["start"]
+                        for b in boundaries
+                        if anchor["start"] < b < anchor["end"]
+                    ]
+                    start_time = self._segment_cues(
+                        cues,
+                        anchor["text"],
+                        span,
+                        max(start_time, clip_start + anchor["start"]),
+                        language,
+                        max_cue_seconds,
+                        local_boundaries,
+                        script,
                     )
-                else:
-                    chunk_end_time = start_time + timedelta(seconds=chunk_duration)
+                start_time = max(start_time, clip_start + duration)
+            else:
+                start_time = self._segment_cues(
+                    cues,
+                    script_text,
+                    duration,
+                    start_time,
+                    language,
+                    max_cue_seconds,
+                    boundaries,
+                    script,
+                )
+        logger.info(f"Built {len(cues)} cues for subtitles")
+        return cues
 
-                # Ensure chunk end time is after start time to prevent zero-duration cues
-                min_cue_duration = 0.1
-                if chunk_end_time <= chunk_start_time:
-                    chunk_end_time = chunk_start_time + timedelta(
-                        seconds=min_cue_duration
-                    )
+    def word_cues(self, text: str, words: list[WordTiming], language: str) -> list[Cue]:
+        """Cut ``text`` into cues at the times its ``words`` were spoken.
+
+        Cue times are relative to the start of the clip. Returns an empty list
+        when the words belong to a different text (e.g. a translation).
+        """
+        text = (text or "").strip()
+        slide = SlideTiming(None, None, (), (), tuple(words))
+        matched = self._matching_words(slide, text)
+        cues: list[Cue] = []
+        if text and matched:
+            self._word_cues(
+                cues,
+                text,
+                matched,
+                0.0,
+                language,
+                self._max_cue_seconds(language),
+                classify_script(text),
+            )
+        return cues
+
+    def _segment_cues(
+        self,
+        cues: list[Cue],
+        script_text: str,
+        duration: float,
+        start_time: float,
+        language: str,
+        max_cue_seconds: float,
+        boundaries: list[float],
+        script: ScriptClass | None = None,
+    ) -> float:
+        """Append cues for ``script_text`` spoken over ``duration`` seconds.
+
+        ``boundaries`` are silence timestamps relative to ``start_time``. Returns
+        the end time of the last cue.
+        """
+        seg = self._split_text_for_subtitles(script_text, language, script)
+        text_chunks = self._normalize_chunks(seg.chunks)
+        if not text_chunks:
+            return start_time
+        if text_chunks != seg.chunks:
+            seg = measure_chunks(text_chunks, seg.script, language)
+        chunk_durations = segment_durations(duration, seg)
+        if boundaries:
+            chunk_durations = snap_to_boundaries(
+                chunk_durations, np.asarray(boundaries, dtype=np.float64), duration
+            )
+        # Ensure no chunk durations are zero to prevent duplicate timestamps
+        chunk_durations = np.maximum(chunk_durations, MIN_CUE_SECONDS)
+        # Chunks run back to back; the last one ends exactly with the audio
+        starts = start_time + np.concatenate(([0.0], np.cumsum(chunk_durations[:-1])))
+        ends = starts + chunk_durations
+        ends[-1] = start_time + duration
+        # Ensure chunk end time is after start time to prevent zero-duration cues
+        ends = np.where(ends <= starts, starts + MIN_CUE_SECONDS, ends)
 
-                total_secs = max(
-                    0.1, (chunk_end_time - chunk_start_time).total_seconds()
+        for chunk, chunk_start, chunk_end in zip(
+            text_chunks, starts.tolist(), ends.tolist(), strict=True
+        ):
+            total_secs = max(MIN_CUE_SECONDS, chunk_end - chunk_start)
+            if total_secs <= max_cue_seconds + 1e-3:
+                self._append_cue(cues, chunk_start, chunk_end, chunk)
+                continue
+            part_seg = self._split_for_cue(chunk, language, classify_script(chunk))
+            parts = part_seg.chunks
+            if len(parts) <= 1:
+                segments = max(
+                    2, int(math.ceil(total_secs / max(0.01, max_cue_seconds)))
                 )
-                if total_secs <= max_cue_seconds + 1e-3:
-                    self._append_cue(cues, chunk_start_time, chunk_end_time, chunk)
-                else:
-                    parts = self._split_for_cue(chunk, language)
-                    if len(parts) <= 1:
-                        segments = max(
-                            2, int(math.ceil(total_secs / max(0.01, max_cue_seconds)))
-                        )
-                        seg_len = total_secs / segments
-                        for s in range(segments):
-                            seg_start = chunk_start_time + timedelta(
-                                seconds=seg_len * s
-                            )
-                            seg_end = (
-                                chunk_end_time
-                                if s == segments - 1
-                                else chunk_start_time
-                                + timedelta(seconds=seg_len * (s + 1))
+                edges = np.linspace(chunk_start, chunk_start + total_secs, segments + 1)
+                edges[-1] = chunk_end
+                for seg_start, seg_end in zip(
+                    edges[:-1].tolist(), edges[1:].tolist(), strict=True
+                ):
+                    self._append_cue(cues, seg_start, seg_end, chunk)
+                continue
+
+            raw_durs = np.maximum(
+                segment_durations(total_secs, part_seg),
+                MIN_CUE_SECONDS,
+            )
+            min_cue = 0.9
+            merged_parts: list[str] = []
+            merged_durs: list[float] = []
+            acc_text = ""
+            acc_dur = 0.0
+            for p_text, p_dur in zip(parts, raw_durs.tolist(), strict=True):
+                acc_text = f"{acc_text} {p_text}".strip() if acc_text else p_text
+                acc_dur += p_dur
+                if acc_dur >= min_cue:
+                    merged_parts.append(acc_text)
+                    merged_durs.append(acc_dur)
+                    acc_text = ""
+                    acc_dur = 0.0
+            if acc_text:
+                merged_parts.append(acc_text)
+                merged_durs.append(max(MIN_CUE_SECONDS, acc_dur))
+
+            cursor = chunk_start
+            for p_text, p_dur in zip(merged_parts, merged_durs, strict=True):
+                remaining = max(MIN_CUE_SECONDS, p_dur)
+                while remaining > 1e-6:
+                    seg_dur = min(remaining, max_cue_seconds)
+                    if 0 < remaining - seg_dur < min_cue:
+                        seg_dur = remaining
+                    seg_end = cursor + max(seg_dur, MIN_CUE_SECONDS)
+                    self._append_cue(cues, cursor, seg_end, p_text)
+                    cursor = seg_end
+                    remaining -= seg_dur
+        return max(start_time, float(ends.max()))
+
+    def _word_cues(
+        self,
+        cues: list[Cue],
+        script_text: str,
+        words: tuple[WordTiming, ...],
+        start_time: float,
+        language: str,
+        max_cue_seconds: float,
+        script: ScriptClass | None = None,
+    ) -> float:
+        """Append cues for ``script_text`` using aligned ``words``.
+
+        Chunks are mapped onto words by their position in the script's
+        letters and digits, so this works for any tokenisation. Returns the
+        end time of the last cue.
+        """
+        lengths = np.array([len(_spoken(w["word"])) for w in words])
+        word_ends = np.cumsum(lengths)
+        word_starts = word_ends - lengths
+        starts = np.array([w["start"] for w in words]) + start_time
+        ends = np.array([w["end"] for w in words]) + start_time
+
+        def span(lo: int, hi: int) -> tuple[float, float]:
+            # First word ending after ``lo`` through last word starting before ``hi``
+            first = min(
+                int(np.searchsorted(word_ends, lo, side="right")), len(words) - 1
+            )
+            last = max(int(np.searchsorted(word_starts, hi, side="left")) - 1, first)
+            return float(starts[first]), float(max(ends[last], starts[first]))
+
+        seg = self._split_text_for_subtitles(script_text, language, script)
+        offset = 0
+        last_end = start_time
+        for chunk in self._normalize_chunks(seg.chunks):
+            size = len(_spoken(chunk))
+            if not size:
+                continue
+            chunk_start, chunk_end = span(offset, offset + size)
+            pieces = [(chunk, chunk_start, chunk_end)]
+            if chunk_end - chunk_start > max_cue_seconds + 1e-3:
+                parts = self._split_for_cue(
+                    chunk, language, classify_script(chunk)
+                ).chunks
+                if len(parts) > 1:
+                    pieces = []
+                    part_offset = offset
+                    for part in parts:
+                        part_size = len(_spoken(part))
+                        if part_size:
+                            pieces.append(
+                                (part, *span(part_offset, part_offset + part_size))
                             )
-                            # Ensure segment end time is after start time
-                            if seg_end <= seg_start:
-                                seg_end = seg_start + timedelta(seconds=0.1)
-                            self._append_cue(cues, seg_start, seg_end, chunk)
-                    else:
-                        raw_durs = calculate_chunk_durations(
-                            total_secs, parts, chunk, language
-                        )
-                        # Ensure no durations are zero
-                        min_duration = 0.1
-                        raw_durs = [max(min_duration, dur) for dur in raw_durs]
-
-                        min_cue = 0.9
-                        merged_parts: list[str] = []
-                        merged_durs: list[float] = []
-                        acc_text = ""
-                        acc_dur = 0.0
-                        for p_text, p_dur in zip(parts, raw_durs, strict=False):
-                            if not acc_text:
-                                acc_text = p_text
-                                acc_dur = p_dur
-                            else:
-                                acc_text = f"{acc_text} {p_text}".strip()
-                                acc_dur += p_dur
-                            if acc_dur >= min_cue:
-                                merged_parts.append(acc_text)
-                                merged_durs.append(max(min_duration, acc_dur))
-                                acc_text = ""
-                                acc_dur = 0.0
-                        if acc_text:
-                            merged_parts.append(acc_text)
-                            merged_durs.append(max(min_duration, acc_dur))
-
-                        cursor = chunk_start_time
-                        for p_text, p_dur in zip(
-                            merged_parts, merged_durs, strict=False
-                        ):
-                            remaining = max(0.1, p_dur)
-                            while remaining > 1e-6:
-                                seg_dur = min(remaining, max_cue_seconds)
-                                if 0 < remaining - seg_dur < min_cue:
-                                    seg_dur = remaining
-                                seg_end = cursor + timedelta(seconds=seg_dur)
-                                # Ensure segment end time is after start time
-                                if seg_end <= cursor:
-                                    seg_end = cursor + timedelta(seconds=0.1)
-                                self._append_cue(cues, cursor, seg_end, p_text)
-                                cursor = seg_end
-                                remaining -= seg_dur
-                start_time = max(start_time, chunk_end_time)
-        logger.info(f"Built {len(cues)} cues for subtitles")
-        return cues
+                            part_offset += part_size
+            for text, cue_start, cue_end in pieces:
+                self._append_cue(cues, cue_start, cue_end, text)
+                last_end = max(last_end, cue_end)
+            offset += size
+        return last_end
+
+    def _matching_words(
+        self, slide: SlideTiming, script_text: str
+    ) -> tuple[WordTiming, ...]:
+        """Return the clip's aligned words if they spell exactly this script."""
+        if not slide.words:
+            return ()
+        spoken = "".join(_spoken(w["word"]) for w in slide.words)
+        if not spoken or spoken != _spoken(script_text):
+            # Subtitles in another language than the voice
+            return ()
+        return slide.words
 
-    def _resolve_duration(self, audio_path: Path | None, script_text: str) -> float:
+    def _matching_anchors(
+        self, slide: SlideTiming, script_text: str
+    ) -> tuple[TimingAnchor, ...]:
+        """Return the clip's timing anchors if they cover exactly this script."""
+        anchors = slide.anchors
+        if not anchors:
+            return ()
+        anchored = "".join(a["text"] for a in anchors)
+        if _SPACE_RE.sub("", anchored) != _SPACE_RE.sub("", script_text):
+            # Subtitles in another language than the voice: anchors don't apply
+            return ()
+        return anchors
+
+    def _resolve_duration(
+        self,
+        slide: SlideTiming,
+        script_text: str,
+        script: ScriptClass | None = None,
+    ) -> float:
         cleaned_text = (script_text or "").strip()
-        estimated = self._estimate_duration_from_text(cleaned_text)
+        estimated = self._estimate_duration_from_text(cleaned_text, script)
         min_reasonable = max(1.0, estimated * 0.35)
-        if audio_path:
-            try:
-                duration = float(self.audio_generator._get_audio_duration(audio_path))
-                # Treat implausibly short clips as invalid and fall back to textual estimate
-                if duration < min_reasonable:
-                    return estimated
-                return max(0.5, duration)
-            except Exception:
-                pass
+        measured = slide.duration
+        if measured is not None:
+            # Treat implausibly short clips as invalid and fall back to textual estimate
+            if measured < min_reasonable:
+                return estimated
+            return max(0.5, measured)
         return max(1.0, estimated)
 
-    def _estimate_duration_from_text(self, text: str) -> float:
+    def _estimate_duration_from_text(
+        self, text: str, script: ScriptClass | None = None
+    ) -> float:
         if not text:
             return 1.5
+        if script is None:
+            script = classify_script(text)
 
-        compact = re.sub(r"\s+", "", text)
-        char_count = max(1, len(compact))
-        is_cjk = bool(
-            re.search(
-                r"[\u3040-\u30FF\u3400-\u4DBF\u4E00-\u9FFF\uF900-\uFAFF\uAC00-\uD7AF]",
-                compact,
-            )
-        )
-
-        if is_cjk:
+        if script == "cjk":
+            char_count = max(1, len(_SPACE_RE.sub("", text)))
             avg_chars_per_sec = 5.0  # slower rate for logographic scripts
             estimated = char_count / avg_chars_per_sec
             return max(2.0, estimated)
 
-        tokens = re.findall(r"[A-Za-z0-9']+", text)
-        word_count = max(1, len(tokens) or len(text.split()))
         avg_words_per_sec = 2.6  # ~156 WPM
-        estimated = word_count / avg_words_per_sec
+        estimated = max(1, word_count(text)) / avg_words_per_sec
         return max(1.5, estimated)
 
     def _normalize_chunks(self, chunks: list[str]) -> list[str]:
@@ -205,7 +376,7 @@ class CueBuilder:
             chunk = (chunk or "").strip()
             if not chunk:
                 continue
-            if re.fullmatch(r"[。！？?!,.、；;：:…·—\-]+", chunk):
+            if _PUNCTUATION_RE.fullmatch(chunk):
                 if normalized:
                     normalized[-1] = f"{normalized[-1].rstrip()}{chunk}"
                 else:
@@ -230,6 +401,12 @@ class CueBuilder:
         cached = self._silence_cache.get(cache_key)
         if cached is not None:
             return cached
+        # Post-processed clips already carry the silences found while encoding
+        metadata = read_clip_metadata(audio_path)
+        if metadata is not None:
+            boundaries = [ts for ts in metadata["silences"] if 0.0 < ts < duration]
+            self._silence_cache[cache_key] = boundaries
+            return boundaries
         cmd = [
             "ffmpeg",
             "-hide_banner",
@@ -237,7 +414,7 @@ class CueBuilder:
             "-i",
             resolved,
             "-af",
-            "silencedetect=noise=-35dB:d=0.28",
+            SILENCE_DETECT_FILTER,
             "-f",
             "null",
             "-",
@@ -248,91 +425,15 @@ class CueBuilder:
             logger.debug("ffmpeg not found while detecting silence; skipping alignment")
             self._silence_cache[cache_key] = []
             return []
-        output = f"{proc.stdout}\n{proc.stderr}"
-        pattern_start = re.compile(r"silence_start:\s*([0-9.]+)")
-        pattern_end = re.compile(r"silence_end:\s*([0-9.]+)")
-        values: list[float] = []
-        for match in pattern_start.finditer(output):
-            try:
-                ts = float(match.group(1))
-                if 0.0 < ts < duration:
-                    values.append(ts)
-            except ValueError:
-                continue
-        for match in pattern_end.finditer(output):
-            try:
-                ts = float(match.group(1))
-                if 0.0 < ts < duration:
-                    values.append(ts)
-            except ValueError:
-                continue
-        deduped: list[float] = []
-        seen = set()
-        for ts in sorted(values):
-            key = round(ts, 2)
-            if key in seen:
-                continue
-            seen.add(key)
-            deduped.append(ts)
+        deduped = parse_silences(f"{proc.stdout}\n{proc.stderr}", duration)
         self._silence_cache[cache_key] = deduped
         return deduped
 
-    def _snap_chunk_durations_to_audio(
-        self,
-        chunk_durations: list[float],
-        boundaries: list[float],
-        total_duration: float,
-    ) -> list[float]:
-        """Align chunk durations to nearest silence boundaries within tolerance."""
-        if len(chunk_durations) <= 1 or not boundaries:
-            return chunk_durations
-        usable_boundaries = [b for b in boundaries if 0.05 < b < total_duration - 0.05]
-        if not usable_boundaries:
-            return chunk_durations
-        interior_targets: list[float] = []
-        accum = 0.0
-        for dur in chunk_durations[:-1]:
-            accum += dur
-            interior_targets.append(accum)
-        snapped_prefix = [0.0]
-        last = 0.0
-        tolerance = 0.45
-        min_gap = 0.12
-        remaining_slots = len(chunk_durations) - 1
-        for idx, target in enumerate(interior_targets, start=1):
-            nearest = min(
-                usable_boundaries, key=lambda b: abs(b - target), default=None
-            )
-            snapped = target
-            if nearest is not None and abs(nearest - target) <= tolerance:
-                snapped = nearest
-            if snapped <= last + min_gap:
-                snapped = max(last + min_gap, target)
-            max_allowed = total_duration - min_gap * (remaining_slots - idx + 1)
-            snapped = min(snapped, max_allowed)
-            snapped_prefix.append(snapped)
-            last = snapped
-        snapped_prefix.append(total_duration)
-        new_durations = [
-            max(min_gap, snapped_prefix[i + 1] - snapped_prefix[i])
-            for i in range(len(chunk_durations))
-        ]
-        total_new = sum(new_durations)
-        if not math.isfinite(total_new) or total_new <= 0:
-            return chunk_durations
-        scale = total_duration / total_new
-        adjusted = [max(min_gap, d * scale) for d in new_durations]
-        # Final correction to ensure sum equals total_duration
-        diff = total_duration - sum(adjusted)
-        if abs(diff) > 1e-6:
-            adjusted[-1] = max(min_gap, adjusted[-1] + diff)
-        return adjusted
-
     def _append_cue(
         self,
-        cues: list[tuple[timedelta, timedelta, str]],
-        start: timedelta,
-        end: timedelta,
+        cues: list[Cue],
+        start: float,
+        end: float,
         text: str,
     ) -> None:
         """Append a cue, merging with previous one when text repeats."""
@@ -340,7 +441,7 @@ class CueBuilder:
         if not cleaned_text:
             return
         if end <= start:
-            end = start + timedelta(seconds=0.1)
+            end = start + MIN_CUE_SECONDS
         if cues and cues[-1][2] == cleaned_text:
             prev_start, prev_end, prev_text = cues[-1]
             cues[-1] = (prev_start, max(prev_end, end), prev_text)
@@ -355,18 +456,26 @@ class CueBuilder:
             return 6.0
         return 7.0
 
-    def _split_for_cue(self, text: str, language: str) -> list[str]:
+    def _split_for_cue(
+        self, text: str, language: str, script: ScriptClass | None = None
+    ) -> Segmentation:
         lang = (language or "").lower()
         if lang in {"simplified_chinese", "traditional_chinese", "japanese", "korean"}:
-            parts = split_sentences(text, max_fallback_len=25)
+            max_len = 25
         elif lang in {"thai"}:
-            parts = split_sentences(text, max_fallback_len=30)
+            max_len = 30
         else:
-            parts = split_sentences(text, max_fallback_len=40)
-        return [p for p in parts if p and p.strip()]
-
-    def _split_text_for_subtitles(self, text: str, language: str) -> list[str]:
-        chunks = split_sentences(text, max_fallback_len=60)
-        if chunks:
-            return chunks
-        return [text]
+            max_len = 40
+        seg = segment(text, max_len, language, script)
+        parts = [p for p in seg.chunks if p and p.strip()]
+        if len(parts) != len(seg.chunks):
+            seg = measure_chunks(parts, seg.script, language)
+        return seg
+
+    def _split_text_for_subtitles(
+        self, text: str, language: str, script: ScriptClass | None = None
+    ) -> Segmentation:
+        seg = segment(text, 60, language, script)
+        if seg.chunks:
+            return seg
+        return measure_chunks([text], seg.script, language)
@@ -1,31 +1,48 @@
 """
 Subtitle generation facade for SlideSpeaker.
 
-Delegates SRT and VTT content creation to dedicated modules to avoid duplication.
+Cues are built once per language from the shared timing model (see
+``timeline``) and every format is serialised from that one cue list.
 """
 
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
 from loguru import logger
 
-from .srt_generator import generate_srt_content
-from .vtt_generator import generate_vtt_content
+from .cues import CueBuilder
+from .srt_generator import format_srt
+from .timeline import Cue, SlideTiming
+from .vtt_generator import format_vtt
+
+# Output suffix -> serialiser; a new format only needs an entry here
+SUBTITLE_FORMATS: dict[str, Callable[[list[Cue], str], str]] = {
+    "srt": format_srt,
+    "vtt": format_vtt,
+}
 
 
 class SubtitleGenerator:
     """Generate SRT and VTT subtitle files from scripts and audio files."""
 
+    def __init__(self) -> None:
+        self.cue_builder = CueBuilder()
+
     def generate_subtitles(
         self,
         scripts: list[dict[str, Any]],
         audio_files: list[Path],
         video_path: Path,
         language: str = "english",
+        timing: list[SlideTiming] | None = None,
     ) -> tuple[str, str]:
         """
         Generate SRT and VTT subtitle files and write them next to `video_path`.
 
+        ``timing`` is the model from ``CueBuilder.build_timing`` for
+        ``audio_files``; it is measured here when not given.
+
         Returns tuple of (srt_path, vtt_path) as strings.
         """
         try:
@@ -40,6 +57,7 @@ class SubtitleGenerator:
             # Filter to scripts with non-empty text; align audio list by index
             valid_scripts: list[dict[str, Any]] = []
             valid_audio_files: list[Path] = []
+            valid_timing: list[SlideTiming] = []
             for i, script_data in enumerate(scripts):
                 text = (script_data or {}).get("script", "").strip()
                 if not text:
@@ -47,6 +65,8 @@ class SubtitleGenerator:
                 valid_scripts.append(script_data)
                 if i < len(audio_files):
                     valid_audio_files.append(audio_files[i])
+                if timing is not None and i < len(timing):
+                    valid_timing.append(timing[i])
 
             srt_path = video_path.with_suffix(".srt")
             vtt_path = video_path.with_suffix(".vtt")
@@ -60,13 +80,15 @@ class SubtitleGenerator:
                 logger.info(f"Created empty subtitle files: {srt_path}, {vtt_path}")
                 return str(srt_path), str(vtt_path)
 
-            # Build contents via dedicated modules
-            srt_content = generate_srt_content(
-                valid_scripts, valid_audio_files, language
-            )
-            vtt_content = generate_vtt_content(
-                valid_scripts, valid_audio_files, language
+            # One cue list, serialised into every format
+            cues = self.cue_builder.build_cues(
+                valid_scripts,
+                valid_audio_files,
+                language,
+                timing=valid_timing if timing is not None else None,
             )
+            srt_content = SUBTITLE_FORMATS["srt"](cues, language)
+            vtt_content = SUBTITLE_FORMATS["vtt"](cues, language)
 
             # Write files
             with open(srt_path, "w", encoding="utf-8") as f:
@@ -6,33 +6,33 @@ Formats cues into SRT text.
 
 from __future__ import annotations
 
-from datetime import timedelta
 from pathlib import Path
 from typing import Any
 
 from .cues import CueBuilder
+from .timeline import Cue
 
 
-def _format_srt_timestamp(td: timedelta) -> str:
-    total_seconds = td.total_seconds()
-    hours = int(total_seconds // 3600)
-    minutes = int((total_seconds % 3600) // 60)
-    seconds = int(total_seconds % 60)
-    milliseconds = int((total_seconds % 1) * 1000)
-    return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
+def _format_srt_timestamp(seconds: float) -> str:
+    total_ms = round(max(0.0, seconds) * 1000)
+    hours, rest = divmod(total_ms, 3_600_000)
+    minutes, rest = divmod(rest, 60_000)
+    secs, milliseconds = divmod(rest, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d},{milliseconds:03d}"
 
 
-def generate_srt_content(
-    scripts: list[dict[str, Any]], audio_files: list[Path], language: str
-) -> str:
-    builder = CueBuilder()
-    cues = builder.build_cues(scripts, audio_files, language)
+def format_srt(cues: list[Cue], language: str | None = None) -> str:
     lines: list[str] = []
-    for idx, (start_td, end_td, text) in enumerate(cues, start=1):
+    for idx, (start, end, text) in enumerate(cues, start=1):
         lines.append(str(idx))
-        lines.append(
-            f"{_format_srt_timestamp(start_td)} --> {_format_srt_timestamp(end_td)}"
-        )
+        lines.append(f"{_format_srt_timestamp(start)} --> {_format_srt_timestamp(end)}")
         lines.append(text)
         lines.append("")
     return "\n".join(lines)
+
+
+def generate_srt_content(
+    scripts: list[dict[str, Any]], audio_files: list[Path], language: str
+) -> str:
+    cues = CueBuilder().build_cues(scripts, audio_files, language)
+    return format_srt(cues, language)
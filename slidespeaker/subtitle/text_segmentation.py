@@ -1,28 +1,104 @@
 """
 Multilingual sentence segmentation utilities (subtitle package).
+
+``segment`` classifies a text's script once and returns its chunks together
+with the per-chunk weights that timing needs, so splitting, duration
+allocation and duration estimation share one classification instead of
+re-running the script-detection regexes. All patterns are compiled at import.
 """
 
 import re
+from typing import Literal, NamedTuple
+
+ScriptClass = Literal["latin", "cjk", "thai"]
 
 _ASCII_ENDERS = ".!?;"
 _CJK_ENDERS = "。！？；"
 
+_CJK_RE = re.compile(
+    r"[\u3040-\u30FF\u3400-\u4DBF\u4E00-\u9FFF\uF900-\uFAFF\uAC00-\uD7AF]"
+)
+_THAI_RE = re.compile(r"[\u0E00-\u0E7F]")
+_SOFT_DELIMS_RE = re.compile(r"[，、：:;；,]")
+_LATIN_RE = re.compile(r"[A-Za-z]")
+_WORD_RE = re.compile(r"[A-Za-z0-9']+")
+
+_CLOSERS = "'\"»)）】】】]}"
+_ABBREVIATIONS = frozenset(
+    {"mr", "mrs", "dr", "prof", "ms", "sr", "jr", "vs", "etc", "i.e", "e.g"}
+)
+
+# Languages timed by characters even when written without CJK/Thai script
+CHAR_WEIGHT_LANGUAGES = frozenset(
+    {"simplified_chinese", "traditional_chinese", "japanese", "korean", "thai"}
+)
+
+
+class Segmentation(NamedTuple):
+    """Chunks of a text with what timing needs to know about each of them."""
+
+    chunks: list[str]
+    script: ScriptClass
+    # True when durations follow characters rather than words
+    char_weighted: bool
+    weights: list[int]
+    nonspace: list[int]
+
+
+def classify_script(text: str) -> ScriptClass:
+    """Return the writing system that drives splitting and timing of ``text``."""
+    if _CJK_RE.search(text):
+        return "cjk"
+    if _THAI_RE.search(text):
+        return "thai"
+    return "latin"
+
+
+def measure_chunks(
+    chunks: list[str], script: ScriptClass, language: str | None = None
+) -> Segmentation:
+    """Attach weights to already-split ``chunks`` of a text in ``script``."""
+    char_weighted = (
+        script != "latin" or (language or "").lower() in CHAR_WEIGHT_LANGUAGES
+    )
+    nonspace = [max(1, len("".join(c.split()))) for c in chunks]
+    weights = nonspace if char_weighted else [max(1, len(c.split())) for c in chunks]
+    return Segmentation(chunks, script, char_weighted, weights, nonspace)
+
+
+def segment(
+    text: str,
+    max_fallback_len: int = 60,
+    language: str | None = None,
+    script: ScriptClass | None = None,
+) -> Segmentation:
+    """Split ``text`` into sentence chunks and weigh them.
+
+    Pass ``script`` when it is already known (e.g. for a chunk of a text that
+    was classified before) to skip classification.
+    """
+    s = (text or "").strip()
+    if script is None:
+        script = classify_script(s)
+    return measure_chunks(_split(s, script, max_fallback_len), script, language)
+
 
 def split_sentences(text: str, max_fallback_len: int = 60) -> list[str]:
-    s = (text or "").strip()
+    return segment(text, max_fallback_len).chunks
+
+
+def word_count(text: str) -> int:
+    """Count spoken words in Latin-script ``text``."""
+    return len(_WORD_RE.findall(text)) or len(text.split())
+
+
+def _split(s: str, script: ScriptClass, max_fallback_len: int) -> list[str]:
     if not s:
         return []
-    is_cjk = bool(
-        re.search(
-            r"[\u3040-\u30FF\u3400-\u4DBF\u4E00-\u9FFF\uF900-\uFAFF\uAC00-\uD7AF]", s
-        )
-    )
-    is_thai = bool(re.search(r"[\u0E00-\u0E7F]", s))
-
-    if is_cjk:
+    if script == "cjk":
         chunks = _split_by_chars(s, _CJK_ENDERS) or _split_by_soft_delims(s)
         return _fallback_chunking(chunks or [s], max_fallback_len)
-    if is_thai:
+    if script == "thai":
         chunks = _split_ascii_with_abbrev(s)
         if not chunks or chunks == [s]:
             return _fallback_chunking([s], max_fallback_len)
@@ -37,57 +113,50 @@ def split_sentences(text: str, max_fallback_len: int = 60) -> list[str]:
 
 def _split_by_chars(s: str, enders: str) -> list[str]:
     out: list[str] = []
-    buf: list[str] = []
-    for ch in s:
-        buf.append(ch)
+    start = 0
+    for i, ch in enumerate(s):
         if ch in enders:
-            seg = "".join(buf).strip()
+            seg = s[start : i + 1].strip()
             if seg:
                 out.append(seg)
-            buf = []
-    tail = "".join(buf).strip()
+            start = i + 1
+    tail = s[start:].strip()
     if tail:
         out.append(tail)
     return out
 
 
 def _split_by_soft_delims(s: str) -> list[str]:
-    parts = re.split(r"[，、：:;；,]", s)
+    parts = _SOFT_DELIMS_RE.split(s)
     return [p.strip() for p in parts if p and p.strip()]
 
 
 def _split_ascii_with_abbrev(s: str) -> list[str]:
     out: list[str] = []
-    buf: list[str] = []
+    start = 0
     n = len(s)
-    i = 0
-    while i < n:
-        ch = s[i]
-        buf.append(ch)
-        if ch in _ASCII_ENDERS and i < n - 1:
-            next_ch = s[i + 1]
-            seg_preview = "".join(buf)
-            if _looks_like_sentence_end(seg_preview, next_ch):
-                seg = seg_preview.strip()
-                if seg:
-                    out.append(seg)
-                buf = []
-        i += 1
-    tail = "".join(buf).strip()
+    for i in range(n - 1):
+        if s[i] in _ASCII_ENDERS and _looks_like_sentence_end(
+            s[start : i + 1], s[i + 1]
+        ):
+            seg = s[start : i + 1].strip()
+            if seg:
+                out.append(seg)
+            start = i + 1
+    tail = s[start:].strip()
     if tail:
         out.append(tail)
     return out
 
 
 def _looks_like_sentence_end(seg: str, next_ch: str) -> bool:
-    if not (next_ch.isspace() or next_ch in "'\"»)）】】】]}"):
+    if not (next_ch.isspace() or next_ch in _CLOSERS):
         return False
     last = seg.strip().rstrip(_ASCII_ENDERS).split()
     if not last:
         return True
     last_word = last[-1].lower().strip("'\"")
-    common = {"mr", "mrs", "dr", "prof", "ms", "sr", "jr", "vs", "etc", "i.e", "e.g"}
-    return not (last_word in common or len(last_word) <= 2)
+    return not (last_word in _ABBREVIATIONS or len(last_word) <= 2)
 
 
 def _fallback_chunking(chunks: list[str], max_len: int) -> list[str]:
@@ -103,10 +172,22 @@ def _fallback_chunking(chunks: list[str], max_len: int) -> list[str]:
             while start < len(cc):
                 end = min(len(cc), start + max_len)
                 window = cc[start:end]
-                if re.search(r"[A-Za-z]", window):
+                if _LATIN_RE.search(window):
                     last_space = window.rfind(" ")
                     if last_space > 0:
                         end = start + last_space
                 out.append(cc[start:end].strip())
                 start = end
     return out
+
+
+__all__ = [
+    "CHAR_WEIGHT_LANGUAGES",
+    "ScriptClass",
+    "Segmentation",
+    "classify_script",
+    "measure_chunks",
+    "segment",
+    "split_sentences",
+    "word_count",
+]
@@ -0,0 +1,117 @@
+"""
+Language-independent subtitle timing model (subtitle package).
+
+Everything subtitle timing needs from the audio is measured once per clip: its
+duration, the pauses in it, any chunk anchors recorded during synthesis and
+any word timings from the TTS provider or forced alignment. A clip with word
+timings is not analysed at all: its duration and pauses come from what was
+recorded when it was synthesised.
+A subtitle language is then just text allocated over that model, and every
+output format is serialised from the same cue list.
+
+Measurements are cached process-wide per clip fingerprint (resolved path, size,
+mtime), so rendering subtitles in a second language does not probe or decode
+the audio again. A re-synthesised clip gets a new fingerprint and is measured
+afresh.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import NamedTuple
+
+from ..audio.alignment import WordTiming, read_words
+from ..audio.chunking import TimingAnchor, read_anchors
+from ..audio.postprocess import read_clip_metadata
+from ..audio.probe import cached_duration, probe_duration
+
+MAX_ENTRIES = 1024
+
+# (start, end, text), in seconds from the start of the audio
+Cue = tuple[float, float, str]
+
+_Fingerprint = tuple[str, int, int]
+
+
+class SlideTiming(NamedTuple):
+    """What the audio of one slide tells us about when words are spoken."""
+
+    audio_path: Path | None
+    duration: float | None
+    silences: tuple[float, ...]
+    anchors: tuple[TimingAnchor, ...]
+    words: tuple[WordTiming, ...] = ()
+
+
+NO_AUDIO = SlideTiming(None, None, (), ())
+
+_models: "OrderedDict[_Fingerprint, SlideTiming]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def _fingerprint(path: Path) -> _Fingerprint | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+
+
+def measure_slide(
+    audio_path: Path | None,
+    detect_silences: Callable[[Path, float], list[float]],
+) -> SlideTiming:
+    """Return the timing of one clip, measuring it at most once per fingerprint."""
+    if audio_path is None:
+        return NO_AUDIO
+    key = _fingerprint(audio_path)
+    if key is None:
+        return SlideTiming(audio_path, None, (), ())
+    with _lock:
+        cached = _models.get(key)
+        if cached is not None:
+            _models.move_to_end(key)
+            return cached
+    words = tuple(read_words(audio_path))
+    duration: float | None
+    if words:
+        # Word times already say when everything is spoken; skip ffprobe/ffmpeg
+        metadata = read_clip_metadata(audio_path)
+        duration = (
+            metadata["duration"]
+            if metadata
+            else cached_duration(audio_path) or words[-1]["end"]
+        )
+        silences = metadata["silences"] if metadata else []
+    else:
+        duration = probe_duration(audio_path)
+        silences = detect_silences(audio_path, duration or float("inf"))
+    timing = SlideTiming(
+        audio_path,
+        duration,
+        tuple(silences),
+        tuple(read_anchors(audio_path)),
+        words,
+    )
+    with _lock:
+        _models[key] = timing
+        _models.move_to_end(key)
+        while len(_models) > MAX_ENTRIES:
+            _models.popitem(last=False)
+    return timing
+
+
+def clear_timing_cache() -> None:
+    """Forget all measured clips."""
+    with _lock:
+        _models.clear()
+
+
+__all__ = [
+    "Cue",
+    "NO_AUDIO",
+    "SlideTiming",
+    "clear_timing_cache",
+    "measure_slide",
+]
@@ -1,8 +1,91 @@
 """
 Subtitle timing utilities (subtitle package).
+
+Timing works on NumPy arrays of float seconds: chunk weights become durations
+through vectorised clamping and renormalisation, the nearest detected silence
+to each chunk boundary is found with ``searchsorted`` (the snapping rule itself
+is sequential), and cue offsets are cumulative sums. Seconds only become timestamps when a format is serialised.
 """
 
-import re
+from typing import cast
+
+import numpy as np
+import numpy.typing as npt
+
+from .text_segmentation import Segmentation, classify_script, measure_chunks
+
+FloatArray = npt.NDArray[np.float64]
+
+MIN_CHUNK_SECONDS = 1.2
+MAX_CHUNK_SECONDS = 7.0
+# Boundaries move to a silence at most this far away
+SNAP_TOLERANCE = 0.45
+SNAP_MIN_GAP = 0.12
+
+
+def _renormalize(
+    durs: FloatArray, total: float, lower: FloatArray, upper: FloatArray
+) -> FloatArray:
+    current = durs.sum()
+    if current <= 0:
+        return np.full(len(durs), total / len(durs))
+    durs = durs * (total / current)
+    for _ in range(2):
+        deficit = np.clip(lower - durs, 0.0, None).sum()
+        durs = np.maximum(durs, lower)
+        if deficit > 0:
+            adjustable = np.clip(durs - np.maximum(lower, 0.0), 0.0, None)
+            total_adj = adjustable.sum()
+            if total_adj > 1e-6:
+                durs = durs - deficit * (adjustable / total_adj)
+            current = durs.sum()
+            if abs(current - total) > 1e-6:
+                durs = durs * (total / max(current, 1e-6))
+
+        surplus = np.clip(durs - upper, 0.0, None).sum()
+        durs = np.minimum(durs, upper)
+        if surplus > 0:
+            room = np.clip(upper - durs, 0.0, None)
+            total_room = room.sum()
+            if total_room > 1e-6:
+                durs = durs + surplus * (room / total_room)
+            current = durs.sum()
+            if abs(current - total) > 1e-6:
+                durs = durs * (total / max(current, 1e-6))
+    return durs
+
+
+def segment_durations(total_duration: float, seg: Segmentation) -> FloatArray:
+    """Split ``total_duration`` across the chunks of ``seg`` by spoken weight."""
+    count = len(seg.chunks)
+    if count == 0:
+        return np.zeros(0)
+    if count == 1:
+        return np.array([max(0.1, total_duration)])
+
+    nonspace = np.asarray(seg.nonspace, dtype=np.float64)
+    weights = np.asarray(seg.weights, dtype=np.float64)
+    if seg.char_weighted:
+        min_cps, max_cps = 4.0, 12.0
+    else:
+        min_cps, max_cps = 10.0, 20.0
+
+    durations = total_duration * (weights / weights.sum())
+    lower = np.maximum(MIN_CHUNK_SECONDS, nonspace / max_cps)
+    upper = np.minimum(MAX_CHUNK_SECONDS, nonspace / max(min_cps, 1e-6))
+    durations = np.clip(durations, lower, np.maximum(lower, upper))
+    return _renormalize(durations, total_duration, lower, upper)
+
+
+def chunk_duration_array(
+    total_duration: float,
+    chunks: list[str],
+    original_text: str,
+    language: str | None = None,
+) -> FloatArray:
+    """Like ``segment_durations`` for chunks split elsewhere."""
+    seg = measure_chunks(chunks, classify_script(original_text), language)
+    return segment_durations(total_duration, seg)
 
 
 def calculate_chunk_durations(
@@ -11,104 +94,75 @@ def calculate_chunk_durations(
     original_text: str,
     language: str | None = None,
 ) -> list[float]:
-    if not chunks:
-        return []
-    if len(chunks) == 1:
-        return [max(0.1, total_duration)]
-
-    is_cjk = bool(
-        re.search(
-            r"[\u3040-\u30FF\u3400-\u4DBF\u4E00-\u9FFF\uF900-\uFAFF\uAC00-\uD7AF]",
-            original_text,
-        )
-    )
-    is_thai = bool(re.search(r"[\u0E00-\u0E7F]", original_text))
-    lang = (language or "").lower()
-
-    use_char_weight = (
-        is_cjk
-        or is_thai
-        or lang
-        in {
-            "simplified_chinese",
-            "traditional_chinese",
-            "japanese",
-            "korean",
-            "thai",
-        }
-    )
+    durations = chunk_duration_array(total_duration, chunks, original_text, language)
+    return cast(list[float], durations.tolist())
+
 
-    def token_weight(s: str) -> int:
-        if use_char_weight:
-            return max(1, len(re.sub(r"\s+", "", s)))
-        return max(1, len(s.split()))
+def snap_to_boundaries(
+    durations: FloatArray,
+    boundaries: FloatArray,
+    total_duration: float,
+    tolerance: float = SNAP_TOLERANCE,
+    min_gap: float = SNAP_MIN_GAP,
+) -> FloatArray:
+    """Move interior chunk boundaries to the nearest silence within ``tolerance``.
 
-    weights = [token_weight(c) for c in chunks]
-    total_w = sum(weights)
-    if total_w <= 0:
-        return [total_duration / len(chunks)] * len(chunks)
+    Boundaries stay at least ``min_gap`` apart and leave room for the remaining
+    chunks; the result still sums to ``total_duration``. A boundary whose snap
+    would land within ``min_gap`` of the previous one falls back to
+    ``max(previous + min_gap, target)``, so each boundary depends on the one
+    before it and that part is a scalar loop.
+    """
+    count = len(durations)
+    if count <= 1 or len(boundaries) == 0:
+        return durations
+    usable = np.sort(boundaries)
+    usable = usable[(usable > 0.05) & (usable < total_duration - 0.05)]
+    if len(usable) == 0:
+        return durations
 
-    durations = [total_duration * (w / total_w) for w in weights]
+    targets = np.cumsum(durations[:-1])
+    # Nearest silence: the candidates either side of each target's insertion point
+    right = np.clip(np.searchsorted(usable, targets), 0, len(usable) - 1)
+    left = np.clip(right - 1, 0, len(usable) - 1)
+    nearest = np.where(
+        np.abs(usable[left] - targets) <= np.abs(usable[right] - targets),
+        usable[left],
+        usable[right],
+    )
+    candidates = np.where(np.abs(nearest - targets) <= tolerance, nearest, targets)
+
+    prefix = [0.0]
+    last = 0.0
+    for idx, (target, snapped) in enumerate(
+        zip(targets.tolist(), candidates.tolist(), strict=True), start=1
+    ):
+        # At least min_gap after the previous boundary (the first after 0)...
+        if snapped <= last + min_gap:
+            snapped = max(last + min_gap, target)
+        # ...and early enough to leave min_gap for every chunk after it
+        snapped = min(snapped, total_duration - min_gap * (count - idx))
+        prefix.append(snapped)
+        last = snapped
+    prefix.append(total_duration)
+
+    new_durations = np.maximum(min_gap, np.diff(prefix))
+    total_new = new_durations.sum()
+    if not np.isfinite(total_new) or total_new <= 0:
+        return durations
+    adjusted: FloatArray = np.maximum(
+        min_gap, new_durations * (total_duration / total_new)
+    )
+    # Final correction to ensure sum equals total_duration
+    diff = total_duration - adjusted.sum()
+    if abs(diff) > 1e-6:
+        adjusted[-1] = max(min_gap, adjusted[-1] + diff)
+    return adjusted
 
-    min_dur = 1.2
-    max_dur = 7.0
-    if use_char_weight:
-        min_cps, max_cps = 4.0, 12.0
-    else:
-        min_cps, max_cps = 10.0, 20.0
 
-    nonspace_lens = [max(1, len(re.sub(r"\s+", "", c))) for c in chunks]
-    lower_bounds = [max(min_dur, nl / max_cps) for nl in nonspace_lens]
-    upper_bounds = [min(max_dur, nl / max(min_cps, 1e-6)) for nl in nonspace_lens]
-
-    durations = [
-        max(lb, min(d, ub))
-        for d, lb, ub in zip(durations, lower_bounds, upper_bounds, strict=False)
-    ]
-
-    def renormalize(durs: list[float], total: float) -> list[float]:
-        current = sum(durs)
-        if current <= 0:
-            return [total / len(durs)] * len(durs)
-        scale = total / current
-        durs = [d * scale for d in durs]
-        for _ in range(2):
-            deficit = 0.0
-            for i, (d, lb) in enumerate(zip(durs, lower_bounds, strict=False)):
-                if d < lb:
-                    deficit += lb - d
-                    durs[i] = lb
-            if deficit > 0:
-                adjustable = [
-                    max(0.0, durs[i] - max(lower_bounds[i], 0.0))
-                    for i in range(len(durs))
-                ]
-                total_adj = sum(adjustable)
-                if total_adj > 1e-6:
-                    for i in range(len(durs)):
-                        if adjustable[i] > 0:
-                            durs[i] -= deficit * (adjustable[i] / total_adj)
-                current2 = sum(durs)
-                if abs(current2 - total) > 1e-6:
-                    s = total / max(current2, 1e-6)
-                    durs = [d * s for d in durs]
-
-            surplus = 0.0
-            for i, (d, ub) in enumerate(zip(durs, upper_bounds, strict=False)):
-                if d > ub:
-                    surplus += d - ub
-                    durs[i] = ub
-            if surplus > 0:
-                room = [max(0.0, upper_bounds[i] - durs[i]) for i in range(len(durs))]
-                total_room = sum(room)
-                if total_room > 1e-6:
-                    for i in range(len(durs)):
-                        if room[i] > 0:
-                            durs[i] += surplus * (room[i] / total_room)
-                current3 = sum(durs)
-                if abs(current3 - total) > 1e-6:
-                    s = total / max(current3, 1e-6)
-                    durs = [d * s for d in durs]
-        return durs
-
-    return renormalize(durations, total_duration)
+__all__ = [
+    "calculate_chunk_durations",
+    "chunk_duration_array",
+    "segment_durations",
+    "snap_to_boundaries",
+]
@@ -4,6 +4,15 @@ Avatar subpackage for SlideSpeaker video package.
 
 from .factory import AvatarFactory
 from .heygen import HeyGenAvatarService
-from .interface import AvatarInterface
+from .interface import AvatarInterface, AvatarJobStatus
+from .jobs import AvatarJobRunner, AvatarJobsCancelledError, AvatarRequest
 
-__all__ = ["AvatarFactory", "AvatarInterface", "HeyGenAvatarService"]
+__all__ = [
+    "AvatarFactory",
+    "AvatarInterface",
+    "AvatarJobRunner",
+    "AvatarJobStatus",
+    "AvatarJobsCancelledError",
+    "AvatarRequest",
+    "HeyGenAvatarService",
+]
@@ -3,6 +3,8 @@ HeyGen Avatar Service (video package)
 """
 
 import asyncio
+import os
+import uuid
 from pathlib import Path
 from typing import Any
 
@@ -10,8 +12,9 @@ import httpx
 from loguru import logger
 
 from slidespeaker.configs.config import config
+from slidespeaker.core.http_client import get_http_client
 
-from .interface import AvatarInterface
+from .interface import AvatarInterface, AvatarJobStatus
 
 
 class HeyGenAvatarService(AvatarInterface):
@@ -90,10 +93,10 @@ class HeyGenAvatarService(AvatarInterface):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                response = await client.post(url, headers=headers, json=payload)
-                response.raise_for_status()
-                data = response.json()
+            client = get_http_client("heygen")
+            response = await client.post(url, headers=headers, json=payload)
+            response.raise_for_status()
+            data = response.json()
             return str(data["data"]["task_id"])
         except httpx.HTTPStatusError as e:
             logger.error(f"HeyGen task creation failed: {e}")
@@ -104,26 +107,56 @@ class HeyGenAvatarService(AvatarInterface):
             logger.error(f"HeyGen task creation failed: {e}")
             raise
 
+    def supports_jobs(self) -> bool:
+        return True
+
+    async def submit_avatar_job(self, script: str, **kwargs: Any) -> str:
+        if not self.is_available():
+            raise ValueError(
+                "HeyGen API key not configured. Please set HEYGEN_API_KEY in your .env file"
+            )
+        return await self._create_talking_avatar_task(
+            script,
+            kwargs.get("avatar_id", self.default_avatar_id),
+            kwargs.get("voice_id", self.default_voice_id),
+        )
+
+    async def get_avatar_job_status(self, job_id: str) -> AvatarJobStatus:
+        url = f"{self.api_url}/video/task/{job_id}"
+        headers = {"X-Api-Key": self.api_key or ""}
+        # Polls reuse one pooled connection instead of a handshake per request
+        client = get_http_client("heygen")
+        response = await client.get(url, headers=headers)
+        response.raise_for_status()
+        data = response.json()
+        status = str(data["data"]["status"])
+        if status == "completed":
+            return {
+                "status": "completed",
+                "video_url": str(data["data"]["video_url"]),
+                "error": None,
+            }
+        if status == "failed":
+            return {
+                "status": "failed",
+                "video_url": None,
+                "error": str(data.get("error", "Unknown error")),
+            }
+        return {"status": "pending", "video_url": None, "error": None}
+
+    async def download_avatar_video(self, video_url: str, output_path: Path) -> None:
+        await self._download_video(video_url, output_path)
+
     async def _wait_for_task_completion(
         self, task_id: str, max_retries: int = 30
     ) -> str:
-        url = f"{self.api_url}/video/task/{task_id}"
-        headers = {"X-Api-Key": self.api_key or ""}
-
         for _attempt in range(max_retries):
             try:
-                async with httpx.AsyncClient(timeout=30) as client:
-                    response = await client.get(url, headers=headers)
-                    response.raise_for_status()
-                    data = response.json()
-                status = str(data["data"]["status"])
-
-                if status == "completed":
-                    return str(data["data"]["video_url"])
-                elif status == "failed":
-                    raise Exception(
-                        f"HeyGen task failed: {data.get('error', 'Unknown error')}"
-                    )
+                job = await self.get_avatar_job_status(task_id)
+                if job["status"] == "completed" and job["video_url"]:
+                    return job["video_url"]
+                elif job["status"] == "failed":
+                    raise Exception(f"HeyGen task failed: {job['error']}")
 
                 await asyncio.sleep(2)
             except Exception as e:
@@ -133,19 +166,23 @@ class HeyGenAvatarService(AvatarInterface):
         raise Exception("HeyGen task timeout")
 
     async def _download_video(self, video_url: str, output_path: Path) -> None:
+        # Write next to the target and rename, so a failed download never
+        # leaves a truncated video behind
+        tmp_path = output_path.with_name(f".{output_path.name}.{uuid.uuid4().hex}")
         try:
-            async with (
-                httpx.AsyncClient(timeout=30) as client,
-                client.stream("GET", video_url) as response,
-            ):
+            client = get_http_client("media")
+            async with client.stream("GET", video_url, timeout=30) as response:
                 response.raise_for_status()
-                with output_path.open("wb") as f:
-                    async for chunk in response.aiter_bytes(chunk_size=8192):
+                with tmp_path.open("wb") as f:
+                    async for chunk in response.aiter_bytes(chunk_size=1024 * 1024):
                         if chunk:
                             f.write(chunk)
+            os.replace(tmp_path, output_path)
         except httpx.HTTPError as e:
             logger.error(f"Error downloading HeyGen video: {e}")
             raise
         except Exception as e:
             logger.error(f"Error downloading HeyGen video: {e}")
             raise
+        finally:
+            tmp_path.unlink(missing_ok=True)
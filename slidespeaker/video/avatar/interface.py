@@ -4,7 +4,15 @@ Avatar Service Interface (video package)
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any
+from typing import Any, TypedDict
+
+
+class AvatarJobStatus(TypedDict):
+    """Snapshot of a submitted render job."""
+
+    status: str  # "pending", "completed" or "failed"
+    video_url: str | None
+    error: str | None
 
 
 class AvatarInterface(ABC):
@@ -29,3 +37,22 @@ class AvatarInterface(ABC):
     def get_supported_options(self) -> dict[str, Any]:
         """Get supported configuration options for this service"""
         raise NotImplementedError
+
+    # Job API: services that render asynchronously implement these so many
+    # videos can be rendered at once (see ``jobs.AvatarJobRunner``)
+
+    def supports_jobs(self) -> bool:
+        """Whether submit/status/download are implemented"""
+        return False
+
+    async def submit_avatar_job(self, script: str, **kwargs: Any) -> str:
+        """Start rendering ``script``; return the provider's job id"""
+        raise NotImplementedError
+
+    async def get_avatar_job_status(self, job_id: str) -> AvatarJobStatus:
+        """Fetch the current status of a submitted job"""
+        raise NotImplementedError
+
+    async def download_avatar_video(self, video_url: str, output_path: Path) -> None:
+        """Download a finished video to ``output_path``"""
+        raise NotImplementedError
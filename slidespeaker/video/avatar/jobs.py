@@ -0,0 +1,225 @@
+"""
+Concurrent avatar rendering (video package).
+
+Rendering one avatar video takes minutes on the provider side, so slides are
+not rendered one after another. Every slide's job is submitted up front, with
+at most ``AVATAR_MAX_CONCURRENT_JOBS`` in flight. A single poller checks the
+status of every outstanding job in one round. The poll interval starts at
+``AVATAR_POLL_INTERVAL`` and backs off towards ``AVATAR_POLL_MAX_INTERVAL``
+while nothing changes. It drops back to the start value whenever a job
+finishes or a new one is submitted. Each video is downloaded as soon as its
+job completes, and the next job is submitted in its place.
+
+Services without a job API (``supports_jobs()`` is False) are driven through
+``generate_avatar_video`` with the same concurrency limit.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any, TypedDict
+
+from loguru import logger
+
+from slidespeaker.configs.config import config
+
+from .interface import AvatarInterface
+
+BACKOFF_FACTOR = 1.5
+
+
+class AvatarRequest(TypedDict):
+    """One video to render."""
+
+    script: str
+    output_path: Path
+    options: dict[str, Any]
+
+
+class AvatarJobsCancelledError(Exception):
+    """Raised into outstanding jobs when the owning task is cancelled."""
+
+
+class AvatarJobRunner:
+    """Renders many avatar videos concurrently with one multiplexed poller."""
+
+    def __init__(
+        self,
+        service: AvatarInterface,
+        max_jobs: int | None = None,
+        poll_interval: float | None = None,
+        max_poll_interval: float | None = None,
+        job_timeout: float | None = None,
+        is_cancelled: Callable[[], Awaitable[bool]] | None = None,
+    ) -> None:
+        self.service = service
+        self.max_jobs = max(
+            1, max_jobs if max_jobs is not None else config.avatar_max_concurrent_jobs
+        )
+        self.poll_interval = (
+            config.avatar_poll_interval if poll_interval is None else poll_interval
+        )
+        self.max_poll_interval = max(
+            self.poll_interval,
+            config.avatar_poll_max_interval
+            if max_poll_interval is None
+            else max_poll_interval,
+        )
+        self.job_timeout = (
+            config.avatar_job_timeout if job_timeout is None else job_timeout
+        )
+        self.is_cancelled = is_cancelled
+        self.cancelled = False
+        # job id -> (completion future, deadline)
+        self._pending: dict[str, tuple[asyncio.Future[str], float]] = {}
+        self._interval = self.poll_interval
+        self._submitted = asyncio.Event()
+
+    def _track(self, job_id: str) -> asyncio.Future[str]:
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self._pending[job_id] = (future, time.monotonic() + self.job_timeout)
+        # Poll soon after a new submission rather than at a backed-off pace
+        self._interval = self.poll_interval
+        self._submitted.set()
+        return future
+
+    def _fail_all(self, error: Exception) -> None:
+        for future, _ in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self._pending.clear()
+
+    async def _poll_once(self) -> bool:
+        """Check every pending job once; True if any of them finished."""
+        job_ids = list(self._pending)
+        statuses = await asyncio.gather(
+            *(self.service.get_avatar_job_status(job_id) for job_id in job_ids),
+            return_exceptions=True,
+        )
+        now = time.monotonic()
+        changed = False
+        for job_id, status in zip(job_ids, statuses, strict=True):
+            future, deadline = self._pending[job_id]
+            if isinstance(status, BaseException):
+                logger.warning(f"Avatar job {job_id} status check failed: {status}")
+            elif status["status"] == "completed" and status["video_url"]:
+                future.set_result(status["video_url"])
+            elif status["status"] == "failed":
+                future.set_exception(
+                    RuntimeError(f"Avatar job {job_id} failed: {status['error']}")
+                )
+            if not future.done() and now > deadline:
+                future.set_exception(TimeoutError(f"Avatar job {job_id} timed out"))
+            if future.done():
+                del self._pending[job_id]
+                changed = True
+        return changed
+
+    def _expire_overdue(self) -> None:
+        now = time.monotonic()
+        for job_id, (future, deadline) in list(self._pending.items()):
+            if now > deadline:
+                if not future.done():
+                    future.set_exception(TimeoutError(f"Avatar job {job_id} timed out"))
+                del self._pending[job_id]
+
+    async def _poll_round(self) -> bool:
+        """Run one cancellation check and status round; True if anything changed."""
+        if self.is_cancelled is not None:
+            try:
+                cancelled = await self.is_cancelled()
+            except Exception as e:
+                # e.g. Redis unavailable; keep polling, deadlines still apply
+                logger.warning(f"Avatar job cancellation check failed: {e}")
+                cancelled = False
+            if cancelled:
+                self.cancelled = True
+                self._fail_all(AvatarJobsCancelledError("Task cancelled"))
+                return True
+        if not self._pending:
+            return False
+        return await self._poll_once()
+
+    async def _poller(self) -> None:
+        while True:
+            if not self._pending:
+                self._submitted.clear()
+                await self._submitted.wait()
+            await asyncio.sleep(self._interval)
+            try:
+                changed = await self._poll_round()
+            except Exception as e:
+                # Never let the poller die: tracked jobs would wait forever
+                logger.error(f"Avatar job poll round failed: {e}")
+                self._expire_overdue()
+                changed = False
+            if changed:
+                self._interval = self.poll_interval
+            else:
+                self._interval = min(
+                    self._interval * BACKOFF_FACTOR, self.max_poll_interval
+                )
+            logger.debug(
+                f"{len(self._pending)} avatar jobs pending; "
+                f"next poll in {self._interval:.1f}s"
+            )
+
+    async def _render(
+        self, index: int, request: AvatarRequest, slots: asyncio.Semaphore
+    ) -> None:
+        if not self.service.supports_jobs():
+            async with slots:
+                if self.is_cancelled is not None and await self.is_cancelled():
+                    self.cancelled = True
+                if self.cancelled:
+                    raise AvatarJobsCancelledError("Task cancelled")
+                generated = await self.service.generate_avatar_video(
+                    request["script"], request["output_path"], **request["options"]
+                )
+            if not generated:
+                raise RuntimeError(
+                    f"Avatar service did not generate {request['output_path']}"
+                )
+            return
+        async with slots:
+            if self.cancelled:
+                raise AvatarJobsCancelledError("Task cancelled")
+            job_id = await self.service.submit_avatar_job(
+                request["script"], **request["options"]
+            )
+            logger.info(f"Avatar video {index + 1} submitted as job {job_id}")
+            video_url = await self._track(job_id)
+        # Download outside the slot so the next job is already rendering
+        await self.service.download_avatar_video(video_url, request["output_path"])
+        logger.info(f"Avatar video {index + 1} saved to {request['output_path']}")
+
+    async def run(self, requests: list[AvatarRequest]) -> list[bool]:
+        """Render all requests; return success flags in the order of ``requests``."""
+        if not requests:
+            return []
+        slots = asyncio.Semaphore(self.max_jobs)
+        poller = asyncio.create_task(self._poller())
+        try:
+            results = await asyncio.gather(
+                *(
+                    self._render(index, request, slots)
+                    for index, request in enumerate(requests)
+                ),
+                return_exceptions=True,
+            )
+        finally:
+            poller.cancel()
+            await asyncio.gather(poller, return_exceptions=True)
+        flags: list[bool] = []
+        for index, result in enumerate(results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, AvatarJobsCancelledError):
+                    logger.error(f"Avatar video {index + 1} failed: {result}")
+                flags.append(False)
+            else:
+                flags.append(True)
+        return flags
+
+
+__all__ = ["AvatarJobRunner", "AvatarJobsCancelledError", "AvatarRequest"]
@@ -11,12 +11,14 @@ import contextlib
 import gc
 import logging
 import os
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
+import numpy as np
 from moviepy import (
+    AudioClip,
     AudioFileClip,
     CompositeVideoClip,
     ImageClip,
@@ -28,19 +30,183 @@ from moviepy.video.VideoClip import TextClip
 
 from slidespeaker.configs.config import config, get_storage_provider
 
+from .memory import MemoryTracker
+from .profiles import DEFAULT_PROFILE, resolve_encoding_profile
+from .segments import (
+    concat_segments,
+    link_segment,
+    prune_stale_segments,
+    segment_cache_key,
+    segment_path,
+)
+from .watermark import watermark_overlay_params, watermark_spec
+
 logger = logging.getLogger(__name__)
 
 
+def _build_watermark_clip(final_clip: Any) -> TextClip | None:
+    """Create the configured watermark clip sized and timed for ``final_clip``."""
+    try:
+        if not config.watermark_enabled:
+            logger.info("Watermark disabled via configuration")
+            return None
+        visible_font_size = max(config.watermark_size, 48)
+        try:
+            watermark = TextClip(
+                text=config.watermark_text,
+                font_size=visible_font_size,
+                color="white",
+                stroke_color="black",
+                stroke_width=4,
+                method="label",
+                font="Arial",
+            )
+        except Exception:
+            watermark = TextClip(
+                text=config.watermark_text,
+                font_size=visible_font_size,
+                color="white",
+                stroke_color="black",
+                stroke_width=3,
+                method="label",
+            )
+        watermark_width = watermark.size[0]
+        watermark_height = watermark.size[1]
+        try:
+            width = int(final_clip.w)
+            height = int(final_clip.h)
+        except (AttributeError, ValueError):
+            if hasattr(final_clip, "size") and len(final_clip.size) >= 2:
+                width = int(final_clip.size[0])
+                height = int(final_clip.size[1])
+            else:
+                width = 1920
+                height = 1080
+        watermark = watermark.with_position(
+            (
+                max(0, width - watermark_width - 50),
+                max(0, height - watermark_height - 50),
+            )
+        )
+        watermark = watermark.with_duration(final_clip.duration)
+        visible_opacity = min(max(config.watermark_opacity, 0.9), 1.0)
+        watermark = watermark.with_opacity(visible_opacity)
+        return watermark
+    except Exception as e:
+        logger.error(f"Watermark creation failed: {e}")
+        return None
+
+
+def _silent_audio(duration: float, fps: int = 44100) -> AudioClip:
+    """Return a mono silent track so audio-less segments keep an audio stream."""
+    return AudioClip(
+        lambda t: np.zeros((np.size(t), 1)) if np.ndim(t) else np.zeros(1),
+        duration=duration,
+        fps=fps,
+    )
+
+
+def _composite_watermark(clip: Any) -> Any:
+    """Composite a TextClip watermark over ``clip`` (fallback when no overlay)."""
+    watermark = _build_watermark_clip(clip)
+    if watermark is None:
+        return clip
+    try:
+        original_audio = clip.audio
+        clip = CompositeVideoClip([clip, watermark])
+        if original_audio is not None:
+            clip = clip.with_audio(original_audio)
+    except Exception:
+        pass
+    return clip
+
+
+def _write_video(
+    clip: Any,
+    output_path: Path,
+    encode: dict[str, Any],
+    temp_audiofile: Path,
+    ffmpeg_params: list[str] | None = None,
+) -> None:
+    """Encode ``clip`` with the shared codec parameters and optional filters."""
+    params = list(encode.get("ffmpeg_params") or []) + list(ffmpeg_params or [])
+    clip.write_videofile(
+        str(output_path),
+        fps=encode["fps"],
+        codec=encode["codec"],
+        audio_codec=encode["audio_codec"],
+        threads=encode["threads"],
+        preset=encode["preset"],
+        bitrate=encode["bitrate"],
+        audio_bitrate=encode["audio_bitrate"],
+        temp_audiofile=str(temp_audiofile),
+        remove_temp=True,
+        ffmpeg_params=params or None,
+        logger=None,
+    )
+
+
+def _encode_slide_segment(job: dict[str, Any]) -> str:
+    """Encode a single slide (image + narration) into a standalone MP4 segment.
+
+    Runs inside a worker process, so it only relies on the picklable ``job``
+    dict and module-level helpers.
+    """
+    output_path = Path(job["output"])
+    clips: list[Any] = []
+    try:
+        audio_path = job.get("audio")
+        if audio_path:
+            audio_clip = AudioFileClip(audio_path)
+            duration = float(audio_clip.duration)
+        else:
+            duration = float(job.get("duration") or 5.0)
+            audio_clip = _silent_audio(duration)
+        clips.append(audio_clip)
+
+        clip = ImageClip(job["image"], duration=duration).with_audio(audio_clip)
+        clips.append(clip)
+        width, height = job["size"]
+        overlay = None
+        if job.get("watermark"):
+            overlay = watermark_overlay_params(width, height)
+            if overlay is None:
+                clip = _composite_watermark(clip)
+                clips.append(clip)
+        clip = clip.with_effects([Resize(width=width, height=height)])
+        clips.append(clip)
+
+        partial_path = output_path.with_name(f"{output_path.stem}.part.mp4")
+        _write_video(
+            clip,
+            partial_path,
+            job["encode"],
+            output_path.with_suffix(".m4a"),
+            overlay,
+        )
+        os.replace(partial_path, output_path)
+        return str(output_path)
+    finally:
+        for clip in reversed(clips):
+            with contextlib.suppress(Exception):
+                clip.close()
+        gc.collect()
+
+
 class VideoComposer:
     """Composer for creating final presentation videos from components"""
 
-    def __init__(self, max_memory_mb: int = 500):
+    def __init__(self, max_memory_mb: int = 500, encoding_profile: str | None = None):
         self.max_memory_mb = max_memory_mb
+        # Named encoding profile; None uses FFMPEG_PROFILE
+        self.encoding_profile = encoding_profile
         # Use more workers for parallel processing, but limit to avoid memory issues
         max_workers = min(4, (os.cpu_count() or 2) + 1)
         self.executor = ThreadPoolExecutor(max_workers=max_workers)
         self.storage_provider = get_storage_provider()
         self.temp_files: list[Path] = []
+        # Summary of the most recent render (mode, memory use) for step results
+        self.last_render_stats: dict[str, Any] = {}
 
     def _validate_video_file(self, video_path: Path) -> tuple[bool, str]:
         if not video_path.exists():
@@ -93,57 +259,7 @@ class VideoComposer:
             return 1280, 720
 
     def _create_watermark(self, final_clip: VideoFileClip) -> TextClip | None:
-        try:
-            from slidespeaker.configs.config import config
-
-            if not config.watermark_enabled:
-                logger.info("Watermark disabled via configuration")
-                return None
-            visible_font_size = max(config.watermark_size, 48)
-            try:
-                watermark = TextClip(
-                    text=config.watermark_text,
-                    font_size=visible_font_size,
-                    color="white",
-                    stroke_color="black",
-                    stroke_width=4,
-                    method="label",
-                    font="Arial",
-                )
-            except Exception:
-                watermark = TextClip(
-                    text=config.watermark_text,
-                    font_size=visible_font_size,
-                    color="white",
-                    stroke_color="black",
-                    stroke_width=3,
-                    method="label",
-                )
-            watermark_width = watermark.size[0]
-            watermark_height = watermark.size[1]
-            try:
-                width = int(final_clip.w)
-                height = int(final_clip.h)
-            except (AttributeError, ValueError):
-                if hasattr(final_clip, "size") and len(final_clip.size) >= 2:
-                    width = int(final_clip.size[0])
-                    height = int(final_clip.size[1])
-                else:
-                    width = 1920
-                    height = 1080
-            watermark = watermark.with_position(
-                (
-                    max(0, width - watermark_width - 50),
-                    max(0, height - watermark_height - 50),
-                )
-            )
-            watermark = watermark.with_duration(final_clip.duration)
-            visible_opacity = min(max(config.watermark_opacity, 0.9), 1.0)
-            watermark = watermark.with_opacity(visible_opacity)
-            return watermark
-        except Exception as e:
-            logger.error(f"Watermark creation failed: {e}")
-            return None
+        return _build_watermark_clip(final_clip)
 
     def _is_cloud_url(self, path: str) -> bool:
         return path.startswith(("s3://", "gs://", "https://", "http://"))
@@ -279,39 +395,17 @@ class VideoComposer:
                 if not video_clips:
                     raise ValueError("No valid clips generated for composition")
                 final_clip = concatenate_videoclips(video_clips, method="compose")
-                watermark = self._create_watermark(final_clip)
-                if watermark is not None:
-                    try:
-                        original_audio = final_clip.audio
-                        final_clip = CompositeVideoClip([final_clip, watermark])
-                        if original_audio is not None:
-                            final_clip = final_clip.with_audio(original_audio)
-                    except Exception:
-                        pass
-                target_width, target_height = self._get_resolution_dimensions(
-                    video_resolution
-                )
+                target_size = self._get_resolution_dimensions(video_resolution)
+                final_clip, overlay = self._prepare_watermark(final_clip, target_size)
                 final_clip_resized = final_clip.with_effects(
-                    [Resize(width=target_width, height=target_height)]
+                    [Resize(width=target_size[0], height=target_size[1])]
                 )
-                # Use fast mode settings when enabled for development/testing
-                ffmpeg_preset = config.ffmpeg_preset
-                ffmpeg_threads = config.ffmpeg_threads
-                if config.ffmpeg_fast_mode:
-                    ffmpeg_preset = "ultrafast"
-                    ffmpeg_threads = max(ffmpeg_threads, (os.cpu_count() or 2))
-                final_clip_resized.write_videofile(
-                    output_path,
-                    fps=config.ffmpeg_fps,
-                    codec=config.ffmpeg_codec,
-                    audio_codec=config.ffmpeg_audio_codec,
-                    threads=ffmpeg_threads,
-                    preset=ffmpeg_preset,
-                    bitrate=config.ffmpeg_bitrate,
-                    audio_bitrate=config.ffmpeg_audio_bitrate,
-                    temp_audiofile=str(Path(output_path).parent / "temp_audio.m4a"),
-                    remove_temp=True,
-                    logger=None,
+                _write_video(
+                    final_clip_resized,
+                    Path(output_path),
+                    self._get_encode_params(),
+                    Path(output_path).parent / "temp_audio.m4a",
+                    overlay,
                 )
             except Exception as e:
                 logger.error(f"Video composition error: {e}")
@@ -324,8 +418,6 @@ class VideoComposer:
                     self._safe_close_clip(final_clip)
                 if "final_clip_resized" in locals():
                     self._safe_close_clip(final_clip_resized)
-                if "watermark" in locals():
-                    self._safe_close_clip(watermark)
                 gc.collect()
 
         loop = asyncio.get_event_loop()
@@ -344,45 +436,50 @@ class VideoComposer:
         self,
         slide_images: list[Path],
         audio_files: list[Path],
+        pad_silence: bool = False,
     ) -> list[Any]:
-        """Create video clips from images and audio files"""
+        """Create video clips from images and audio files.
+
+        Each audio file is opened once; its clip provides both the slide
+        duration and the attached track. With ``pad_silence`` slides without
+        narration get a silent track so every clip carries an audio stream.
+        """
         video_clips: list[Any] = []
         for i, image_path in enumerate(slide_images):
             image_path = Path(image_path)
             if not image_path.exists():
                 continue
-            duration = 5.0
+            audio_clip: Any = None
             if i < len(audio_files):
                 ap = Path(audio_files[i])
                 if ap.exists():
                     try:
-                        with AudioFileClip(str(ap)) as ac:
-                            duration = ac.duration
+                        audio_clip = AudioFileClip(str(ap))
                     except Exception:
-                        pass
+                        audio_clip = None
+            duration = float(audio_clip.duration) if audio_clip is not None else 5.0
+            if audio_clip is None and pad_silence:
+                audio_clip = _silent_audio(duration)
             video_clip = ImageClip(str(image_path), duration=duration)
-            if i < len(audio_files):
-                ap = Path(audio_files[i])
-                if ap.exists():
-                    from contextlib import suppress
-
-                    with suppress(Exception):
-                        video_clip = video_clip.with_audio(AudioFileClip(str(ap)))
+            if audio_clip is not None:
+                video_clip = video_clip.with_audio(audio_clip)
             video_clips.append(video_clip)
         return video_clips
 
-    def _apply_watermark_to_clip(self, final_clip: Any) -> Any:
-        """Apply watermark to the final clip if configured"""
-        watermark = self._create_watermark(final_clip)
-        if watermark is not None:
-            try:
-                original_audio = final_clip.audio
-                final_clip = CompositeVideoClip([final_clip, watermark])
-                if original_audio is not None:
-                    final_clip = final_clip.with_audio(original_audio)
-            except Exception:
-                pass
-        return final_clip
+    def _prepare_watermark(
+        self, final_clip: Any, size: tuple[int, int]
+    ) -> tuple[Any, list[str] | None]:
+        """Return the clip to encode and ffmpeg params for the watermark.
+
+        The cached watermark overlay for ``size`` is preferred; when it is not
+        available the watermark is composited onto the clip instead.
+        """
+        if not config.watermark_enabled:
+            return final_clip, None
+        overlay = watermark_overlay_params(*size)
+        if overlay is not None:
+            return final_clip, overlay
+        return _composite_watermark(final_clip), None
 
     def _create_video_sync(
         self,
@@ -395,7 +492,6 @@ class VideoComposer:
         video_clips: list[Any] = []
         final_clip: Any = None
         final_clip_resized: Any = None
-        watermark: Any = None
 
         try:
             if not slide_images:
@@ -408,31 +504,19 @@ class VideoComposer:
                 raise ValueError("No valid clips for video creation")
 
             final_clip = concatenate_videoclips(video_clips, method="compose")
-            final_clip = self._apply_watermark_to_clip(final_clip)
-
-            target_width, target_height = self._get_resolution_dimensions(
-                video_resolution
-            )
+            target_size = self._get_resolution_dimensions(video_resolution)
+            final_clip, overlay = self._prepare_watermark(final_clip, target_size)
             final_clip_resized = final_clip.with_effects(
-                [Resize(width=target_width, height=target_height)]
+                [Resize(width=target_size[0], height=target_size[1])]
             )
 
-            # Get FFmpeg settings
-            ffmpeg_preset, ffmpeg_threads = self._get_ffmpeg_settings()
-
             # Write video file
-            final_clip_resized.write_videofile(
-                str(output_path),
-                fps=config.ffmpeg_fps,
-                codec=config.ffmpeg_codec,
-                audio_codec=config.ffmpeg_audio_codec,
-                threads=ffmpeg_threads,
-                preset=ffmpeg_preset,
-                bitrate=config.ffmpeg_bitrate,
-                audio_bitrate=config.ffmpeg_audio_bitrate,
-                temp_audiofile=str(Path(output_path).parent / "temp_audio.m4a"),
-                remove_temp=True,
-                logger=None,
+            _write_video(
+                final_clip_resized,
+                Path(output_path),
+                self._get_encode_params(),
+                Path(output_path).parent / "temp_audio.m4a",
+                overlay,
             )
 
         except Exception as e:
@@ -446,8 +530,6 @@ class VideoComposer:
                 self._safe_close_clip(final_clip)
             if final_clip_resized is not None:
                 self._safe_close_clip(final_clip_resized)
-            if watermark is not None:
-                self._safe_close_clip(watermark)
             gc.collect()
 
     def _validate_video_inputs(
@@ -494,8 +576,8 @@ class VideoComposer:
                 continue
 
             bg_clip = ImageClip(str(image_path))
-            with AudioFileClip(str(audio_path)) as audio_clip:
-                duration = audio_clip.duration
+            audio_clip = AudioFileClip(str(audio_path))
+            duration = audio_clip.duration
             bg_clip = bg_clip.with_duration(duration)
             fg_clip = VideoFileClip(str(avatar_path)).with_duration(duration)
             fg_clip = fg_clip.resize(height=int(bg_clip.h * 0.9))
@@ -506,35 +588,316 @@ class VideoComposer:
                 )
             )
             comp_clip = CompositeVideoClip([bg_clip, fg_clip])
-            from contextlib import suppress
-
-            with suppress(Exception):
-                comp_clip = comp_clip.with_audio(AudioFileClip(str(audio_path)))
+            with contextlib.suppress(Exception):
+                comp_clip = comp_clip.with_audio(audio_clip)
             video_clips.append(comp_clip)
 
         return video_clips
 
-    def _apply_watermark(self, final_clip: Any) -> Any:
-        """Apply watermark to the final clip if configured"""
-        watermark = self._create_watermark(final_clip)
-        if watermark is not None:
+    def _get_encode_params(self) -> dict[str, Any]:
+        """Return the codec parameters shared by every encode of a composition."""
+        try:
+            return resolve_encoding_profile(self.encoding_profile)
+        except ValueError as e:
+            logger.warning(f"{e}; using the {DEFAULT_PROFILE} profile")
+            return resolve_encoding_profile(DEFAULT_PROFILE)
+
+    def _build_segment_jobs(
+        self,
+        slide_images: list[Path],
+        audio_files: list[Path],
+        segments_dir: Path,
+        video_resolution: str,
+    ) -> list[dict[str, Any]]:
+        """Describe one picklable encode job per slide, keyed by its inputs."""
+        size = self._get_resolution_dimensions(video_resolution)
+        encode = self._get_encode_params()
+        watermark = watermark_spec(*size)
+        jobs: list[dict[str, Any]] = []
+        for i, image_path in enumerate(slide_images):
+            image_path = Path(image_path)
+            if not image_path.exists():
+                continue
+            audio_path: Path | None = None
+            if i < len(audio_files) and Path(audio_files[i]).exists():
+                audio_path = Path(audio_files[i])
+            key = segment_cache_key(image_path, audio_path, size, encode, watermark)
+            jobs.append(
+                {
+                    "image": str(image_path),
+                    "audio": str(audio_path) if audio_path else None,
+                    "duration": 5.0,
+                    "size": size,
+                    "encode": encode,
+                    "watermark": watermark is not None,
+                    "key": key,
+                    "output": str(segment_path(segments_dir, i, key)),
+                }
+            )
+        return jobs
+
+    async def _create_video_segmented(
+        self,
+        slide_images: list[Path],
+        audio_files: list[Path],
+        output_path: Path,
+        video_resolution: str = "hd",
+    ) -> list[Path]:
+        """Encode slides as independent segments in a process pool, then concat.
+
+        Segments live next to the output under ``segments/`` and are reused when
+        their inputs and encoding parameters are unchanged. Slides repeated in
+        the deck (same image and narration) are encoded once and linked.
+        """
+        if not slide_images:
+            raise ValueError("No slide images provided")
+        segments_dir = Path(output_path).parent / "segments"
+        segments_dir.mkdir(parents=True, exist_ok=True)
+        jobs = self._build_segment_jobs(
+            slide_images, audio_files, segments_dir, video_resolution
+        )
+        if not jobs:
+            raise ValueError("No valid clips for video creation")
+
+        # Slides repeated within the deck share a key; encode each key once and
+        # link the other copies to it
+        sources: dict[str, Path] = {}
+        for job in jobs:
+            if Path(job["output"]).exists():
+                sources.setdefault(job["key"], Path(job["output"]))
+        pending: list[dict[str, Any]] = []
+        copies: list[dict[str, Any]] = []
+        for job in jobs:
+            if Path(job["output"]).exists():
+                continue
+            if job["key"] in sources:
+                copies.append(job)
+            else:
+                sources[job["key"]] = Path(job["output"])
+                pending.append(job)
+        logger.info(
+            "Encoding %d of %d slide segments (%d reused, %d repeated)",
+            len(pending),
+            len(jobs),
+            len(jobs) - len(pending) - len(copies),
+            len(copies),
+        )
+        loop = asyncio.get_running_loop()
+        if pending:
+            workers = max(1, min(config.video_segment_workers, len(pending)))
+            # Not a ``with`` block: its exit waits for running encodes and would
+            # hold the event loop after a timeout or a failed segment
+            executor = ProcessPoolExecutor(max_workers=workers)
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(
+                        *(
+                            loop.run_in_executor(executor, _encode_slide_segment, job)
+                            for job in pending
+                        )
+                    ),
+                    timeout=1800,
+                )
+            except TimeoutError:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise Exception(
+                    "Video composition timed out after 30 minutes"
+                ) from None
+            except BaseException:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            await asyncio.to_thread(executor.shutdown)
+        for job in copies:
+            link_segment(sources[job["key"]], Path(job["output"]))
+
+        segment_paths = [Path(job["output"]) for job in jobs]
+        await loop.run_in_executor(
+            None, concat_segments, segment_paths, Path(output_path)
+        )
+        prune_stale_segments(segments_dir, segment_paths)
+        return segment_paths
+
+    async def _try_create_video_segmented(
+        self,
+        slide_images: list[Path],
+        audio_files: list[Path],
+        output_path: Path,
+        video_resolution: str,
+    ) -> bool:
+        """Run segmented composition when enabled; report whether it succeeded."""
+        if not config.video_segmented_encoding:
+            return False
+        try:
+            segments = await self._create_video_segmented(
+                slide_images, audio_files, output_path, video_resolution
+            )
+            self.last_render_stats = {"mode": "segmented", "segments": len(segments)}
+            return True
+        except Exception as e:
+            logger.warning(
+                f"Segmented composition failed, falling back to single render: {e}"
+            )
+            return False
+
+    def _estimate_slide_memory_mb(self, image_path: Path) -> float:
+        """Estimate the resident cost of one slide clip while it is rendered."""
+        try:
+            from PIL import Image
+
+            with Image.open(image_path) as img:
+                width, height = img.size
+        except Exception:
+            width, height = 1920, 1080
+        # Decoded RGB frame held by ImageClip, a resized copy for the output,
+        # and the audio reader's decode buffer
+        frame_mb = float(width * height * 3) / (1024 * 1024)
+        return frame_mb * 2 + 8.0
+
+    def _create_video_streaming_sync(
+        self,
+        slide_images: list[Path],
+        audio_files: list[Path],
+        output_path: Path,
+        video_resolution: str = "hd",
+    ) -> dict[str, Any]:
+        """Render slides in bounded windows that fit ``max_memory_mb``.
+
+        Each window is encoded to its own file and its clips are released
+        before the next window opens. The window shrinks whenever the memory
+        growth measured while a window renders exceeds the budget. Windows are
+        joined with stream copy.
+        """
+        if not slide_images:
+            raise ValueError("No slide images provided")
+        output_path = Path(output_path)
+        windows_dir = output_path.parent / f".{output_path.stem}_windows"
+        windows_dir.mkdir(parents=True, exist_ok=True)
+        target_width, target_height = self._get_resolution_dimensions(video_resolution)
+        per_slide_mb = self._estimate_slide_memory_mb(Path(slide_images[0]))
+        initial_window = max(
+            1,
+            min(
+                config.video_stream_window_max,
+                int(self.max_memory_mb // max(per_slide_mb, 1.0)),
+            ),
+        )
+        window = initial_window
+        window_paths: list[Path] = []
+        window_count = 0
+        smallest_window = window
+
+        with MemoryTracker(self.max_memory_mb) as tracker:
+            try:
+                start = 0
+                while start < len(slide_images):
+                    if tracker.over_budget():
+                        gc.collect()
+                        tracker.sample()
+                    tracker.start_window()
+                    batch_images = slide_images[start : start + window]
+                    batch_audio = list(audio_files[start : start + window])
+                    clips: list[Any] = []
+                    try:
+                        clips = self._create_image_clips(
+                            batch_images, batch_audio, pad_silence=True
+                        )
+                        if clips:
+                            window_clip = concatenate_videoclips(
+                                clips, method="compose"
+                            )
+                            clips.append(window_clip)
+                            window_clip, overlay = self._prepare_watermark(
+                                window_clip, (target_width, target_height)
+                            )
+                            clips.append(window_clip)
+                            window_clip = window_clip.with_effects(
+                                [Resize(width=target_width, height=target_height)]
+                            )
+                            clips.append(window_clip)
+                            window_path = (
+                                windows_dir / f"window_{len(window_paths):04d}.mp4"
+                            )
+                            _write_video(
+                                window_clip,
+                                window_path,
+                                self._get_encode_params(),
+                                window_path.with_suffix(".m4a"),
+                                overlay,
+                            )
+                            window_paths.append(window_path)
+                    finally:
+                        tracker.sample()
+                        self._safe_close_clips(list(reversed(clips)))
+                        clips.clear()
+                        gc.collect()
+                    start += len(batch_images)
+                    # Only this window's peak counts: an earlier spike that has
+                    # since been released must not keep shrinking later windows
+                    if tracker.window_growth_mb() > self.max_memory_mb:
+                        window = max(1, window // 2)
+                        smallest_window = min(smallest_window, window)
+                        logger.info(
+                            "Memory growth above %.0f MB budget; window reduced to %d",
+                            self.max_memory_mb,
+                            window,
+                        )
+
+                if not window_paths:
+                    raise ValueError("No valid clips for video creation")
+                concat_segments(window_paths, output_path)
+                window_count = len(window_paths)
+            finally:
+                for path in window_paths:
+                    with contextlib.suppress(OSError):
+                        path.unlink()
+                with contextlib.suppress(OSError):
+                    windows_dir.rmdir()
+
+        stats = tracker.stats()
+        stats.update(
+            {
+                "mode": "streaming",
+                "slides": len(slide_images),
+                "windows": window_count,
+                "initial_window": initial_window,
+                "smallest_window": smallest_window,
+            }
+        )
+        logger.info(
+            "Streaming composition finished: peak RSS %.1f MB (budget %.0f MB, %d windows)",
+            stats["peak_rss_mb"],
+            self.max_memory_mb,
+            window_count,
+        )
+        return stats
+
+    async def _try_create_video_streaming(
+        self,
+        slide_images: list[Path],
+        audio_files: list[Path],
+        output_path: Path,
+        video_resolution: str,
+    ) -> bool:
+        """Run memory-bounded composition when enabled; report whether it ran."""
+        if not config.video_streaming_composition:
+            return False
+        loop = asyncio.get_event_loop()
+        with ThreadPoolExecutor(max_workers=1) as executor:
             try:
-                original_audio = final_clip.audio
-                final_clip = CompositeVideoClip([final_clip, watermark])
-                if original_audio is not None:
-                    final_clip = final_clip.with_audio(original_audio)
-            except Exception:
-                pass
-        return final_clip
-
-    def _get_ffmpeg_settings(self) -> tuple[str, int]:
-        """Get FFmpeg settings, applying fast mode if enabled"""
-        ffmpeg_preset = config.ffmpeg_preset
-        ffmpeg_threads = config.ffmpeg_threads
-        if config.ffmpeg_fast_mode:
-            ffmpeg_preset = "ultrafast"
-            ffmpeg_threads = max(ffmpeg_threads, (os.cpu_count() or 2))
-        return ffmpeg_preset, ffmpeg_threads
+                self.last_render_stats = await asyncio.wait_for(
+                    loop.run_in_executor(
+                        executor,
+                        lambda: self._create_video_streaming_sync(
+                            slide_images, audio_files, output_path, video_resolution
+                        ),
+                    ),
+                    timeout=1800,
+                )
+            except TimeoutError:
+                raise Exception(
+                    "Video composition timed out after 30 minutes"
+                ) from None
+        return True
 
     def _compose_video_sync(
         self,
@@ -548,7 +911,6 @@ class VideoComposer:
         video_clips: list[Any] = []
         final_clip: Any = None
         final_clip_resized: Any = None
-        watermark: Any = None
 
         try:
             # Validate inputs
@@ -570,31 +932,19 @@ class VideoComposer:
                 raise ValueError("No valid clips for composition")
 
             final_clip = concatenate_videoclips(video_clips, method="compose")
-            final_clip = self._apply_watermark(final_clip)
-
-            target_width, target_height = self._get_resolution_dimensions(
-                video_resolution
-            )
+            target_size = self._get_resolution_dimensions(video_resolution)
+            final_clip, overlay = self._prepare_watermark(final_clip, target_size)
             final_clip_resized = final_clip.with_effects(
-                [Resize(width=target_width, height=target_height)]
+                [Resize(width=target_size[0], height=target_size[1])]
             )
 
-            # Get FFmpeg settings
-            ffmpeg_preset, ffmpeg_threads = self._get_ffmpeg_settings()
-
             # Write video file
-            final_clip_resized.write_videofile(
-                str(output_path),
-                fps=config.ffmpeg_fps,
-                codec=config.ffmpeg_codec,
-                audio_codec=config.ffmpeg_audio_codec,
-                threads=ffmpeg_threads,
-                preset=ffmpeg_preset,
-                bitrate=config.ffmpeg_bitrate,
-                audio_bitrate=config.ffmpeg_audio_bitrate,
-                temp_audiofile=str(Path(output_path).parent / "temp_audio.m4a"),
-                remove_temp=True,
-                logger=None,
+            _write_video(
+                final_clip_resized,
+                Path(output_path),
+                self._get_encode_params(),
+                Path(output_path).parent / "temp_audio.m4a",
+                overlay,
             )
 
         except Exception as e:
@@ -608,8 +958,6 @@ class VideoComposer:
                 self._safe_close_clip(final_clip)
             if final_clip_resized is not None:
                 self._safe_close_clip(final_clip_resized)
-            if watermark is not None:
-                self._safe_close_clip(watermark)
             gc.collect()
 
     async def _compose_video_with_local_files(
@@ -621,6 +969,14 @@ class VideoComposer:
         video_resolution: str = "hd",
     ) -> None:
         """Compose video with local files using thread pool executor"""
+        if not avatar_videos and await self._try_create_video_segmented(
+            slide_images, audio_files, output_path, video_resolution
+        ):
+            return
+        if not avatar_videos and await self._try_create_video_streaming(
+            slide_images, audio_files, output_path, video_resolution
+        ):
+            return
         loop = asyncio.get_event_loop()
         with ThreadPoolExecutor(max_workers=1) as executor:
             try:
@@ -649,6 +1005,14 @@ class VideoComposer:
         output_path: Path,
         video_resolution: str = "hd",
     ) -> None:
+        if await self._try_create_video_segmented(
+            slide_images, audio_files, output_path, video_resolution
+        ):
+            return
+        if await self._try_create_video_streaming(
+            slide_images, audio_files, output_path, video_resolution
+        ):
+            return
         loop = asyncio.get_event_loop()
         with ThreadPoolExecutor(max_workers=1) as executor:
             try:
@@ -0,0 +1,118 @@
+"""
+Process memory tracking for video composition (video package).
+
+Samples the resident set size (RSS) of the current process so composition can
+size its working windows against a memory budget and report the peak it saw.
+"""
+
+import os
+import resource
+import sys
+import threading
+from types import TracebackType
+from typing import Any
+
+
+def current_rss_mb() -> float:
+    """Return the current resident set size of this process in MiB."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        # Non-Linux fallback: lifetime peak is the best cheap approximation
+        peak = float(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+        divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+        return peak / divisor
+
+
+class MemoryTracker:
+    """Track RSS growth against a budget while a block of work runs.
+
+    The budget applies to memory added on top of the RSS measured when the
+    tracker starts, so the interpreter's own baseline does not count against
+    composition. A background thread samples periodically to catch peaks that
+    occur inside long blocking calls such as ``write_videofile``.
+    """
+
+    def __init__(self, budget_mb: float, interval: float = 0.5) -> None:
+        self.budget_mb = float(budget_mb)
+        self.interval = interval
+        self.baseline_mb = 0.0
+        self.peak_mb = 0.0
+        self.window_start_mb = 0.0
+        self.window_peak_mb = 0.0
+        self.last_mb = 0.0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "MemoryTracker":
+        self.baseline_mb = current_rss_mb()
+        self.peak_mb = self.baseline_mb
+        self.window_start_mb = self.baseline_mb
+        self.window_peak_mb = self.baseline_mb
+        self.last_mb = self.baseline_mb
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="memory-tracker", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval * 2)
+        self.sample()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def sample(self) -> float:
+        """Record the current RSS and return it in MiB."""
+        value = current_rss_mb()
+        with self._lock:
+            self.last_mb = value
+            self.peak_mb = max(self.peak_mb, value)
+            self.window_peak_mb = max(self.window_peak_mb, value)
+        return value
+
+    def start_window(self) -> None:
+        """Restart the per-window peak from the current RSS."""
+        value = current_rss_mb()
+        with self._lock:
+            self.last_mb = value
+            self.window_start_mb = value
+            self.window_peak_mb = value
+
+    def window_growth_mb(self) -> float:
+        """Return the peak RSS growth seen since ``start_window``."""
+        return max(0.0, self.window_peak_mb - self.window_start_mb)
+
+    def used_mb(self) -> float:
+        """Return the RSS growth since the tracker started."""
+        return max(0.0, self.last_mb - self.baseline_mb)
+
+    def over_budget(self) -> bool:
+        """Return True when current growth exceeds the configured budget."""
+        return self.used_mb() > self.budget_mb
+
+    def stats(self) -> dict[str, Any]:
+        """Return a JSON-friendly summary for step results."""
+        return {
+            "memory_budget_mb": round(self.budget_mb, 1),
+            "baseline_rss_mb": round(self.baseline_mb, 1),
+            "peak_rss_mb": round(self.peak_mb, 1),
+            "peak_growth_mb": round(max(0.0, self.peak_mb - self.baseline_mb), 1),
+            "budget_exceeded": self.peak_mb - self.baseline_mb > self.budget_mb,
+        }
+
+
+__all__ = ["MemoryTracker", "current_rss_mb"]
@@ -0,0 +1,111 @@
+"""
+Named encoding profiles for the video package.
+
+A profile bundles the codec parameters used for every encode of one
+composition. ``default`` reproduces the ``FFMPEG_*`` environment settings; the
+``slides*`` profiles exploit the fact that slide videos are mostly static
+frames: low frame rates, still-image tuning, constant-quality (CRF) rate
+control and long GOPs. ``scripts/encoding_benchmark.py`` measures encode time
+against output size for each profile.
+"""
+
+import os
+from typing import Any
+
+from slidespeaker.configs.config import config
+
+DEFAULT_PROFILE = "default"
+
+# Overrides applied on top of the environment defaults. ``crf`` switches to
+# constant-quality rate control (bitrate is dropped); ``keyint_seconds`` sets the
+# GOP length in seconds of video.
+ENCODING_PROFILES: dict[str, dict[str, Any]] = {
+    "default": {},
+    "fast": {"preset": "ultrafast", "all_threads": True},
+    "slides": {
+        "fps": 12,
+        "preset": "medium",
+        "crf": 26,
+        "tune": "stillimage",
+        "keyint_seconds": 10,
+    },
+    "slides_hq": {
+        "fps": 24,
+        "preset": "slow",
+        "crf": 20,
+        "tune": "stillimage",
+        "keyint_seconds": 5,
+    },
+    "slides_small": {
+        "fps": 6,
+        "preset": "slower",
+        "crf": 30,
+        "tune": "stillimage",
+        "keyint_seconds": 20,
+    },
+}
+
+# Encoders that understand libx264-style -crf / -tune options
+_X264_STYLE_CODECS = {"libx264", "libx265"}
+
+
+def available_profiles() -> list[str]:
+    """Return the names of all encoding profiles."""
+    return list(ENCODING_PROFILES)
+
+
+def resolve_encoding_profile(name: str | None = None) -> dict[str, Any]:
+    """Return the full encode parameters for profile ``name``.
+
+    ``None`` selects ``FFMPEG_PROFILE`` (``default`` when unset). The result has
+    the keys expected by the composer's encoders: fps, codec, audio_codec,
+    threads, preset, bitrate, audio_bitrate and ffmpeg_params.
+
+    Raises:
+        ValueError: If the profile name is unknown
+    """
+    profile_name = (name or config.ffmpeg_profile or DEFAULT_PROFILE).strip().lower()
+    if profile_name not in ENCODING_PROFILES:
+        raise ValueError(
+            f"Unknown encoding profile: {profile_name}. "
+            f"Valid options: {', '.join(available_profiles())}"
+        )
+    overrides = dict(ENCODING_PROFILES[profile_name])
+    if profile_name == DEFAULT_PROFILE and config.ffmpeg_fast_mode:
+        overrides = dict(ENCODING_PROFILES["fast"])
+
+    threads = config.ffmpeg_threads
+    if overrides.get("all_threads"):
+        threads = max(threads, os.cpu_count() or 2)
+    fps = int(overrides.get("fps", config.ffmpeg_fps))
+    codec = config.ffmpeg_codec
+    bitrate: str | None = config.ffmpeg_bitrate
+    ffmpeg_params: list[str] = []
+    if codec in _X264_STYLE_CODECS:
+        if "crf" in overrides:
+            ffmpeg_params += ["-crf", str(overrides["crf"])]
+            bitrate = None
+        if "tune" in overrides:
+            ffmpeg_params += ["-tune", str(overrides["tune"])]
+    if "keyint_seconds" in overrides:
+        ffmpeg_params += ["-g", str(max(1, fps * int(overrides["keyint_seconds"])))]
+
+    return {
+        "profile": profile_name,
+        "fps": fps,
+        "codec": codec,
+        "audio_codec": config.ffmpeg_audio_codec,
+        "threads": threads,
+        "preset": overrides.get("preset", config.ffmpeg_preset),
+        "bitrate": bitrate,
+        "audio_bitrate": config.ffmpeg_audio_bitrate,
+        "ffmpeg_params": ffmpeg_params,
+    }
+
+
+__all__ = [
+    "DEFAULT_PROFILE",
+    "ENCODING_PROFILES",
+    "available_profiles",
+    "resolve_encoding_profile",
+]
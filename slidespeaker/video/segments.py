@@ -0,0 +1,139 @@
+"""
+Per-slide segment helpers for the video package.
+
+Slides can be encoded into standalone MP4 segments that share identical codec
+parameters. Segments are named after a hash of their inputs' content so
+unchanged slides are reused on re-renders and slides repeated within a deck
+(same image and narration) are encoded once. Segments are joined with the
+ffmpeg concat demuxer using stream copy (no re-encoding).
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import uuid
+from contextlib import suppress
+from pathlib import Path
+from typing import Any
+
+SEGMENT_PREFIX = "slide_"
+
+
+def _file_fingerprint(path: Path) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def segment_cache_key(
+    image_path: Path,
+    audio_path: Path | None,
+    size: tuple[int, int],
+    encode_params: dict[str, Any],
+    watermark: dict[str, Any] | None = None,
+) -> str:
+    """Return a short, stable key describing everything that shapes a segment."""
+    digest = hashlib.sha1()
+    digest.update(_file_fingerprint(image_path).encode("utf-8"))
+    if audio_path is not None:
+        digest.update(_file_fingerprint(audio_path).encode("utf-8"))
+    # Thread count does not change the encoded output, so keep it out of the key
+    params = {k: v for k, v in encode_params.items() if k != "threads"}
+    digest.update(
+        json.dumps(
+            {"size": list(size), "encode": params, "watermark": watermark},
+            sort_keys=True,
+            default=str,
+        ).encode("utf-8")
+    )
+    return digest.hexdigest()[:16]
+
+
+def segment_path(segments_dir: Path, index: int, key: str) -> Path:
+    """Return the on-disk location of a slide segment."""
+    return segments_dir / f"{SEGMENT_PREFIX}{index + 1:03d}_{key}.mp4"
+
+
+def link_segment(src: Path, dest: Path) -> None:
+    """Reuse the encoded segment ``src`` as ``dest`` (hardlink, else copy)."""
+    tmp = dest.with_name(f".{dest.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        os.link(src, tmp)
+    except OSError:
+        shutil.copyfile(src, tmp)
+    os.replace(tmp, dest)
+
+
+def prune_stale_segments(segments_dir: Path, keep: list[Path]) -> None:
+    """Delete segments left over from earlier renders that are no longer used."""
+    if not segments_dir.exists():
+        return
+    keep_names = {p.name for p in keep}
+    for candidate in segments_dir.glob(f"{SEGMENT_PREFIX}*.mp4"):
+        if candidate.name not in keep_names:
+            with suppress(OSError):
+                candidate.unlink()
+
+
+def write_concat_list(paths: list[Path], list_file: Path) -> None:
+    """Write an ffmpeg concat demuxer list file for the given media paths."""
+    with open(list_file, "w", encoding="utf-8") as f:
+        for p in paths:
+            escaped = str(Path(p).resolve()).replace("'", "'\\''")
+            f.write(f"file '{escaped}'\n")
+
+
+def concat_segments(segment_paths: list[Path], output_path: Path) -> None:
+    """Join MP4 segments into ``output_path`` with stream copy.
+
+    Raises:
+        ValueError: If no segments are provided
+        RuntimeError: If ffmpeg fails or produces an empty file
+    """
+    if not segment_paths:
+        raise ValueError("No segments provided for concatenation")
+    list_file = output_path.with_suffix(".segments.txt")
+    try:
+        write_concat_list(segment_paths, list_file)
+        cmd = [
+            "ffmpeg",
+            "-y",
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-f",
+            "concat",
+            "-safe",
+            "0",
+            "-i",
+            str(list_file),
+            "-c",
+            "copy",
+            "-movflags",
+            "+faststart",
+            str(output_path),
+        ]
+        res = subprocess.run(cmd, capture_output=True, text=True)
+        if res.returncode != 0:
+            raise RuntimeError(f"ffmpeg segment concat failed: {res.stderr[:400]}")
+        if not output_path.exists() or output_path.stat().st_size == 0:
+            raise RuntimeError(
+                f"ffmpeg segment concat produced no output: {output_path}"
+            )
+    finally:
+        with suppress(Exception):
+            list_file.unlink(missing_ok=True)
+
+
+__all__ = [
+    "concat_segments",
+    "link_segment",
+    "prune_stale_segments",
+    "segment_cache_key",
+    "segment_path",
+    "write_concat_list",
+]
@@ -0,0 +1,148 @@
+"""
+Pre-rendered watermark overlay for the video package.
+
+The watermark text is rasterised once per (text, font size, opacity, output
+resolution) into a transparent PNG kept under the cache directory. Encoders
+burn it in with an ffmpeg ``overlay`` filter, so watermarking costs no per-frame
+Python compositing.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any
+
+from PIL import Image, ImageDraw, ImageFont
+
+from slidespeaker.configs.config import config
+
+logger = logging.getLogger(__name__)
+
+# Pixel sizes are the same at every output resolution
+MIN_FONT_SIZE = 48
+MARGIN = 50
+STROKE_WIDTH = 4
+
+_asset_cache: dict[str, Path] = {}
+_asset_lock = threading.Lock()
+
+
+def watermark_spec(width: int, height: int) -> dict[str, Any] | None:
+    """Describe the configured watermark for a ``width`` x ``height`` frame.
+
+    Returns None when watermarking is disabled.
+    """
+    if not config.watermark_enabled or not config.watermark_text:
+        return None
+    return {
+        "text": config.watermark_text,
+        "font_size": max(config.watermark_size, MIN_FONT_SIZE),
+        "stroke_width": STROKE_WIDTH,
+        "margin": MARGIN,
+        "opacity": min(max(config.watermark_opacity, 0.9), 1.0),
+        "resolution": [int(width), int(height)],
+    }
+
+
+def _load_font(size: int) -> Any:
+    for name in ("Arial.ttf", "DejaVuSans.ttf"):
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    return ImageFont.load_default(size=size)
+
+
+def render_watermark(spec: dict[str, Any]) -> Image.Image:
+    """Rasterise the watermark text into a tightly cropped RGBA image."""
+    font = _load_font(int(spec["font_size"]))
+    stroke = int(spec["stroke_width"])
+    probe = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+    left, top, right, bottom = probe.textbbox(
+        (0, 0), spec["text"], font=font, stroke_width=stroke
+    )
+    image = Image.new(
+        "RGBA", (max(1, math.ceil(right - left)), max(1, math.ceil(bottom - top)))
+    )
+    draw = ImageDraw.Draw(image)
+    draw.text(
+        (-left, -top),
+        spec["text"],
+        font=font,
+        fill=(255, 255, 255, 255),
+        stroke_width=stroke,
+        stroke_fill=(0, 0, 0, 255),
+    )
+    opacity = float(spec["opacity"])
+    if opacity < 1.0:
+        alpha = image.getchannel("A").point(lambda a: round(a * opacity))
+        image.putalpha(alpha)
+    return image
+
+
+def get_watermark_asset(
+    width: int, height: int, cache_dir: Path | None = None
+) -> Path | None:
+    """Return the cached watermark PNG for this resolution, rendering it once.
+
+    Returns None when watermarking is disabled or the asset cannot be rendered.
+    """
+    spec = watermark_spec(width, height)
+    if spec is None:
+        return None
+    payload = json.dumps(spec, sort_keys=True).encode("utf-8")
+    key = hashlib.sha1(payload).hexdigest()[:16]
+    with _asset_lock:
+        cached = _asset_cache.get(key)
+        if cached is not None and cached.exists():
+            return cached
+        directory = (cache_dir or config.cache_dir) / "watermarks"
+        asset = directory / f"watermark_{key}.png"
+        if not asset.exists():
+            try:
+                directory.mkdir(parents=True, exist_ok=True)
+                partial = asset.with_name(f"{asset.stem}.{os.getpid()}.tmp.png")
+                render_watermark(spec).save(partial)
+                os.replace(partial, asset)
+            except Exception as e:
+                logger.error(f"Watermark rendering failed: {e}")
+                return None
+        _asset_cache[key] = asset
+        return asset
+
+
+def _escape_filter_path(path: Path) -> str:
+    # Escape once for the filter option value and once for the filtergraph
+    value = re.sub(r"([\\':])", r"\\\1", str(path))
+    return re.sub(r"([\\'\[\],;])", r"\\\1", value)
+
+
+def watermark_overlay_params(width: int, height: int) -> list[str] | None:
+    """Return ffmpeg output params that overlay the watermark on the encode.
+
+    The params fit MoviePy's ``write_videofile(ffmpeg_params=...)``. Returns
+    None when watermarking is disabled or no asset is available.
+    """
+    spec = watermark_spec(width, height)
+    asset = get_watermark_asset(width, height) if spec is not None else None
+    if spec is None or asset is None:
+        return None
+    margin = int(spec["margin"])
+    return [
+        "-vf",
+        f"movie={_escape_filter_path(asset)}[wm];"
+        f"[in][wm]overlay=W-w-{margin}:H-h-{margin}:format=auto[out]",
+    ]
+
+
+__all__ = [
+    "get_watermark_asset",
+    "render_watermark",
+    "watermark_overlay_params",
+    "watermark_spec",
+]
@@ -16,6 +16,9 @@ os.environ.setdefault("GOOGLE_GEMINI_TIMEOUT", "60")
 os.environ.setdefault("GOOGLE_GEMINI_RETRIES", "3")
 os.environ.setdefault("GOOGLE_GEMINI_BACKOFF", "0.5")
 os.environ.setdefault("STORAGE_PROVIDER", "local")
+os.environ.setdefault("AUDIO_POSTPROCESS_ENABLED", "false")
+# Keep synthesised clips out of the repo's output/.cache
+os.environ.setdefault("TTS_CACHE_ENABLED", "false")
 
 from server import app
 
@@ -0,0 +1,107 @@
+"""
+Unit tests for frame-level MP3 concatenation.
+"""
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from slidespeaker.audio import concat, probe
+from slidespeaker.audio.concat import concat_mp3
+from slidespeaker.audio.mp3 import audio_frames, is_info_frame, mp3_duration
+from slidespeaker.configs.config import config
+from slidespeaker.pipeline.steps.common import audio_generator as step
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz: 417-byte frames of 1152 samples
+FRAME = bytes([0xFF, 0xFB, 0x90, 0x00]) + b"\x00" * 413
+FRAME_SECONDS = 1152 / 44100
+ID3 = b"ID3\x04\x00\x00\x00\x00\x00\x00"
+
+
+def _clip(path: Path, frames: int) -> Path:
+    path.write_bytes(ID3 + FRAME * frames)
+    return path
+
+
+def test_concat_writes_single_header_and_offsets(tmp_path: Path) -> None:
+    inputs = [_clip(tmp_path / f"slide_{i}.mp3", n) for i, n in enumerate((3, 5, 2))]
+    output = tmp_path / "final.mp3"
+
+    clips = concat_mp3(inputs, output)
+
+    data = output.read_bytes()
+    assert not data.startswith(b"ID3")
+    assert is_info_frame(data[: len(data) - len(FRAME) * 10])
+    assert audio_frames(data)[0] == FRAME * 10
+    assert mp3_duration(data) == pytest.approx(10 * FRAME_SECONDS)
+    assert [c["start"] for c in clips] == pytest.approx(
+        [0, 3 * FRAME_SECONDS, 8 * FRAME_SECONDS]
+    )
+    assert clips[-1]["end"] == pytest.approx(10 * FRAME_SECONDS)
+    assert probe.cached_duration(output) == pytest.approx(10 * FRAME_SECONDS)
+    assert list(tmp_path.glob(".*")) == []
+
+
+def test_mismatched_layouts_fall_back_to_ffmpeg(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    first = _clip(tmp_path / "a.mp3", 2)
+    # Same bitrate at 48 kHz: cannot share one frame stream with 44.1 kHz
+    second = tmp_path / "b.mp3"
+    second.write_bytes(bytes([0xFF, 0xFB, 0x94, 0x00]) + b"\x00" * 380)
+    calls: list[list[Path]] = []
+
+    def fake_demuxer(inputs: list[Path], output: Path) -> list[concat.ClipOffset]:
+        calls.append(inputs)
+        output.write_bytes(b"")
+        return [{"path": str(p), "start": 0.0, "end": 1.0} for p in inputs]
+
+    monkeypatch.setattr(concat, "_concat_demuxer", fake_demuxer)
+
+    clips = concat_mp3([first, second], tmp_path / "final.mp3")
+
+    assert calls == [[first, second]]
+    assert len(clips) == 2
+
+
+def test_concat_requires_inputs(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        concat_mp3([], tmp_path / "final.mp3")
+
+
+@pytest.mark.asyncio
+async def test_final_audio_segments_keep_slide_indices(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    class Scheduler:
+        def __init__(self, generator: Any) -> None:
+            pass
+
+        async def run(self, jobs: list[Any]) -> list[bool]:
+            for job in jobs:
+                _clip(job["output_path"], 2)
+            return [True] * len(jobs)
+
+    state: dict[str, Any] = {"voice_language": "english"}
+    manager = MagicMock(
+        get_state=AsyncMock(return_value=state),
+        update_step_status=AsyncMock(),
+        save_state=AsyncMock(),
+    )
+    monkeypatch.setattr(config, "_output_dir", tmp_path)
+    monkeypatch.setattr(step, "state_manager", manager)
+    monkeypatch.setattr(step, "AudioGenerator", MagicMock())
+    monkeypatch.setattr(step, "TTSScheduler", Scheduler)
+    monkeypatch.setattr(step, "get_storage_provider", MagicMock())
+    transcripts = [{"script": ""}, {"script": "Second"}, {"script": "Third"}]
+
+    await step.generate_audio_common(
+        "file-1", "generate_audio", AsyncMock(return_value=transcripts)
+    )
+
+    segments = state["artifacts"]["final_audio"]["segments"]
+    # The first slide has no narration, so the first clip belongs to slide 2
+    assert [s["index"] for s in segments] == [1, 2]
+    assert segments[1]["start"] == pytest.approx(2 * FRAME_SECONDS)
@@ -35,6 +35,8 @@ class TestAudioGenerator:
             mock_tts_service.generate_speech = AsyncMock(
                 return_value=b"test_audio_data"
             )
+            mock_tts_service.supports_word_timings = MagicMock(return_value=False)
+            mock_tts_service.resolve_voice = MagicMock(return_value=("alloy", "tts-1"))
             mock_tts_factory.create_service = MagicMock(return_value=mock_tts_service)
 
             # Mock Path
@@ -0,0 +1,117 @@
+"""
+Unit tests for TTS clip post-processing (silence trim and loudness).
+"""
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from slidespeaker.audio import probe
+from slidespeaker.audio.mp3 import mp3_duration
+from slidespeaker.audio.postprocess import (
+    parse_silences,
+    postprocess_clip,
+    read_clip_metadata,
+)
+from slidespeaker.subtitle.cues import CueBuilder
+
+needs_ffmpeg = pytest.mark.skipif(
+    shutil.which("ffmpeg") is None, reason="ffmpeg not installed"
+)
+
+
+def _speech_like_clip(path: Path) -> None:
+    """0.7s silence, 1.5s tone, 0.5s pause, 1s tone, 0.9s silence."""
+    parts = [("anullsrc=", 0.7), ("sine=f=440:", 1.5), ("anullsrc=", 0.5)]
+    parts += [("sine=f=660:", 1.0), ("anullsrc=", 0.9)]
+    cmd = ["ffmpeg", "-y", "-v", "error"]
+    for source, seconds in parts:
+        cmd += ["-f", "lavfi", "-i", f"{source}r=24000:d={seconds}"]
+    cmd += [
+        "-filter_complex",
+        "".join(f"[{i}]" for i in range(len(parts)))
+        + f"concat=n={len(parts)}:v=0:a=1,aformat=channel_layouts=mono",
+        "-c:a",
+        "libmp3lame",
+        "-b:a",
+        "64k",
+        str(path),
+    ]
+    subprocess.run(cmd, check=True)
+
+
+def test_parse_silences_sorts_dedupes_and_bounds() -> None:
+    log = (
+        "[silencedetect @ 0x1] silence_start: 2.5\n"
+        "[silencedetect @ 0x1] silence_end: 3.0 | silence_duration: 0.5\n"
+        "[silencedetect @ 0x1] silence_start: 1.001\n"
+        "[silencedetect @ 0x1] silence_start: 1.0\n"
+        "[silencedetect @ 0x1] silence_start: 0\n"
+        "[silencedetect @ 0x1] silence_end: 9.0\n"
+    )
+    assert parse_silences(log, duration=5.0) == [1.0, 2.5, 3.0]
+
+
+@needs_ffmpeg
+@pytest.mark.asyncio
+async def test_postprocess_trims_and_records_silences(tmp_path: Path) -> None:
+    clip = tmp_path / "slide_1.mp3"
+    _speech_like_clip(clip)
+    before = mp3_duration(clip.read_bytes())
+
+    metadata = await postprocess_clip(clip)
+
+    assert metadata is not None
+    # About 0.6s trimmed from the start and 0.8s from the end
+    assert metadata["duration"] == pytest.approx(before - 1.4, abs=0.15)
+    assert mp3_duration(clip.read_bytes()) == pytest.approx(metadata["duration"])
+    assert probe.cached_duration(clip) == pytest.approx(metadata["duration"])
+    # The inner pause survives and is reported on the trimmed timeline
+    assert metadata["silences"][0] == pytest.approx(1.6, abs=0.1)
+    assert read_clip_metadata(clip) == metadata
+    assert list(tmp_path.glob(".*")) == []
+
+    # Cue timing reuses the saved pauses instead of running ffmpeg again
+    builder = CueBuilder()
+    assert (
+        builder._detect_silence_boundaries(clip, metadata["duration"])
+        == (metadata["silences"])
+    )
+
+
+@needs_ffmpeg
+@pytest.mark.asyncio
+async def test_untrimmed_clip_keeps_its_length(tmp_path: Path) -> None:
+    clip = tmp_path / "chapter_1.mp3"
+    _speech_like_clip(clip)
+    before = mp3_duration(clip.read_bytes())
+
+    metadata = await postprocess_clip(clip, trim=False)
+
+    assert metadata is not None
+    assert metadata["trimmed"] is False
+    assert metadata["duration"] == pytest.approx(before, abs=0.1)
+
+
+@pytest.mark.asyncio
+async def test_unprocessable_clip_is_left_alone(tmp_path: Path) -> None:
+    clip = tmp_path / "slide_1.mp3"
+    clip.write_bytes(b"not audio")
+
+    assert await postprocess_clip(clip) is None
+    assert clip.read_bytes() == b"not audio"
+    assert read_clip_metadata(clip) is None
+
+
+@needs_ffmpeg
+@pytest.mark.asyncio
+async def test_metadata_ignored_once_clip_is_rewritten(tmp_path: Path) -> None:
+    clip = tmp_path / "slide_1.mp3"
+    _speech_like_clip(clip)
+    assert await postprocess_clip(clip) is not None
+
+    clip.write_bytes(clip.read_bytes() + b"\x00")
+
+    assert read_clip_metadata(clip) is None
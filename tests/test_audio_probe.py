@@ -0,0 +1,63 @@
+"""
+Unit tests for the shared media duration probe.
+"""
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from slidespeaker.audio import probe
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache() -> Iterator[None]:
+    probe.clear_duration_cache()
+    yield
+    probe.clear_duration_cache()
+
+
+def _clip(tmp_path: Path, payload: bytes = b"mp3-bytes") -> Path:
+    path = tmp_path / "slide_1.mp3"
+    path.write_bytes(payload)
+    return path
+
+
+def test_probe_runs_once_per_file(tmp_path: Path) -> None:
+    path = _clip(tmp_path)
+    with patch.object(probe, "_ffprobe_duration", return_value=3.5) as ffprobe:
+        assert probe.probe_duration(path) == 3.5
+        assert probe.probe_duration(str(path)) == 3.5
+    assert ffprobe.call_count == 1
+
+
+def test_recorded_duration_skips_probe(tmp_path: Path) -> None:
+    path = _clip(tmp_path)
+    probe.record_duration(path, 7.25)
+    with patch.object(probe, "_ffprobe_duration") as ffprobe:
+        assert probe.probe_duration(path) == 7.25
+    ffprobe.assert_not_called()
+
+
+def test_rewritten_file_is_probed_again(tmp_path: Path) -> None:
+    path = _clip(tmp_path)
+    probe.record_duration(path, 2.0)
+    path.write_bytes(b"longer narration bytes")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert probe.cached_duration(path) is None
+    with patch.object(probe, "_ffprobe_duration", return_value=4.0):
+        assert probe.probe_duration(path) == 4.0
+
+
+def test_unmeasurable_files_are_not_cached(tmp_path: Path) -> None:
+    path = _clip(tmp_path)
+    with (
+        patch.object(probe, "_ffprobe_duration", return_value=None),
+        patch.object(probe, "_decoder_duration", return_value=None),
+    ):
+        assert probe.probe_duration(path) is None
+    assert probe.cached_duration(path) is None
+    assert probe.probe_duration(tmp_path / "missing.mp3") is None
@@ -0,0 +1,202 @@
+"""
+Unit tests for concurrent avatar rendering with a shared poller.
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from slidespeaker.video.avatar.interface import AvatarInterface, AvatarJobStatus
+from slidespeaker.video.avatar.jobs import AvatarJobRunner, AvatarRequest
+
+
+class FakeJobService(AvatarInterface):
+    """Jobs finish after a fixed number of status polls."""
+
+    def __init__(self, polls: dict[str, int], fail: set[str] | None = None) -> None:
+        self.polls = polls
+        self.fail = fail or set()
+        self.active = 0
+        self.peak = 0
+        self.poll_rounds: list[float] = []
+        self.downloaded: list[str] = []
+        self._remaining: dict[str, int] = {}
+
+    def supports_jobs(self) -> bool:
+        return True
+
+    async def generate_avatar_video(
+        self, script: str, output_path: Path, **kwargs: Any
+    ) -> bool:
+        raise AssertionError("job API should be used")
+
+    def is_available(self) -> bool:
+        return True
+
+    def get_supported_options(self) -> dict[str, Any]:
+        return {}
+
+    async def submit_avatar_job(self, script: str, **kwargs: Any) -> str:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        self._remaining[script] = self.polls[script]
+        return script
+
+    async def get_avatar_job_status(self, job_id: str) -> AvatarJobStatus:
+        if (
+            not self.poll_rounds
+            or self.poll_rounds[-1] != asyncio.get_running_loop().time()
+        ):
+            self.poll_rounds.append(asyncio.get_running_loop().time())
+        self._remaining[job_id] -= 1
+        if self._remaining[job_id] > 0:
+            return {"status": "pending", "video_url": None, "error": None}
+        self.active -= 1
+        if job_id in self.fail:
+            return {"status": "failed", "video_url": None, "error": "boom"}
+        return {"status": "completed", "video_url": f"url:{job_id}", "error": None}
+
+    async def download_avatar_video(self, video_url: str, output_path: Path) -> None:
+        self.downloaded.append(video_url)
+        output_path.write_text(video_url)
+
+
+def _requests(tmp_path: Path, scripts: list[str]) -> list[AvatarRequest]:
+    return [
+        {"script": s, "output_path": tmp_path / f"{s}.mp4", "options": {}}
+        for s in scripts
+    ]
+
+
+@pytest.mark.asyncio
+async def test_runner_bounds_concurrency_and_keeps_order(tmp_path: Path) -> None:
+    service = FakeJobService({"a": 3, "b": 1, "c": 2, "d": 1})
+    runner = AvatarJobRunner(
+        service, max_jobs=2, poll_interval=0.001, max_poll_interval=0.01
+    )
+
+    results = await runner.run(_requests(tmp_path, ["a", "b", "c", "d"]))
+
+    assert results == [True, True, True, True]
+    assert service.peak == 2
+    # Quick jobs are downloaded before the slow first one finishes
+    assert service.downloaded.index("url:b") < service.downloaded.index("url:a")
+    assert (tmp_path / "c.mp4").read_text() == "url:c"
+
+
+@pytest.mark.asyncio
+async def test_runner_backs_off_while_jobs_are_pending(tmp_path: Path) -> None:
+    service = FakeJobService({"slow": 5})
+    runner = AvatarJobRunner(service, poll_interval=0.01, max_poll_interval=0.04)
+
+    assert await runner.run(_requests(tmp_path, ["slow"])) == [True]
+
+    gaps = [
+        b - a
+        for a, b in zip(service.poll_rounds[:-1], service.poll_rounds[1:], strict=True)
+    ]
+    assert gaps[-1] > gaps[0]
+    assert max(gaps) < 0.04 * 3
+
+
+@pytest.mark.asyncio
+async def test_runner_reports_failures_and_timeouts(tmp_path: Path) -> None:
+    service = FakeJobService({"ok": 1, "bad": 1, "stuck": 10_000}, fail={"bad"})
+    runner = AvatarJobRunner(
+        service, poll_interval=0.001, max_poll_interval=0.001, job_timeout=0.05
+    )
+
+    results = await runner.run(_requests(tmp_path, ["ok", "bad", "stuck"]))
+
+    assert results == [True, False, False]
+    assert service.downloaded == ["url:ok"]
+
+
+class FakeBlockingService(AvatarInterface):
+    """Renders in one call and reports failure for some scripts."""
+
+    def __init__(self, fail: set[str]) -> None:
+        self.fail = fail
+
+    async def generate_avatar_video(
+        self, script: str, output_path: Path, **kwargs: Any
+    ) -> bool:
+        if script in self.fail:
+            return False
+        output_path.write_text(script)
+        return True
+
+    def is_available(self) -> bool:
+        return True
+
+    def get_supported_options(self) -> dict[str, Any]:
+        return {}
+
+
+@pytest.mark.asyncio
+async def test_runner_reports_failed_blocking_renders(tmp_path: Path) -> None:
+    runner = AvatarJobRunner(FakeBlockingService(fail={"bad"}))
+
+    assert await runner.run(_requests(tmp_path, ["ok", "bad"])) == [True, False]
+
+
+@pytest.mark.asyncio
+async def test_runner_stops_on_cancellation(tmp_path: Path) -> None:
+    service = FakeJobService({"a": 10_000, "b": 1})
+
+    async def cancelled() -> bool:
+        return True
+
+    runner = AvatarJobRunner(
+        service, max_jobs=1, poll_interval=0.001, is_cancelled=cancelled
+    )
+
+    assert await runner.run(_requests(tmp_path, ["a", "b"])) == [False, False]
+    assert runner.cancelled
+    assert "b" not in service._remaining
+
+
+@pytest.mark.asyncio
+async def test_runner_survives_failing_checks(tmp_path: Path) -> None:
+    service = FakeJobService({"ok": 2, "stuck": 10_000})
+
+    async def redis_down() -> bool:
+        raise ConnectionError("redis unavailable")
+
+    runner = AvatarJobRunner(
+        service,
+        poll_interval=0.001,
+        max_poll_interval=0.001,
+        job_timeout=0.05,
+        is_cancelled=redis_down,
+    )
+
+    results = await asyncio.wait_for(
+        runner.run(_requests(tmp_path, ["ok", "stuck"])), timeout=2
+    )
+
+    assert results == [True, False]
+    assert not runner.cancelled
+
+
+@pytest.mark.asyncio
+async def test_runner_enforces_timeouts_when_status_rounds_break(
+    tmp_path: Path,
+) -> None:
+    service = FakeJobService({"stuck": 10_000})
+
+    async def broken_round() -> bool:
+        raise KeyError("status")
+
+    runner = AvatarJobRunner(
+        service, poll_interval=0.001, max_poll_interval=0.001, job_timeout=0.05
+    )
+    runner._poll_once = broken_round  # type: ignore[method-assign]
+
+    results = await asyncio.wait_for(
+        runner.run(_requests(tmp_path, ["stuck"])), timeout=2
+    )
+
+    assert results == [False]
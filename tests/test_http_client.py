@@ -0,0 +1,79 @@
+"""
+Unit tests for the shared HTTP client registry.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from slidespeaker.core import http_client
+
+
+@pytest.mark.asyncio
+async def test_clients_are_pooled_per_name() -> None:
+    default = http_client.get_http_client()
+    heygen = http_client.get_http_client("heygen")
+
+    assert http_client.get_http_client() is default
+    assert http_client.get_http_client("heygen") is heygen
+    assert heygen is not default
+    assert http_client.get_http_client("media").follow_redirects is True
+
+    await http_client.close_http_clients()
+    assert default.is_closed and heygen.is_closed
+    assert http_client.get_http_client() is not default
+    await http_client.close_http_clients()
+
+
+def test_each_event_loop_gets_its_own_client() -> None:
+    async def grab():
+        client = http_client.get_http_client()
+        await http_client.close_http_clients()
+        return client
+
+    first = asyncio.run(grab())
+    second = asyncio.run(grab())
+    assert first is not second
+    assert first.is_closed and second.is_closed
+
+
+def test_http2_requires_flag(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(http_client.config, "http2_enabled", False)
+    assert http_client.http2_available() is False
+
+
+@pytest.mark.asyncio
+async def test_full_media_pool_times_out(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def endless_stream(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        await reader.readuntil(b"\r\n\r\n")
+        writer.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: video/mp4\r\n"
+            b"Transfer-Encoding: chunked\r\n\r\n4\r\ndata\r\n"
+        )
+        await writer.drain()
+        # Like a paused player: the stream stays open without finishing
+        await asyncio.sleep(60)
+
+    assert http_client.get_http_client("media").timeout.pool is not None
+    await http_client.close_http_clients()
+    media = http_client.CLIENT_PROFILES["media"]
+    monkeypatch.setitem(
+        http_client.CLIENT_PROFILES,
+        "media",
+        {**media, "max_connections": 1, "pool_timeout": 0.2},
+    )
+    server = await asyncio.start_server(endless_stream, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    url = f"http://127.0.0.1:{port}/video.mp4"
+    client = http_client.get_http_client("media")
+    try:
+        async with client.stream("GET", url) as held:
+            assert held.status_code == 200
+            with pytest.raises(httpx.PoolTimeout):
+                await asyncio.wait_for(client.get(url), timeout=5)
+    finally:
+        await http_client.close_http_clients()
+        server.close()
@@ -0,0 +1,109 @@
+"""
+Unit tests for parallel chapter image generation.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pytest
+from PIL import Image
+
+from slidespeaker.configs.config import config
+from slidespeaker.image import generator as image_generator
+from slidespeaker.image.generator import ImageGenerator
+
+CHAPTERS = [
+    {
+        "title": f"Chapter {n}",
+        "description": "A short description of the chapter.",
+        "key_points": ["First point", "Second point"],
+    }
+    for n in range(1, 4)
+]
+
+
+class FakeLLMGenerator:
+    """Records how many image requests and downloads overlap."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.max_requests = 0
+        self.downloading = 0
+        self.overlapped_download = False
+
+    async def request_slide_image(self, title: str, **_: Any) -> str:
+        self.requests += 1
+        self.max_requests = max(self.max_requests, self.requests)
+        if self.downloading:
+            self.overlapped_download = True
+        await asyncio.sleep(0.02)
+        self.requests -= 1
+        return title
+
+    async def download_image(self, url: str, output_path: Path) -> None:
+        self.downloading += 1
+        await asyncio.sleep(0.03)
+        output_path.write_text(url)
+        self.downloading -= 1
+
+
+@pytest.mark.asyncio
+async def test_pil_chapters_render_in_worker_processes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(config, "image_render_workers", 2)
+
+    paths = await ImageGenerator()._generate_slide_images_by_pil(CHAPTERS, tmp_path)
+
+    assert paths == [tmp_path / f"chapter_{n}.png" for n in range(1, 4)]
+    for path in paths:
+        with Image.open(path) as image:
+            assert image.size == (1920, 1080)
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    """Thread pool that records how it was shut down."""
+
+    shutdowns: list[dict[str, Any]] = []
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        self.shutdowns.append({"wait": wait, "cancel_futures": cancel_futures})
+        super().shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+@pytest.mark.asyncio
+async def test_failed_pil_render_does_not_wait_for_other_chapters(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def render(chapter: dict[str, Any], image_path: Path) -> None:
+        raise RuntimeError(f"cannot draw {chapter['title']}")
+
+    monkeypatch.setattr(config, "image_render_workers", 2)
+    monkeypatch.setattr(RecordingExecutor, "shutdowns", [])
+    monkeypatch.setattr(image_generator, "ProcessPoolExecutor", RecordingExecutor)
+    monkeypatch.setattr(image_generator, "_render_pil_chapter", render)
+
+    with pytest.raises(RuntimeError, match="cannot draw"):
+        await ImageGenerator()._generate_slide_images_by_pil(CHAPTERS, tmp_path)
+
+    assert RecordingExecutor.shutdowns == [{"wait": False, "cancel_futures": True}]
+
+
+@pytest.mark.asyncio
+async def test_llm_requests_are_bounded_and_downloads_overlap(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(config, "image_generation_concurrency", 2)
+    chapters = CHAPTERS * 2
+    generator = ImageGenerator()
+    fake = FakeLLMGenerator()
+    generator.llm_generator = fake  # type: ignore[assignment]
+
+    paths = await generator._generate_slide_images_by_llm(chapters, tmp_path)
+
+    assert [p.name for p in paths] == [f"chapter_{n}.png" for n in range(1, 7)]
+    assert [p.read_text() for p in paths] == [c["title"] for c in chapters]
+    assert fake.max_requests == 2
+    assert fake.overlapped_download
@@ -30,6 +30,6 @@ async def test_download_image_supports_data_uri(
     uri = f"data:image/png;base64,{payload}"
     output_path = tmp_path / "generated.png"
 
-    await generator._download_image(uri, output_path)
+    await generator.download_image(uri, output_path)
 
     assert output_path.read_bytes() == b"binary-image"
@@ -0,0 +1,72 @@
+"""
+Unit tests for cached slide backgrounds and fonts.
+"""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PIL import Image
+
+from slidespeaker.document.extractor import SlideExtractor
+from slidespeaker.image import templates
+from slidespeaker.image.pil import PILImageGenerator
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache() -> None:
+    templates.clear_template_cache()
+
+
+def test_background_is_rendered_once_and_copied() -> None:
+    first = templates.slide_background("chapter")
+    first.putpixel((0, 0), (0, 0, 0))
+    second = templates.slide_background("chapter")
+
+    assert templates._background.cache_info().misses == 1
+    assert second.size == (1920, 1080)
+    assert second.mode == "RGB"
+    # Top of the gradient is light blue, the rule and corner dot are accent blue
+    assert second.getpixel((0, 0)) == (240, 245, 255)
+    assert second.getpixel((960, 200)) == (66, 135, 245)
+    assert second.getpixel((1870, 1030)) == (66, 135, 245)
+
+
+def test_fonts_are_loaded_once_per_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(templates, "FONT_CANDIDATES", ("no-such-font.ttf",))
+
+    font = templates.load_font(32)
+
+    # Falls back to the default font and keeps it
+    assert font is not None
+    assert templates.load_font(32) is font
+    assert templates.load_font.cache_info().misses == 1
+
+
+def test_chapter_slides_reuse_the_template(tmp_path: Path) -> None:
+    generator = PILImageGenerator()
+    chapter = {"title": "Caching", "key_points": ["Render once", "Copy often"]}
+
+    for n in range(3):
+        generator.render_slide_image(chapter, tmp_path / f"chapter_{n}.png")
+
+    assert templates._background.cache_info().misses == 1
+    with Image.open(tmp_path / "chapter_2.png") as image:
+        assert image.size == (1920, 1080)
+
+
+@pytest.mark.asyncio
+async def test_pdf_content_image_uses_its_own_theme(tmp_path: Path) -> None:
+    page = MagicMock()
+    page.extract_text.return_value = "Agenda:\nWhy caching matters for rendering"
+    pdf = tmp_path / "deck.pdf"
+    pdf.write_bytes(b"%PDF")
+    output = tmp_path / "slide_1.png"
+
+    with patch("slidespeaker.document.extractor.PdfReader") as reader:
+        reader.return_value.pages = [page]
+        await SlideExtractor()._create_pdf_content_image(pdf, 0, output)
+
+    with Image.open(output) as image:
+        assert image.getpixel((960, 150)) == (66, 135, 245)
+    assert templates._background.cache_info().currsize == 1
@@ -0,0 +1,93 @@
+"""
+Unit tests for the podcast dialogue mixer.
+"""
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from slidespeaker.audio import probe
+from slidespeaker.audio.mixer import _filter_graph, mix_dialogue, plan_timeline
+from slidespeaker.audio.mp3 import mp3_duration
+
+needs_ffmpeg = pytest.mark.skipif(
+    shutil.which("ffmpeg") is None, reason="ffmpeg not installed"
+)
+
+
+def _tone(path: Path, seconds: float, rate: int, codec: str) -> str:
+    subprocess.run(
+        [
+            "ffmpeg",
+            "-y",
+            "-v",
+            "error",
+            "-f",
+            "lavfi",
+            "-i",
+            f"sine=f=440:r={rate}:d={seconds}",
+            "-c:a",
+            codec,
+            str(path),
+        ],
+        check=True,
+    )
+    return str(path)
+
+
+def test_plan_inserts_gaps_between_turns() -> None:
+    timeline = plan_timeline([2.0, 1.0, 3.0], gap=0.5)
+
+    assert timeline == pytest.approx([(0.0, 2.0), (2.5, 3.5), (4.0, 7.0)])
+
+
+def test_plan_overlaps_turns_when_crossfade_exceeds_gap() -> None:
+    timeline = plan_timeline([2.0, 1.0, 0.4], gap=0.1, crossfade=0.4)
+
+    assert timeline[1] == pytest.approx((1.7, 2.7))
+    # Overlap is capped at half of the shorter neighbour
+    assert timeline[2] == pytest.approx((2.5, 2.9))
+
+
+def test_graph_concats_pauses_and_crossfades_overlaps() -> None:
+    turns = [
+        {"path": "a.mp3", "start": 0.0, "end": 1.0},
+        {"path": "b.mp3", "start": 1.5, "end": 2.5},
+        {"path": "c.mp3", "start": 2.2, "end": 3.0},
+    ]
+
+    graph = _filter_graph(turns)  # type: ignore[arg-type]
+
+    assert "apad=whole_dur=1.500000[s0]" in graph
+    assert "[s0][s1]concat=n=2:v=0:a=1[g0]" in graph
+    assert "[g0][s2]acrossfade=d=0.300000" in graph
+    assert graph.endswith("anull[out]")
+
+
+@needs_ffmpeg
+def test_mix_follows_the_planned_timeline(tmp_path: Path) -> None:
+    inputs = [
+        _tone(tmp_path / "host.mp3", 1.5, 24000, "libmp3lame"),
+        _tone(tmp_path / "guest.m4a", 1.0, 44100, "aac"),
+        _tone(tmp_path / "host2.mp3", 1.2, 16000, "libmp3lame"),
+    ]
+    timeline = plan_timeline([1.5, 1.0, 1.2], gap=0.3, crossfade=0.5)
+    turns = [
+        {"path": path, "start": start, "end": end}
+        for path, (start, end) in zip(inputs, timeline, strict=True)
+    ]
+    output = tmp_path / "podcast" / "final.mp3"
+
+    duration = mix_dialogue(turns, output)  # type: ignore[arg-type]
+
+    assert duration == pytest.approx(timeline[-1][1])
+    assert mp3_duration(output.read_bytes()) == pytest.approx(duration, abs=0.1)
+    assert probe.cached_duration(output) == pytest.approx(duration)
+    assert list(output.parent.glob(".*")) == []
+
+
+def test_mix_requires_turns(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        mix_dialogue([], tmp_path / "final.mp3")
@@ -0,0 +1,159 @@
+"""
+Unit tests for duplicate slide detection and analysis/segment reuse.
+"""
+
+import os
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from PIL import Image, ImageDraw
+
+from slidespeaker.configs.config import Config, config
+from slidespeaker.image import fingerprint as fp
+from slidespeaker.image.pil import PILImageGenerator
+from slidespeaker.pipeline.steps.video.slides import analyze_slides
+from slidespeaker.video.segments import link_segment, segment_cache_key
+
+
+def _slide(path: Path, title: str, shade: int = 255) -> Path:
+    img = Image.new("RGB", (640, 360), (shade, shade, shade))
+    draw = ImageDraw.Draw(img)
+    draw.rectangle([40, 40, 600, 90], fill=(30, 60, 120))
+    draw.text((60, 150), title, fill=(0, 0, 0))
+    draw.ellipse([500, 250, 580, 330], fill=(200, 40, 40))
+    img.save(path)
+    return path
+
+
+def _checkerboard(path: Path) -> Path:
+    img = Image.new("RGB", (640, 360), (255, 255, 255))
+    draw = ImageDraw.Draw(img)
+    for x in range(0, 640, 40):
+        for y in range(0, 360, 40):
+            if (x + y) // 40 % 2:
+                draw.rectangle([x, y, x + 39, y + 39], fill=(0, 0, 0))
+    img.save(path)
+    return path
+
+
+def test_identical_and_near_identical_slides_are_grouped(tmp_path: Path) -> None:
+    first = fp.fingerprint_image(_slide(tmp_path / "slide_1.png", "Agenda"))
+    exact = fp.fingerprint_image(_slide(tmp_path / "slide_2.png", "Agenda"))
+    near = fp.fingerprint_image(_slide(tmp_path / "slide_3.png", "Agenda", 250))
+    other = fp.fingerprint_image(_checkerboard(tmp_path / "slide_4.png"))
+
+    assert exact["digest"] == first["digest"]
+    assert near["digest"] != first["digest"]
+    assert fp.find_duplicates([first, exact, near, other, None], 3) == [
+        0,
+        0,
+        0,
+        3,
+        4,
+    ]
+    # Only exact copies when perceptual matching is disabled
+    assert fp.find_duplicates([first, exact, near], -1) == [0, 0, 2]
+
+
+def test_fingerprint_sidecar_is_invalidated_by_changes(tmp_path: Path) -> None:
+    image = _slide(tmp_path / "slide_1.png", "Agenda")
+    saved = fp.fingerprint_image(image)
+
+    assert fp.fingerprint_path(image).name == "slide_1.phash.json"
+    assert fp.read_fingerprint(image) == saved
+
+    _checkerboard(image)
+    stat = image.stat()
+    os.utime(image, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert fp.read_fingerprint(image) is None
+    assert fp.load_fingerprint(image)["digest"] != saved["digest"]  # type: ignore[index]
+
+
+async def _analyze(images: list[Path]) -> tuple[AsyncMock, list[dict[str, Any]]]:
+    state = {"steps": {"convert_slides_to_images": {"data": [str(p) for p in images]}}}
+    analyze = AsyncMock(side_effect=lambda path: {"content": {"title": path.name}})
+
+    with (
+        patch.object(analyze_slides, "state_manager") as manager,
+        patch.object(analyze_slides.vision_service, "analyze_slide_image", analyze),
+    ):
+        manager.get_state = AsyncMock(return_value=state)
+        manager.update_step_status = AsyncMock()
+        await analyze_slides.analyze_slides_step("file-1")
+
+    return analyze, manager.update_step_status.await_args_list[-1].args[3]
+
+
+@pytest.mark.asyncio
+async def test_analysis_is_reused_for_duplicate_slides(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(config, "slide_dedup_enabled", True)
+    monkeypatch.setattr(config, "slide_dedup_max_distance", -1)
+    images = [
+        _slide(tmp_path / "slide_1.png", "Agenda"),
+        _checkerboard(tmp_path / "slide_2.png"),
+        _slide(tmp_path / "slide_3.png", "Agenda"),
+    ]
+
+    analyze, analyses = await _analyze(images)
+
+    assert analyze.await_count == 2
+    assert [a["slide_number"] for a in analyses] == [1, 2, 3]
+    assert analyses[2]["analysis"] == {"content": {"title": "slide_1.png"}}
+    assert analyses[2]["duplicate_of"] == 1
+    assert analyses[2]["analysis"] is not analyses[0]["analysis"]
+
+
+@pytest.mark.asyncio
+async def test_same_template_slides_with_different_text_are_analysed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv("SLIDE_DEDUP_MAX_DISTANCE", raising=False)
+    monkeypatch.setattr(config, "slide_dedup_enabled", True)
+    monkeypatch.setattr(
+        config, "slide_dedup_max_distance", Config().slide_dedup_max_distance
+    )
+    generator = PILImageGenerator()
+    images = [tmp_path / "slide_1.png", tmp_path / "slide_2.png"]
+    generator.render_slide_image(
+        {"title": "Results", "key_points": ["Revenue up 12%", "Margin 31%"]},
+        images[0],
+    )
+    generator.render_slide_image(
+        {"title": "Results", "key_points": ["Revenue down 4%", "Margin 22%"]},
+        images[1],
+    )
+    first, second = (fp.fingerprint_image(p) for p in images)
+
+    # The layout hash cannot tell them apart, so it must not decide reuse
+    assert fp.hash_distance(first["phash"], second["phash"]) <= 3
+    analyze, analyses = await _analyze(images)
+
+    assert analyze.await_count == 2
+    assert all("duplicate_of" not in a for a in analyses)
+
+
+def test_repeated_slides_share_a_segment(tmp_path: Path) -> None:
+    first = _slide(tmp_path / "slide_1.png", "Agenda")
+    again = _slide(tmp_path / "slide_5.png", "Agenda")
+    audio_1 = tmp_path / "slide_1.mp3"
+    audio_5 = tmp_path / "slide_5.mp3"
+    audio_1.write_bytes(b"same narration")
+    audio_5.write_bytes(b"same narration")
+    encode = {"fps": 24, "codec": "libx264"}
+
+    assert segment_cache_key(first, audio_1, (1280, 720), encode) == (
+        segment_cache_key(again, audio_5, (1280, 720), encode)
+    )
+
+    src = tmp_path / "slide_001_abc.mp4"
+    src.write_bytes(b"segment")
+    dest = tmp_path / "slide_005_abc.mp4"
+    link_segment(src, dest)
+    link_segment(src, dest)
+    assert dest.read_bytes() == b"segment"
+    assert sorted(p.name for p in tmp_path.glob("*.mp4")) == [src.name, dest.name]
@@ -0,0 +1,128 @@
+"""
+Unit tests for forced-alignment subtitle timing.
+"""
+
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from slidespeaker.audio import alignment
+from slidespeaker.audio import scheduler as scheduler_module
+from slidespeaker.audio.alignment import (
+    WordTiming,
+    align_clip,
+    read_words,
+    write_words,
+)
+from slidespeaker.audio.scheduler import TTSScheduler
+from slidespeaker.configs.config import config
+from slidespeaker.subtitle.cues import CueBuilder
+from slidespeaker.subtitle.timeline import SlideTiming
+
+SCRIPT = "Hello there, everyone. Today we talk about caching!"
+
+
+def _words(text: str, step: float = 0.5) -> list[WordTiming]:
+    # Each word is spoken for 0.4s, followed by a 0.1s gap
+    return [
+        {"word": word, "start": index * step, "end": index * step + 0.4}
+        for index, word in enumerate(text.split())
+    ]
+
+
+def test_word_sidecar_is_tied_to_the_clip(tmp_path: Path) -> None:
+    clip = tmp_path / "slide_1.mp3"
+    clip.write_bytes(b"audio")
+    words = _words(SCRIPT)
+
+    write_words(clip, words, "aligner")
+    assert read_words(clip) == words
+
+    clip.write_bytes(b"re-synthesised audio")
+    os.utime(clip, ns=(1, 1))
+    assert read_words(clip) == []
+
+
+def test_cues_are_cut_at_word_boundaries() -> None:
+    words = tuple(_words(SCRIPT))
+    timing = [SlideTiming(None, 5.0, (1.3,), (), words)]
+
+    cues = CueBuilder().build_cues([{"script": SCRIPT}], [], "english", timing=timing)
+
+    assert cues == [
+        (0.0, 1.4, "Hello there, everyone."),
+        (1.5, 3.9, "Today we talk about caching!"),
+    ]
+
+
+def test_words_apply_only_to_the_spoken_script() -> None:
+    timing = [SlideTiming(None, 5.0, (), (), tuple(_words(SCRIPT)))]
+    translated = "Bonjour à tous. Aujourd'hui, parlons de cache !"
+
+    cues = CueBuilder().build_cues(
+        [{"script": translated}], [], "french", timing=timing
+    )
+
+    # Heuristic timing over the whole clip
+    assert cues[-1][1] == pytest.approx(5.0)
+    assert cues[0][2] == "Bonjour à tous."
+
+
+def test_long_sentences_split_on_word_times() -> None:
+    text = (
+        "This sentence, which is long, keeps on going, and going, "
+        "well beyond what fits on screen."
+    )
+    words = tuple(_words(text, step=0.8))
+    timing = [SlideTiming(None, 13.0, (), (), words)]
+
+    cues = CueBuilder().build_cues([{"script": text}], [], "english", timing=timing)
+
+    assert len(cues) > 1
+    starts = {w["start"] for w in words}
+    assert all(start in starts for start, _, _ in cues)
+    assert all(end - start <= 7.0 for start, end, _ in cues)
+
+
+@pytest.mark.asyncio
+async def test_align_clip_is_skipped_without_torchaudio(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    clip = tmp_path / "slide_1.mp3"
+    clip.write_bytes(b"audio")
+    monkeypatch.setitem(sys.modules, "torch", None)
+
+    assert await align_clip(clip, SCRIPT) is None
+    assert not alignment.words_path(clip).exists()
+
+
+class FakeGenerator:
+    provider = "openai"
+
+    async def generate_audio(self, text: str, output_path: str, **_: Any) -> bool:
+        Path(output_path).write_bytes(b"audio")
+        return True
+
+
+@pytest.mark.asyncio
+async def test_scheduler_aligns_clips_in_aligned_mode(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(config, "subtitle_timing_mode", "aligned")
+    aligned: list[tuple[Path, str]] = []
+
+    async def fake_align(path: Path, text: str) -> None:
+        aligned.append((path, text))
+
+    monkeypatch.setattr(scheduler_module, "align_clip", fake_align)
+    output = tmp_path / "slide_1.mp3"
+
+    results = await TTSScheduler(FakeGenerator()).run(  # type: ignore[arg-type]
+        [{"text": SCRIPT, "output_path": output, "language": "english", "voice": None}]
+    )
+
+    assert results == [True]
+    assert aligned == [(output, SCRIPT)]
@@ -0,0 +1,96 @@
+"""
+Unit tests for the single-pass multilingual segmenter.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from slidespeaker.subtitle import cues as cues_module
+from slidespeaker.subtitle.cues import CueBuilder
+from slidespeaker.subtitle.text_segmentation import (
+    classify_script,
+    segment,
+    split_sentences,
+)
+from slidespeaker.subtitle.timeline import Cue, SlideTiming
+
+
+def test_segment_returns_chunks_script_and_weights() -> None:
+    seg = segment("Dr. Smith arrived early. Then the talk began!", 60, "english")
+
+    assert seg.chunks == ["Dr. Smith arrived early.", "Then the talk began!"]
+    assert seg.script == "latin"
+    assert seg.char_weighted is False
+    assert seg.weights == [4, 4]
+    assert seg.nonspace == [21, 17]
+    assert split_sentences("Dr. Smith arrived early. Then the talk began!") == (
+        seg.chunks
+    )
+
+
+def test_segment_weighs_cjk_and_thai_by_characters() -> None:
+    cjk = segment("今天天气很好。我们去公园吧！")
+    assert cjk.script == "cjk"
+    assert cjk.chunks == ["今天天气很好。", "我们去公园吧！"]
+    assert cjk.weights == [7, 7]
+
+    assert classify_script("สวัสดีครับ") == "thai"
+    # Romanised Japanese is still timed by characters
+    assert segment("Konnichiwa minasan.", language="japanese").char_weighted
+
+
+def test_known_script_skips_classification() -> None:
+    with patch("slidespeaker.subtitle.text_segmentation.classify_script") as classify:
+        seg = segment("今天天气很好", script="cjk")
+    classify.assert_not_called()
+    assert seg.char_weighted
+
+
+def test_cue_builder_classifies_scripts_and_resplit_chunks() -> None:
+    scripts = [
+        {
+            "script": (
+                "This is a rather long opening sentence that keeps going well past "
+                "the cue limit so that it has to be split again. Short one."
+            )
+        },
+        {"script": "今天天气很好。我们去公园吧！"},
+    ]
+    timing = [
+        SlideTiming(None, 20.0, (), ()),
+        SlideTiming(None, 4.0, (), ()),
+    ]
+    with patch.object(
+        cues_module, "classify_script", wraps=cues_module.classify_script
+    ) as classify:
+        cues = CueBuilder().build_cues(scripts, [], "english", timing=timing)
+
+    texts = [call.args[0] for call in classify.call_args_list]
+    assert texts[0] == scripts[0]["script"]
+    assert texts[-1] == scripts[1]["script"]
+    # Only chunks too long for one cue are classified again, on their own
+    assert len(texts) > len(scripts)
+    assert all(text in scripts[0]["script"] for text in texts[1:-1])
+    assert cues[-1][2] == "我们去公园吧！"
+    assert cues[-1][1] == 24.0
+
+
+def test_oversized_chunks_are_timed_by_their_own_script() -> None:
+    sentence = "Revenue grew quickly, and margins improved a lot."
+    timing = [SlideTiming(None, 11.0, (), ())]
+    builder = CueBuilder()
+
+    latin = builder.build_cues([{"script": sentence}], [], "english", timing=timing)
+    mixed = builder.build_cues(
+        [{"script": f"東京。 {sentence}"}], [], "english", timing=timing
+    )
+
+    # The CJK word makes the slide "cjk", but the English sentence is still
+    # split across its cues by words, exactly as on an English-only slide
+    def shares(cues: list[Cue]) -> list[float]:
+        start, end = cues[0][0], cues[-1][1]
+        return [(cue_end - cue_start) / (end - start) for cue_start, cue_end, _ in cues]
+
+    assert [c[2] for c in mixed[1:]] == [c[2] for c in latin]
+    assert shares(mixed[1:]) == pytest.approx(shares(latin))
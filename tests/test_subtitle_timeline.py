@@ -0,0 +1,98 @@
+"""
+Unit tests for the shared subtitle timing model.
+"""
+
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from slidespeaker.subtitle import timeline
+from slidespeaker.subtitle.cues import CueBuilder
+from slidespeaker.subtitle.generator import SubtitleGenerator
+
+SCRIPTS = [
+    {"script": "Welcome to the course. Today we look at caching."},
+    {"script": "Caches trade memory for speed. Use them wisely."},
+]
+TRANSLATED = [
+    {"script": "Bienvenue dans le cours. Aujourd'hui, nous parlons de cache."},
+    {"script": "Les caches échangent mémoire contre vitesse."},
+]
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache() -> Iterator[None]:
+    timeline.clear_timing_cache()
+    yield
+    timeline.clear_timing_cache()
+
+
+def _clips(tmp_path: Path) -> list[Path]:
+    clips = []
+    for index in range(2):
+        clip = tmp_path / f"slide_{index + 1}.mp3"
+        clip.write_bytes(b"mp3-bytes" * (index + 1))
+        clips.append(clip)
+    return clips
+
+
+def test_languages_share_one_measurement_per_clip(tmp_path: Path) -> None:
+    clips = _clips(tmp_path)
+    detected: list[Path] = []
+
+    def silences(path: Path, duration: float) -> list[float]:
+        detected.append(path)
+        return [2.1]
+
+    with (
+        patch.object(timeline, "probe_duration", return_value=4.0) as probe,
+        patch.object(CueBuilder, "_detect_silence_boundaries", side_effect=silences),
+    ):
+        english = CueBuilder().build_cues(SCRIPTS, clips, "english")
+        french = CueBuilder().build_cues(TRANSLATED, clips, "french")
+
+    assert probe.call_count == 2
+    assert detected == clips
+    # Both languages fill the same audio timeline
+    assert english[-1][1] == french[-1][1]
+    assert english[-1][1] == pytest.approx(8.0)
+
+
+def test_rewritten_clip_is_measured_again(tmp_path: Path) -> None:
+    clip = _clips(tmp_path)[0]
+    builder = CueBuilder()
+    with patch.object(timeline, "probe_duration", return_value=4.0):
+        first = builder.build_timing([clip])
+    clip.write_bytes(b"re-synthesised clip")
+    with patch.object(timeline, "probe_duration", return_value=6.0):
+        second = builder.build_timing([clip])
+
+    assert first[0].duration == 4.0
+    assert second[0].duration == 6.0
+
+
+def test_srt_and_vtt_come_from_one_cue_list(tmp_path: Path) -> None:
+    clips = _clips(tmp_path)
+    generator = SubtitleGenerator()
+    with (
+        patch.object(timeline, "probe_duration", return_value=4.0),
+        patch.object(CueBuilder, "_detect_silence_boundaries", return_value=[]),
+        patch.object(
+            generator.cue_builder,
+            "build_cues",
+            wraps=generator.cue_builder.build_cues,
+        ) as build,
+    ):
+        srt_path, vtt_path = generator.generate_subtitles(
+            SCRIPTS, clips, tmp_path / "video.mp4"
+        )
+
+    assert build.call_count == 1
+    srt = Path(srt_path).read_text(encoding="utf-8")
+    vtt = Path(vtt_path).read_text(encoding="utf-8")
+    assert vtt.startswith("WEBVTT Language: en")
+    srt_times = [line for line in srt.splitlines() if "-->" in line]
+    vtt_times = [line for line in vtt.splitlines() if "-->" in line]
+    assert [t.replace(",", ".") for t in srt_times] == vtt_times
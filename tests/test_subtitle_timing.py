@@ -0,0 +1,128 @@
+"""
+Unit tests for the array-based subtitle timing engine.
+"""
+
+import numpy as np
+import pytest
+
+from slidespeaker.subtitle.srt_generator import format_srt
+from slidespeaker.subtitle.timing import (
+    calculate_chunk_durations,
+    chunk_duration_array,
+    snap_to_boundaries,
+)
+from slidespeaker.subtitle.vtt_generator import format_vtt
+
+
+def test_chunk_durations_fill_the_clip() -> None:
+    chunks = ["A short one.", "A much longer sentence with many more words in it."]
+    durations = chunk_duration_array(8.0, chunks, " ".join(chunks), "english")
+
+    assert durations.sum() == pytest.approx(8.0)
+    assert durations[1] > durations[0]
+    assert calculate_chunk_durations(8.0, chunks, "", "english") == pytest.approx(
+        durations.tolist()
+    )
+
+
+def test_cjk_chunks_are_weighted_by_characters() -> None:
+    chunks = ["今天天气很好。", "我们去公园散步吧，顺便买点东西。"]
+    durations = chunk_duration_array(6.0, chunks, "".join(chunks))
+
+    assert durations.sum() == pytest.approx(6.0)
+    assert durations[1] / durations[0] == pytest.approx(15 / 7, rel=0.3)
+
+
+def test_snapping_moves_boundaries_to_nearby_silences() -> None:
+    durations = np.array([2.0, 2.0, 2.0, 2.0])
+    boundaries = np.array([1.8, 4.3, 5.0, 7.9])
+
+    snapped = snap_to_boundaries(durations, boundaries, 8.0)
+
+    # 2.0 -> 1.8 and 4.0 -> 4.3; 6.0 has nothing within tolerance
+    assert np.cumsum(snapped)[:-1] == pytest.approx([1.8, 4.3, 6.0])
+    assert snapped.sum() == pytest.approx(8.0)
+
+
+def test_snapping_matches_a_brute_force_search() -> None:
+    rng = np.random.default_rng(7)
+    durations = rng.uniform(1.0, 4.0, 200)
+    total = float(durations.sum())
+    boundaries = np.sort(rng.uniform(0.0, total, 500))
+
+    snapped = snap_to_boundaries(durations, boundaries, total)
+
+    for target, prefix in zip(
+        np.cumsum(durations)[:-1], np.cumsum(snapped)[:-1], strict=True
+    ):
+        usable = boundaries[(boundaries > 0.05) & (boundaries < total - 0.05)]
+        nearest = usable[np.argmin(np.abs(usable - target))]
+        expected = nearest if abs(nearest - target) <= 0.45 else target
+        assert prefix == pytest.approx(expected, abs=1e-6)
+    assert snapped.sum() == pytest.approx(total)
+
+
+def test_snapping_keeps_a_minimum_gap() -> None:
+    durations = np.array([1.0, 0.05, 1.0])
+    snapped = snap_to_boundaries(durations, np.array([1.0, 1.02]), 2.05)
+
+    assert snapped.min() >= 0.12 - 1e-9
+    assert snapped.sum() == pytest.approx(2.05)
+
+
+def _sequential_snap(
+    durations: list[float], boundaries: list[float], total: float
+) -> list[float]:
+    """The scalar snapping rule the subtitle builder has always used."""
+    usable = [b for b in boundaries if 0.05 < b < total - 0.05]
+    prefix, last, accum = [0.0], 0.0, 0.0
+    for idx, dur in enumerate(durations[:-1], start=1):
+        accum += dur
+        nearest = min(usable, key=lambda b: abs(b - accum))
+        snapped = nearest if abs(nearest - accum) <= 0.45 else accum
+        if snapped <= last + 0.12:
+            snapped = max(last + 0.12, accum)
+        snapped = min(snapped, total - 0.12 * (len(durations) - idx))
+        prefix.append(snapped)
+        last = snapped
+    prefix.append(total)
+    new = [max(0.12, b - a) for a, b in zip(prefix[:-1], prefix[1:], strict=True)]
+    adjusted = [max(0.12, d * total / sum(new)) for d in new]
+    adjusted[-1] = max(0.12, adjusted[-1] + total - sum(adjusted))
+    return adjusted
+
+
+def test_snapping_falls_back_to_the_target_on_collisions() -> None:
+    snapped = snap_to_boundaries(np.array([1.0, 0.6, 1.4]), np.array([1.4]), 3.0)
+
+    assert snapped.tolist() == pytest.approx([1.4, 0.2, 1.4])
+
+
+def test_snapping_matches_the_sequential_rule() -> None:
+    rng = np.random.default_rng(7)
+    for _ in range(2000):
+        count = int(rng.integers(2, 8))
+        durations = rng.uniform(0.05, 3.0, count)
+        total = float(durations.sum())
+        boundaries = np.sort(rng.uniform(0.0, total, int(rng.integers(1, 6))))
+        if not ((boundaries > 0.05) & (boundaries < total - 0.05)).any():
+            continue
+
+        snapped = snap_to_boundaries(durations, boundaries, total)
+
+        assert snapped.tolist() == pytest.approx(
+            _sequential_snap(durations.tolist(), boundaries.tolist(), total),
+            abs=1e-9,
+        )
+
+
+def test_formats_render_seconds_at_serialisation() -> None:
+    cues = [(0.0, 1.5, "One."), (3599.9995, 3723.25, "Two.")]
+
+    srt = format_srt(cues)
+    vtt = format_vtt(cues, "english")
+
+    assert "00:00:00,000 --> 00:00:01,500" in srt
+    assert "01:00:00,000 --> 01:02:03,250" in srt
+    assert vtt.startswith("WEBVTT Language: en")
+    assert "01:00:00.000 --> 01:02:03.250" in vtt
@@ -0,0 +1,134 @@
+"""
+Unit tests for chunked synthesis of long TTS scripts.
+"""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from slidespeaker.audio import probe
+from slidespeaker.audio.chunking import plan_chunks, read_anchors, stitch_clips
+from slidespeaker.audio.mp3 import audio_frames, mp3_duration
+from slidespeaker.audio.scheduler import TTSScheduler
+from slidespeaker.configs.config import config
+from slidespeaker.subtitle.cues import CueBuilder
+from slidespeaker.subtitle.timeline import SlideTiming
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz: 417-byte frames of 1152 samples
+FRAME = bytes([0xFF, 0xFB, 0x90, 0x00]) + b"\x00" * 413
+FRAME_SECONDS = 1152 / 44100
+
+SCRIPT = (
+    "The first sentence introduces the topic. "
+    "The second sentence adds some detail. "
+    "The third sentence wraps everything up."
+)
+
+
+class FrameGenerator:
+    """Writes one frame per character so chunk durations are predictable."""
+
+    provider = "openai"
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    async def generate_audio(self, text: str, output_path: str, **_: Any) -> bool:
+        self.calls.append(text)
+        Path(output_path).write_bytes(FRAME * len(text))
+        return True
+
+
+def test_plan_chunks_groups_sentences_within_limit() -> None:
+    assert plan_chunks(SCRIPT, 0) == [SCRIPT]
+    assert plan_chunks(SCRIPT, 500) == [SCRIPT]
+
+    chunks = plan_chunks(SCRIPT, 80)
+    assert chunks == [
+        "The first sentence introduces the topic. The second sentence adds some detail.",
+        "The third sentence wraps everything up.",
+    ]
+    assert all(len(chunk) <= 80 for chunk in chunks)
+
+
+def test_stitch_records_exact_anchors(tmp_path: Path) -> None:
+    parts = []
+    for index, frames in enumerate((3, 5)):
+        part = tmp_path / f"part{index}.mp3"
+        part.write_bytes(b"ID3\x04\x00\x00\x00\x00\x00\x00" + FRAME * frames)
+        parts.append(part)
+    output = tmp_path / "slide_1.mp3"
+
+    anchors = stitch_clips(parts, ["One.", "Two."], output)
+
+    assert audio_frames(output.read_bytes())[0] == FRAME * 8
+    assert anchors[1]["start"] == pytest.approx(3 * FRAME_SECONDS)
+    assert anchors[1]["end"] == pytest.approx(8 * FRAME_SECONDS)
+    assert read_anchors(output) == anchors
+    assert probe.cached_duration(output) == pytest.approx(mp3_duration(FRAME * 8))
+
+
+@pytest.mark.asyncio
+async def test_scheduler_synthesises_long_scripts_in_chunks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(config, "tts_chunk_max_chars", 80)
+    generator = FrameGenerator()
+    output = tmp_path / "chapter_1.mp3"
+
+    results = await TTSScheduler(generator).run(  # type: ignore[arg-type]
+        [
+            {
+                "text": SCRIPT,
+                "output_path": output,
+                "language": "english",
+                "voice": None,
+            }
+        ]
+    )
+
+    assert results == [True]
+    assert generator.calls == plan_chunks(SCRIPT, 80)
+    frames = audio_frames(output.read_bytes())[0]
+    assert frames == FRAME * sum(len(c) for c in generator.calls)
+    assert [a["text"] for a in read_anchors(output)] == generator.calls
+    assert list(tmp_path.glob(".*.mp3")) == []
+
+
+def test_cues_start_on_chunk_anchors(tmp_path: Path) -> None:
+    audio = tmp_path / "chapter_1.mp3"
+    parts = []
+    texts = plan_chunks(SCRIPT, 80)
+    for index, frames in enumerate((300, 120)):
+        part = tmp_path / f"part{index}.mp3"
+        part.write_bytes(FRAME * frames)
+        parts.append(part)
+    anchors = stitch_clips(parts, texts, audio)
+
+    builder = CueBuilder()
+    builder._silence_cache[str(audio.resolve())] = []
+    cues = builder.build_cues([{"script": SCRIPT}], [audio], "english")
+
+    starts = [start for start, _, _ in cues]
+    assert anchors[1]["start"] in starts
+    assert cues[-1][2] == "The third sentence wraps everything up."
+
+
+def test_cues_after_anchored_slide_start_at_its_clip_end() -> None:
+    texts = plan_chunks(SCRIPT, 80)
+    anchors = (
+        {"text": texts[0], "start": 0.0, "end": 1.5},
+        {"text": texts[1], "start": 1.5, "end": 2.0},
+    )
+    # The probed clip is longer than its last anchor (e.g. encoder padding)
+    timing = [
+        SlideTiming(None, 3.0, (), anchors),  # type: ignore[arg-type]
+        SlideTiming(None, 1.0, (), ()),
+    ]
+
+    cues = CueBuilder().build_cues(
+        [{"script": SCRIPT}, {"script": "Next slide."}], [], "english", timing
+    )
+
+    assert cues[-1][0] == pytest.approx(3.0)
@@ -0,0 +1,170 @@
+"""
+Unit tests for the persistent TTS clip cache.
+"""
+
+import os
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from slidespeaker.audio import probe
+from slidespeaker.audio.clip_cache import TTSClipCache, clip_cache_key
+from slidespeaker.audio.elevenlabs_tts import ElevenLabsTTSService
+from slidespeaker.audio.generator import AudioGenerator
+from slidespeaker.audio.openai_tts import OpenAITTSService
+from slidespeaker.configs.config import config
+
+
+def test_key_ignores_whitespace_but_not_voice_or_language() -> None:
+    base = clip_cache_key("openai", "tts-1", "alloy", "english", "Hello  world\n")
+    assert base == clip_cache_key("openai", "tts-1", "alloy", "English", "Hello world")
+    assert base != clip_cache_key("openai", "tts-1", "onyx", "english", "Hello world")
+    assert base != clip_cache_key("openai", "tts-1", "alloy", "french", "Hello world")
+    assert base != clip_cache_key(
+        "openai", "tts-1-hd", "alloy", "english", "Hello world"
+    )
+
+
+def test_hit_links_clip_and_records_duration(tmp_path: Path) -> None:
+    cache = TTSClipCache(root=tmp_path / "cache", max_bytes=1024, shared=False)
+    src = tmp_path / "src.mp3"
+    src.write_bytes(b"audio")
+    cache.put("k1", src, duration=2.5)
+
+    dest = tmp_path / "out" / "slide_1.mp3"
+    assert cache.get("k1", dest) is True
+    assert dest.read_bytes() == b"audio"
+    assert probe.cached_duration(dest) == 2.5
+    assert cache.get("missing", tmp_path / "other.mp3") is False
+
+
+def test_empty_clips_are_never_served(tmp_path: Path) -> None:
+    cache = TTSClipCache(root=tmp_path / "cache", max_bytes=1024, shared=False)
+    empty = tmp_path / "empty.mp3"
+    empty.write_bytes(b"")
+    cache.put("k1", empty, duration=1.0)
+    assert not (tmp_path / "cache" / "k1.mp3").exists()
+
+    # An empty clip left by an earlier version is evicted on lookup
+    cache.root.mkdir()
+    (tmp_path / "cache" / "k2.mp3").write_bytes(b"")
+    (tmp_path / "cache" / "k2.json").write_text("{}")
+    assert cache.get("k2", tmp_path / "out.mp3") is False
+    assert list((tmp_path / "cache").iterdir()) == []
+    assert not (tmp_path / "out.mp3").exists()
+
+
+def test_eviction_drops_least_recently_used(tmp_path: Path) -> None:
+    cache = TTSClipCache(root=tmp_path / "cache", max_bytes=25, shared=False)
+    for index, key in enumerate(("a", "b")):
+        src = tmp_path / f"{key}.mp3"
+        src.write_bytes(b"x" * 10)
+        cache.put(key, src)
+        os.utime(cache.root / f"{key}.json", (index, index))
+    # Reading "a" makes "b" the least recently used clip
+    cache.get("a", tmp_path / "a_out.mp3")
+
+    src = tmp_path / "c.mp3"
+    src.write_bytes(b"x" * 10)
+    cache.put("c", src)
+
+    assert (cache.root / "a.mp3").exists()
+    assert not (cache.root / "b.mp3").exists()
+    assert (cache.root / "c.mp3").exists()
+    assert cache.size_bytes() <= 25
+
+
+def test_shared_miss_pulls_from_storage(tmp_path: Path) -> None:
+    storage = MagicMock()
+    storage.file_exists.return_value = True
+    storage.download_file.side_effect = lambda _key, dest: Path(dest).write_bytes(
+        b"remote"
+    )
+    storage.download_bytes.return_value = b'{"duration": 1.5}'
+    cache = TTSClipCache(root=tmp_path / "cache", max_bytes=1024, shared=True)
+
+    dest = tmp_path / "slide_1.mp3"
+    with patch(
+        "slidespeaker.audio.clip_cache.get_storage_provider", return_value=storage
+    ):
+        assert cache.get("k1", dest) is True
+
+    storage.download_file.assert_called_once()
+    assert dest.read_bytes() == b"remote"
+    assert probe.cached_duration(dest) == 1.5
+
+
+@pytest.mark.asyncio
+async def test_generator_reuses_cached_clip(tmp_path: Path) -> None:
+    async def fake_speech(_text, output_path, _language, _voice):
+        Path(output_path).write_bytes(b"speech")
+
+    service = MagicMock()
+    service.resolve_voice.return_value = ("alloy", "tts-1")
+    service.supports_word_timings.return_value = False
+    service.generate_speech = AsyncMock(side_effect=fake_speech)
+    generator = AudioGenerator()
+    generator.tts_service = service
+    generator.clip_cache = TTSClipCache(
+        root=tmp_path / "cache", max_bytes=1024, shared=False
+    )
+
+    with patch("slidespeaker.audio.generator.probe_duration", return_value=4.0):
+        first = await generator.generate_audio(
+            "Welcome!", str(tmp_path / "a.mp3"), voice="alloy"
+        )
+        second = await generator.generate_audio(
+            "Welcome! ", str(tmp_path / "b.mp3"), voice="alloy"
+        )
+
+    assert first is True and second is True
+    assert service.generate_speech.await_count == 1
+    assert (tmp_path / "b.mp3").read_bytes() == b"speech"
+    assert probe.cached_duration(tmp_path / "b.mp3") == 4.0
+
+
+@pytest.mark.asyncio
+async def test_changing_default_voice_misses_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache = TTSClipCache(root=tmp_path / "cache", max_bytes=1024, shared=False)
+    voices: list[str] = []
+
+    async def fake_speech(self, _text, output_path, _language="english", voice=None):
+        voices.append(self.resolve_voice(voice=voice)[0])
+        Path(output_path).write_bytes(b"speech")
+
+    monkeypatch.setattr(ElevenLabsTTSService, "generate_speech", fake_speech)
+    monkeypatch.setattr(config, "tts_word_timings", False)
+
+    async def synthesise(voice_id: str, name: str) -> None:
+        monkeypatch.setattr(config, "elevenlabs_voice_id", voice_id)
+        generator = AudioGenerator()
+        generator.provider = "elevenlabs"
+        generator.tts_service = ElevenLabsTTSService()
+        generator.clip_cache = cache
+        with patch("slidespeaker.audio.generator.probe_duration", return_value=1.0):
+            assert await generator.generate_audio("Welcome!", str(tmp_path / name))
+
+    await synthesise("voice-a", "a.mp3")
+    await synthesise("voice-a", "b.mp3")
+    await synthesise("voice-b", "c.mp3")
+
+    assert voices == ["voice-a", "voice-b"]
+
+
+def test_services_resolve_configured_defaults(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(config, "openai_api_key", "sk-test")
+    monkeypatch.setattr(config, "openai_tts_model", "tts-1")
+    monkeypatch.setattr(config, "openai_tts_voice", "echo")
+    monkeypatch.setattr(config, "elevenlabs_voice_id", "voice-a")
+
+    openai = OpenAITTSService()
+    assert openai.resolve_voice("english") == ("alloy", "tts-1")
+    assert openai.resolve_voice("german") == ("echo", "tts-1")
+    assert openai.resolve_voice("german", "nova") == ("nova", "tts-1")
+    assert ElevenLabsTTSService().resolve_voice("english") == (
+        "voice-a",
+        "eleven_monolingual_v1",
+    )
@@ -0,0 +1,125 @@
+"""
+Unit tests for the concurrent TTS scheduler.
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from slidespeaker.audio import limits
+from slidespeaker.audio import scheduler as scheduler_module
+from slidespeaker.audio.scheduler import TTSJob, TTSScheduler
+from slidespeaker.configs.config import config
+
+
+class FakeGenerator:
+    """Stands in for AudioGenerator and records concurrency."""
+
+    def __init__(self, failures: dict[str, int] | None = None) -> None:
+        self.provider = "openai"
+        self.failures = dict(failures or {})
+        self.calls: list[str] = []
+        self.active = 0
+        self.peak = 0
+
+    async def generate_audio(self, text: str, output_path: str, **_: Any) -> bool:
+        self.calls.append(text)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            # Later items finish first to prove ordering does not depend on timing
+            await asyncio.sleep(0.01 * (10 - int(text)))
+            if self.failures.get(text, 0) > 0:
+                self.failures[text] -= 1
+                return False
+            Path(output_path).write_bytes(b"mp3")
+            return True
+        finally:
+            self.active -= 1
+
+
+def _jobs(tmp_path: Path, count: int) -> list[TTSJob]:
+    return [
+        {
+            "text": str(i),
+            "output_path": tmp_path / f"clip_{i}.mp3",
+            "language": "english",
+            "voice": None,
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_results_follow_submission_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(config, "openai_tts_concurrency", 3)
+    generator = FakeGenerator(failures={"4": 5})
+    scheduler = TTSScheduler(generator, max_retries=0)  # type: ignore[arg-type]
+
+    results = await scheduler.run(_jobs(tmp_path, 6))
+
+    assert results == [True, True, True, True, False, True]
+    assert 1 < generator.peak <= 3
+
+
+@pytest.mark.asyncio
+async def test_failed_clip_is_retried_alone(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(config, "openai_tts_concurrency", 4)
+    generator = FakeGenerator(failures={"1": 2})
+    scheduler = TTSScheduler(generator, max_retries=2, retry_backoff=0)  # type: ignore[arg-type]
+
+    results = await scheduler.run(_jobs(tmp_path, 3))
+
+    assert results == [True, True, True]
+    assert generator.calls.count("1") == 3
+    assert generator.calls.count("0") == 1
+    assert generator.calls.count("2") == 1
+
+
+def test_provider_limits_are_forgotten_with_their_loop() -> None:
+    async def acquire() -> asyncio.Semaphore:
+        semaphore = scheduler_module._provider_semaphore("openai")
+        async with semaphore:
+            assert scheduler_module._provider_semaphore("openai") is semaphore
+        return semaphore
+
+    first = asyncio.run(acquire())
+    for _ in range(20):
+        assert asyncio.run(acquire()) is not first
+    # Only the entry of the most recent loop is left until the next lookup
+    closed = [
+        ref for ref, _ in limits._limits.values() if ref() is None or ref().is_closed()
+    ]
+    assert len(closed) <= 1
+
+
+@pytest.mark.asyncio
+async def test_empty_job_list() -> None:
+    scheduler = TTSScheduler(FakeGenerator())  # type: ignore[arg-type]
+    assert await scheduler.run([]) == []
+
+
+@pytest.mark.asyncio
+async def test_successful_clips_are_post_processed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    processed: list[tuple[Path, bool]] = []
+
+    async def fake_postprocess(path: Path, trim: bool = True) -> None:
+        processed.append((path, trim))
+
+    monkeypatch.setattr(config, "audio_postprocess_enabled", True)
+    monkeypatch.setattr(config, "audio_trim_silence", True)
+    monkeypatch.setattr(scheduler_module, "postprocess_clip", fake_postprocess)
+    generator = FakeGenerator(failures={"1": 5})
+    scheduler = TTSScheduler(generator, max_retries=0)  # type: ignore[arg-type]
+    jobs = _jobs(tmp_path, 2)
+
+    assert await scheduler.run(jobs) == [True, False]
+    assert processed == [(jobs[0]["output_path"], True)]
@@ -0,0 +1,74 @@
+"""
+Unit tests for streaming TTS output to disk.
+"""
+
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+
+from slidespeaker.audio import probe
+from slidespeaker.audio.mp3 import MP3DurationCounter, mp3_duration
+from slidespeaker.audio.streaming import stream_to_file
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz, no padding: 417-byte frames
+FRAME_HEADER = bytes([0xFF, 0xFB, 0x90, 0x00])
+FRAME_SECONDS = 1152 / 44100
+
+
+def _frames(count: int) -> bytes:
+    return (FRAME_HEADER + b"\x00" * 413) * count
+
+
+def _id3_tag(payload_size: int) -> bytes:
+    size = bytes([(payload_size >> shift) & 0x7F for shift in (21, 14, 7, 0)])
+    return b"ID3\x04\x00\x00" + size + b"\x00" * payload_size
+
+
+def _xing_frame() -> bytes:
+    return FRAME_HEADER + b"\x00" * 32 + b"Info" + b"\x00" * 377
+
+
+async def _chunks(data: bytes, size: int) -> AsyncIterator[bytes]:
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+def test_counter_skips_tags_and_info_frame_across_chunk_boundaries() -> None:
+    data = _id3_tag(300) + _xing_frame() + _frames(20)
+    counter = MP3DurationCounter()
+    for start in range(0, len(data), 7):
+        counter.feed(data[start : start + 7])
+
+    assert counter.frames == 20
+    assert counter.duration == pytest.approx(20 * FRAME_SECONDS)
+    assert mp3_duration(data) == pytest.approx(counter.duration)
+
+
+@pytest.mark.asyncio
+async def test_stream_to_file_writes_clip_and_records_duration(tmp_path: Path) -> None:
+    data = _frames(40)
+    target = tmp_path / "audio" / "slide_1.mp3"
+
+    duration = await stream_to_file(_chunks(data, 1000), target)
+
+    assert target.read_bytes() == data
+    assert duration == pytest.approx(40 * FRAME_SECONDS)
+    assert probe.cached_duration(target) == pytest.approx(duration)
+    assert list(target.parent.glob(".*.part")) == []
+
+
+@pytest.mark.asyncio
+async def test_failed_stream_keeps_previous_clip(tmp_path: Path) -> None:
+    target = tmp_path / "slide_1.mp3"
+    target.write_bytes(b"previous")
+
+    async def broken() -> AsyncIterator[bytes]:
+        yield _frames(2)
+        raise ConnectionError("stream reset")
+
+    with pytest.raises(ConnectionError):
+        await stream_to_file(broken(), target)
+
+    assert target.read_bytes() == b"previous"
+    assert list(tmp_path.glob(".*.part")) == []
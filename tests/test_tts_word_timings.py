@@ -0,0 +1,177 @@
+"""
+Unit tests for word timings returned by TTS providers.
+"""
+
+import base64
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from slidespeaker.audio import elevenlabs_tts
+from slidespeaker.audio.alignment import (
+    WordTiming,
+    read_words,
+    words_from_characters,
+    write_words,
+)
+from slidespeaker.audio.chunking import stitch_clips
+from slidespeaker.audio.clip_cache import TTSClipCache
+from slidespeaker.audio.elevenlabs_tts import ElevenLabsTTSService
+from slidespeaker.audio.generator import AudioGenerator
+from slidespeaker.configs.config import config
+from slidespeaker.pipeline.steps.podcast.pdf.generate_subtitles import (
+    _subtitle_items,
+)
+from slidespeaker.subtitle import timeline
+from slidespeaker.subtitle.cues import CueBuilder
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz: 417-byte frames of 1152 samples
+FRAME = bytes([0xFF, 0xFB, 0x90, 0x00]) + b"\x00" * 413
+FRAME_SECONDS = 1152 / 44100
+
+TEXT = "Hi there. Bye now."
+
+
+def _character_alignment(text: str, step: float = 0.1) -> dict[str, Any]:
+    return {
+        "characters": list(text),
+        "character_start_times_seconds": [i * step for i in range(len(text))],
+        "character_end_times_seconds": [(i + 1) * step for i in range(len(text))],
+    }
+
+
+def _words() -> list[WordTiming]:
+    return words_from_characters(**_alignment_kwargs(TEXT))
+
+
+def _alignment_kwargs(text: str) -> dict[str, Any]:
+    alignment = _character_alignment(text)
+    return {
+        "characters": alignment["characters"],
+        "starts": alignment["character_start_times_seconds"],
+        "ends": alignment["character_end_times_seconds"],
+    }
+
+
+def test_characters_are_grouped_into_words() -> None:
+    words = _words()
+
+    assert [w["word"] for w in words] == ["Hi", "there.", "Bye", "now."]
+    assert words[1]["start"] == pytest.approx(0.3)
+    assert words[1]["end"] == pytest.approx(0.9)
+
+
+@pytest.mark.asyncio
+async def test_elevenlabs_returns_words_from_timestamp_endpoint(
+    tmp_path: Path,
+) -> None:
+    response = MagicMock()
+    response.json.return_value = {
+        "audio_base64": base64.b64encode(FRAME * 4).decode("ascii"),
+        "alignment": _character_alignment(TEXT),
+    }
+    client = MagicMock()
+
+    async def post(url: str, **_: Any) -> MagicMock:
+        client.url = url
+        return response
+
+    client.post = post
+    service = ElevenLabsTTSService()
+    service.api_key = "key"
+    output = tmp_path / "slide_1.mp3"
+
+    with patch.object(elevenlabs_tts, "get_http_client", return_value=client):
+        words = await service.generate_speech_with_timings(TEXT, output)
+
+    assert client.url.endswith("/with-timestamps")
+    assert output.read_bytes() == FRAME * 4
+    assert words == _words()
+
+
+@pytest.mark.asyncio
+async def test_generator_saves_and_caches_provider_words(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(config, "tts_word_timings", True)
+    calls: list[str] = []
+
+    async def fake_speech(_text, output_path, _language, _voice):
+        calls.append(str(output_path))
+        Path(output_path).write_bytes(FRAME * 4)
+        return _words()
+
+    service = MagicMock()
+    service.resolve_voice.return_value = ("voice-1", "eleven")
+    service.supports_word_timings.return_value = True
+    service.generate_speech_with_timings = fake_speech
+    generator = AudioGenerator()
+    generator.tts_service = service
+    generator.clip_cache = TTSClipCache(
+        root=tmp_path / "cache", max_bytes=1 << 20, shared=False
+    )
+
+    assert await generator.generate_audio(TEXT, str(tmp_path / "a.mp3"))
+    assert await generator.generate_audio(TEXT, str(tmp_path / "b.mp3"))
+
+    assert len(calls) == 1
+    assert read_words(tmp_path / "a.mp3") == _words()
+    assert read_words(tmp_path / "b.mp3") == _words()
+
+
+def test_stitched_words_are_shifted_by_chunk(tmp_path: Path) -> None:
+    parts = []
+    for index, text in enumerate(("Hi there.", "Bye now.")):
+        part = tmp_path / f"part{index}.mp3"
+        part.write_bytes(FRAME * 40)
+        write_words(part, words_from_characters(**_alignment_kwargs(text)), "tts")
+        parts.append(part)
+    output = tmp_path / "slide_1.mp3"
+
+    stitch_clips(parts, ["Hi there.", "Bye now."], output)
+
+    words = read_words(output)
+    assert [w["word"] for w in words] == ["Hi", "there.", "Bye", "now."]
+    assert words[2]["start"] == pytest.approx(40 * FRAME_SECONDS)
+
+
+def test_clips_with_words_are_not_analysed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    clip = tmp_path / "slide_1.mp3"
+    clip.write_bytes(FRAME * 80)
+    write_words(clip, _words(), "tts")
+    timeline.clear_timing_cache()
+
+    def fail(*_: Any) -> Any:
+        raise AssertionError("audio was analysed")
+
+    monkeypatch.setattr(timeline, "probe_duration", fail)
+    slide = timeline.measure_slide(clip, fail)
+
+    assert slide.words == tuple(_words())
+    cues = CueBuilder().build_cues([{"script": TEXT}], [], "english", timing=[slide])
+    assert [text for *_, text in cues] == ["Hi there.", "Bye now."]
+    assert cues[1][0] == pytest.approx(1.0)
+
+
+def test_podcast_lines_are_split_at_word_times(tmp_path: Path) -> None:
+    clip = tmp_path / "segment_001.mp3"
+    clip.write_bytes(FRAME * 80)
+    write_words(clip, _words(), "tts")
+    line = {"label": "Host", "start": 10.0, "end": 12.0, "speaker": "Host"}
+    dialogue = [
+        {**line, "text": TEXT, "segment_file": str(clip)},
+        {**line, "text": "Salut. A bientot.", "segment_file": str(clip)},
+    ]
+
+    items = _subtitle_items(dialogue, "english")
+
+    assert [(i["text"], i["start"]) for i in items] == [
+        ("Hi there.", 10.0),
+        ("Bye now.", pytest.approx(11.0)),
+        # Words of another text leave the line as one cue
+        ("Salut. A bientot.", 10.0),
+    ]
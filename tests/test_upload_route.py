@@ -111,3 +111,22 @@ def test_json_upload_plain_base64(client: TestClient):
     payload = response.json()
     assert payload["task_id"] == "task-123"
     assert payload["file_id"]
+
+
+def test_json_upload_rejects_unknown_encoding_profile(client: TestClient):
+    encoded = base64.b64encode(b"dummy-pdf").decode("ascii")
+
+    response = client.post(
+        "/api/upload",
+        json={
+            "filename": "deck.pdf",
+            "file_data": encoded,
+            "voice_language": "english",
+            "video_resolution": "hd",
+            "encoding_profile": "cinema",
+        },
+        headers={"Authorization": "Bearer fake-token"},
+    )
+
+    assert response.status_code == 400
+    assert "encoding profile" in response.json()["detail"]
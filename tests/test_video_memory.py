@@ -0,0 +1,51 @@
+"""
+Unit tests for composition memory tracking.
+"""
+
+import pytest
+
+from slidespeaker.video import memory
+from slidespeaker.video.memory import MemoryTracker, current_rss_mb
+
+
+def test_current_rss_is_positive() -> None:
+    assert current_rss_mb() > 0
+
+
+def test_tracker_reports_peak_growth() -> None:
+    with MemoryTracker(budget_mb=1, interval=0.01) as tracker:
+        # Above glibc's largest mmap threshold, so the block never reuses heap
+        # memory freed by earlier tests (e.g. PIL's 16 MB image blocks)
+        block = bytearray(64 * 1024 * 1024)
+        block[::4096] = b"x" * len(block[::4096])
+        tracker.sample()
+        assert tracker.over_budget()
+        del block
+
+    stats = tracker.stats()
+    assert stats["memory_budget_mb"] == 1
+    assert stats["peak_rss_mb"] >= stats["baseline_rss_mb"]
+    assert stats["peak_growth_mb"] > 1
+    assert stats["budget_exceeded"] is True
+
+
+def test_tracker_within_budget() -> None:
+    with MemoryTracker(budget_mb=10_000, interval=0.01) as tracker:
+        tracker.sample()
+    assert not tracker.over_budget()
+    assert tracker.stats()["budget_exceeded"] is False
+
+
+def test_window_growth_forgets_released_spikes(monkeypatch: pytest.MonkeyPatch) -> None:
+    rss = iter([100.0, 500.0, 120.0, 130.0, 110.0])
+    monkeypatch.setattr(memory, "current_rss_mb", lambda: next(rss))
+    tracker = memory.MemoryTracker(budget_mb=200, interval=60)
+    with tracker:
+        tracker.sample()
+        assert tracker.window_growth_mb() == 400
+
+        # 20 MB retained from the first window does not count against the next
+        tracker.start_window()
+        tracker.sample()
+        assert tracker.window_growth_mb() == 10
+        assert tracker.peak_mb == 500
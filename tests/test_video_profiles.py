@@ -0,0 +1,57 @@
+"""
+Unit tests for named video encoding profiles.
+"""
+
+import pytest
+
+from slidespeaker.configs.config import config
+from slidespeaker.video.profiles import available_profiles, resolve_encoding_profile
+
+
+@pytest.fixture(autouse=True)
+def _encoder_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(config, "ffmpeg_profile", "default")
+    monkeypatch.setattr(config, "ffmpeg_fast_mode", False)
+    monkeypatch.setattr(config, "ffmpeg_codec", "libx264")
+    monkeypatch.setattr(config, "ffmpeg_fps", 24)
+    monkeypatch.setattr(config, "ffmpeg_preset", "medium")
+    monkeypatch.setattr(config, "ffmpeg_bitrate", "2000k")
+
+
+def test_default_profile_uses_environment_settings() -> None:
+    params = resolve_encoding_profile()
+    assert params["profile"] == "default"
+    assert params["fps"] == 24
+    assert params["preset"] == "medium"
+    assert params["bitrate"] == "2000k"
+    assert params["ffmpeg_params"] == []
+
+
+def test_fast_mode_maps_default_to_fast(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(config, "ffmpeg_fast_mode", True)
+    assert resolve_encoding_profile()["preset"] == "ultrafast"
+
+
+def test_slides_profile_uses_crf_and_long_gop() -> None:
+    params = resolve_encoding_profile("slides")
+    assert params["fps"] == 12
+    assert params["bitrate"] is None
+    assert params["ffmpeg_params"] == ["-crf", "26", "-tune", "stillimage", "-g", "120"]
+
+
+def test_crf_options_skipped_for_other_codecs(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(config, "ffmpeg_codec", "mpeg4")
+    params = resolve_encoding_profile("slides")
+    assert params["bitrate"] == "2000k"
+    assert params["ffmpeg_params"] == ["-g", "120"]
+
+
+def test_configured_default_profile(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(config, "ffmpeg_profile", "slides_hq")
+    assert resolve_encoding_profile()["profile"] == "slides_hq"
+
+
+def test_unknown_profile_raises() -> None:
+    assert "slides" in available_profiles()
+    with pytest.raises(ValueError):
+        resolve_encoding_profile("cinema")
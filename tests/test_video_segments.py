@@ -0,0 +1,78 @@
+"""
+Unit tests for per-slide video segment helpers.
+"""
+
+from pathlib import Path
+
+from slidespeaker.video.segments import (
+    prune_stale_segments,
+    segment_cache_key,
+    segment_path,
+    write_concat_list,
+)
+
+ENCODE = {
+    "fps": 24,
+    "codec": "libx264",
+    "audio_codec": "aac",
+    "threads": 2,
+    "preset": "medium",
+    "bitrate": "2000k",
+    "audio_bitrate": "128k",
+}
+
+
+def _make_inputs(tmp_path: Path) -> tuple[Path, Path]:
+    image = tmp_path / "slide_1.png"
+    audio = tmp_path / "slide_1.mp3"
+    image.write_bytes(b"png")
+    audio.write_bytes(b"mp3")
+    return image, audio
+
+
+def test_segment_cache_key_is_stable(tmp_path: Path) -> None:
+    image, audio = _make_inputs(tmp_path)
+    first = segment_cache_key(image, audio, (1280, 720), ENCODE)
+    second = segment_cache_key(image, audio, (1280, 720), dict(ENCODE))
+    assert first == second
+
+
+def test_segment_cache_key_ignores_thread_count(tmp_path: Path) -> None:
+    image, audio = _make_inputs(tmp_path)
+    base = segment_cache_key(image, audio, (1280, 720), ENCODE)
+    threaded = segment_cache_key(image, audio, (1280, 720), {**ENCODE, "threads": 8})
+    assert base == threaded
+
+
+def test_segment_cache_key_changes_with_inputs(tmp_path: Path) -> None:
+    image, audio = _make_inputs(tmp_path)
+    base = segment_cache_key(image, audio, (1280, 720), ENCODE)
+    assert base != segment_cache_key(image, audio, (1920, 1080), ENCODE)
+    assert base != segment_cache_key(image, None, (1280, 720), ENCODE)
+    assert base != segment_cache_key(
+        image, audio, (1280, 720), {**ENCODE, "preset": "fast"}
+    )
+    audio.write_bytes(b"different narration")
+    assert base != segment_cache_key(image, audio, (1280, 720), ENCODE)
+
+
+def test_write_concat_list_escapes_quotes(tmp_path: Path) -> None:
+    segment = tmp_path / "it's.mp4"
+    list_file = tmp_path / "list.txt"
+    write_concat_list([segment], list_file)
+    escaped = str(segment.resolve()).replace("'", "'\\''")
+    assert list_file.read_text(encoding="utf-8") == f"file '{escaped}'\n"
+
+
+def test_prune_stale_segments_keeps_current(tmp_path: Path) -> None:
+    current = segment_path(tmp_path, 0, "aaaa")
+    stale = segment_path(tmp_path, 0, "bbbb")
+    unrelated = tmp_path / "final.mp4"
+    for path in (current, stale, unrelated):
+        path.write_bytes(b"x")
+
+    prune_stale_segments(tmp_path, [current])
+
+    assert current.exists()
+    assert not stale.exists()
+    assert unrelated.exists()
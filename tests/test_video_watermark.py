@@ -0,0 +1,63 @@
+"""
+Unit tests for the cached watermark overlay.
+"""
+
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from slidespeaker.configs.config import config
+from slidespeaker.video import watermark
+
+
+@pytest.fixture(autouse=True)
+def _enable_watermark(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(config, "watermark_enabled", True)
+    monkeypatch.setattr(config, "watermark_text", "SlideSpeaker AI")
+    monkeypatch.setattr(config, "watermark_size", 64)
+    monkeypatch.setattr(config, "watermark_opacity", 0.95)
+    monkeypatch.setattr(watermark, "_asset_cache", {})
+
+
+def test_spec_keeps_pixel_sizes_across_resolutions() -> None:
+    full_hd = watermark.watermark_spec(1920, 1080)
+    hd = watermark.watermark_spec(1280, 720)
+    assert full_hd is not None and hd is not None
+    assert full_hd["font_size"] == hd["font_size"] == 64
+    assert full_hd["margin"] == hd["margin"] == 50
+    assert full_hd["resolution"] != hd["resolution"]
+
+
+def test_disabled_watermark_has_no_overlay(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(config, "watermark_enabled", False)
+    assert watermark.watermark_spec(1920, 1080) is None
+    assert watermark.watermark_overlay_params(1920, 1080) is None
+
+
+def test_asset_rendered_once_per_resolution(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[dict] = []
+    real_render = watermark.render_watermark
+
+    def counting_render(spec: dict) -> Image.Image:
+        calls.append(spec)
+        return real_render(spec)
+
+    monkeypatch.setattr(watermark, "render_watermark", counting_render)
+
+    first = watermark.get_watermark_asset(1280, 720, cache_dir=tmp_path)
+    second = watermark.get_watermark_asset(1280, 720, cache_dir=tmp_path)
+    other = watermark.get_watermark_asset(1920, 1080, cache_dir=tmp_path)
+
+    assert first is not None and first == second
+    assert other is not None and other != first
+    assert len(calls) == 2
+    with Image.open(first) as image:
+        assert image.mode == "RGBA"
+
+
+def test_escape_filter_path() -> None:
+    escaped = watermark._escape_filter_path(Path("/tmp/a:b/it's[1].png"))
+    assert escaped == "/tmp/a\\\\:b/it\\\\\\'s\\[1\\].png"
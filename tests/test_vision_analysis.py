@@ -0,0 +1,172 @@
+"""
+Unit tests for structured (JSON) slide analysis with the scraper fallback.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PIL import Image
+
+from slidespeaker.configs.config import config
+from slidespeaker.image import vision_service as vs
+
+ANALYSIS: dict[str, Any] = {
+    "slide_metadata": {
+        "type": "Content",
+        "title": " Revenue by region ",
+        "estimated_duration_seconds": 600,
+    },
+    "content": {
+        "text_content": "Revenue by region: EMEA 42%, APAC 31%",
+        "speaking_points": ["EMEA leads", "APAC is growing", ""],
+        "visual_highlights": ["The EMEA bar"],
+        "transition_phrases": ["Next, costs"],
+    },
+    "presentation_context": {
+        "main_topic": "Regional revenue",
+        "key_insights": ["EMEA is the largest market"],
+        "audience_focus": "Sales leads",
+        "visual_elements": ["chart"],
+        "numerical_data": ["42%", 31],
+    },
+    "script_guidance": {
+        "opening_line": "Where does our revenue come from?",
+        "emphasis_points": ["EMEA share"],
+        "explanation_needs": ["Define APAC"],
+        "closing_transition": "With that, let's look at costs.",
+    },
+}
+
+
+def _shape(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _shape(item) for key, item in value.items()}
+    return type(value).__name__
+
+
+@pytest.fixture
+def slide(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(config, "vision_image_optimize", False)
+    monkeypatch.setattr(config, "vision_structured_output", True)
+    monkeypatch.setattr(config, "vision_analyzer_model", "openai/gpt-4o-mini")
+    path = tmp_path / "slide_1.png"
+    Image.new("RGB", (64, 36), (255, 255, 255)).save(path)
+    return path
+
+
+@pytest.mark.asyncio
+async def test_valid_json_skips_the_scraper(slide: Path) -> None:
+    service = vs.VisionService()
+    reply = "```json\n" + json.dumps(ANALYSIS) + "\n```"
+
+    with (
+        patch.object(vs, "chat_completion", return_value=reply) as chat,
+        patch.object(service, "_parse_analysis", side_effect=AssertionError),
+    ):
+        analysis = await service.analyze_slide_image(slide, "Revenue by region")
+
+    options = chat.call_args.kwargs["response_format"]
+    assert options["json_schema"]["schema"] == vs.SLIDE_ANALYSIS_SCHEMA
+    assert analysis["slide_metadata"] == {
+        "type": "content",
+        "title": "Revenue by region",
+        "estimated_duration_seconds": 180,
+    }
+    assert analysis["content"]["speaking_points"] == ["EMEA leads", "APAC is growing"]
+    assert analysis["content"]["extracted_text"] == "Revenue by region"
+    assert analysis["presentation_context"]["numerical_data"] == ["42%", "31"]
+    assert analysis["raw_analysis"] == reply
+
+
+def test_structured_analysis_has_the_scraper_shape() -> None:
+    service = vs.VisionService()
+    structured = service._parse_structured_analysis(json.dumps(ANALYSIS))
+    scraped = service._parse_analysis("Title: Revenue by region")
+
+    assert structured is not None
+    assert _shape(structured) == _shape(scraped)
+
+
+@pytest.mark.parametrize(
+    "reply",
+    [
+        "Title: Revenue by region\nKey: EMEA leads",
+        json.dumps({**ANALYSIS, "content": {"text_content": "partial"}}),
+        json.dumps(
+            {**ANALYSIS, "slide_metadata": {**ANALYSIS["slide_metadata"], "type": "x"}}
+        ),
+        "{not json",
+    ],
+)
+def test_invalid_analyses_are_rejected(reply: str) -> None:
+    assert vs.VisionService()._parse_structured_analysis(reply) is None
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_free_text_when_structured_output_fails(
+    slide: Path,
+) -> None:
+    service = vs.VisionService()
+    calls: list[dict[str, Any]] = []
+
+    def chat(**kwargs: Any) -> str:
+        calls.append(kwargs)
+        if "response_format" in kwargs:
+            raise RuntimeError("response_format is not supported")
+        return "Title: Revenue by region\nSpeaking point: EMEA leads"
+
+    with patch.object(vs, "chat_completion", side_effect=chat):
+        analysis = await service.analyze_slide_image(slide)
+        assert len(calls) == 2
+        # The model is remembered: later slides go straight to free text
+        await service.analyze_slide_image(slide)
+
+    assert len(calls) == 3
+    assert calls[0]["retries"] == 1
+    assert "response_format" not in calls[2]
+    assert "JSON schema" not in calls[1]["messages"][1]["content"][0]["text"]
+    assert analysis["slide_metadata"]["title"] == "Revenue by region"
+    assert analysis["content"]["speaking_points"] == ["EMEA leads"]
+
+
+@pytest.mark.asyncio
+async def test_timeouts_do_not_disable_structured_output(slide: Path) -> None:
+    service = vs.VisionService()
+    reply = json.dumps(ANALYSIS)
+    chat = MagicMock(side_effect=[TimeoutError("read timed out"), "Title: x", reply])
+
+    with patch.object(vs, "chat_completion", chat):
+        await service.analyze_slide_image(slide)
+        analysis = await service.analyze_slide_image(slide)
+
+    assert "response_format" in chat.call_args.kwargs
+    assert service.structured_unsupported == set()
+    assert analysis["content"]["speaking_points"] == ["EMEA leads", "APAC is growing"]
+
+
+@pytest.mark.asyncio
+async def test_structured_output_can_be_disabled(
+    slide: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(config, "vision_structured_output", False)
+    chat = MagicMock(return_value="Title: Revenue by region")
+
+    with patch.object(vs, "chat_completion", chat):
+        analysis = await vs.VisionService().analyze_slide_image(slide)
+
+    chat.assert_called_once()
+    assert "response_format" not in chat.call_args.kwargs
+    assert analysis["slide_metadata"]["title"] == "Revenue by region"
+
+
+def test_gemini_models_get_a_json_schema() -> None:
+    options = vs._structured_output_options("google/gemini-2.5-flash")
+
+    assert options == {
+        "response_mime_type": "application/json",
+        "response_json_schema": vs.SLIDE_ANALYSIS_SCHEMA,
+    }
+    assert "response_format" in vs._structured_output_options("gpt-4o-mini")
@@ -0,0 +1,97 @@
+"""
+Unit tests for vision-optimised slide image variants.
+"""
+
+import base64
+from pathlib import Path
+
+import pytest
+from PIL import Image, ImageFilter
+
+from slidespeaker.configs.config import config
+from slidespeaker.image import vision_variant
+from slidespeaker.image.vision_service import VisionService
+
+
+@pytest.fixture(autouse=True)
+def _variant_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(config, "vision_image_optimize", True)
+    monkeypatch.setattr(config, "vision_image_format", "webp")
+    monkeypatch.setattr(config, "vision_image_quality", 85)
+    monkeypatch.setattr(config, "vision_image_short_side", 768)
+    monkeypatch.setattr(config, "vision_image_long_side", 2048)
+
+
+def _photo_slide(path: Path, size: tuple[int, int] = (2000, 1125)) -> Path:
+    noise = Image.effect_noise(size, 60).filter(ImageFilter.GaussianBlur(2))
+    Image.merge(
+        "RGB", (noise, noise.transpose(Image.Transpose.FLIP_LEFT_RIGHT), noise)
+    ).save(path)
+    return path
+
+
+def test_target_size_fits_both_limits() -> None:
+    assert vision_variant.target_size(2000, 1125, 768, 2048) == (1365, 768)
+    assert vision_variant.target_size(1125, 4000, 768, 2048) == (576, 2048)
+    # Never enlarged
+    assert vision_variant.target_size(640, 360, 768, 2048) == (640, 360)
+
+
+def test_variant_is_downscaled_and_cached(tmp_path: Path) -> None:
+    slide = _photo_slide(tmp_path / "slide_1.png")
+
+    variant = vision_variant.load_vision_variant(slide)
+
+    assert variant.path == tmp_path / "slide_1.vision.webp"
+    assert variant.mime_type == "image/webp"
+    assert variant.path.stat().st_size < slide.stat().st_size / 4
+    with Image.open(variant.path) as img:
+        assert img.size == (1365, 768)
+
+    mtime = variant.path.stat().st_mtime_ns
+    assert vision_variant.load_vision_variant(slide) == variant
+    assert variant.path.stat().st_mtime_ns == mtime
+
+
+def test_variant_follows_settings_and_source(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    slide = _photo_slide(tmp_path / "slide_1.png")
+    vision_variant.load_vision_variant(slide)
+
+    monkeypatch.setattr(config, "vision_image_format", "jpeg")
+    variant = vision_variant.load_vision_variant(slide)
+    assert variant == (tmp_path / "slide_1.vision.jpg", "image/jpeg")
+
+    _photo_slide(slide, (1000, 1000))
+    with Image.open(vision_variant.load_vision_variant(slide).path) as img:
+        assert img.size == (768, 768)
+
+
+def test_compressed_slides_are_sent_as_is(tmp_path: Path) -> None:
+    slide = tmp_path / "slide_1.jpg"
+    _photo_slide(tmp_path / "photo.png", (320, 180))
+    with Image.open(tmp_path / "photo.png") as img:
+        img.save(slide, quality=20)
+
+    variant = vision_variant.load_vision_variant(slide)
+
+    # Re-encoding an already compressed slide would not make it smaller
+    assert variant == (slide, "image/jpeg")
+    assert not (tmp_path / "slide_1.vision.webp").exists()
+
+
+def test_vision_service_sends_the_variant(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    slide = _photo_slide(tmp_path / "slide_1.png")
+    service = VisionService()
+
+    mime_type, data = service._encode_image(slide)
+    assert mime_type == "image/webp"
+    assert base64.b64decode(data) == (tmp_path / "slide_1.vision.webp").read_bytes()
+
+    monkeypatch.setattr(config, "vision_image_optimize", False)
+    mime_type, data = service._encode_image(slide)
+    assert mime_type == "image/png"
+    assert base64.b64decode(data) == slide.read_bytes()
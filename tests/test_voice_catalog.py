@@ -0,0 +1,142 @@
+"""
+Unit tests for the process-wide voice catalogue cache and its routes.
+"""
+
+import asyncio
+from typing import Any
+
+import pytest
+from starlette.requests import Request
+
+from slidespeaker.audio.generator import AudioGenerator
+from slidespeaker.audio.voice_catalog import VoiceCatalogCache, voice_catalog
+from slidespeaker.routes import tts_routes
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _request(etag: str | None = None) -> Request:
+    headers = [(b"if-none-match", etag.encode())] if etag else []
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load() -> None:
+    cache = VoiceCatalogCache(ttl=60, clock=Clock())
+    calls = 0
+
+    async def load() -> list[str]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return ["alloy"]
+
+    entries = await asyncio.gather(*(cache.get("k", load) for _ in range(5)))
+
+    assert calls == 1
+    assert {e.etag for e in entries} == {entries[0].etag}
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_is_served_while_refreshing() -> None:
+    clock = Clock()
+    cache = VoiceCatalogCache(ttl=60, clock=clock)
+    versions = iter([["alloy"], ["alloy", "nova"]])
+
+    async def load() -> list[str]:
+        return next(versions)
+
+    first = await cache.get("k", load)
+    clock.now = 61
+
+    stale = await cache.get("k", load)
+    assert stale.payload == ["alloy"]
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    refreshed = await cache.get("k", load)
+    assert refreshed.payload == ["alloy", "nova"]
+    assert refreshed.etag != first.etag
+
+
+def test_sync_lookup_keeps_stale_entry_when_refresh_fails() -> None:
+    clock = Clock()
+    cache = VoiceCatalogCache(ttl=60, clock=clock)
+    assert cache.get_sync("k", lambda: ["onyx"]).payload == ["onyx"]
+
+    def broken() -> Any:
+        raise RuntimeError("provider down")
+
+    clock.now = 120
+    assert cache.get_sync("k", broken).payload == ["onyx"]
+    with pytest.raises(RuntimeError):
+        cache.get_sync("other", broken)
+
+
+@pytest.mark.asyncio
+async def test_catalog_route_answers_conditional_requests() -> None:
+    voice_catalog.invalidate()
+
+    response = await tts_routes.tts_catalog(_request(), provider="openai")
+    etag = response.headers["etag"]
+    assert response.status_code == 200
+    assert b'"alloy"' in response.body
+
+    cached = await tts_routes.tts_catalog(_request(etag), provider="openai")
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+
+
+@pytest.mark.asyncio
+async def test_voices_route_is_served_from_cache(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    voice_catalog.invalidate()
+    created: list[str | None] = []
+
+    class FakeService:
+        def get_supported_voices(self, language: str) -> list[str]:
+            return ["nova", "alloy"]
+
+    def counting_create(model_spec: str | None = None) -> Any:
+        created.append(model_spec)
+        return FakeService()
+
+    monkeypatch.setattr(tts_routes.TTSFactory, "create_service", counting_create)
+
+    for _ in range(3):
+        response = await tts_routes.list_tts_voices(
+            _request(), language="japanese", provider="openai"
+        )
+        assert response.status_code == 200
+
+    assert created == ["openai"]
+    assert b'"nova"' in response.body
+
+
+@pytest.mark.asyncio
+async def test_generator_reads_voices_cached_by_the_route(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    voice_catalog.invalidate()
+
+    class FakeService:
+        def get_supported_voices(self, language: str) -> list[str]:
+            return ["nova", "alloy"]
+
+    monkeypatch.setattr(
+        tts_routes.TTSFactory, "create_service", lambda model_spec=None: FakeService()
+    )
+    generator = AudioGenerator()
+    generator.provider = "openai"
+    generator.tts_service = FakeService()  # type: ignore[assignment]
+
+    await tts_routes.list_tts_voices(_request(), language="english", provider="openai")
+
+    assert generator.get_supported_voices("english") == ["nova", "alloy"]
@@ -32,6 +32,7 @@ setup_logging(
     component="worker",
 )
 
+from slidespeaker.core.http_client import close_http_clients  # noqa: E402
 from slidespeaker.core.state_manager import state_manager  # noqa: E402
 from slidespeaker.core.task_queue import task_queue  # noqa: E402
 from slidespeaker.pipeline.coordinator import accept_task  # noqa: E402
@@ -322,6 +323,15 @@ async def main() -> None:
 
     logger.info(f"Task worker starting for task {task_id}")
 
+    try:
+        await _run_task(task_id)
+    finally:
+        # Close pooled HTTP connections before the process exits
+        await close_http_clients()
+
+
+async def _run_task(task_id: str) -> None:
+    """Process one task and exit with its status code."""
     try:
         final_status = await process_task(task_id)
         if final_status == "completed":